@@ -0,0 +1,269 @@
+"""Microbenchmark for `construct_type()`.
+
+Compares the cached constructor plans used by `construct_type()` against a reference copy of
+the previous implementation, which re-inspected every annotation for every nested value.
+
+    $ python scripts/bench-construct-type.py
+"""
+
+from __future__ import annotations
+
+import time
+import inspect
+from typing import Any, List, Callable, Optional, cast
+from datetime import date, datetime
+
+from openai._utils import is_list, is_mapping, parse_date, parse_datetime, extract_type_arg
+from openai._compat import (
+    PYDANTIC_V1,
+    get_args,
+    is_union,
+    get_origin,
+    is_literal_type,
+    get_model_config,
+    get_model_fields,
+    field_get_default,
+)
+from openai._models import (
+    BaseModel,
+    GenericModel,
+    validate_type,
+    construct_type,
+    _ConfigProtocol,
+    _get_extra_fields_type,
+    _build_discriminated_union_meta,
+)
+from openai.types.chat import ChatCompletionChunk
+from openai._utils._typing import is_annotated_type, is_type_alias_type
+from openai.types.conversations import ConversationItemList
+from openai.types.vector_stores import VectorStoreFile
+
+
+def reference_construct_type(*, value: object, type_: Any, metadata: Optional[List[Any]] = None) -> object:
+    """The implementation of `construct_type()` before constructor plans were introduced"""
+    original_type = None
+    if is_type_alias_type(type_):
+        original_type = type_
+        type_ = type_.__value__
+
+    if metadata is not None and len(metadata) > 0:
+        meta: tuple[Any, ...] = tuple(metadata)
+    elif is_annotated_type(type_):
+        meta = get_args(type_)[1:]
+        type_ = extract_type_arg(type_, 0)
+    else:
+        meta = tuple()
+
+    origin = get_origin(type_) or type_
+    args = get_args(type_)
+
+    if is_union(origin):
+        try:
+            return validate_type(type_=cast("type[object]", original_type or type_), value=value)
+        except Exception:
+            pass
+
+        discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=meta)
+        if discriminator and is_mapping(value):
+            variant_value = value.get(discriminator.field_alias_from or discriminator.field_name)
+            if variant_value and isinstance(variant_value, str):
+                variant_type = discriminator.mapping.get(variant_value)
+                if variant_type:
+                    return reference_construct_type(type_=variant_type, value=value)
+
+        for variant in args:
+            try:
+                return reference_construct_type(value=value, type_=variant)
+            except Exception:
+                continue
+
+        raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
+
+    if origin == dict:
+        if not is_mapping(value):
+            return value
+
+        _, items_type = get_args(type_)
+        return {key: reference_construct_type(value=item, type_=items_type) for key, item in value.items()}
+
+    if not is_literal_type(type_) and inspect.isclass(origin) and issubclass(origin, (BaseModel, GenericModel)):
+        if is_list(value):
+            return [reference_construct_model(type_, entry) if is_mapping(entry) else entry for entry in value]
+
+        if is_mapping(value):
+            return reference_construct_model(type_, value)
+
+    if origin == list:
+        if not is_list(value):
+            return value
+
+        return [reference_construct_type(value=entry, type_=args[0]) for entry in value]
+
+    if origin == float:
+        if isinstance(value, int):
+            coerced = float(value)
+            return value if coerced != value else coerced
+        return value
+
+    if type_ == datetime:
+        try:
+            return parse_datetime(value)  # type: ignore
+        except Exception:
+            return value
+
+    if type_ == date:
+        try:
+            return parse_date(value)  # type: ignore
+        except Exception:
+            return value
+
+    return value
+
+
+def reference_construct_model(cls: Any, values: Any) -> object:
+    """The implementation of `BaseModel.construct()` before constructor plans were introduced"""
+    m = cls.__new__(cls)
+    fields_values: dict[str, object] = {}
+
+    config = get_model_config(cls)
+    populate_by_name = (
+        config.allow_population_by_field_name if isinstance(config, _ConfigProtocol) else config.get("populate_by_name")
+    )
+
+    fields_set: set[str] = set()
+    model_fields = get_model_fields(cls)
+    for name, field in model_fields.items():
+        key = field.alias
+        if key is None or (key not in values and populate_by_name):
+            key = name
+
+        if key in values:
+            value = values[key]
+            if value is None:
+                fields_values[name] = field_get_default(field)
+            else:
+                type_ = field.outer_type_ if PYDANTIC_V1 else field.annotation  # type: ignore
+                fields_values[name] = reference_construct_type(
+                    value=value, type_=type_, metadata=getattr(field, "metadata", None)
+                )
+            fields_set.add(name)
+        else:
+            fields_values[name] = field_get_default(field)
+
+    extra_field_type = _get_extra_fields_type(cls)
+
+    extra = {}
+    for key, value in values.items():
+        if key not in model_fields:
+            parsed = reference_construct_type(value=value, type_=extra_field_type) if extra_field_type else value
+            if PYDANTIC_V1:
+                fields_set.add(key)
+                fields_values[key] = parsed
+            else:
+                extra[key] = parsed
+
+    object.__setattr__(m, "__dict__", fields_values)
+    if PYDANTIC_V1:
+        m._init_private_attributes()
+        object.__setattr__(m, "__fields_set__", fields_set)
+    else:
+        object.__setattr__(m, "__pydantic_private__", None)
+        object.__setattr__(m, "__pydantic_extra__", extra)
+        object.__setattr__(m, "__pydantic_fields_set__", fields_set)
+
+    return m
+
+
+def vector_store_files(n: int) -> list[dict[str, object]]:
+    return [
+        {
+            "id": f"file-{i}",
+            "created_at": 1700000000 + i,
+            "last_error": None,
+            "object": "vector_store.file",
+            "status": "completed",
+            "usage_bytes": 1024 * i,
+            "vector_store_id": "vs_abc123",
+            "attributes": {"author": "someone", "year": 2024, "draft": False},
+            "chunking_strategy": {
+                "type": "static",
+                "static": {"chunk_overlap_tokens": 400, "max_chunk_size_tokens": 800},
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def conversation_items(n: int) -> dict[str, object]:
+    return {
+        "object": "list",
+        "first_id": "msg_0",
+        "last_id": f"msg_{n - 1}",
+        "has_more": False,
+        "data": [
+            {
+                "id": f"msg_{i}",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": "Hello there!", "annotations": [], "logprobs": []}],
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def chat_completion_chunk(i: int) -> dict[str, object]:
+    return {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": f"token {i}"}, "logprobs": None, "finish_reason": None}],
+    }
+
+
+def bench(name: str, fn: Callable[[], object], *, rounds: int) -> float:
+    fn()  # warm up caches shared by both implementations, e.g. pydantic schemas
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = (time.perf_counter() - start) / rounds
+
+    print(f"  {name:<10} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+def main() -> None:
+    files = vector_store_files(1000)
+    items = conversation_items(1000)
+    chunks = [chat_completion_chunk(i) for i in range(1000)]
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "1000 x VectorStoreFile",
+            lambda: reference_construct_type(type_=List[VectorStoreFile], value=files),
+            lambda: construct_type(type_=List[VectorStoreFile], value=files),
+        ),
+        (
+            "ConversationItemList with 1000 items",
+            lambda: reference_construct_type(type_=ConversationItemList, value=items),
+            lambda: construct_type(type_=ConversationItemList, value=items),
+        ),
+        (
+            "1000 x ChatCompletionChunk",
+            lambda: [reference_construct_type(type_=ChatCompletionChunk, value=chunk) for chunk in chunks],
+            lambda: [construct_type(type_=ChatCompletionChunk, value=chunk) for chunk in chunks],
+        ),
+    ]
+
+    for title, reference_fn, cached_fn in cases:
+        print(title)
+        reference = bench("reference", reference_fn, rounds=20)
+        cached = bench("cached", cached_fn, rounds=20)
+        print(f"  {'speedup':<10} {reference / cached:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
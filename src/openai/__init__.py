@@ -7,13 +7,16 @@ import typing as _t
 from typing_extensions import override
 
 from . import types
+from ._json import JSONCodec
 from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes, omit, not_given
 from ._utils import file_from_path
 from ._client import Client, OpenAI, Stream, Timeout, Transport, AsyncClient, AsyncOpenAI, AsyncStream, RequestOptions
 from ._models import BaseModel
+from ._poller import Poller, AsyncPoller, AsyncPollHandle
 from ._version import __title__, __version__
 from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
 from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS
+from ._coalescing import RequestCoalescer
 from ._exceptions import (
     APIError,
     OpenAIError,
@@ -27,14 +30,20 @@ from ._exceptions import (
     AuthenticationError,
     InternalServerError,
     PermissionDeniedError,
+    CircuitBreakerOpenError,
     LengthFinishReasonError,
     UnprocessableEntityError,
     APIResponseValidationError,
     InvalidWebhookSignatureError,
     ContentFilterFinishReasonError,
 )
+from ._rate_limit import RateLimiter
 from ._base_client import DefaultHttpxClient, DefaultAioHttpClient, DefaultAsyncHttpxClient
+from ._concurrency import AdaptiveConcurrencyLimiter
 from ._utils._logs import setup_logging as _setup_logging
+from ._pool_metrics import PoolMetrics
+from ._endpoint_pool import EndpointPool
+from ._circuit_breaker import CircuitBreaker
 from ._legacy_response import HttpxBinaryResponseContent as HttpxBinaryResponseContent
 
 __all__ = [
@@ -66,6 +75,7 @@ __all__ = [
     "LengthFinishReasonError",
     "ContentFilterFinishReasonError",
     "InvalidWebhookSignatureError",
+    "CircuitBreakerOpenError",
     "Timeout",
     "RequestOptions",
     "Client",
@@ -76,6 +86,16 @@ __all__ = [
     "AsyncOpenAI",
     "file_from_path",
     "BaseModel",
+    "JSONCodec",
+    "RateLimiter",
+    "CircuitBreaker",
+    "AdaptiveConcurrencyLimiter",
+    "RequestCoalescer",
+    "Poller",
+    "AsyncPoller",
+    "AsyncPollHandle",
+    "EndpointPool",
+    "PoolMetrics",
     "DEFAULT_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_CONNECTION_LIMITS",
@@ -89,7 +109,14 @@ if not _t.TYPE_CHECKING:
 
 from .lib import azure as _azure, pydantic_function_tool as pydantic_function_tool
 from .version import VERSION as VERSION
-from .lib.azure import AzureOpenAI as AzureOpenAI, AsyncAzureOpenAI as AsyncAzureOpenAI
+from .lib.azure import (
+    AzureOpenAI as AzureOpenAI,
+    AzureEndpoint as AzureEndpoint,
+    AsyncAzureOpenAI as AsyncAzureOpenAI,
+    AsyncAzureEndpoint as AsyncAzureEndpoint,
+    LoadBalancedAzureOpenAI as LoadBalancedAzureOpenAI,
+    AsyncLoadBalancedAzureOpenAI as AsyncLoadBalancedAzureOpenAI,
+)
 from .lib._old_api import *
 from .lib.streaming import (
     AssistantEventHandler as AssistantEventHandler,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import os
 import sys
-import json
 import time
 import uuid
 import email
@@ -10,13 +10,16 @@ import inspect
 import logging
 import platform
 import email.utils
+import importlib.util
 from types import TracebackType
 from random import random
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    List,
     Type,
+    Tuple,
     Union,
     Generic,
     Mapping,
@@ -30,6 +33,7 @@ from typing import (
     overload,
 )
 from typing_extensions import Literal, override, get_origin
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 import anyio
 import httpx
@@ -40,6 +44,7 @@ from pydantic import PrivateAttr
 
 from . import _exceptions
 from ._qs import Querystring
+from ._json import JSONCodec, JSONCodecLike, resolve_json_codec
 from ._files import to_httpx_files, async_to_httpx_files
 from ._types import (
     Body,
@@ -50,6 +55,7 @@ from ._types import (
     NotGiven,
     ResponseT,
     AnyMapping,
+    HedgeAfter,
     PostParser,
     RequestFiles,
     HttpxSendArgs,
@@ -60,7 +66,10 @@ from ._types import (
 )
 from ._utils import SensitiveHeadersFilter, is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
 from ._compat import PYDANTIC_V1, model_copy, model_dump
+from ._export import RawItem, ExportFormat, raw_page, item_to_raw, open_export_writer
 from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
+from ._hedging import HEDGE_IDEMPOTENCY_HEADER, LatencyTracker, copy_request, endpoint_key, is_safe_to_hedge
+from ._prefetch import prefetch_pages, async_prefetch_pages
 from ._response import (
     APIResponse,
     BaseAPIResponse,
@@ -81,8 +90,14 @@ from ._exceptions import (
     APIStatusError,
     APITimeoutError,
     APIConnectionError,
+    CircuitBreakerOpenError,
     APIResponseValidationError,
 )
+from ._rate_limit import RateLimiter
+from ._concurrency import AdaptiveConcurrencyLimiter
+from ._pool_metrics import PoolMetrics, trace_request, get_pool_metrics, async_trace_request
+from ._extras._common import MissingDependencyError, format_instructions
+from ._circuit_breaker import CircuitBreaker
 from ._legacy_response import LegacyAPIResponse
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -254,7 +269,19 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    def iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
+    def iter_pages(self: SyncPageT, *, prefetch: int = 0) -> Iterator[SyncPageT]:
+        """Iterate over this page and every page after it.
+
+        If `prefetch` is given, up to that many pages are fetched ahead in a background
+        thread while the current page is being handled.
+        """
+        if prefetch < 0:
+            raise ValueError(f"Expected `prefetch` to be a non-negative integer but received {prefetch}")
+
+        if prefetch > 0:
+            yield from prefetch_pages(self, prefetch)
+            return
+
         page = self
         while True:
             yield page
@@ -263,6 +290,12 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
             else:
                 return
 
+    def iter_items(self, *, prefetch: int = 0) -> Iterator[_T]:
+        """Iterate over the items in this page and every page after it, see `.iter_pages()`"""
+        for page in self.iter_pages(prefetch=prefetch):
+            for item in page._get_page_items():
+                yield item
+
     def get_next_page(self: SyncPageT) -> SyncPageT:
         info = self.next_page_info()
         if not info:
@@ -273,6 +306,65 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
         options = self._info_to_options(info)
         return self._client._request_api_list(self._model, page=self.__class__, options=options)
 
+    def iter_raw(self) -> Iterator[RawItem]:
+        """Iterate over the items in this page and every page after it as the dictionaries
+        returned by the API.
+
+        Pages after this one are never parsed into models, which is considerably faster and
+        uses less memory when you don't need them, e.g. when exporting a large list.
+        """
+        for items in self._iter_raw_pages():
+            yield from items
+
+    def export(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "jsonl",
+        schema: Optional[Any] = None,
+    ) -> int:
+        """Write the items in this page and every page after it to the given file, returning the
+        number of items that were written.
+
+        Args:
+            format: Either `"jsonl"`, to write each item as a line of JSON, or `"arrow"` to write
+                an Arrow IPC file, which requires `pyarrow` to be installed.
+
+            schema: The `pyarrow.Schema` to write items with, by default it is inferred from the first page.
+        """
+        writer = open_export_writer(path, format=format, json_codec=self._client._json_codec, schema=schema)
+        count = 0
+        try:
+            for items in self._iter_raw_pages():
+                writer.write(items)
+                count += len(items)
+        finally:
+            writer.close()
+
+        return count
+
+    def _iter_raw_pages(self) -> Iterator[List[RawItem]]:
+        yield [item_to_raw(item) for item in self._get_page_items()]
+
+        page = self
+        while page.has_next_page():
+            items, page = page._get_next_raw_page()
+            yield items
+
+    def _get_next_raw_page(self: SyncPageT) -> Tuple[List[RawItem], SyncPageT]:
+        info = self.next_page_info()
+        if not info:
+            raise RuntimeError(
+                "No next page expected; please check `.has_next_page()` before calling `.get_next_page()`."
+            )
+
+        options = self._info_to_options(info)
+        options.post_parser = not_given
+
+        items, page = raw_page(self.__class__, self._client.request(object, options))
+        page._set_private_attributes(client=self._client, model=self._model, options=options)
+        return items, page
+
 
 class AsyncPaginator(Generic[_T, AsyncPageT]):
     def __init__(
@@ -312,6 +404,45 @@ class AsyncPaginator(Generic[_T, AsyncPageT]):
         async for item in page:
             yield item
 
+    async def iter_pages(self, *, prefetch: int = 0) -> AsyncIterator[AsyncPageT]:
+        """Iterate over the first page and every page after it, see `BaseAsyncPage.iter_pages()`"""
+        first_page = await self._get_page()
+        async for page in first_page.iter_pages(prefetch=prefetch):
+            yield page
+
+    async def iter_items(self, *, prefetch: int = 0) -> AsyncIterator[_T]:
+        """Iterate over the items in every page, see `BaseAsyncPage.iter_pages()`"""
+        first_page = await self._get_page()
+        async for item in first_page.iter_items(prefetch=prefetch):
+            yield item
+
+    async def iter_raw(self) -> AsyncIterator[RawItem]:
+        """Iterate over the items in every page as the dictionaries returned by the API, without
+        parsing any page into models, see `BaseSyncPage.iter_raw()`"""
+        async for items in self._iter_raw_pages():
+            for item in items:
+                yield item
+
+    async def export(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "jsonl",
+        schema: Optional[Any] = None,
+    ) -> int:
+        """Write the items in every page to the given file, returning the number of items that
+        were written, see `BaseSyncPage.export()`"""
+        return await _export_raw_pages(
+            self._iter_raw_pages(), path, format=format, json_codec=self._client._json_codec, schema=schema
+        )
+
+    async def _iter_raw_pages(self) -> AsyncIterator[List[RawItem]]:
+        items, first_page = await _request_raw_page(self._client, self._page_cls, self._model, self._options)
+        yield items
+
+        async for items in first_page._iter_raw_pages_after():
+            yield items
+
 
 class BaseAsyncPage(BasePage[_T], Generic[_T]):
     _client: AsyncAPIClient = pydantic.PrivateAttr()
@@ -334,7 +465,20 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    async def iter_pages(self: AsyncPageT) -> AsyncIterator[AsyncPageT]:
+    async def iter_pages(self: AsyncPageT, *, prefetch: int = 0) -> AsyncIterator[AsyncPageT]:
+        """Iterate over this page and every page after it.
+
+        If `prefetch` is given, up to that many pages are fetched ahead in a background
+        task while the current page is being handled. This is only supported with `asyncio`.
+        """
+        if prefetch < 0:
+            raise ValueError(f"Expected `prefetch` to be a non-negative integer but received {prefetch}")
+
+        if prefetch > 0:
+            async for page in async_prefetch_pages(self, prefetch):
+                yield page
+            return
+
         page = self
         while True:
             yield page
@@ -343,6 +487,12 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             else:
                 return
 
+    async def iter_items(self, *, prefetch: int = 0) -> AsyncIterator[_T]:
+        """Iterate over the items in this page and every page after it, see `.iter_pages()`"""
+        async for page in self.iter_pages(prefetch=prefetch):
+            for item in page._get_page_items():
+                yield item
+
     async def get_next_page(self: AsyncPageT) -> AsyncPageT:
         info = self.next_page_info()
         if not info:
@@ -353,6 +503,77 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
         options = self._info_to_options(info)
         return await self._client._request_api_list(self._model, page=self.__class__, options=options)
 
+    async def iter_raw(self) -> AsyncIterator[RawItem]:
+        """Iterate over the items in this page and every page after it as the dictionaries
+        returned by the API, see `BaseSyncPage.iter_raw()`"""
+        async for items in self._iter_raw_pages():
+            for item in items:
+                yield item
+
+    async def export(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "jsonl",
+        schema: Optional[Any] = None,
+    ) -> int:
+        """Write the items in this page and every page after it to the given file, returning the
+        number of items that were written, see `BaseSyncPage.export()`"""
+        return await _export_raw_pages(
+            self._iter_raw_pages(), path, format=format, json_codec=self._client._json_codec, schema=schema
+        )
+
+    async def _iter_raw_pages(self) -> AsyncIterator[List[RawItem]]:
+        yield [item_to_raw(item) for item in self._get_page_items()]
+
+        async for items in self._iter_raw_pages_after():
+            yield items
+
+    async def _iter_raw_pages_after(self) -> AsyncIterator[List[RawItem]]:
+        page = self
+        while page.has_next_page():
+            info = page.next_page_info()
+            assert info is not None
+
+            options = page._info_to_options(info)
+            items, page = await _request_raw_page(self._client, self.__class__, self._model, options)
+            yield items
+
+
+async def _request_raw_page(
+    client: AsyncAPIClient,
+    page_cls: Type[AsyncPageT],
+    model: Type[object],
+    options: FinalRequestOptions,
+) -> Tuple[List[RawItem], AsyncPageT]:
+    options = model_copy(options)
+    options.post_parser = not_given
+
+    items, page = raw_page(page_cls, await client.request(object, options))
+    page._set_private_attributes(client=client, model=model, options=options)
+    return items, page
+
+
+async def _export_raw_pages(
+    pages: AsyncIterator[List[RawItem]],
+    path: str | os.PathLike[str],
+    *,
+    format: ExportFormat,
+    json_codec: JSONCodec,
+    schema: Optional[Any],
+) -> int:
+    writer = await asyncify(open_export_writer)(path, format=format, json_codec=json_codec, schema=schema)
+    count = 0
+    try:
+        async for items in pages:
+            # file writes are blocking so they're done in a worker thread
+            await asyncify(writer.write)(items)
+            count += len(items)
+    finally:
+        await asyncify(writer.close)()
+
+    return count
+
 
 _HttpxClientT = TypeVar("_HttpxClientT", bound=Union[httpx.Client, httpx.AsyncClient])
 _DefaultStreamT = TypeVar("_DefaultStreamT", bound=Union[Stream[Any], AsyncStream[Any]])
@@ -363,9 +584,13 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     _version: str
     _base_url: URL
     max_retries: int
+    hedge_after: HedgeAfter
     timeout: Union[float, Timeout, None]
     _strict_response_validation: bool
     _idempotency_header: str | None
+    _json_codec: JSONCodec
+    _rate_limiter: RateLimiter | None
+    _circuit_breaker: CircuitBreaker | None
     _default_stream_cls: type[_DefaultStreamT] | None = None
 
     def __init__(
@@ -378,6 +603,10 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         timeout: float | Timeout | None = DEFAULT_TIMEOUT,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedge_after: HedgeAfter = None,
     ) -> None:
         self._version = version
         self._base_url = self._enforce_trailing_slash(URL(base_url))
@@ -387,6 +616,11 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         self._custom_query = custom_query or {}
         self._strict_response_validation = _strict_response_validation
         self._idempotency_header = None
+        self._json_codec = resolve_json_codec(json_codec)
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self.hedge_after = hedge_after
+        self._latency_tracker = LatencyTracker()
         self._platform: Platform | None = None
 
         if max_retries is None:  # pyright: ignore[reportUnnecessaryComparison]
@@ -414,7 +648,7 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             body = err_text
 
             try:
-                body = json.loads(err_text)
+                body = self._json_codec.loads(err_text)
                 err_msg = f"Error code: {response.status_code} - {body}"
             except Exception:
                 err_msg = err_text or f"Error code: {response.status_code}"
@@ -536,8 +770,10 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         if is_body_allowed:
             if isinstance(json_data, bytes):
                 kwargs["content"] = json_data
-            else:
-                kwargs["json"] = json_data if is_given(json_data) else None
+            elif is_given(json_data) and json_data is not None and not files and "data" not in kwargs:
+                kwargs["content"] = self._json_codec.dumps(json_data)
+                if "Content-Type" not in headers:
+                    headers["Content-Type"] = "application/json"
             kwargs["files"] = files
         else:
             headers.pop("Content-Type", None)
@@ -723,6 +959,43 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         retry_date = email.utils.mktime_tz(retry_date_tuple)
         return float(retry_date - time.time())
 
+    def _get_hedge_after(self, options: FinalRequestOptions, *, stream: bool) -> HedgeAfter:
+        # streamed responses can't be raced against each other and file uploads can't be sent twice
+        if stream or options.files is not None:
+            return None
+
+        # a per-request `hedge_after` is an explicit opt in but a client-wide one only applies to
+        # requests that can be sent twice without creating duplicate resources or being billed twice
+        if isinstance(options.hedge_after, NotGiven) and not is_safe_to_hedge(options):
+            return None
+
+        return options.get_hedge_after(self.hedge_after)
+
+    def _set_hedge_idempotency_key(self, request: httpx.Request, options: FinalRequestOptions) -> None:
+        """Ensures that both attempts of a hedged request are sent with the same idempotency key"""
+        if options.idempotency_key is None:
+            return
+
+        header = self._idempotency_header or HEDGE_IDEMPOTENCY_HEADER
+        if header not in request.headers:
+            request.headers[header] = options.idempotency_key
+
+    def _get_warm_up_urls(self) -> list[URL]:
+        """The URLs that `warm_up()` should open connections to"""
+        return [self.base_url]
+
+    def _is_circuit_open(self) -> bool:
+        """Whether or not requests are currently being rejected by the circuit breaker, in which case we fail fast instead of retrying"""
+        return self._circuit_breaker is not None and self._circuit_breaker.is_open(self.base_url)
+
+    def _get_circuit_url(self, request: httpx.Request) -> URL:  # noqa: ARG002
+        """The base URL whose circuit the given request counts towards"""
+        return self.base_url
+
+    def _can_retry_rejected_request(self) -> bool:
+        """Whether or not a request that was rejected by the circuit breaker can be retried, e.g. against another endpoint"""
+        return False
+
     def _calculate_retry_timeout(
         self,
         remaining_retries: int,
@@ -806,6 +1079,17 @@ else:
     DefaultHttpxClient = _DefaultHttpxClient
 
 
+def _ensure_http2_installed() -> None:
+    # httpx would otherwise raise an error that tells users to install `httpx[http2]` instead of our extra
+    if importlib.util.find_spec("h2") is None:
+        raise MissingDependencyError(format_instructions(library="h2", extra="http2"))
+
+
+def _close_hedged_response(future: Future[httpx.Response]) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
 class SyncHttpxClientWrapper(DefaultHttpxClient):
     def __del__(self) -> None:
         if self.is_closed:
@@ -819,6 +1103,7 @@ class SyncHttpxClientWrapper(DefaultHttpxClient):
 
 class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
     _client: httpx.Client
+    _pool_metrics: PoolMetrics | None
     _default_stream_cls: type[Stream[Any]] | None = None
 
     def __init__(
@@ -831,6 +1116,12 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         http_client: httpx.Client | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        hedge_after: HedgeAfter = None,
+        http2: bool = False,
         _strict_response_validation: bool,
     ) -> None:
         if not is_given(timeout):
@@ -851,6 +1142,13 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 f"Invalid `http_client` argument; Expected an instance of `httpx.Client` but got {type(http_client)}"
             )
 
+        if http2:
+            if http_client is not None:
+                raise ValueError(
+                    "The `http2` and `http_client` arguments are mutually exclusive; pass `http2=True` to your HTTP client instead"
+                )
+            _ensure_http2_installed()
+
         super().__init__(
             version=version,
             # cast to a valid type because mypy doesn't understand our type narrowing
@@ -859,17 +1157,64 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedge_after=hedge_after,
             _strict_response_validation=_strict_response_validation,
         )
         self._client = http_client or SyncHttpxClientWrapper(
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            http2=http2,
         )
+        self._pool_metrics = get_pool_metrics(self._client) if pool_metrics else None
 
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    @property
+    def pool_metrics(self) -> PoolMetrics | None:
+        """Connection pool checkout wait & connection setup times, shared by every client using the same HTTP client.
+
+        `None` unless the client was created with `pool_metrics=True`.
+        """
+        return self._pool_metrics
+
+    def warm_up(self, connections: int = 1) -> int:
+        """Opens connections to the API ahead of any requests, so that the first requests
+        don't have to wait for the TCP & TLS handshakes.
+
+        With `http2=True` a single connection can serve many concurrent requests.
+
+        Returns the number of connections that were opened successfully.
+        """
+        if connections < 1:
+            raise ValueError(f"Expected connections to be at least 1 but got {connections}")
+
+        def warm_up_connection(request: httpx.Request) -> bool:
+            if self._pool_metrics is not None:
+                trace_request(request, self._pool_metrics)
+            try:
+                # any response means the connection has been opened, reading it returns the connection to the pool
+                self._client.send(request)
+            except Exception:
+                log.debug("Failed to open a connection to %s", request.url, exc_info=True)
+                return False
+
+            return True
+
+        requests = [
+            httpx.Request("HEAD", url, headers={"User-Agent": self.user_agent})
+            for url in self._get_warm_up_urls()
+            for _ in range(connections)
+        ]
+
+        # the requests have to be sent concurrently, otherwise they would all reuse the same connection
+        with ThreadPoolExecutor(max_workers=len(requests), thread_name_prefix="openai-warm-up") as executor:
+            return sum(executor.map(warm_up_connection, requests))
+
     def close(self) -> None:
         """Close the underlying HTTPX client.
 
@@ -968,6 +1313,12 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             request = self._build_request(options, retries_taken=retries_taken)
             self._prepare_request(request)
 
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve(options, request)
+                if delay > 0:
+                    log.debug("Delaying request to %s by %f seconds to stay within rate limits", request.url, delay)
+                    time.sleep(delay)
+
             kwargs: HttpxSendArgs = {}
             if self.custom_auth is not None:
                 kwargs["auth"] = self.custom_auth
@@ -977,17 +1328,19 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
             log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
+            should_stream = stream or self._should_stream_response_body(request=request)
+            hedge_after = self._get_hedge_after(options, stream=should_stream)
+
             response = None
             try:
-                response = self._client.send(
-                    request,
-                    stream=stream or self._should_stream_response_body(request=request),
-                    **kwargs,
-                )
+                if hedge_after is None:
+                    response = self._send_request(request, stream=should_stream, kwargs=kwargs)
+                else:
+                    response = self._send_hedged_request(request, options, hedge_after=hedge_after, kwargs=kwargs)
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and not self._is_circuit_open():
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -998,10 +1351,23 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
                 log.debug("Raising timeout error")
                 raise APITimeoutError(request=request) from err
+            except CircuitBreakerOpenError:
+                if remaining_retries > 0 and self._can_retry_rejected_request():
+                    log.debug("Circuit breaker is open, retrying the request elsewhere")
+                    self._sleep_for_retry(
+                        retries_taken=retries_taken,
+                        max_retries=max_retries,
+                        options=input_options,
+                        response=None,
+                    )
+                    continue
+
+                log.debug("Not sending request as the circuit breaker is open")
+                raise
             except Exception as err:
                 log.debug("Encountered Exception", exc_info=True)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and not self._is_circuit_open():
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -1023,12 +1389,15 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             )
             log.debug("request_id: %s", response.headers.get("x-request-id"))
 
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(options, request, response)
+
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
                 log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-                if remaining_retries > 0 and self._should_retry(err.response):
+                if remaining_retries > 0 and self._should_retry(err.response) and not self._is_circuit_open():
                     err.response.close()
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
@@ -1058,6 +1427,87 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             retries_taken=retries_taken,
         )
 
+    def _send_request(self, request: httpx.Request, *, stream: bool, kwargs: HttpxSendArgs) -> httpx.Response:
+        if self._pool_metrics is not None:
+            trace_request(request, self._pool_metrics)
+
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return self._client.send(request, stream=stream, **kwargs)
+
+        circuit_url = self._get_circuit_url(request)
+        breaker.acquire(circuit_url, request)
+        try:
+            response = self._client.send(request, stream=stream, **kwargs)
+        except BaseException as err:
+            # e.g. a `KeyboardInterrupt` doesn't tell us anything about the health of the API
+            breaker.release(circuit_url, success=False if isinstance(err, Exception) else None)
+            raise
+
+        breaker.release(circuit_url, success=response.status_code < 500)
+        return response
+
+    def _send_hedged_request(
+        self,
+        request: httpx.Request,
+        options: FinalRequestOptions,
+        *,
+        hedge_after: float | Literal["auto"],
+        kwargs: HttpxSendArgs,
+    ) -> httpx.Response:
+        """Sends the request and, if it hasn't completed after `hedge_after` seconds, sends a duplicate of it and returns
+        whichever response arrives first.
+
+        Both requests share the same idempotency key.
+        """
+        endpoint = endpoint_key(options)
+        delay = self._latency_tracker.percentile(endpoint) if hedge_after == "auto" else hedge_after
+        started_at = time.monotonic()
+        self._set_hedge_idempotency_key(request, options)
+
+        if delay is None:
+            response = self._send_request(request, stream=False, kwargs=kwargs)
+        else:
+
+            def send(request: httpx.Request) -> httpx.Response:
+                return self._send_request(request, stream=False, kwargs=kwargs)
+
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="openai-hedge")
+            try:
+                pending: set[Future[httpx.Response]] = {executor.submit(send, request)}
+                done, _ = wait(pending, timeout=delay)
+                if not done:
+                    log.debug("Request to %s is still outstanding after %f seconds, hedging", request.url, delay)
+                    pending.add(executor.submit(send, copy_request(request)))
+
+                winner: httpx.Response | None = None
+                error: BaseException | None = None
+                while pending and winner is None:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        exc = future.exception()
+                        if exc is not None:
+                            error = error or exc
+                        elif winner is None:
+                            winner = future.result()
+                        else:
+                            future.result().close()
+
+                # the losing request can't be interrupted so we close its response once it arrives
+                for future in pending:
+                    future.add_done_callback(_close_hedged_response)
+
+                if winner is None:
+                    assert error is not None
+                    raise error
+
+                response = winner
+            finally:
+                executor.shutdown(wait=False)
+
+        self._latency_tracker.record(endpoint, time.monotonic() - started_at)
+        return response
+
     def _sleep_for_retry(
         self, *, retries_taken: int, max_retries: int, options: FinalRequestOptions, response: httpx.Response | None
     ) -> None:
@@ -1364,6 +1814,8 @@ class AsyncHttpxClientWrapper(DefaultAsyncHttpxClient):
 
 class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
     _client: httpx.AsyncClient
+    _pool_metrics: PoolMetrics | None
+    _concurrency_limiter: AdaptiveConcurrencyLimiter | None
     _default_stream_cls: type[AsyncStream[Any]] | None = None
 
     def __init__(
@@ -1377,6 +1829,13 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         http_client: httpx.AsyncClient | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        hedge_after: HedgeAfter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        http2: bool = False,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1396,6 +1855,13 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 f"Invalid `http_client` argument; Expected an instance of `httpx.AsyncClient` but got {type(http_client)}"
             )
 
+        if http2:
+            if http_client is not None:
+                raise ValueError(
+                    "The `http2` and `http_client` arguments are mutually exclusive; pass `http2=True` to your HTTP client instead"
+                )
+            _ensure_http2_installed()
+
         super().__init__(
             version=version,
             base_url=base_url,
@@ -1404,17 +1870,68 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedge_after=hedge_after,
             _strict_response_validation=_strict_response_validation,
         )
         self._client = http_client or AsyncHttpxClientWrapper(
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            http2=http2,
         )
+        self._pool_metrics = get_pool_metrics(self._client) if pool_metrics else None
+        self._concurrency_limiter = concurrency_limiter
 
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    @property
+    def pool_metrics(self) -> PoolMetrics | None:
+        """Connection pool checkout wait & connection setup times, shared by every client using the same HTTP client.
+
+        `None` unless the client was created with `pool_metrics=True`.
+        """
+        return self._pool_metrics
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """Opens connections to the API ahead of any requests, so that the first requests
+        don't have to wait for the TCP & TLS handshakes.
+
+        With `http2=True` a single connection can serve many concurrent requests.
+
+        Returns the number of connections that were opened successfully.
+        """
+        if connections < 1:
+            raise ValueError(f"Expected connections to be at least 1 but got {connections}")
+
+        opened = 0
+
+        async def warm_up_connection(request: httpx.Request) -> None:
+            nonlocal opened
+            if self._pool_metrics is not None:
+                async_trace_request(request, self._pool_metrics)
+            try:
+                # any response means the connection has been opened, reading it returns the connection to the pool
+                await self._client.send(request)
+            except Exception:
+                log.debug("Failed to open a connection to %s", request.url, exc_info=True)
+                return
+
+            opened += 1
+
+        # the requests have to be sent concurrently, otherwise they would all reuse the same connection
+        async with anyio.create_task_group() as task_group:
+            for url in self._get_warm_up_urls():
+                for _ in range(connections):
+                    task_group.start_soon(
+                        warm_up_connection, httpx.Request("HEAD", url, headers={"User-Agent": self.user_agent})
+                    )
+
+        return opened
+
     async def close(self) -> None:
         """Close the underlying HTTPX client.
 
@@ -1515,6 +2032,12 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             request = self._build_request(options, retries_taken=retries_taken)
             await self._prepare_request(request)
 
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve(options, request)
+                if delay > 0:
+                    log.debug("Delaying request to %s by %f seconds to stay within rate limits", request.url, delay)
+                    await anyio.sleep(delay)
+
             kwargs: HttpxSendArgs = {}
             if self.custom_auth is not None:
                 kwargs["auth"] = self.custom_auth
@@ -1524,17 +2047,19 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
             log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
+            should_stream = stream or self._should_stream_response_body(request=request)
+            hedge_after = self._get_hedge_after(options, stream=should_stream)
+
             response = None
             try:
-                response = await self._client.send(
-                    request,
-                    stream=stream or self._should_stream_response_body(request=request),
-                    **kwargs,
-                )
+                if hedge_after is None:
+                    response = await self._send_request(request, stream=should_stream, kwargs=kwargs)
+                else:
+                    response = await self._send_hedged_request(request, options, hedge_after=hedge_after, kwargs=kwargs)
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and not self._is_circuit_open():
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -1545,10 +2070,23 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
                 log.debug("Raising timeout error")
                 raise APITimeoutError(request=request) from err
+            except CircuitBreakerOpenError:
+                if remaining_retries > 0 and self._can_retry_rejected_request():
+                    log.debug("Circuit breaker is open, retrying the request elsewhere")
+                    await self._sleep_for_retry(
+                        retries_taken=retries_taken,
+                        max_retries=max_retries,
+                        options=input_options,
+                        response=None,
+                    )
+                    continue
+
+                log.debug("Not sending request as the circuit breaker is open")
+                raise
             except Exception as err:
                 log.debug("Encountered Exception", exc_info=True)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and not self._is_circuit_open():
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -1570,12 +2108,15 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             )
             log.debug("request_id: %s", response.headers.get("x-request-id"))
 
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(options, request, response)
+
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
                 log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-                if remaining_retries > 0 and self._should_retry(err.response):
+                if remaining_retries > 0 and self._should_retry(err.response) and not self._is_circuit_open():
                     await err.response.aclose()
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
@@ -1605,6 +2146,110 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             retries_taken=retries_taken,
         )
 
+    async def _send_request(self, request: httpx.Request, *, stream: bool, kwargs: HttpxSendArgs) -> httpx.Response:
+        breaker = self._circuit_breaker
+        limiter = self._concurrency_limiter
+        if breaker is None and limiter is None:
+            if self._pool_metrics is not None:
+                async_trace_request(request, self._pool_metrics)
+            return await self._client.send(request, stream=stream, **kwargs)
+
+        circuit_url = self._get_circuit_url(request)
+        if breaker is not None:
+            breaker.acquire(circuit_url, request)
+
+        started_at = 0.0
+        try:
+            if limiter is not None:
+                if limiter.queue_depth or limiter.in_flight >= limiter.limit:
+                    log.debug(
+                        "Waiting for one of %i in-flight requests to finish, %i requests are queued",
+                        limiter.in_flight,
+                        limiter.queue_depth,
+                    )
+
+                started_at = await limiter.acquire()
+
+            # the time spent waiting for the concurrency limiter shouldn't count towards the pool checkout wait
+            if self._pool_metrics is not None:
+                async_trace_request(request, self._pool_metrics)
+            try:
+                response = await self._client.send(request, stream=stream, **kwargs)
+            except BaseException as err:
+                if limiter is not None:
+                    limiter.release(started_at, response=None, timed_out=isinstance(err, httpx.TimeoutException))
+                raise
+        except BaseException as err:
+            if breaker is not None:
+                # cancellation doesn't tell us anything about the health of the API
+                breaker.release(circuit_url, success=False if isinstance(err, Exception) else None)
+            raise
+
+        if limiter is not None:
+            limiter.release(started_at, response=response)
+        if breaker is not None:
+            breaker.release(circuit_url, success=response.status_code < 500)
+        return response
+
+    async def _send_hedged_request(
+        self,
+        request: httpx.Request,
+        options: FinalRequestOptions,
+        *,
+        hedge_after: float | Literal["auto"],
+        kwargs: HttpxSendArgs,
+    ) -> httpx.Response:
+        """Sends the request and, if it hasn't completed after `hedge_after` seconds, sends a duplicate of it and returns
+        whichever response arrives first, cancelling the other request.
+
+        Both requests share the same idempotency key.
+        """
+        endpoint = endpoint_key(options)
+        delay = self._latency_tracker.percentile(endpoint) if hedge_after == "auto" else hedge_after
+        started_at = time.monotonic()
+        self._set_hedge_idempotency_key(request, options)
+
+        if delay is None:
+            response = await self._send_request(request, stream=False, kwargs=kwargs)
+        else:
+            responses: list[httpx.Response] = []
+            errors: list[Exception] = []
+            in_flight = 0
+
+            async with anyio.create_task_group() as tg:
+
+                async def send(request: httpx.Request, hedge: bool) -> None:
+                    nonlocal in_flight
+
+                    if hedge:
+                        await anyio.sleep(delay)
+                        log.debug("Request to %s is still outstanding after %f seconds, hedging", request.url, delay)
+
+                    in_flight += 1
+                    try:
+                        responses.append(await self._send_request(request, stream=False, kwargs=kwargs))
+                    except Exception as err:
+                        errors.append(err)
+                    finally:
+                        in_flight -= 1
+
+                    # stop as soon as we have a response or when every request that was sent has failed
+                    if responses or in_flight == 0:
+                        tg.cancel_scope.cancel()
+
+                tg.start_soon(send, request, False)
+                tg.start_soon(send, copy_request(request), True)
+
+            if not responses:
+                raise errors[0]
+
+            response = responses[0]
+            for extra in responses[1:]:
+                await extra.aclose()
+
+        self._latency_tracker.record(endpoint, time.monotonic() - started_at)
+        return response
+
     async def _sleep_for_retry(
         self, *, retries_taken: int, max_retries: int, options: FinalRequestOptions, response: httpx.Response | None
     ) -> None:
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+import logging
+import threading
+from typing import Dict, Callable, Optional
+from typing_extensions import Literal, TypeAlias
+
+import httpx
+
+from ._exceptions import CircuitBreakerOpenError
+
+__all__ = ["CircuitBreaker", "CircuitState"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+CircuitState: TypeAlias = Literal["closed", "open", "half_open"]
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state: CircuitState = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API behind a base URL is unavailable.
+
+    Each base URL has its own circuit which starts out `closed`, letting every request through.
+
+    - after `failure_threshold` consecutive connection errors, timeouts or `5xx` responses the circuit
+      `open`s and requests immediately raise `CircuitBreakerOpenError` without being sent or retried.
+    - once `recovery_timeout` seconds have passed the circuit becomes `half_open` and lets up to
+      `half_open_max_requests` requests through at a time to probe whether the API has recovered.
+    - a successful probe closes the circuit again while a failed probe re-opens it.
+
+    A single instance can be shared between clients, e.g. so that every worker in a pool sheds load
+    as soon as any of them has observed an outage:
+
+    ```py
+    from openai import OpenAI, CircuitBreaker
+
+    client = OpenAI(circuit_breaker=CircuitBreaker())
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_requests: int = 1,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError(f"Expected failure_threshold to be at least 1 but got {failure_threshold}")
+
+        if half_open_max_requests < 1:
+            raise ValueError(f"Expected half_open_max_requests to be at least 1 but got {half_open_max_requests}")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_requests = half_open_max_requests
+
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+        self._clock: Callable[[], float] = time.monotonic
+
+    def state(self, base_url: str | httpx.URL) -> CircuitState:
+        """Returns the current state of the circuit for the given base URL"""
+        with self._lock:
+            circuit = self._circuits.get(str(base_url))
+            if circuit is None:
+                return "closed"
+
+            if circuit.state == "open" and self._clock() - circuit.opened_at >= self.recovery_timeout:
+                return "half_open"
+
+            return circuit.state
+
+    def is_open(self, base_url: str | httpx.URL) -> bool:
+        """Returns whether or not requests to the given base URL are currently being rejected"""
+        return self.state(base_url) == "open"
+
+    def acquire(self, base_url: str | httpx.URL, request: httpx.Request) -> None:
+        """Raises `CircuitBreakerOpenError` if the given request should not be sent.
+
+        Every request that is let through must be followed by a call to `release()`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(str(base_url))
+            if circuit is None or circuit.state == "closed":
+                return
+
+            if circuit.state == "open":
+                retry_after = circuit.opened_at + self.recovery_timeout - self._clock()
+                if retry_after > 0:
+                    raise CircuitBreakerOpenError(request=request, retry_after=retry_after)
+
+                log.debug("Circuit breaker for %s is half-open, probing with a request", base_url)
+                circuit.state = "half_open"
+
+            if circuit.probes_in_flight >= self.half_open_max_requests:
+                raise CircuitBreakerOpenError(request=request, retry_after=0)
+
+            circuit.probes_in_flight += 1
+
+    def release(self, base_url: str | httpx.URL, *, success: Optional[bool]) -> None:
+        """Records the outcome of a request that was let through by `acquire()`.
+
+        `success` should be `None` when the outcome doesn't say anything about the health of the API,
+        e.g. when the request was cancelled.
+        """
+        with self._lock:
+            key = str(base_url)
+            circuit = self._circuits.get(key)
+
+            if circuit is not None and circuit.state == "half_open":
+                circuit.probes_in_flight = max(circuit.probes_in_flight - 1, 0)
+
+            if success is None:
+                return
+
+            if success:
+                if circuit is not None:
+                    if circuit.state != "closed":
+                        log.info("Circuit breaker for %s has closed", key)
+                    del self._circuits[key]
+                return
+
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+
+            circuit.consecutive_failures += 1
+            if circuit.state == "half_open" or (
+                circuit.state == "closed" and circuit.consecutive_failures >= self.failure_threshold
+            ):
+                log.warning(
+                    "Circuit breaker for %s has opened after %i consecutive failures",
+                    key,
+                    circuit.consecutive_failures,
+                )
+                circuit.state = "open"
+                circuit.opened_at = self._clock()
+                circuit.probes_in_flight = 0
+
+    def reset(self, base_url: str | httpx.URL | None = None) -> None:
+        """Closes the circuit for the given base URL, or every circuit if no base URL is given"""
+        with self._lock:
+            if base_url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(str(base_url), None)
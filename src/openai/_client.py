@@ -10,11 +10,13 @@ import httpx
 
 from . import _exceptions
 from ._qs import Querystring
+from ._json import JSONCodecLike
 from ._types import (
     Omit,
     Timeout,
     NotGiven,
     Transport,
+    HedgeAfter,
     ProxiesTypes,
     RequestOptions,
     not_given,
@@ -28,12 +30,16 @@ from ._compat import cached_property
 from ._models import FinalRequestOptions
 from ._version import __version__
 from ._streaming import Stream as Stream, AsyncStream as AsyncStream
+from ._coalescing import RequestCoalescer
 from ._exceptions import OpenAIError, APIStatusError
+from ._rate_limit import RateLimiter
 from ._base_client import (
     DEFAULT_MAX_RETRIES,
     SyncAPIClient,
     AsyncAPIClient,
 )
+from ._concurrency import AdaptiveConcurrencyLimiter
+from ._circuit_breaker import CircuitBreaker
 
 if TYPE_CHECKING:
     from .resources import (
@@ -107,12 +113,30 @@ class OpenAI(SyncAPIClient):
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = not_given,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        # Send a duplicate of a non-streaming request if it hasn't completed after this many seconds, or at the
+        # p95 latency of the endpoint with `"auto"`. Only use this for requests that are safe to send twice.
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         # Configure a custom httpx client.
         # We provide a `DefaultHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
+        # Use HTTP/2, which multiplexes concurrent requests over a single connection.
+        # Requires the `http2` extra, e.g. `pip install openai[http2]`, and can't be combined with `http_client`.
+        http2: bool = False,
+        # Configure the JSON library used to serialize request bodies and to parse responses & stream events.
+        # `"auto"` uses `orjson` or `msgspec` when either is installed and otherwise falls back to the standard library.
+        json_codec: JSONCodecLike | None = None,
+        # Pace requests on the client side based on the `x-ratelimit-*` headers returned by the API
+        # so that bursts of requests wait for capacity instead of failing with `429` errors & being retried.
+        rate_limiter: RateLimiter | None = None,
+        # Fail requests immediately instead of retrying them while the API is unavailable.
+        # See `CircuitBreaker` for more details.
+        circuit_breaker: CircuitBreaker | None = None,
+        # Record how long requests wait for a connection from the pool and how long new connections take to open.
+        # See `PoolMetrics` for more details.
+        pool_metrics: bool = False,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -167,10 +191,16 @@ class OpenAI(SyncAPIClient):
             version=__version__,
             base_url=base_url,
             max_retries=max_retries,
+            hedge_after=hedge_after,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             custom_headers=default_headers,
             custom_query=default_query,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=pool_metrics,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -349,7 +379,13 @@ class OpenAI(SyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = not_given,
         http_client: httpx.Client | None = None,
+        http2: bool | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool | None = None,
         max_retries: int | NotGiven = not_given,
+        hedge_after: HedgeAfter | NotGiven = not_given,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -377,7 +413,9 @@ class OpenAI(SyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        if http2 is None:
+            # keep using the same connection pool unless a different protocol was asked for
+            http_client = http_client or self._client
         return self.__class__(
             api_key=api_key or self._api_key_provider or self.api_key,
             organization=organization or self.organization,
@@ -387,7 +425,13 @@ class OpenAI(SyncAPIClient):
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=bool(http2),
+            json_codec=json_codec or self._json_codec,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            circuit_breaker=circuit_breaker or self._circuit_breaker,
+            pool_metrics=self._pool_metrics is not None if pool_metrics is None else pool_metrics,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
+            hedge_after=self.hedge_after if isinstance(hedge_after, NotGiven) else hedge_after,
             default_headers=headers,
             default_query=params,
             **_extra_kwargs,
@@ -458,12 +502,36 @@ class AsyncOpenAI(AsyncAPIClient):
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = not_given,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        # Send a duplicate of a non-streaming request if it hasn't completed after this many seconds, or at the
+        # p95 latency of the endpoint with `"auto"`. Only use this for requests that are safe to send twice.
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         # Configure a custom httpx client.
         # We provide a `DefaultAsyncHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
         http_client: httpx.AsyncClient | None = None,
+        # Use HTTP/2, which multiplexes concurrent requests over a single connection.
+        # Requires the `http2` extra, e.g. `pip install openai[http2]`, and can't be combined with `http_client`.
+        http2: bool = False,
+        # Configure the JSON library used to serialize request bodies and to parse responses & stream events.
+        # `"auto"` uses `orjson` or `msgspec` when either is installed and otherwise falls back to the standard library.
+        json_codec: JSONCodecLike | None = None,
+        # Pace requests on the client side based on the `x-ratelimit-*` headers returned by the API
+        # so that bursts of requests wait for capacity instead of failing with `429` errors & being retried.
+        rate_limiter: RateLimiter | None = None,
+        # Fail requests immediately instead of retrying them while the API is unavailable.
+        # See `CircuitBreaker` for more details.
+        circuit_breaker: CircuitBreaker | None = None,
+        # Record how long requests wait for a connection from the pool and how long new connections take to open.
+        # See `PoolMetrics` for more details.
+        pool_metrics: bool = False,
+        # Limit the number of in-flight requests, adapting the limit based on the latency & errors of responses.
+        # See `AdaptiveConcurrencyLimiter` for more details.
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        # Batch concurrent single-input `embeddings.create()` & `moderations.create()` calls into fewer requests.
+        # See `RequestCoalescer` for more details.
+        coalescer: RequestCoalescer | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -518,14 +586,22 @@ class AsyncOpenAI(AsyncAPIClient):
             version=__version__,
             base_url=base_url,
             max_retries=max_retries,
+            hedge_after=hedge_after,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             custom_headers=default_headers,
             custom_query=default_query,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=pool_metrics,
+            concurrency_limiter=concurrency_limiter,
             _strict_response_validation=_strict_response_validation,
         )
 
         self._default_stream_cls = AsyncStream
+        self._coalescer = coalescer
 
     @cached_property
     def completions(self) -> AsyncCompletions:
@@ -698,9 +774,17 @@ class AsyncOpenAI(AsyncAPIClient):
         webhook_secret: str | None = None,
         websocket_base_url: str | httpx.URL | None = None,
         base_url: str | httpx.URL | None = None,
+        http2: bool | None = None,
         timeout: float | Timeout | None | NotGiven = not_given,
         http_client: httpx.AsyncClient | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
         max_retries: int | NotGiven = not_given,
+        hedge_after: HedgeAfter | NotGiven = not_given,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -728,7 +812,9 @@ class AsyncOpenAI(AsyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        if http2 is None:
+            # keep using the same connection pool unless a different protocol was asked for
+            http_client = http_client or self._client
         return self.__class__(
             api_key=api_key or self._api_key_provider or self.api_key,
             organization=organization or self.organization,
@@ -738,7 +824,15 @@ class AsyncOpenAI(AsyncAPIClient):
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=bool(http2),
+            json_codec=json_codec or self._json_codec,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            circuit_breaker=circuit_breaker or self._circuit_breaker,
+            pool_metrics=self._pool_metrics is not None if pool_metrics is None else pool_metrics,
+            concurrency_limiter=concurrency_limiter or self._concurrency_limiter,
+            coalescer=coalescer or self._coalescer,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
+            hedge_after=self.hedge_after if isinstance(hedge_after, NotGiven) else hedge_after,
             default_headers=headers,
             default_query=params,
             **_extra_kwargs,
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Generic, TypeVar, Callable, Hashable, Optional, Awaitable
+
+import anyio
+
+from ._exceptions import BadRequestError
+
+__all__ = ["RequestCoalescer"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class _Batch(Generic[_T, _R]):
+    def __init__(self) -> None:
+        self.items: List[_T] = []
+        self.results: Optional[List[_R]] = None
+        self.error: Optional[Exception] = None
+        # set if every caller should send its own item, e.g. because the batch was rejected
+        self.send_alone = False
+        self.full = anyio.Event()
+        self.done = anyio.Event()
+
+
+class RequestCoalescer:
+    """Coalesces concurrent single-input `embeddings.create()` & `moderations.create()` calls made
+    with an async client into batched requests.
+
+    The first call for a given model opens a batch and waits up to `max_wait` seconds, or until
+    `max_batch_size` inputs have been added, before the batch is sent as a single request and
+    the result for each input is returned to the call that added it.
+
+    Only calls with a single string input and no per-request options, such as `extra_headers`
+    or `timeout`, are coalesced. As the API only reports the usage of the whole batched request,
+    the `usage` of a coalesced embeddings response is that total split between the inputs in
+    proportion to their length. If the API rejects a batch with a `400` error then every input in
+    it is retried on its own so that one invalid input can't fail the others.
+
+    ```py
+    from openai import AsyncOpenAI, RequestCoalescer
+
+    client = AsyncOpenAI(coalescer=RequestCoalescer(max_wait=0.005))
+    ```
+    """
+
+    def __init__(self, *, max_wait: float = 0.005, max_batch_size: int = 64) -> None:
+        """
+        Args:
+            max_wait: The longest a call waits for other calls to join its batch, in seconds.
+
+            max_batch_size: A batch is sent as soon as it has this many inputs.
+        """
+        if max_wait < 0:
+            raise ValueError(f"Expected max_wait to be a non-negative number but got {max_wait}")
+        if max_batch_size < 1:
+            raise ValueError(f"Expected max_batch_size to be a positive integer but got {max_batch_size}")
+
+        self.max_wait = max_wait
+        self.max_batch_size = max_batch_size
+        self._batches: Dict[Hashable, _Batch[Any, Any]] = {}
+
+        self.requests = 0
+        """The number of batched requests that have been sent"""
+
+        self.coalesced = 0
+        """The number of calls that have been sent as part of a batched request"""
+
+    async def submit(self, key: Hashable, item: _T, send: Callable[[List[_T]], Awaitable[List[_R]]]) -> _R:
+        """Adds the item to the open batch for the given key, returning its result once the batch has been sent.
+
+        `send` is called with every item in the batch and must return a result for each item, in order.
+        """
+        batch = self._batches.get(key)
+        leader = batch is None
+        if batch is None:
+            batch = _Batch[_T, _R]()
+            self._batches[key] = batch
+
+        index = len(batch.items)
+        batch.items.append(item)
+        if len(batch.items) >= self.max_batch_size:
+            self._close(key, batch)
+            batch.full.set()
+
+        if leader:
+            await self._send(key, batch, send)
+        else:
+            await batch.done.wait()
+
+        if batch.send_alone:
+            return (await send([item]))[0]
+
+        if batch.error is not None:
+            raise batch.error
+
+        assert batch.results is not None
+        return batch.results[index]
+
+    def _close(self, key: Hashable, batch: _Batch[Any, Any]) -> None:
+        # stop any more items being added to the batch
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+
+    async def _send(
+        self, key: Hashable, batch: _Batch[_T, _R], send: Callable[[List[_T]], Awaitable[List[_R]]]
+    ) -> None:
+        try:
+            with anyio.move_on_after(self.max_wait):
+                await batch.full.wait()
+            self._close(key, batch)
+
+            if len(batch.items) == 1:
+                # nothing else joined the batch so it's sent like any other call
+                batch.send_alone = True
+                return
+
+            self.requests += 1
+            self.coalesced += len(batch.items)
+            results = await send(batch.items)
+            if len(results) != len(batch.items):
+                raise RuntimeError(
+                    f"Expected {len(batch.items)} results for the batched request but received {len(results)}"
+                )
+
+            batch.results = results
+        except BadRequestError:
+            log.debug("Batched request for %s inputs was rejected, sending each input on its own", len(batch.items))
+            batch.send_alone = True
+        except Exception as exc:
+            batch.error = exc
+        finally:
+            if batch.results is None and batch.error is None:
+                # the batch was cancelled before it could be sent, so every caller sends its own input
+                self._close(key, batch)
+                batch.send_alone = True
+
+            batch.done.set()
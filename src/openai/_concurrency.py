@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import time
+from typing import Deque, Optional
+from collections import deque
+
+import anyio
+import httpx
+
+from ._constants import DEFAULT_CONNECTION_LIMITS
+
+__all__ = ["AdaptiveConcurrencyLimiter"]
+
+# status codes that indicate the API is overloaded and that we should back off
+_OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+# how much weight each new latency sample is given in the moving average
+_LATENCY_SMOOTHING = 0.1
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of in-flight requests made by an async client, adapting the limit to how the API responds.
+
+    The limit is adjusted with an AIMD (additive increase, multiplicative decrease) strategy:
+
+    - while requests succeed without their latency degrading, the limit grows by roughly one
+      request every time a full window of requests completes.
+    - when a request is rate limited (`429`), the API is unavailable (`503`) or a request
+      times out, the limit is multiplied by `backoff_ratio`.
+
+    Requests that can't be sent immediately wait in a FIFO queue.
+
+    ```py
+    from openai import AsyncOpenAI, AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter()
+    client = AsyncOpenAI(concurrency_limiter=limiter)
+
+    ...
+    print(limiter.limit, limiter.in_flight, limiter.queue_depth)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            initial_limit: The number of requests that may be in-flight before any responses have been received.
+
+            min_limit: The limit will never be decreased below this value.
+
+            max_limit: The limit will never be increased above this value, defaults to the maximum number of connections.
+
+            backoff_ratio: The limit is multiplied by this value when the API signals that it is overloaded.
+
+            latency_tolerance: The limit is only increased when the latency of a request is no more than
+                this multiple of the moving average latency.
+        """
+        if max_limit is None:
+            max_limit = DEFAULT_CONNECTION_LIMITS.max_connections or 1000
+
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(
+                f"Expected 1 <= min_limit <= max_limit but got min_limit={min_limit}, max_limit={max_limit}"
+            )
+
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f"Expected backoff_ratio to be between 0 and 1 but got {backoff_ratio}")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[anyio.Event] = deque()
+        self._average_latency: float | None = None
+        self._last_backoff_at = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of in-flight requests"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests that are currently in-flight"""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests that are waiting to be sent"""
+        return len(self._waiters)
+
+    @property
+    def average_latency(self) -> float | None:
+        """The moving average latency of successful requests in seconds"""
+        return self._average_latency
+
+    async def acquire(self) -> float:
+        """Waits until a request can be sent and returns the time at which it was started, to be given to `release()`"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        waiter = anyio.Event()
+        self._waiters.append(waiter)
+        try:
+            await waiter.wait()
+        except BaseException:
+            if waiter.is_set():
+                # we were handed a slot but were cancelled before we could use it
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+        return time.monotonic()
+
+    def release(self, started_at: float, *, response: httpx.Response | None, timed_out: bool = False) -> None:
+        """Marks a request as finished and adjusts the limit based on its outcome.
+
+        If the request failed without a response for any reason other than a timeout then
+        the limit is left unchanged.
+        """
+        now = time.monotonic()
+        saturated = self._in_flight >= self.limit
+        self._in_flight -= 1
+
+        if timed_out or (response is not None and response.status_code in _OVERLOAD_STATUS_CODES):
+            self._backoff(started_at, now=now)
+        elif response is not None and response.status_code < 500:
+            self._record_success(now - started_at, saturated=saturated)
+
+        self._wake_waiters()
+
+    def _backoff(self, started_at: float, *, now: float) -> None:
+        # requests that were sent before the last backoff were sent when the limit was higher so
+        # we've already accounted for them, this avoids collapsing the limit on a burst of errors
+        if started_at < self._last_backoff_at:
+            return
+
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        self._last_backoff_at = now
+
+    def _record_success(self, latency: float, *, saturated: bool) -> None:
+        average = self._average_latency
+        if average is None:
+            self._average_latency = latency
+            return
+
+        self._average_latency = average + _LATENCY_SMOOTHING * (latency - average)
+
+        # there's no point in increasing the limit if we aren't using all of it
+        if saturated and latency <= average * self.latency_tolerance:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft().set()
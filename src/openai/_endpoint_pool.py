@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+import random
+import logging
+import threading
+from typing import Dict, List, Callable, Optional, Sequence
+
+import httpx
+
+__all__ = ["EndpointPool"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+
+class _Endpoint:
+    def __init__(self, base_url: httpx.URL, weight: float) -> None:
+        self.base_url = base_url
+        self.weight = weight
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+
+
+class EndpointPool:
+    """Spreads requests over several base URLs, preferring healthy and lightly loaded ones.
+
+    - an endpoint that responds with a `429` or `5xx` status code, or that can't be reached at all, is
+      taken out of rotation until its `retry-after` delay has passed or, if it didn't give one, for
+      `cooldown` seconds, doubling with each consecutive failure up to `max_cooldown` seconds.
+    - requests are routed to the healthy endpoint with the fewest requests in flight relative to its `weight`,
+      choosing between two candidates that are sampled in proportion to their weights.
+    - if every endpoint is cooling down, requests are sent to whichever endpoint is expected to recover first.
+    """
+
+    def __init__(
+        self,
+        base_urls: Sequence[str | httpx.URL],
+        *,
+        weights: Optional[Sequence[float]] = None,
+        cooldown: float = 1.0,
+        max_cooldown: float = 60.0,
+    ) -> None:
+        if not base_urls:
+            raise ValueError("Expected at least one base URL")
+
+        if weights is None:
+            weights = [1.0] * len(base_urls)
+        elif len(weights) != len(base_urls):
+            raise ValueError(f"Expected {len(base_urls)} weights but got {len(weights)}")
+
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self._endpoints: Dict[str, _Endpoint] = {}
+        for base_url, weight in zip(base_urls, weights):
+            if weight <= 0:
+                raise ValueError(f"Expected the weight for {base_url} to be positive but got {weight}")
+
+            url = httpx.URL(str(base_url))
+            key = str(url)
+            if key in self._endpoints:
+                raise ValueError(f"Duplicate base URL {key}")
+
+            self._endpoints[key] = _Endpoint(url, weight)
+
+        self._lock = threading.Lock()
+        self._clock: Callable[[], float] = time.monotonic
+        self._random = random.Random()
+
+    @property
+    def base_urls(self) -> List[httpx.URL]:
+        return [endpoint.base_url for endpoint in self._endpoints.values()]
+
+    def in_flight(self, base_url: str | httpx.URL) -> int:
+        """Returns the number of requests to the given base URL that have not completed yet"""
+        with self._lock:
+            return self._endpoints[str(base_url)].in_flight
+
+    def is_healthy(self, base_url: str | httpx.URL) -> bool:
+        """Returns whether or not the given base URL is currently in rotation"""
+        with self._lock:
+            return self._endpoints[str(base_url)].unhealthy_until <= self._clock()
+
+    def has_healthy_endpoint(self) -> bool:
+        with self._lock:
+            now = self._clock()
+            return any(endpoint.unhealthy_until <= now for endpoint in self._endpoints.values())
+
+    def find(self, url: str | httpx.URL) -> httpx.URL | None:
+        """Returns the base URL that the given request URL belongs to, if any"""
+        url = httpx.URL(str(url))
+        for endpoint in self._endpoints.values():
+            # the scheme is ignored so that e.g. `wss://` URLs for the realtime API can be matched too
+            base_url = endpoint.base_url
+            if url.host == base_url.host and url.port == base_url.port and url.raw_path.startswith(base_url.raw_path):
+                return base_url
+        return None
+
+    def select(self) -> httpx.URL:
+        """Returns the base URL that the next request should be sent to"""
+        with self._lock:
+            now = self._clock()
+            healthy = [endpoint for endpoint in self._endpoints.values() if endpoint.unhealthy_until <= now]
+            if not healthy:
+                return min(self._endpoints.values(), key=lambda endpoint: endpoint.unhealthy_until).base_url
+
+            candidates: List[_Endpoint] = []
+            while healthy and len(candidates) < 2:
+                (candidate,) = self._random.choices(healthy, weights=[endpoint.weight for endpoint in healthy])
+                healthy.remove(candidate)
+                candidates.append(candidate)
+
+            # `min()` returns the first candidate on ties, which was sampled in proportion to its weight
+            return min(candidates, key=lambda endpoint: endpoint.in_flight / endpoint.weight).base_url
+
+    def acquire(self, base_url: str | httpx.URL) -> None:
+        """Records that a request is being sent to the given base URL.
+
+        Every call must be followed by a call to `release()`.
+        """
+        with self._lock:
+            self._endpoints[str(base_url)].in_flight += 1
+
+    def release(
+        self,
+        base_url: str | httpx.URL,
+        *,
+        success: Optional[bool],
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Records the outcome of a request to the given base URL.
+
+        `success` should be `None` when the outcome doesn't say anything about the health of the endpoint,
+        e.g. when the request was cancelled.
+        """
+        with self._lock:
+            endpoint = self._endpoints[str(base_url)]
+            endpoint.in_flight = max(endpoint.in_flight - 1, 0)
+
+            if success is None:
+                return
+
+            if success:
+                endpoint.consecutive_failures = 0
+                endpoint.unhealthy_until = 0.0
+                return
+
+            endpoint.consecutive_failures += 1
+            if retry_after is None or retry_after <= 0:
+                retry_after = self.cooldown * pow(2.0, min(endpoint.consecutive_failures - 1, 32))
+
+            cooldown = min(retry_after, self.max_cooldown)
+            log.warning("Taking %s out of rotation for %.2f seconds", endpoint.base_url, cooldown)
+            endpoint.unhealthy_until = self._clock() + cooldown
@@ -25,6 +25,7 @@ __all__ = [
     "LengthFinishReasonError",
     "ContentFilterFinishReasonError",
     "InvalidWebhookSignatureError",
+    "CircuitBreakerOpenError",
 ]
 
 
@@ -101,6 +102,20 @@ class APITimeoutError(APIConnectionError):
         super().__init__(message="Request timed out.", request=request)
 
 
+class CircuitBreakerOpenError(APIConnectionError):
+    """Raised instead of sending a request while the circuit breaker for the client's base URL is open."""
+
+    retry_after: float
+    """The number of seconds until requests will be let through again to probe whether the API has recovered"""
+
+    def __init__(self, *, request: httpx.Request, retry_after: float) -> None:
+        super().__init__(
+            message=f"Circuit breaker is open after repeated failures, retry in {retry_after:.1f} seconds.",
+            request=request,
+        )
+        self.retry_after = retry_after
+
+
 class BadRequestError(APIStatusError):
     status_code: Literal[400] = 400  # pyright: ignore[reportIncompatibleVariableOverride]
 
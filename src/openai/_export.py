@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Type, Tuple, TypeVar, Optional, cast
+from typing_extensions import Literal, TypeAlias, override
+
+from ._json import JSONCodec
+from ._extras import pyarrow
+from ._models import BaseModel, construct_type
+
+if TYPE_CHECKING:
+    from ._base_client import BasePage
+
+__all__ = ["ExportFormat", "ExportWriter", "open_export_writer", "item_to_raw", "raw_page"]
+
+ExportFormat: TypeAlias = Literal["jsonl", "arrow"]
+
+RawItem: TypeAlias = Dict[str, object]
+
+_PageT = TypeVar("_PageT", bound="BasePage[Any]")
+
+
+def item_to_raw(item: object) -> RawItem:
+    """Converts an item that has already been parsed back to the dictionary the API returned"""
+    if isinstance(item, BaseModel):
+        return item.to_dict(mode="json")
+    if isinstance(item, dict):
+        return item  # type: ignore[return-value]
+    raise TypeError(f"Expected a paginated item to be a model or a dictionary but received {type(item)}")
+
+
+def raw_page(page_cls: Type[_PageT], body: object) -> Tuple[List[RawItem], _PageT]:
+    """Splits a raw page response body into its items and a page that can be used to request the
+    next page.
+
+    Only the last item is parsed, as that's all that's needed to determine the cursor for the next
+    page, so the cost of parsing a page doesn't depend on how many items it contains.
+    """
+    if not isinstance(body, dict):
+        raise TypeError(f"Expected a paginated response body to be a dictionary but received {type(body)}")
+
+    fields = cast(Dict[str, Any], body)
+    items = fields.get("data")
+    if items is None:
+        items = []
+    if not isinstance(items, list):
+        raise TypeError(f"Expected the `data` of a paginated response to be a list but received {type(items)}")
+
+    raw_items = cast(List[RawItem], items)
+    page = cast(_PageT, construct_type(type_=page_cls, value={**fields, "data": raw_items[-1:]}))
+    return raw_items, page
+
+
+class ExportWriter(ABC):
+    """Writes pages of raw items to a file"""
+
+    @abstractmethod
+    def write(self, items: List[RawItem]) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class _JSONLWriter(ExportWriter):
+    def __init__(self, path: str | os.PathLike[str], *, json_codec: JSONCodec) -> None:
+        self._json_codec = json_codec
+        self._file: IO[bytes] = open(path, "wb")
+
+    @override
+    def write(self, items: List[RawItem]) -> None:
+        dumps = self._json_codec.dumps
+        self._file.write(b"".join([dumps(item) + b"\n" for item in items]))
+
+    @override
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowWriter(ExportWriter):
+    def __init__(self, path: str | os.PathLike[str], *, schema: Optional[Any]) -> None:
+        self._path = os.fspath(path)
+        self._schema = schema
+        self._writer: Any = None
+
+        if schema is not None:
+            self._writer = pyarrow.ipc.new_file(self._path, schema)
+
+    @override
+    def write(self, items: List[RawItem]) -> None:
+        if not items:
+            return
+
+        if self._writer is None:
+            # the schema is inferred from the first page, later pages are converted to it
+            batch = pyarrow.RecordBatch.from_pylist(items)
+            self._schema = batch.schema
+            self._writer = pyarrow.ipc.new_file(self._path, batch.schema)
+        else:
+            batch = pyarrow.RecordBatch.from_pylist(items, schema=self._schema)
+
+        self._writer.write_batch(batch)
+
+    @override
+    def close(self) -> None:
+        if self._writer is None:
+            # there were no items to infer a schema from
+            self._writer = pyarrow.ipc.new_file(self._path, pyarrow.schema([]))
+
+        self._writer.close()
+
+
+def open_export_writer(
+    path: str | os.PathLike[str],
+    *,
+    format: ExportFormat,
+    json_codec: JSONCodec,
+    schema: Optional[Any] = None,
+) -> ExportWriter:
+    if format == "jsonl":
+        if schema is not None:
+            raise ValueError("A `schema` can only be given when exporting to the `arrow` format")
+        return _JSONLWriter(path, json_codec=json_codec)
+
+    if format == "arrow":
+        return _ArrowWriter(path, schema=schema)
+
+    raise ValueError(f"Unsupported export format {format!r}, expected one of 'jsonl' or 'arrow'")
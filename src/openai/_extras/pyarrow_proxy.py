@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from typing_extensions import override
+
+from .._utils import LazyProxy
+from ._common import MissingDependencyError, format_instructions
+
+if TYPE_CHECKING:
+    # `pyarrow` doesn't ship type stubs so importing it here would only give us unknown types
+    pyarrow: Any
+
+
+PYARROW_INSTRUCTIONS = format_instructions(library="pyarrow", extra="arrow")
+
+
+class PyArrowProxy(LazyProxy[Any]):
+    @override
+    def __load__(self) -> Any:
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.ipc  # type: ignore
+        except ImportError as err:
+            raise MissingDependencyError(PYARROW_INSTRUCTIONS) from err
+
+        return pyarrow
+
+
+if not TYPE_CHECKING:
+    pyarrow = PyArrowProxy()
@@ -3,8 +3,8 @@ from __future__ import annotations
 import io
 import os
 import pathlib
-from typing import overload
-from typing_extensions import TypeGuard
+from typing import IO, Union, Optional, cast, overload
+from typing_extensions import TypeGuard, override
 
 import anyio
 
@@ -38,6 +38,110 @@ def assert_is_file_content(obj: object, *, key: str | None = None) -> None:
         ) from None
 
 
+class FileRange(io.RawIOBase):
+    """A readable & seekable view of `length` bytes of a file, or of an in-memory buffer, starting at `offset`.
+
+    This allows a file to be streamed as a request body without reading it into memory. Files are only
+    opened while they're being read, so that many ranges can be created up front without exhausting
+    file descriptors, and the range can be rewound with `.seek(0)` if the request has to be retried.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike[str], bytes],
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self._source: Union[str, bytes] = file if isinstance(file, bytes) else os.fspath(file)
+        self._offset = offset
+        self._length = length
+        self._position = 0
+        self._handle: Optional[io.FileIO] = None
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self._source) if isinstance(self._source, str) else "upload"
+
+    @property
+    def size(self) -> int:
+        if self._length is None:
+            total = len(self._source) if isinstance(self._source, bytes) else os.stat(self._source).st_size
+            self._length = max(total - self._offset, 0)
+        return self._length
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def tell(self) -> int:
+        return self._position
+
+    @override
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        if position != self._position:
+            self._close_handle()
+        self._position = position
+        return position
+
+    @override
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        remaining = self.size - self._position
+        if remaining <= 0:
+            self._close_handle()
+            return 0
+
+        view = memoryview(buffer).cast("B")[:remaining]
+
+        if isinstance(self._source, bytes):
+            start = self._offset + self._position
+            count = len(view)
+            view[:count] = memoryview(self._source)[start : start + count]
+        else:
+            if self._handle is None:
+                self._handle = io.FileIO(self._source)
+                self._handle.seek(self._offset + self._position)
+            count = self._handle.readinto(view) or 0
+
+        self._position += count
+        if count == remaining:
+            # release the file as soon as the whole range has been read
+            self._close_handle()
+        return count
+
+    @override
+    def close(self) -> None:
+        self._close_handle()
+        super().close()
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def _stream_file(path: os.PathLike[str]) -> IO[bytes]:
+    # `httpx` streams file objects in chunks instead of loading them into memory
+    return cast(IO[bytes], FileRange(path))
+
+
 @overload
 def to_httpx_files(files: None) -> None: ...
 
@@ -64,7 +168,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
             path = pathlib.Path(file)
-            return (path.name, path.read_bytes())
+            return (path.name, _stream_file(path))
 
         return file
 
@@ -76,7 +180,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
 
 def read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return pathlib.Path(file).read_bytes()
+        return _stream_file(file)
     return file
 
 
@@ -105,6 +209,8 @@ async def async_to_httpx_files(files: RequestFiles | None) -> HttpxRequestFiles
 async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
+            # `httpx` reads file objects synchronously, even when sending async requests, so the
+            # file is read in a worker thread instead of being streamed from the event loop
             path = anyio.Path(file)
             return (path.name, await path.read_bytes())
 
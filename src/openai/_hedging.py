@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import re
+import math
+import threading
+from typing import TYPE_CHECKING, Dict, Deque
+from collections import deque
+
+import httpx
+
+if TYPE_CHECKING:
+    from ._models import FinalRequestOptions
+
+__all__ = ["LatencyTracker", "endpoint_key", "copy_request", "is_safe_to_hedge", "HEDGE_IDEMPOTENCY_HEADER"]
+
+# sent with both attempts of a hedged request if the client doesn't already send idempotency keys
+HEDGE_IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# path segments that are resource IDs, e.g. `file-abc123` or `vs_abc123`, rather than part of the endpoint
+_ID_SEGMENT = re.compile(r"\d|^[A-Za-z]+[_-][A-Za-z0-9]{16,}$")
+
+# `POST` endpoints that don't have any side effects, so sending a request to them twice is harmless
+_SIDE_EFFECT_FREE_POST_PATHS = ("/embeddings", "/moderations", "/responses/input_tokens")
+
+
+def _path(options: FinalRequestOptions) -> str:
+    return httpx.URL(options.url).path
+
+
+def endpoint_key(options: FinalRequestOptions) -> str:
+    """Returns the method & path template of the request, e.g. `GET /files/{id}`, so that requests
+    for different resources are tracked as a single endpoint.
+    """
+    segments = ["{id}" if _ID_SEGMENT.search(segment) else segment for segment in _path(options).split("/")]
+    return f"{options.method.upper()} {'/'.join(segments)}"
+
+
+def is_safe_to_hedge(options: FinalRequestOptions) -> bool:
+    """Whether sending the request twice is harmless, i.e. it's a `GET` or a `POST` without side effects"""
+    method = options.method.lower()
+    if method == "get":
+        return True
+
+    return method == "post" and _path(options).endswith(_SIDE_EFFECT_FREE_POST_PATHS)
+
+
+def copy_request(request: httpx.Request) -> httpx.Request:
+    """Returns a copy of the given request that can be sent concurrently with the original.
+
+    Note: this should only be used for requests with a body that has already been read, i.e. not file uploads.
+    """
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        content=request.content,
+        extensions=request.extensions,
+    )
+
+
+class LatencyTracker:
+    """Tracks the latency of recent requests to each endpoint so that `hedge_after="auto"` can hedge at the p95 latency."""
+
+    def __init__(self, *, window: int = 100, min_samples: int = 20, max_endpoints: int = 256) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self.max_endpoints = max_endpoints
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                if len(self._samples) >= self.max_endpoints:
+                    # evict the endpoint we started tracking the longest time ago
+                    del self._samples[next(iter(self._samples))]
+
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+
+            samples.append(latency)
+
+    def percentile(self, endpoint: str, percentile: float = 0.95) -> float | None:
+        """Returns the given percentile of the recent latencies for the endpoint, or `None` if there aren't enough samples"""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+
+            ordered = sorted(samples)
+
+        return ordered[min(len(ordered) - 1, math.ceil(percentile * len(ordered)) - 1)]
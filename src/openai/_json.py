@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union, Callable
+from typing_extensions import Literal, Protocol, TypeAlias, get_args, override, runtime_checkable
+
+from ._extras._common import MissingDependencyError, format_instructions
+
+FAST_JSON_INSTRUCTIONS = format_instructions(library="orjson", extra="fast_json")
+
+
+@runtime_checkable
+class JSONCodec(Protocol):
+    """Serializes request bodies and deserializes response bodies & stream events."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize the given object to UTF-8 encoded JSON"""
+        ...
+
+    def loads(self, data: str | bytes) -> Any:
+        """Deserialize the given JSON document"""
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    """A codec backed by the standard library `json` module.
+
+    The output of `dumps()` matches the body that `httpx` builds for `json=` arguments.
+    """
+
+    @override
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """A codec backed by [orjson](https://github.com/ijl/orjson)."""
+
+    _dumps: Callable[[Any], bytes]
+    _loads: Callable[[Union[str, bytes]], Any]
+
+    def __init__(self) -> None:
+        try:
+            import orjson  # type: ignore[import-not-found]  # pyright: ignore[reportMissingImports]
+        except ImportError as err:
+            raise MissingDependencyError(FAST_JSON_INSTRUCTIONS) from err
+
+        lib: Any = orjson
+        self._dumps = lib.dumps
+        self._loads = lib.loads
+
+    @override
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        return self._loads(data)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class MsgspecCodec(JSONCodec):
+    """A codec backed by [msgspec](https://github.com/jcrist/msgspec)."""
+
+    _encode: Callable[[Any], bytes]
+    _decode: Callable[[Union[str, bytes]], Any]
+
+    def __init__(self) -> None:
+        try:
+            import msgspec  # type: ignore[import-not-found]  # pyright: ignore[reportMissingImports]
+        except ImportError as err:
+            raise MissingDependencyError(format_instructions(library="msgspec", extra="fast_json")) from err
+
+        lib: Any = msgspec
+        self._encode = lib.json.Encoder().encode
+        self._decode = lib.json.Decoder().decode
+
+    @override
+    def dumps(self, obj: Any) -> bytes:
+        return self._encode(obj)
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        return self._decode(data)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+JSONCodecName: TypeAlias = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+JSONCodecLike: TypeAlias = Union[JSONCodec, JSONCodecName]
+
+
+def resolve_json_codec(codec: JSONCodecLike | None) -> JSONCodec:
+    """Returns the codec to use for the given client option.
+
+    `"auto"` picks the fastest installed backend, preferring orjson, then msgspec
+    and finally falling back to the standard library.
+    """
+    if codec is None or codec == "stdlib":
+        return _STDLIB_CODEC
+
+    if codec == "orjson":
+        return OrjsonCodec()
+
+    if codec == "msgspec":
+        return MsgspecCodec()
+
+    if codec == "auto":
+        for codec_cls in (OrjsonCodec, MsgspecCodec):
+            try:
+                return codec_cls()
+            except MissingDependencyError:
+                pass
+
+        return _STDLIB_CODEC
+
+    if not isinstance(codec, JSONCodec):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(
+            f"Invalid `json_codec` argument; Expected one of {get_args(JSONCodecName)} or an object with `dumps()` & `loads()` methods but got {codec!r}"
+        )
+
+    return codec
+
+
+_STDLIB_CODEC = StdlibJSONCodec()
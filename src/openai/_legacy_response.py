@@ -307,7 +307,7 @@ class LegacyAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = self._client._json_codec.loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -329,7 +329,7 @@ class LegacyAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = self._client._json_codec.loads(response.content)
 
         return self._client._process_response_data(
             data=data,
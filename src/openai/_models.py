@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import os
 import inspect
+import weakref
 from typing import TYPE_CHECKING, Any, Type, Tuple, Union, Generic, TypeVar, Callable, Optional, cast
 from datetime import date, datetime
+from collections import OrderedDict
 from typing_extensions import (
     List,
     Unpack,
@@ -32,6 +34,7 @@ from ._types import (
     Timeout,
     NotGiven,
     AnyMapping,
+    HedgeAfter,
     HttpxRequestFiles,
 )
 from ._utils import (
@@ -211,34 +214,31 @@ class BaseModel(pydantic.BaseModel):
         m = __cls.__new__(__cls)
         fields_values: dict[str, object] = {}
 
-        config = get_model_config(__cls)
-        populate_by_name = (
-            config.allow_population_by_field_name
-            if isinstance(config, _ConfigProtocol)
-            else config.get("populate_by_name")
-        )
+        plan = _get_model_construct_plan(__cls)
+        populate_by_name = plan.populate_by_name
 
         if _fields_set is None:
             _fields_set = set()
 
-        model_fields = get_model_fields(__cls)
-        for name, field in model_fields.items():
-            key = field.alias
+        for name, alias, field, construct_field in plan.fields:
+            key = alias
             if key is None or (key not in values and populate_by_name):
                 key = name
 
             if key in values:
-                fields_values[name] = _construct_field(value=values[key], field=field, key=key)
+                value = values[key]
+                fields_values[name] = field_get_default(field) if value is None else construct_field(value)
                 _fields_set.add(name)
             else:
                 fields_values[name] = field_get_default(field)
 
-        extra_field_type = _get_extra_fields_type(__cls)
+        model_fields = plan.model_fields
+        construct_extra = plan.construct_extra
 
         _extra = {}
         for key, value in values.items():
             if key not in model_fields:
-                parsed = construct_type(value=value, type_=extra_field_type) if extra_field_type is not None else value
+                parsed = construct_extra(value) if construct_extra is not None else value
 
                 if PYDANTIC_V1:
                     _fields_set.add(key)
@@ -390,19 +390,64 @@ class BaseModel(pydantic.BaseModel):
             )
 
 
-def _construct_field(value: object, field: FieldInfo, key: str) -> object:
-    if value is None:
-        return field_get_default(field)
+class _ModelConstructPlan:
+    """The pre-computed field details that `BaseModel.construct()` needs for a given model class"""
+
+    model_fields: dict[str, FieldInfo]
+    populate_by_name: bool
+    fields: list[tuple[str, str | None, FieldInfo, TypeConstructor]]
+    construct_extra: TypeConstructor | None
+
+    def __init__(self, model: type[pydantic.BaseModel]) -> None:
+        # note: this has to happen first as it may trigger a deferred model build
+        # which can replace the model fields
+        extra_field_type = _get_extra_fields_type(model)
+
+        config = get_model_config(model)
+        self.populate_by_name = bool(
+            config.allow_population_by_field_name
+            if isinstance(config, _ConfigProtocol)
+            else config.get("populate_by_name")
+        )
+        self.model_fields = get_model_fields(model)
+        self.fields = [
+            (name, field.alias, field, _build_field_constructor(field, name))
+            for name, field in self.model_fields.items()
+        ]
+        self.construct_extra = get_type_constructor(extra_field_type) if extra_field_type is not None else None
+
+
+# keyed on the model class itself so that dynamically created models can still be garbage collected
+_model_construct_plans: weakref.WeakKeyDictionary[type, _ModelConstructPlan] = weakref.WeakKeyDictionary()
+
+
+def _get_model_construct_plan(model: type[pydantic.BaseModel]) -> _ModelConstructPlan:
+    plan = _model_construct_plans.get(model)
 
+    # the model fields are replaced if the model is rebuilt, e.g. once forward references can be resolved
+    if plan is None or plan.model_fields is not get_model_fields(model):
+        plan = _ModelConstructPlan(model)
+        _model_construct_plans[model] = plan
+
+    return plan
+
+
+def _build_field_constructor(field: FieldInfo, name: str) -> TypeConstructor:
+    type_: object
     if PYDANTIC_V1:
-        type_ = cast(type, field.outer_type_)  # type: ignore
+        type_ = cast(object, field.outer_type_)  # type: ignore
     else:
-        type_ = field.annotation  # type: ignore
+        type_ = field.annotation
 
     if type_ is None:
-        raise RuntimeError(f"Unexpected field type is None for {key}")
 
-    return construct_type(value=value, type_=type_, metadata=getattr(field, "metadata", None))
+        def construct_untyped_field(value: object) -> object:  # noqa: ARG001
+            raise RuntimeError(f"Unexpected field type is None for {field.alias or name}")
+
+        return construct_untyped_field
+
+    metadata = getattr(field, "metadata", None)
+    return get_type_constructor(type_, metadata=tuple(metadata) if metadata else ())
 
 
 def _get_extra_fields_type(cls: type[pydantic.BaseModel]) -> type | None:
@@ -478,7 +523,109 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
 
     If the given value does not match the expected type then it is returned as-is.
     """
+    return get_type_constructor(type_, metadata=tuple(metadata) if metadata else ())(value)
+
+
+TypeConstructor = Callable[[object], object]
+
+_TypeConstructorKey = Tuple[int, Tuple[Any, ...]]
+
+
+class _TypeConstructorCache:
+    """A bounded cache of type constructors that evicts the least recently used entry once it's full.
+
+    Each entry keeps a reference to its type so that the type's `id()` can't be reused while it is cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[_TypeConstructorKey, tuple[object, TypeConstructor]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
+    def get(self, key: _TypeConstructorKey) -> TypeConstructor | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # the entry was evicted by another thread
+            pass
+
+        return entry[1]
+
+    def set(self, key: _TypeConstructorKey, type_: object, constructor: TypeConstructor) -> None:
+        self._entries[key] = (type_, constructor)
+
+        while len(self._entries) > self.maxsize:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                break
+
+
+_type_constructors = _TypeConstructorCache(maxsize=4096)
+
+
+def get_type_constructor(type_: object, *, metadata: tuple[Any, ...] = ()) -> TypeConstructor:
+    """Returns a function that performs the same coercion as `construct_type()` for the given type.
+
+    The type is only inspected the first time this is called, the resulting function
+    is cached so that subsequent calls are just a dictionary lookup.
+    """
+    return _get_type_constructor(type_, metadata, compiling={})
+
+
+def _get_type_constructor(
+    type_: object,
+    metadata: tuple[Any, ...],
+    *,
+    compiling: dict[_TypeConstructorKey, TypeConstructor],
+) -> TypeConstructor:
+    # we key on the identity of the type as some types compare equal even though they
+    # should be constructed differently, e.g. `Union[A, B] == Union[B, A]`
+    key = (id(type_), metadata)
+    try:
+        cached = _type_constructors.get(key)
+    except TypeError:
+        # the metadata isn't hashable so we can't cache anything
+        return _build_type_constructor(type_, metadata, compiling=compiling)
+
+    if cached is not None:
+        return cached
+
+    pending = compiling.get(key)
+    if pending is not None:
+        # this is a recursive type, e.g. `JSONValue = Union[str, List[JSONValue]]`,
+        # so we hand out a function that defers to the constructor once it has been built
+        return pending
+
+    resolved: list[TypeConstructor] = []
+
+    def construct_recursive(value: object) -> object:
+        return resolved[0](value)
+
+    compiling[key] = construct_recursive
+    try:
+        constructor = _build_type_constructor(type_, metadata, compiling=compiling)
+    finally:
+        del compiling[key]
+
+    resolved.append(constructor)
+
+    _type_constructors.set(key, type_, constructor)
+    return constructor
+
+
+def _build_type_constructor(
+    type_: object,
+    metadata: tuple[Any, ...],
+    *,
+    compiling: dict[_TypeConstructorKey, TypeConstructor],
+) -> TypeConstructor:
     # store a reference to the original type we were given before we extract any inner
     # types so that we can properly resolve forward references in `TypeAliasType` annotations
     original_type = None
@@ -491,8 +638,8 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
         type_ = type_.__value__  # type: ignore[unreachable]
 
     # unwrap `Annotated[T, ...]` -> `T`
-    if metadata is not None and len(metadata) > 0:
-        meta: tuple[Any, ...] = tuple(metadata)
+    if len(metadata) > 0:
+        meta: tuple[Any, ...] = metadata
     elif is_annotated_type(type_):
         meta = get_args(type_)[1:]
         type_ = extract_type_arg(type_, 0)
@@ -505,8 +652,120 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
     args = get_args(type_)
 
     if is_union(origin):
+        return _build_union_constructor(
+            union=type_,
+            validation_type=cast("type[object]", original_type or type_),
+            meta=meta,
+            compiling=compiling,
+        )
+
+    if origin == dict:
+        # Dict[_, items_type]
+        construct_item = _get_type_constructor(args[1] if len(args) == 2 else object, (), compiling=compiling)
+
+        if construct_item is _construct_as_is:
+
+            def construct_dict(value: object) -> object:
+                return dict(value) if is_mapping(value) else value
+
+        else:
+
+            def construct_dict(value: object) -> object:
+                if not is_mapping(value):
+                    return value
+
+                return {key: construct_item(item) for key, item in value.items()}
+
+        return construct_dict
+
+    if (
+        not is_literal_type(type_)
+        and inspect.isclass(origin)
+        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
+    ):
+        model = cast(Any, type_)
+
+        def construct_model(value: object) -> object:
+            if is_list(value):
+                return [model.construct(**entry) if is_mapping(entry) else entry for entry in value]
+
+            if is_mapping(value):
+                return model.construct(**value)
+
+            return value
+
+        return construct_model
+
+    if origin == list:
+        # List[inner_type]
+        construct_entry = _get_type_constructor(args[0] if args else object, (), compiling=compiling)
+
+        if construct_entry is _construct_as_is:
+
+            def construct_list(value: object) -> object:
+                return list(value) if is_list(value) else value
+
+        else:
+
+            def construct_list(value: object) -> object:
+                if not is_list(value):
+                    return value
+
+                return [construct_entry(entry) for entry in value]
+
+        return construct_list
+
+    if origin == float:
+        return _construct_float
+
+    if type_ == datetime:
+        return _construct_datetime
+
+    if type_ == date:
+        return _construct_date
+
+    return _construct_as_is
+
+
+def _build_union_constructor(
+    *,
+    union: type,
+    validation_type: type[object],
+    meta: tuple[Any, ...],
+    compiling: dict[_TypeConstructorKey, TypeConstructor],
+) -> TypeConstructor:
+    variants = [_get_type_constructor(variant, (), compiling=compiling) for variant in get_args(union)]
+
+    # the discriminator is only resolved the first time some data fails validation as
+    # it requires building the schema for every variant
+    discriminator: DiscriminatorDetails | None = None
+    discriminated_variants: dict[str, TypeConstructor] = {}
+    discriminator_resolved = False
+
+    def get_discriminated_variant(value: AnyMapping) -> TypeConstructor | None:
+        nonlocal discriminator, discriminated_variants, discriminator_resolved
+
+        if not discriminator_resolved:
+            discriminator = _build_discriminated_union_meta(union=union, meta_annotations=meta)
+            if discriminator:
+                discriminated_variants = {
+                    variant_value: get_type_constructor(variant_type)
+                    for variant_value, variant_type in discriminator.mapping.items()
+                }
+            discriminator_resolved = True
+
+        if discriminator is None:
+            return None
+
+        variant_value = value.get(discriminator.field_alias_from or discriminator.field_name)
+        if variant_value and isinstance(variant_value, str):
+            return discriminated_variants.get(variant_value)
+
+        return None
+
+    def construct_union(value: object) -> object:
         try:
-            return validate_type(type_=cast("type[object]", original_type or type_), value=value)
+            return validate_type(type_=validation_type, value=value)
         except Exception:
             pass
 
@@ -524,73 +783,49 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
         #
         # without this block, if the data we get is something like `{'kind': 'bar', 'value': 'foo'}` then
         # we'd end up constructing `FooType` when it should be `BarType`.
-        discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=meta)
-        if discriminator and is_mapping(value):
-            variant_value = value.get(discriminator.field_alias_from or discriminator.field_name)
-            if variant_value and isinstance(variant_value, str):
-                variant_type = discriminator.mapping.get(variant_value)
-                if variant_type:
-                    return construct_type(type_=variant_type, value=value)
+        if is_mapping(value):
+            construct_variant = get_discriminated_variant(value)
+            if construct_variant is not None:
+                return construct_variant(value)
 
         # if the data is not valid, use the first variant that doesn't fail while deserializing
-        for variant in args:
+        for construct_variant in variants:
             try:
-                return construct_type(value=value, type_=variant)
+                return construct_variant(value)
             except Exception:
                 continue
 
-        raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
+        raise RuntimeError(f"Could not convert data into a valid instance of {union}")
 
-    if origin == dict:
-        if not is_mapping(value):
-            return value
-
-        _, items_type = get_args(type_)  # Dict[_, items_type]
-        return {key: construct_type(value=item, type_=items_type) for key, item in value.items()}
+    return construct_union
 
-    if (
-        not is_literal_type(type_)
-        and inspect.isclass(origin)
-        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
-    ):
-        if is_list(value):
-            return [cast(Any, type_).construct(**entry) if is_mapping(entry) else entry for entry in value]
 
-        if is_mapping(value):
-            if issubclass(type_, BaseModel):
-                return type_.construct(**value)  # type: ignore[arg-type]
+def _construct_as_is(value: object) -> object:
+    return value
 
-            return cast(Any, type_).construct(**value)
 
-    if origin == list:
-        if not is_list(value):
+def _construct_float(value: object) -> object:
+    if isinstance(value, int):
+        coerced = float(value)
+        if coerced != value:
             return value
+        return coerced
 
-        inner_type = args[0]  # List[inner_type]
-        return [construct_type(value=entry, type_=inner_type) for entry in value]
+    return value
 
-    if origin == float:
-        if isinstance(value, int):
-            coerced = float(value)
-            if coerced != value:
-                return value
-            return coerced
 
+def _construct_datetime(value: object) -> object:
+    try:
+        return parse_datetime(value)  # type: ignore
+    except Exception:
         return value
 
-    if type_ == datetime:
-        try:
-            return parse_datetime(value)  # type: ignore
-        except Exception:
-            return value
-
-    if type_ == date:
-        try:
-            return parse_date(value)  # type: ignore
-        except Exception:
-            return value
 
-    return value
+def _construct_date(value: object) -> object:
+    try:
+        return parse_date(value)  # type: ignore
+    except Exception:
+        return value
 
 
 @runtime_checkable
@@ -808,6 +1043,7 @@ class FinalRequestOptionsInput(TypedDict, total=False):
     json_data: Body
     extra_json: AnyMapping
     follow_redirects: bool
+    hedge_after: HedgeAfter
 
 
 @final
@@ -822,6 +1058,7 @@ class FinalRequestOptions(pydantic.BaseModel):
     idempotency_key: Union[str, None] = None
     post_parser: Union[Callable[[Any], Any], NotGiven] = NotGiven()
     follow_redirects: Union[bool, None] = None
+    hedge_after: Union[float, Literal["auto"], None, NotGiven] = NotGiven()
 
     # It should be noted that we cannot use `json` here as that would override
     # a BaseModel method in an incompatible fashion.
@@ -840,6 +1077,11 @@ class FinalRequestOptions(pydantic.BaseModel):
             return max_retries
         return self.max_retries
 
+    def get_hedge_after(self, hedge_after: HedgeAfter) -> HedgeAfter:
+        if isinstance(self.hedge_after, NotGiven):
+            return hedge_after
+        return self.hedge_after
+
     def _strip_raw_response_header(self) -> None:
         if not is_given(self.headers):
             return
@@ -0,0 +1,830 @@
+from __future__ import annotations
+
+import time
+import heapq
+import inspect
+import logging
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Set,
+    Dict,
+    List,
+    Tuple,
+    Generic,
+    TypeVar,
+    Callable,
+    Optional,
+    Awaitable,
+    Generator,
+)
+from typing_extensions import override
+from concurrent.futures import Future, CancelledError, ThreadPoolExecutor
+
+import anyio
+import anyio.abc
+
+from ._types import Omit, omit
+from ._utils import is_given
+from ._legacy_response import LegacyAPIResponse
+
+if TYPE_CHECKING:
+    from ._client import OpenAI, AsyncOpenAI
+    from .types.batch import Batch
+    from .types.video import Video
+    from .types.file_object import FileObject
+    from .types.beta.threads.run import Run
+    from .types.vector_stores.vector_store_file import VectorStoreFile
+    from .types.vector_stores.vector_store_file_batch import VectorStoreFileBatch
+
+__all__ = ["Poller", "AsyncPoller", "AsyncPollHandle"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_JobT = TypeVar("_JobT", bound="_Job")
+
+_RUN_TERMINAL_STATES = {"requires_action", "cancelled", "completed", "failed", "expired", "incomplete"}
+_FILE_TERMINAL_STATES = {"processed", "error", "deleted"}
+_BATCH_TERMINAL_STATES = {"failed", "completed", "expired", "cancelled"}
+
+
+def _is_run_done(run: Run) -> bool:
+    return run.status in _RUN_TERMINAL_STATES
+
+
+def _is_video_done(video: Video) -> bool:
+    return video.status != "in_progress" and video.status != "queued"
+
+
+def _is_vector_store_file_done(file: VectorStoreFile) -> bool:
+    return file.status != "in_progress"
+
+
+def _is_file_batch_done(batch: VectorStoreFileBatch) -> bool:
+    return batch.file_counts.in_progress == 0
+
+
+def _is_file_done(file: FileObject) -> bool:
+    return file.status in _FILE_TERMINAL_STATES
+
+
+def _is_batch_done(batch: Batch) -> bool:
+    return batch.status in _BATCH_TERMINAL_STATES
+
+
+class _Job(ABC):
+    def __init__(self, *, poll_interval_ms: int | Omit) -> None:
+        self.headers: Dict[str, str] = {"X-Stainless-Poll-Helper": "true"}
+        self.interval: Optional[float] = None
+        if is_given(poll_interval_ms):
+            self.headers["X-Stainless-Custom-Poll-Interval"] = str(poll_interval_ms)
+            self.interval = poll_interval_ms / 1000
+
+    @abstractmethod
+    def cancelled(self) -> bool:
+        """Whether the job has been resolved or cancelled, in which case it shouldn't be retrieved again"""
+
+    def next_interval(self, response: LegacyAPIResponse[Any], default: float) -> float:
+        if self.interval is not None:
+            return self.interval
+
+        from_header = response.headers.get("openai-poll-after-ms")
+        if from_header is not None:
+            try:
+                return int(from_header) / 1000
+            except ValueError:
+                log.debug("Ignoring invalid openai-poll-after-ms header: %s", from_header)
+
+        return default
+
+
+class _Schedule(Generic[_JobT]):
+    """Orders jobs by when they should next be retrieved, spacing the retrieves out to fit the request budget"""
+
+    def __init__(self, max_requests_per_second: Optional[float]) -> None:
+        self._heap: List[Tuple[float, int, _JobT]] = []
+        self._counter = itertools.count()
+        self._spacing = 0.0 if max_requests_per_second is None else 1 / max_requests_per_second
+        self._next_slot = 0.0
+
+    def push(self, job: _JobT, at: float) -> None:
+        heapq.heappush(self._heap, (at, next(self._counter), job))
+
+    def next_due(self) -> Optional[float]:
+        """Returns when the next job can be retrieved, or `None` if there aren't any jobs waiting"""
+        while self._heap and self._heap[0][2].cancelled():
+            heapq.heappop(self._heap)
+
+        if not self._heap:
+            return None
+
+        return max(self._heap[0][0], self._next_slot)
+
+    def pop(self, now: float) -> Optional[_JobT]:
+        """Returns the next job if it's due and the request budget allows it to be retrieved now"""
+        due = self.next_due()
+        if due is None or due > now:
+            return None
+
+        self._next_slot = now + self._spacing
+        return heapq.heappop(self._heap)[2]
+
+
+def _validate(*, max_concurrency: int, max_requests_per_second: Optional[float], poll_interval: float) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f"Expected max_concurrency to be a positive integer but got {max_concurrency}")
+    if max_requests_per_second is not None and max_requests_per_second <= 0:
+        raise ValueError(f"Expected max_requests_per_second to be a positive number but got {max_requests_per_second}")
+    if poll_interval < 0:
+        raise ValueError(f"Expected poll_interval to be a non-negative number but got {poll_interval}")
+
+
+class _SyncJob(_Job):
+    def __init__(
+        self,
+        retrieve: Callable[[Dict[str, str]], LegacyAPIResponse[Any]],
+        *,
+        is_done: Callable[[Any], bool],
+        poll_interval_ms: int | Omit,
+        callback: Optional[Callable[[Any], object]],
+    ) -> None:
+        super().__init__(poll_interval_ms=poll_interval_ms)
+        self.retrieve = retrieve
+        self.is_done = is_done
+        self.callback = callback
+        self.future: Future[Any] = Future()
+
+    @override
+    def cancelled(self) -> bool:
+        return self.future.done()
+
+
+def _resolve(future: Future[Any], *, result: Any = None, exception: Optional[BaseException] = None) -> None:
+    # the future may have been cancelled while its job was being retrieved
+    if future.done():
+        return
+
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except Exception:
+        pass
+
+
+class Poller:
+    """Polls many long-running jobs, e.g. video generations or batches, until each reaches a terminal state.
+
+    Instead of running a sleep loop per job, like `videos.poll()` does, every job is tracked by a single
+    scheduler thread that retrieves each one once it is due according to its `openai-poll-after-ms` hint.
+    At most `max_concurrency` retrieves are in flight at once and, if `max_requests_per_second` is given,
+    they're spaced out so that the poller as a whole stays within that budget.
+
+    Each job returns a `concurrent.futures.Future` that's resolved with the job's final state, or with the
+    error if it couldn't be retrieved, and can be cancelled to stop polling it.
+
+    ```py
+    from openai import OpenAI, Poller
+
+    client = OpenAI()
+
+    with Poller(client, max_requests_per_second=10) as poller:
+        futures = [poller.video(video_id, callback=on_video_done) for video_id in video_ids]
+    ```
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        *,
+        max_concurrency: int = 8,
+        max_requests_per_second: Optional[float] = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: The maximum number of retrieve requests that can be in flight at once.
+
+            max_requests_per_second: If given, retrieve requests are spaced out so that no more than
+                this many are sent per second, across every job.
+
+            poll_interval: How long to wait between retrieves, in seconds, if the API doesn't
+                provide a hint.
+        """
+        _validate(
+            max_concurrency=max_concurrency,
+            max_requests_per_second=max_requests_per_second,
+            poll_interval=poll_interval,
+        )
+
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self._schedule: _Schedule[_SyncJob] = _Schedule(max_requests_per_second)
+        self._slots = threading.Semaphore(max_concurrency)
+        self._condition = threading.Condition()
+        self._pending: Set[Future[Any]] = set()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.requests = 0
+        """The number of retrieve requests that have been sent"""
+
+    def __enter__(self) -> Poller:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, exc_tb: object) -> None:
+        self.close(cancel=exc_type is not None)
+
+    @property
+    def pending(self) -> int:
+        """The number of jobs that haven't reached a terminal state yet"""
+        with self._condition:
+            return len(self._pending)
+
+    def add(
+        self,
+        retrieve: Callable[[Dict[str, str]], LegacyAPIResponse[_T]],
+        *,
+        is_done: Callable[[_T], bool],
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[_T], object]] = None,
+    ) -> Future[_T]:
+        """Polls a job until `is_done` returns `True` for its retrieved state.
+
+        `retrieve` is called with the headers to send and must return the raw response, e.g.
+        `lambda headers: client.responses.with_raw_response.retrieve(id, extra_headers=headers)`.
+
+        If given, `callback` is called with the final state before the returned future is resolved,
+        any exception it raises is logged.
+        """
+        job = _SyncJob(retrieve, is_done=is_done, poll_interval_ms=poll_interval_ms, callback=callback)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot add a job to a closed poller")
+
+            self._start()
+            self._pending.add(job.future)
+            self._schedule.push(job, time.monotonic())
+            self._condition.notify_all()
+
+        job.future.add_done_callback(self._discard)
+        return job.future
+
+    def run(
+        self,
+        run_id: str,
+        *,
+        thread_id: str,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[Run], object]] = None,
+    ) -> Future[Run]:
+        """Polls a run until it reaches a terminal state, like `beta.threads.runs.poll()`"""
+        runs = self._client.beta.threads.runs  # pyright: ignore[reportDeprecated]
+        return self.add(
+            lambda headers: runs.with_raw_response.retrieve(  # pyright: ignore[reportDeprecated]
+                run_id, thread_id=thread_id, extra_headers=headers
+            ),
+            is_done=_is_run_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def video(
+        self,
+        video_id: str,
+        *,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[Video], object]] = None,
+    ) -> Future[Video]:
+        """Polls a video until it has finished generating, like `videos.poll()`"""
+        return self.add(
+            lambda headers: self._client.videos.with_raw_response.retrieve(video_id, extra_headers=headers),
+            is_done=_is_video_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def vector_store_file(
+        self,
+        file_id: str,
+        *,
+        vector_store_id: str,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[VectorStoreFile], object]] = None,
+    ) -> Future[VectorStoreFile]:
+        """Polls a vector store file until it has been processed, like `vector_stores.files.poll()`"""
+        return self.add(
+            lambda headers: self._client.vector_stores.files.with_raw_response.retrieve(
+                file_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=_is_vector_store_file_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def file_batch(
+        self,
+        batch_id: str,
+        *,
+        vector_store_id: str,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[VectorStoreFileBatch], object]] = None,
+    ) -> Future[VectorStoreFileBatch]:
+        """Polls a vector store file batch until it has been processed, like `vector_stores.file_batches.poll()`"""
+        return self.add(
+            lambda headers: self._client.vector_stores.file_batches.with_raw_response.retrieve(
+                batch_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=_is_file_batch_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def file(
+        self,
+        file_id: str,
+        *,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[FileObject], object]] = None,
+    ) -> Future[FileObject]:
+        """Polls a file until it has been processed, like `files.wait_for_processing()`"""
+        return self.add(
+            lambda headers: self._client.files.with_raw_response.retrieve(file_id, extra_headers=headers),
+            is_done=_is_file_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def batch(
+        self,
+        batch_id: str,
+        *,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[Batch], object]] = None,
+    ) -> Future[Batch]:
+        """Polls a batch until it has completed, failed, expired or been cancelled"""
+        return self.add(
+            lambda headers: self._client.batches.with_raw_response.retrieve(batch_id, extra_headers=headers),
+            is_done=_is_batch_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def close(self, *, cancel: bool = False) -> None:
+        """Waits for every job to reach a terminal state and stops the poller.
+
+        If `cancel` is `True` then every job that hasn't finished yet is cancelled instead.
+        """
+        with self._condition:
+            self._closed = True
+            pending = list(self._pending) if cancel else []
+            self._condition.notify_all()
+
+        for future in pending:
+            future.cancel()
+
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="openai-poller")
+        self._thread = threading.Thread(target=self._schedule_jobs, name="openai-poller-scheduler", daemon=True)
+        self._thread.start()
+
+    def _discard(self, future: Future[Any]) -> None:
+        with self._condition:
+            self._pending.discard(future)
+            self._condition.notify_all()
+
+    def _next_job(self) -> Optional[_SyncJob]:
+        with self._condition:
+            while True:
+                if self._closed and not self._pending:
+                    return None
+
+                now = time.monotonic()
+                job = self._schedule.pop(now)
+                if job is not None:
+                    return job
+
+                due = self._schedule.next_due()
+                self._condition.wait(None if due is None else due - now)
+
+    def _schedule_jobs(self) -> None:
+        assert self._executor is not None
+
+        while True:
+            self._slots.acquire()
+            job = self._next_job()
+            if job is None:
+                self._slots.release()
+                return
+
+            self._executor.submit(self._poll, job)
+
+    def _poll(self, job: _SyncJob) -> None:
+        try:
+            with self._condition:
+                self.requests += 1
+
+            try:
+                response = job.retrieve(job.headers)
+                result = response.parse()
+                done = job.is_done(result)
+            except Exception as exc:
+                _resolve(job.future, exception=exc)
+                return
+
+            if done:
+                if job.callback is not None:
+                    try:
+                        job.callback(result)
+                    except Exception:
+                        # the job itself succeeded so its result is still set
+                        log.exception("Exception calling poller callback for %r", result)
+                _resolve(job.future, result=result)
+                return
+
+            with self._condition:
+                self._schedule.push(job, time.monotonic() + job.next_interval(response, self.poll_interval))
+                self._condition.notify_all()
+        finally:
+            self._slots.release()
+
+
+class AsyncPollHandle(Generic[_T]):
+    """The eventual result of a job polled by an `AsyncPoller`, which can be awaited for the job's final state"""
+
+    def __init__(self) -> None:
+        self._event = anyio.Event()
+        self._result: Optional[_T] = None
+        self._exception: Optional[BaseException] = None
+        self._cancelled = False
+        self._callbacks: List[Callable[[AsyncPollHandle[_T]], object]] = []
+
+    def __await__(self) -> Generator[Any, None, _T]:
+        return self.result().__await__()
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> bool:
+        """Stops polling the job, returns `False` if it has already finished"""
+        if self.done():
+            return False
+
+        self._cancelled = True
+        self._finish()
+        return True
+
+    async def result(self) -> _T:
+        """Waits for the job to reach a terminal state and returns its final state"""
+        await self._event.wait()
+
+        if self._cancelled:
+            raise CancelledError()
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result  # type: ignore[return-value]
+
+    def add_done_callback(self, fn: Callable[[AsyncPollHandle[_T]], object]) -> None:
+        """Calls `fn` with this handle once the job has finished or been cancelled"""
+        if self.done():
+            fn(self)
+        else:
+            self._callbacks.append(fn)
+
+    def _set_result(self, result: _T) -> None:
+        if not self.done():
+            self._result = result
+            self._finish()
+
+    def _set_exception(self, exception: BaseException) -> None:
+        if not self.done():
+            self._exception = exception
+            self._finish()
+
+    def _finish(self) -> None:
+        self._event.set()
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                log.exception("Exception calling callback for %r", self)
+
+
+class _AsyncJob(_Job):
+    def __init__(
+        self,
+        retrieve: Callable[[Dict[str, str]], Awaitable[LegacyAPIResponse[Any]]],
+        *,
+        is_done: Callable[[Any], bool],
+        poll_interval_ms: int | Omit,
+        callback: Optional[Callable[[Any], object]],
+    ) -> None:
+        super().__init__(poll_interval_ms=poll_interval_ms)
+        self.retrieve = retrieve
+        self.is_done = is_done
+        self.callback = callback
+        self.handle: AsyncPollHandle[Any] = AsyncPollHandle()
+
+    @override
+    def cancelled(self) -> bool:
+        return self.handle.done()
+
+
+class AsyncPoller:
+    """Polls many long-running jobs, e.g. video generations or batches, until each reaches a terminal state.
+
+    Instead of running a sleep loop per job, like `videos.poll()` does, every job is tracked by a single
+    scheduler task that retrieves each one once it is due according to its `openai-poll-after-ms` hint.
+    At most `max_concurrency` retrieves are in flight at once and, if `max_requests_per_second` is given,
+    they're spaced out so that the poller as a whole stays within that budget.
+
+    Each job returns an `AsyncPollHandle` that can be awaited for the job's final state and cancelled to
+    stop polling it. The poller must be used as an async context manager, which waits for every job to
+    finish when it exits.
+
+    ```py
+    from openai import AsyncOpenAI, AsyncPoller
+
+    client = AsyncOpenAI()
+
+    async with AsyncPoller(client, max_requests_per_second=10) as poller:
+        handles = [poller.video(video_id, callback=on_video_done) for video_id in video_ids]
+    ```
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        *,
+        max_concurrency: int = 8,
+        max_requests_per_second: Optional[float] = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: The maximum number of retrieve requests that can be in flight at once.
+
+            max_requests_per_second: If given, retrieve requests are spaced out so that no more than
+                this many are sent per second, across every job.
+
+            poll_interval: How long to wait between retrieves, in seconds, if the API doesn't
+                provide a hint.
+        """
+        _validate(
+            max_concurrency=max_concurrency,
+            max_requests_per_second=max_requests_per_second,
+            poll_interval=poll_interval,
+        )
+
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self._schedule: _Schedule[_AsyncJob] = _Schedule(max_requests_per_second)
+        self._pending: Set[AsyncPollHandle[Any]] = set()
+        self._closed = False
+        self._wakeup: Optional[anyio.Event] = None
+        self._task_group: Optional[anyio.abc.TaskGroup] = None
+
+        self.requests = 0
+        """The number of retrieve requests that have been sent"""
+
+    async def __aenter__(self) -> AsyncPoller:
+        if self._task_group is not None or self._closed:
+            raise RuntimeError("An AsyncPoller can only be entered once")
+
+        task_group = anyio.create_task_group()
+        await task_group.__aenter__()
+        task_group.start_soon(self._schedule_jobs, task_group)
+        self._task_group = task_group
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, exc_tb: Any) -> Optional[bool]:
+        assert self._task_group is not None
+
+        if exc_type is not None:
+            for handle in list(self._pending):
+                handle.cancel()
+
+        self._closed = True
+        self._wake()
+        return await self._task_group.__aexit__(exc_type, exc, exc_tb)
+
+    @property
+    def pending(self) -> int:
+        """The number of jobs that haven't reached a terminal state yet"""
+        return len(self._pending)
+
+    def add(
+        self,
+        retrieve: Callable[[Dict[str, str]], Awaitable[LegacyAPIResponse[_T]]],
+        *,
+        is_done: Callable[[_T], bool],
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[_T], object]] = None,
+    ) -> AsyncPollHandle[_T]:
+        """Polls a job until `is_done` returns `True` for its retrieved state.
+
+        `retrieve` is called with the headers to send and must return the raw response, e.g.
+        `lambda headers: client.responses.with_raw_response.retrieve(id, extra_headers=headers)`.
+
+        If given, `callback` is called with the final state, and awaited if it returns an awaitable,
+        before the returned handle is resolved. Any exception it raises is logged.
+        """
+        if self._task_group is None:
+            raise RuntimeError("An AsyncPoller must be entered with `async with` before jobs are added")
+        if self._closed:
+            raise RuntimeError("Cannot add a job to a closed poller")
+
+        job = _AsyncJob(retrieve, is_done=is_done, poll_interval_ms=poll_interval_ms, callback=callback)
+        self._pending.add(job.handle)
+        job.handle.add_done_callback(self._discard)
+        self._schedule.push(job, time.monotonic())
+        self._wake()
+        return job.handle
+
+    def run(
+        self,
+        run_id: str,
+        *,
+        thread_id: str,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[Run], object]] = None,
+    ) -> AsyncPollHandle[Run]:
+        """Polls a run until it reaches a terminal state, like `beta.threads.runs.poll()`"""
+        runs = self._client.beta.threads.runs  # pyright: ignore[reportDeprecated]
+        return self.add(
+            lambda headers: runs.with_raw_response.retrieve(  # pyright: ignore[reportDeprecated]
+                run_id, thread_id=thread_id, extra_headers=headers
+            ),
+            is_done=_is_run_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def video(
+        self,
+        video_id: str,
+        *,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[Video], object]] = None,
+    ) -> AsyncPollHandle[Video]:
+        """Polls a video until it has finished generating, like `videos.poll()`"""
+        return self.add(
+            lambda headers: self._client.videos.with_raw_response.retrieve(video_id, extra_headers=headers),
+            is_done=_is_video_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def vector_store_file(
+        self,
+        file_id: str,
+        *,
+        vector_store_id: str,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[VectorStoreFile], object]] = None,
+    ) -> AsyncPollHandle[VectorStoreFile]:
+        """Polls a vector store file until it has been processed, like `vector_stores.files.poll()`"""
+        return self.add(
+            lambda headers: self._client.vector_stores.files.with_raw_response.retrieve(
+                file_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=_is_vector_store_file_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def file_batch(
+        self,
+        batch_id: str,
+        *,
+        vector_store_id: str,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[VectorStoreFileBatch], object]] = None,
+    ) -> AsyncPollHandle[VectorStoreFileBatch]:
+        """Polls a vector store file batch until it has been processed, like `vector_stores.file_batches.poll()`"""
+        return self.add(
+            lambda headers: self._client.vector_stores.file_batches.with_raw_response.retrieve(
+                batch_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=_is_file_batch_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def file(
+        self,
+        file_id: str,
+        *,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[FileObject], object]] = None,
+    ) -> AsyncPollHandle[FileObject]:
+        """Polls a file until it has been processed, like `files.wait_for_processing()`"""
+        return self.add(
+            lambda headers: self._client.files.with_raw_response.retrieve(file_id, extra_headers=headers),
+            is_done=_is_file_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def batch(
+        self,
+        batch_id: str,
+        *,
+        poll_interval_ms: int | Omit = omit,
+        callback: Optional[Callable[[Batch], object]] = None,
+    ) -> AsyncPollHandle[Batch]:
+        """Polls a batch until it has completed, failed, expired or been cancelled"""
+        return self.add(
+            lambda headers: self._client.batches.with_raw_response.retrieve(batch_id, extra_headers=headers),
+            is_done=_is_batch_done,
+            poll_interval_ms=poll_interval_ms,
+            callback=callback,
+        )
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _discard(self, handle: AsyncPollHandle[Any]) -> None:
+        self._pending.discard(handle)
+        self._wake()
+
+    async def _next_job(self) -> Optional[_AsyncJob]:
+        while True:
+            if self._closed and not self._pending:
+                return None
+
+            now = time.monotonic()
+            job = self._schedule.pop(now)
+            if job is not None:
+                return job
+
+            due = self._schedule.next_due()
+            self._wakeup = anyio.Event()
+            with anyio.move_on_after(None if due is None else due - now):
+                await self._wakeup.wait()
+            self._wakeup = None
+
+    async def _schedule_jobs(self, task_group: anyio.abc.TaskGroup) -> None:
+        slots = anyio.Semaphore(self.max_concurrency)
+
+        while True:
+            await slots.acquire()
+            job = await self._next_job()
+            if job is None:
+                slots.release()
+                return
+
+            task_group.start_soon(self._poll, job, slots)
+
+    async def _poll(self, job: _AsyncJob, slots: anyio.Semaphore) -> None:
+        try:
+            self.requests += 1
+
+            try:
+                response = await job.retrieve(job.headers)
+                result = response.parse()
+                done = job.is_done(result)
+            except Exception as exc:
+                job.handle._set_exception(exc)
+                return
+
+            if done:
+                if job.callback is not None:
+                    try:
+                        returned = job.callback(result)
+                        if inspect.isawaitable(returned):
+                            await returned
+                    except Exception:
+                        # the job itself succeeded so its result is still set
+                        log.exception("Exception calling poller callback for %r", result)
+                job.handle._set_result(result)
+                return
+
+            self._schedule.push(job, time.monotonic() + job.next_interval(response, self.poll_interval))
+        finally:
+            slots.release()
+            self._wake()
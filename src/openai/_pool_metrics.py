@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import time
+import weakref
+import threading
+from typing import Any, Dict, Union, Callable, Optional, Awaitable
+
+import httpx
+
+__all__ = ["PoolMetrics", "get_pool_metrics", "trace_request", "async_trace_request"]
+
+_CONNECT_STARTED_EVENTS = frozenset(["connection.connect_tcp.started", "connection.connect_unix_socket.started"])
+_CONNECT_COMPLETE_EVENTS = frozenset(
+    [
+        "http11.send_request_headers.started",
+        "http2.send_connection_init.started",
+        "http2.send_request_headers.started",
+    ]
+)
+
+
+class PoolMetrics:
+    """Measures how long requests wait to check out a connection from the HTTP connection pool
+    and how long it takes to open new connections, including the TLS handshake.
+
+    Requests are only measured by clients created with `pool_metrics=True`.
+
+    The measurements rely on the `trace` extension of the default `httpcore` based transports,
+    so they are not recorded when using a custom transport such as `DefaultAioHttpClient`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.total_checkout_wait = 0.0
+            self.max_checkout_wait = 0.0
+            self.connections_opened = 0
+            self.total_connect_time = 0.0
+
+    @property
+    def average_checkout_wait(self) -> float | None:
+        """The average number of seconds requests waited for a connection, or `None` if no requests have been made"""
+        with self._lock:
+            return self.total_checkout_wait / self.requests if self.requests else None
+
+    @property
+    def average_connect_time(self) -> float | None:
+        """The average number of seconds it took to open a connection, or `None` if no connections have been opened"""
+        with self._lock:
+            return self.total_connect_time / self.connections_opened if self.connections_opened else None
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_checkout_wait += wait
+            self.max_checkout_wait = max(self.max_checkout_wait, wait)
+
+    def record_connect(self, duration: float) -> None:
+        with self._lock:
+            self.connections_opened += 1
+            self.total_connect_time += duration
+
+
+_pool_metrics: weakref.WeakKeyDictionary[Union[httpx.Client, httpx.AsyncClient], PoolMetrics] = (
+    weakref.WeakKeyDictionary()
+)
+_pool_metrics_lock = threading.Lock()
+
+
+def get_pool_metrics(http_client: httpx.Client | httpx.AsyncClient) -> PoolMetrics:
+    """Returns the metrics for the connection pool of the given HTTP client, which are shared by every API client using it"""
+    with _pool_metrics_lock:
+        metrics = _pool_metrics.get(http_client)
+        if metrics is None:
+            metrics = _pool_metrics[http_client] = PoolMetrics()
+        return metrics
+
+
+class _RequestTrace:
+    def __init__(self, metrics: PoolMetrics, inner: Any) -> None:
+        self.metrics = metrics
+        self.inner = inner
+        self.started_at = time.monotonic()
+        self.checked_out = False
+        self.connect_started_at: Optional[float] = None
+
+    def _on_event(self, name: str) -> None:
+        now = time.monotonic()
+        if not self.checked_out:
+            # the first event is emitted once the request has been assigned a connection
+            self.checked_out = True
+            self.metrics.record_checkout(now - self.started_at)
+
+        if name in _CONNECT_STARTED_EVENTS:
+            self.connect_started_at = now
+        elif name in _CONNECT_COMPLETE_EVENTS and self.connect_started_at is not None:
+            self.metrics.record_connect(now - self.connect_started_at)
+            self.connect_started_at = None
+
+
+class _SyncRequestTrace(_RequestTrace):
+    inner: Optional[Callable[[str, Dict[str, Any]], None]]
+
+    def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        self._on_event(name)
+        if self.inner is not None:
+            self.inner(name, info)
+
+
+class _AsyncRequestTrace(_RequestTrace):
+    inner: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]]
+
+    async def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        self._on_event(name)
+        if self.inner is not None:
+            await self.inner(name, info)
+
+
+def trace_request(request: httpx.Request, metrics: PoolMetrics) -> None:
+    """Records the pool checkout wait & connection setup time of the given request once it is sent"""
+    inner = request.extensions.get("trace")
+    if isinstance(inner, _SyncRequestTrace):
+        # e.g. a hedged copy of a request that was already traced
+        inner = inner.inner
+
+    # the extensions may be shared with a copy of the request so we can't mutate them
+    request.extensions = {**request.extensions, "trace": _SyncRequestTrace(metrics, inner)}
+
+
+def async_trace_request(request: httpx.Request, metrics: PoolMetrics) -> None:
+    """Records the pool checkout wait & connection setup time of the given request once it is sent"""
+    inner = request.extensions.get("trace")
+    if isinstance(inner, _AsyncRequestTrace):
+        # e.g. a hedged copy of a request that was already traced
+        inner = inner.inner
+
+    # the extensions may be shared with a copy of the request so we can't mutate them
+    request.extensions = {**request.extensions, "trace": _AsyncRequestTrace(metrics, inner)}
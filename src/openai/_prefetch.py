@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Union, Generic, TypeVar, Iterator, AsyncIterator
+from collections import deque
+
+import sniffio
+
+if TYPE_CHECKING:
+    from ._base_client import BaseSyncPage, BaseAsyncPage
+
+__all__ = ["prefetch_pages", "async_prefetch_pages"]
+
+_SyncPageT = TypeVar("_SyncPageT", bound="BaseSyncPage[object]")
+_AsyncPageT = TypeVar("_AsyncPageT", bound="BaseAsyncPage[object]")
+_PageT = TypeVar("_PageT")
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class _Done:
+    pass
+
+
+class _PageBuffer(Generic[_PageT]):
+    """A bounded buffer of pages shared by the consumer and a background thread fetching them"""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._items: deque[Union[_PageT, _Failure, _Done]] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def wait_for_space(self) -> bool:
+        """Waits until another page can be fetched, returns `False` if the consumer has stopped iterating"""
+        with self._condition:
+            while len(self._items) >= self._size and not self._closed:
+                self._condition.wait()
+
+            return not self._closed
+
+    def put(self, item: Union[_PageT, _Failure, _Done]) -> None:
+        with self._condition:
+            if not self._closed:
+                self._items.append(item)
+                self._condition.notify_all()
+
+    def get(self) -> Union[_PageT, _Failure, _Done]:
+        with self._condition:
+            while not self._items:
+                self._condition.wait()
+
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._items.clear()
+            self._condition.notify_all()
+
+
+def prefetch_pages(page: _SyncPageT, prefetch: int) -> Iterator[_SyncPageT]:
+    """Iterate over the given page and every page after it, fetching up to `prefetch`
+    pages ahead in a background thread while the caller handles the current page.
+    """
+    buffer: _PageBuffer[_SyncPageT] = _PageBuffer(prefetch)
+
+    def fetch_pages() -> None:
+        current = page
+        try:
+            while current.has_next_page():
+                if not buffer.wait_for_space():
+                    return
+
+                current = current.get_next_page()
+                buffer.put(current)
+        except BaseException as exc:
+            buffer.put(_Failure(exc))
+        else:
+            buffer.put(_Done())
+
+    thread = threading.Thread(target=fetch_pages, name="openai-page-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        yield page
+
+        while True:
+            item = buffer.get()
+            if isinstance(item, _Done):
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        # a request that is already in flight will still complete but its page is discarded
+        buffer.close()
+
+
+async def async_prefetch_pages(page: _AsyncPageT, prefetch: int) -> AsyncIterator[_AsyncPageT]:
+    """Iterate over the given page and every page after it, fetching up to `prefetch`
+    pages ahead in a background task while the caller handles the current page.
+
+    Note: prefetching is only supported with `asyncio` as the backing async runtime.
+    """
+    async_library = sniffio.current_async_library()
+    if async_library != "asyncio":
+        raise RuntimeError(f"Prefetching pages is not supported with {async_library}, only asyncio is supported")
+
+    queue: asyncio.Queue[Union[_AsyncPageT, _Failure, _Done]] = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def fetch_pages() -> None:
+        current = page
+        try:
+            while current.has_next_page():
+                await slots.acquire()
+                current = await current.get_next_page()
+                queue.put_nowait(current)
+        except Exception as exc:
+            queue.put_nowait(_Failure(exc))
+        else:
+            queue.put_nowait(_Done())
+
+    task = asyncio.get_running_loop().create_task(fetch_pages())
+
+    try:
+        yield page
+
+        while True:
+            item = await queue.get()
+            slots.release()
+            if isinstance(item, _Done):
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        task.cancel()
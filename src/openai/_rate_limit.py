@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import re
+import time
+import threading
+from typing import TYPE_CHECKING, Dict, Tuple, Callable, Optional, cast
+
+import httpx
+
+from ._utils import is_mapping
+
+if TYPE_CHECKING:
+    from ._models import FinalRequestOptions
+
+__all__ = ["RateLimiter"]
+
+_RateLimitKey = Tuple[Optional[str], Optional[str]]
+"""The `(organization, model)` pair that rate limits are tracked for"""
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+# this is only meant to be a rough estimate
+_CHARS_PER_TOKEN = 4
+
+# images, files & audio are counted as a fixed number of tokens instead of by the size of their data,
+# roughly a high detail 1024x1024 image
+_MEDIA_PART_TYPES = {"image", "image_url", "input_image", "file", "input_file", "input_audio"}
+_MEDIA_PART_TOKENS = 765
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Parses an `x-ratelimit-reset-*` header value, e.g. `6m0s` or `20ms`, into seconds"""
+    if not value:
+        return None
+
+    total = 0.0
+    end = 0
+    for match in _DURATION_PART.finditer(value):
+        if match.start() != end:
+            return None
+
+        total += float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+        end = match.end()
+
+    if end == 0 or end != len(value):
+        return None
+
+    return total
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def estimate_request_tokens(options: FinalRequestOptions) -> int:
+    """Returns a rough estimate of the number of tokens that will be counted against the rate limit for a request.
+
+    Like the API, this counts the prompt (approximated from the size of the request body) plus the
+    maximum number of tokens that can be generated.
+    """
+    json_data = options.json_data
+    if not is_mapping(json_data):
+        return 0
+
+    completion_tokens = 0
+    for key in ("max_completion_tokens", "max_output_tokens", "max_tokens"):
+        value = json_data.get(key)
+        if isinstance(value, int):
+            completion_tokens = value
+            break
+
+    counter = _PromptCounter()
+    for key, value in json_data.items():
+        if key in ("messages", "input", "prompt", "instructions", "tools"):
+            counter.count(value)
+
+    return counter.chars // _CHARS_PER_TOKEN + counter.media_parts * _MEDIA_PART_TOKENS + completion_tokens
+
+
+class _PromptCounter:
+    """Counts the text in a prompt without serialising it, e.g. `messages` or `input`"""
+
+    def __init__(self) -> None:
+        self.chars = 0
+        self.media_parts = 0
+
+    def count(self, value: object) -> None:
+        if isinstance(value, str):
+            self.chars += len(value)
+        elif is_mapping(value):
+            if value.get("type") in _MEDIA_PART_TYPES:
+                self.media_parts += 1
+                return
+
+            for item in value.values():
+                self.count(item)
+        elif isinstance(value, (list, tuple)):
+            for item in cast("list[object]", value):
+                self.count(item)
+        elif hasattr(value, "__dict__") and not isinstance(value, type):
+            # e.g. output items from a previous response that are passed back as input
+            self.count(vars(value))
+
+
+class _TokenBucket:
+    """A token bucket that is continuously re-synchronised with the rate limit state reported by the API."""
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.available = 0.0
+        self.refill_rate = 0.0
+        self.updated_at = 0.0
+
+    def sync(self, *, limit: int | None, remaining: int | None, reset: float | None, now: float) -> None:
+        if remaining is None:
+            return
+
+        if limit is None:
+            limit = remaining if self.limit is None else max(self.limit, remaining)
+
+        self.limit = limit
+        self.available = float(remaining)
+        self.updated_at = now
+
+        # the API refills the bucket continuously so that it is full again once the reset duration has elapsed
+        if reset is not None and reset > 0 and limit > remaining:
+            self.refill_rate = (limit - remaining) / reset
+        elif limit <= remaining:
+            self.refill_rate = 0.0
+
+    def reserve(self, cost: float, *, now: float) -> float:
+        """Takes `cost` units out of the bucket and returns how many seconds the caller must wait before sending"""
+        limit = self.limit
+        if limit is None:
+            # we haven't seen any rate limit headers for this bucket yet
+            return 0.0
+
+        if self.refill_rate > 0:
+            self.available = min(float(limit), self.available + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+        # a request that costs more than the entire limit would otherwise wait forever
+        cost = min(cost, float(limit))
+
+        self.available -= cost
+        if self.available >= 0:
+            return 0.0
+
+        if self.refill_rate <= 0:
+            # there's no way to know when the bucket refills so don't block, we'll
+            # get a more accurate picture from the next response
+            return 0.0
+
+        # note: the bucket is allowed to go negative so that concurrent callers queue up behind each other
+        return -self.available / self.refill_rate
+
+
+class _RateLimitState:
+    def __init__(self) -> None:
+        self.requests = _TokenBucket()
+        self.tokens = _TokenBucket()
+
+
+class RateLimiter:
+    """Paces requests on the client side using the `x-ratelimit-*` headers returned by the API.
+
+    Limits are tracked separately for every organization & model pair. Before a request is sent, one
+    request and an estimate of the number of tokens it will use are reserved from the corresponding
+    buckets, and the client waits until they're available instead of sending the request and receiving
+    a `429` error.
+
+    A single instance can be shared between clients, including sync and async clients, for example:
+
+    ```py
+    from openai import OpenAI, RateLimiter
+
+    client = OpenAI(rate_limiter=RateLimiter())
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_delay: float = 60.0,
+        token_estimator: Callable[[FinalRequestOptions], int] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_delay: The maximum number of seconds that a single request will be held back for.
+
+            token_estimator: A function returning the number of tokens a request is expected to use,
+                defaults to a rough estimate based on the size of the request body and the maximum
+                number of output tokens.
+        """
+        self.max_delay = max_delay
+        self._token_estimator = token_estimator or estimate_request_tokens
+        self._states: Dict[_RateLimitKey, _RateLimitState] = {}
+        self._lock = threading.Lock()
+        self._clock: Callable[[], float] = time.monotonic
+
+    def _get_key(self, options: FinalRequestOptions, request: httpx.Request) -> _RateLimitKey:
+        json_data = options.json_data
+        model = json_data.get("model") if is_mapping(json_data) else None
+        return (
+            request.headers.get("openai-organization"),
+            model if isinstance(model, str) else None,
+        )
+
+    def reserve(self, options: FinalRequestOptions, request: httpx.Request) -> float:
+        """Reserves capacity for the given request and returns the number of seconds to wait before sending it"""
+        key = self._get_key(options, request)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return 0.0
+
+            now = self._clock()
+            delay = max(
+                state.requests.reserve(1, now=now),
+                state.tokens.reserve(self._token_estimator(options), now=now),
+            )
+
+        return min(delay, self.max_delay)
+
+    def update(self, options: FinalRequestOptions, request: httpx.Request, response: httpx.Response) -> None:
+        """Updates the tracked limits from the headers of the given response"""
+        headers = response.headers
+        remaining_requests = _parse_int(headers.get("x-ratelimit-remaining-requests"))
+        remaining_tokens = _parse_int(headers.get("x-ratelimit-remaining-tokens"))
+        if remaining_requests is None and remaining_tokens is None:
+            return
+
+        key = self._get_key(options, request)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _RateLimitState()
+
+            now = self._clock()
+            state.requests.sync(
+                limit=_parse_int(headers.get("x-ratelimit-limit-requests")),
+                remaining=remaining_requests,
+                reset=parse_reset_duration(headers.get("x-ratelimit-reset-requests")),
+                now=now,
+            )
+            state.tokens.sync(
+                limit=_parse_int(headers.get("x-ratelimit-limit-tokens")),
+                remaining=remaining_tokens,
+                reset=parse_reset_duration(headers.get("x-ratelimit-reset-tokens")),
+                now=now,
+            )
@@ -240,7 +240,7 @@ class BaseAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = self._client._json_codec.loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -262,7 +262,7 @@ class BaseAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = self._client._json_codec.loads(response.content)
 
         return self._client._process_response_data(
             data=data,
@@ -348,7 +348,7 @@ class APIResponse(BaseAPIResponse[R]):
     def json(self) -> object:
         """Read and decode the JSON response content."""
         self.read()
-        return self.http_response.json()
+        return self._client._json_codec.loads(self.http_response.content)
 
     def close(self) -> None:
         """Close the response and release the connection.
@@ -455,7 +455,7 @@ class AsyncAPIResponse(BaseAPIResponse[R]):
     async def json(self) -> object:
         """Read and decode the JSON response content."""
         await self.read()
-        return self.http_response.json()
+        return self._client._json_codec.loads(self.http_response.content)
 
     async def close(self) -> None:
         """Close the response and release the connection.
@@ -1,6 +1,7 @@
 # Note: initially copied from https://github.com/florimondmanca/httpx-sse/blob/master/src/httpx_sse/_decoders.py
 from __future__ import annotations
 
+import re
 import json
 import inspect
 from types import TracebackType
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T")
 
+_LINE_SEPARATOR = re.compile(r"\r\n|\r|\n")
+
 
 class Stream(Generic[_T]):
     """Provides the core interface to iterate over a synchronous stream response."""
@@ -53,6 +56,7 @@ class Stream(Generic[_T]):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+        json_loads = self._client._json_codec.loads
         iterator = self._iter_events()
 
         for sse in iterator:
@@ -61,7 +65,7 @@ class Stream(Generic[_T]):
 
             # we have to special case the Assistants `thread.` events since we won't have an "event" key in the data
             if sse.event and sse.event.startswith("thread."):
-                data = sse.json()
+                data = json_loads(sse.data)
 
                 if sse.event == "error" and is_mapping(data) and data.get("error"):
                     message = None
@@ -79,7 +83,7 @@ class Stream(Generic[_T]):
 
                 yield process_data(data={"data": data, "event": sse.event}, cast_to=cast_to, response=response)
             else:
-                data = sse.json()
+                data = json_loads(sse.data)
                 if is_mapping(data) and data.get("error"):
                     message = None
                     error = data.get("error")
@@ -155,6 +159,7 @@ class AsyncStream(Generic[_T]):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+        json_loads = self._client._json_codec.loads
         iterator = self._iter_events()
 
         async for sse in iterator:
@@ -163,7 +168,7 @@ class AsyncStream(Generic[_T]):
 
             # we have to special case the Assistants `thread.` events since we won't have an "event" key in the data
             if sse.event and sse.event.startswith("thread."):
-                data = sse.json()
+                data = json_loads(sse.data)
 
                 if sse.event == "error" and is_mapping(data) and data.get("error"):
                     message = None
@@ -181,7 +186,7 @@ class AsyncStream(Generic[_T]):
 
                 yield process_data(data={"data": data, "event": sse.event}, cast_to=cast_to, response=response)
             else:
-                data = sse.json()
+                data = json_loads(sse.data)
                 if is_mapping(data) and data.get("error"):
                     message = None
                     error = data.get("error")
@@ -268,56 +273,107 @@ class SSEDecoder:
     _event: str | None
     _retry: int | None
     _last_event_id: str | None
+    _buffer: bytearray
+    _seen_cr: bool
 
     def __init__(self) -> None:
         self._event = None
         self._data = []
         self._last_event_id = None
         self._retry = None
+        self._buffer = bytearray()
+        self._seen_cr = False
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        for chunk in self._iter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            yield from self._feed(chunk)
+        yield from self._flush()
 
     async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        async for chunk in self._aiter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    async def _aiter_chunks(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         async for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            for sse in self._feed(chunk):
+                yield sse
+        for sse in self._flush():
+            yield sse
+
+    def _feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Append a chunk of raw binary data to the buffer and decode every complete event it contains.
+
+        Events are framed by searching the buffer for a blank line instead of splitting it into lines,
+        so each event is only copied out of the buffer once, when it is decoded.
+        """
+        buffer = self._buffer
+        # a terminator can straddle two chunks, so we have to re-scan the tail of the previous one
+        pos = max(len(buffer) - 3, 0)
+        buffer += chunk
+        if not self._seen_cr and b"\r" in chunk:
+            self._seen_cr = True
+
+        events: list[ServerSentEvent] = []
+        start = 0
+        while True:
+            end, pos = self._find_event_boundary(buffer, pos)
+            if end < 0:
+                break
+
+            events.extend(self._decode_lines(buffer, start, end, dispatch=True))
+            start = pos
+
+        if start:
+            del buffer[:start]
+
+        return events
+
+    def _flush(self) -> list[ServerSentEvent]:
+        """Decode whatever is left in the buffer once the underlying iterator is exhausted"""
+        buffer = self._buffer
+        if not buffer:
+            return []
+
+        events = self._decode_lines(buffer, 0, len(buffer), dispatch=False)
+        del buffer[:]
+        return events
+
+    def _find_event_boundary(self, buffer: bytearray, pos: int) -> tuple[int, int]:
+        """Returns the end of the next complete event & the offset just past its terminator, or `(-1, pos)`"""
+        end = buffer.find(b"\n\n", pos)
+        next_pos = end + 2
+
+        if self._seen_cr:
+            limit = end if end >= 0 else len(buffer)
+            for terminator in (b"\r\r", b"\r\n\r\n"):
+                index = buffer.find(terminator, pos, limit + len(terminator) - 1)
+                if index >= 0 and (end < 0 or index < end):
+                    end = index
+                    next_pos = index + len(terminator)
+                    limit = index
+
+        if end < 0:
+            return -1, pos
+
+        return end, next_pos
+
+    def _decode_lines(self, buffer: bytearray, start: int, end: int, *, dispatch: bool) -> list[ServerSentEvent]:
+        with memoryview(buffer) as view, view[start:end] as raw:
+            text = str(raw, "utf-8")
+
+        # we can't use `str.splitlines()` here as it also splits on characters such as U+2028
+        lines = _LINE_SEPARATOR.split(text) if self._seen_cr else text.split("\n")
+
+        events: list[ServerSentEvent] = []
+        for line in lines:
+            sse = self.decode(line)
+            if sse:
+                events.append(sse)
+
+        if dispatch:
+            sse = self.decode("")
+            if sse:
+                events.append(sse)
+
+        return events
 
     def decode(self, line: str) -> ServerSentEvent | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
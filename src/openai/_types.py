@@ -105,6 +105,11 @@ else:
     NoneType = type(None)
 
 
+# The number of seconds after which a duplicate of a request is sent if it hasn't
+# completed yet, `"auto"` to use the p95 latency of the endpoint or `None` to disable hedging
+HedgeAfter = Union[float, Literal["auto"], None]
+
+
 class RequestOptions(TypedDict, total=False):
     headers: Headers
     max_retries: int
@@ -113,6 +118,7 @@ class RequestOptions(TypedDict, total=False):
     extra_json: AnyMapping
     idempotency_key: str
     follow_redirects: bool
+    hedge_after: HedgeAfter
 
 
 # Sentinel class used until PEP 0661 is accepted
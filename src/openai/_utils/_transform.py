@@ -3,8 +3,9 @@ from __future__ import annotations
 import io
 import base64
 import pathlib
-from typing import Any, Mapping, TypeVar, cast
+from typing import Any, Tuple, Mapping, TypeVar, Iterable, cast
 from datetime import date, datetime
+from collections import OrderedDict
 from typing_extensions import Literal, get_args, override, get_type_hints as _get_type_hints
 
 import anyio
@@ -108,7 +109,7 @@ def transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = _transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = _get_transformer(cast(type, expected_type)).transform(data)
     return cast(_T, transformed)
 
 
@@ -151,13 +152,309 @@ def _no_transform_needed(annotation: type) -> bool:
     return annotation == float or annotation == int
 
 
-def _transform_recursive(
-    data: object,
-    *,
+_SequenceKind = Literal["list", "iterable", "sequence"]
+
+_PLAIN_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_plain_data(data: object) -> bool:
+    """Returns whether or not the given data only consists of builtin JSON types, for which a transformer without
+    any `PropertyInfo` aliases or formats is guaranteed to be a no-op.
+    """
+    type_ = type(data)
+    if type_ in _PLAIN_SCALAR_TYPES:
+        return True
+
+    if type_ is dict:
+        for value in cast("dict[object, object]", data).values():
+            if not _is_plain_data(value):
+                return False
+        return True
+
+    if type_ is list:
+        for entry in cast("list[object]", data):
+            if not _is_plain_data(entry):
+                return False
+        return True
+
+    return False
+
+
+class _Transformer:
+    """Transforms data for a specific type annotation.
+
+    All of the reflection on the annotation, e.g. resolving `TypedDict` type hints, stripping `Annotated`
+    and `Required` wrappers and fanning out over union variants, happens once when the transformer is
+    built instead of every time some data is transformed.
+    """
+
+    plain: bool
+    """Whether or not there are any `PropertyInfo` aliases or formats in this type.
+
+    If there aren't, then data that only consists of builtin JSON types can be returned as-is.
+    """
+
+    needs_async: bool
+    """Whether or not transforming data for this type may require async I/O, e.g. reading a file to base64 encode it"""
+
+    def __init__(self) -> None:
+        # these are resolved by `_resolve_flags()` once the transformer and all of its children are built
+        self.plain = False
+        self.needs_async = True
+        self._children: list[_Transformer] = []
+        self._own_plain = True
+        self._own_async = False
+
+        self._format: PropertyInfo | None = None
+        self._typeddict_fields: dict[str, tuple[str, _Transformer]] | None = None
+        self._dict_items: _Transformer | None = None
+        self._sequence_kind: _SequenceKind | None = None
+        self._sequence_entries: _Transformer | None = None
+        self._union_variants: list[_Transformer] | None = None
+
+    def _build(
+        self,
+        annotation: type,
+        inner_type: type,
+        *,
+        building: dict[_TransformerKey, tuple[type, type, _Transformer]],
+    ) -> None:
+        stripped_type = strip_annotated_type(inner_type)
+        origin = get_origin(stripped_type) or stripped_type
+
+        annotated_type = _get_annotated_type(annotation)
+        if annotated_type is not None:
+            # ignore the first argument as it is the actual type
+            for info in get_args(annotated_type)[1:]:
+                if isinstance(info, PropertyInfo) and info.format is not None:
+                    self._format = info
+                    break
+
+        children = self._children
+        plain = self._format is None
+
+        if is_typeddict(stripped_type):
+            self._typeddict_fields = {}
+            for key, type_ in get_type_hints(stripped_type, include_extras=True).items():
+                field = _get_transformer(type_, building=building)
+                transformed_key = _maybe_transform_key(key, type_)
+                self._typeddict_fields[key] = (transformed_key, field)
+                children.append(field)
+                plain = plain and transformed_key == key
+        elif origin == dict:
+            args = get_args(stripped_type)
+            items_type = args[1] if len(args) == 2 else cast(type, object)
+            self._dict_items = _get_transformer(items_type, building=building)
+            children.append(self._dict_items)
+        elif is_list_type(stripped_type) or is_iterable_type(stripped_type) or is_sequence_type(stripped_type):
+            self._sequence_kind = (
+                "list" if is_list_type(stripped_type) else "iterable" if is_iterable_type(stripped_type) else "sequence"
+            )
+
+            entry_type = extract_type_arg(stripped_type, 0)
+            if not _no_transform_needed(entry_type):
+                # the container annotation is used for each entry so that any `PropertyInfo`
+                # formats on the container apply to the entries too
+                self._sequence_entries = _get_transformer(annotation, entry_type, building=building)
+                children.append(self._sequence_entries)
+        elif is_union_type(stripped_type):
+            # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+            #
+            # TODO: there may be edge cases where the same normalized field name will transform to two different names
+            # in different subtypes.
+            self._union_variants = []
+            has_leaf_variant = False
+            for subtype in get_args(stripped_type):
+                variant = _get_transformer(annotation, subtype, building=building)
+                if variant._is_leaf():
+                    # every leaf variant shares the same `annotation` and therefore performs the exact same
+                    # transformation, which is idempotent, so we only need to run it once
+                    if has_leaf_variant:
+                        continue
+                    has_leaf_variant = True
+
+                self._union_variants.append(variant)
+                children.append(variant)
+
+        self._own_plain = plain
+        self._own_async = self._format is not None and self._format.format == "base64"
+
+    def _is_leaf(self) -> bool:
+        return (
+            self._typeddict_fields is None
+            and self._dict_items is None
+            and self._sequence_kind is None
+            and self._union_variants is None
+        )
+
+    def _matches_sequence(self, data: object) -> bool:
+        kind = self._sequence_kind
+        if kind == "list":
+            return is_list(data)
+        if kind == "iterable":
+            return is_iterable(data) and not isinstance(data, str)
+        if kind == "sequence":
+            return is_sequence(data) and not isinstance(data, str)
+        return False
+
+    def transform(self, data: object) -> object:
+        if self.plain and _is_plain_data(data):
+            return data
+
+        typeddict_fields = self._typeddict_fields
+        if typeddict_fields is not None and is_mapping(data):
+            result: dict[str, object] = {}
+            for key, value in data.items():
+                if not is_given(value):
+                    # we don't need to include omitted values here as they'll
+                    # be stripped out before the request is sent anyway
+                    continue
+
+                field = typeddict_fields.get(key)
+                if field is None:
+                    # we do not have a type annotation for this field, leave it as is
+                    result[key] = value
+                else:
+                    result[field[0]] = field[1].transform(value)
+            return result
+
+        dict_items = self._dict_items
+        if dict_items is not None and is_mapping(data):
+            return {key: dict_items.transform(value) for key, value in data.items()}
+
+        if self._sequence_kind is not None and self._matches_sequence(data):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            entries = self._sequence_entries
+            if entries is None:
+                # for some types there is no need to transform anything, so we can get a small
+                # perf boost from skipping that work.
+                #
+                # but we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(cast("Iterable[object]", data))
+
+            return [entries.transform(entry) for entry in cast("Iterable[object]", data)]
+
+        if self._union_variants is not None:
+            for variant in self._union_variants:
+                data = variant.transform(data)
+            return data
+
+        if isinstance(data, pydantic.BaseModel):
+            return _dump_model(data)
+
+        if self._format is not None:
+            return _format_data(data, self._format.format, self._format.format_template)  # type: ignore[arg-type]
+
+        return data
+
+    async def async_transform(self, data: object) -> object:
+        if not self.needs_async:
+            return self.transform(data)
+
+        typeddict_fields = self._typeddict_fields
+        if typeddict_fields is not None and is_mapping(data):
+            result: dict[str, object] = {}
+            for key, value in data.items():
+                if not is_given(value):
+                    continue
+
+                field = typeddict_fields.get(key)
+                if field is None:
+                    result[key] = value
+                else:
+                    transformed_key, transformer = field
+                    result[transformed_key] = (
+                        await transformer.async_transform(value)
+                        if transformer.needs_async
+                        else transformer.transform(value)
+                    )
+            return result
+
+        dict_items = self._dict_items
+        if dict_items is not None and is_mapping(data):
+            return {key: await dict_items.async_transform(value) for key, value in data.items()}
+
+        if self._sequence_kind is not None and self._matches_sequence(data):
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            entries = self._sequence_entries
+            if entries is None:
+                if is_list(data):
+                    return data
+                return list(cast("Iterable[object]", data))
+
+            return [await entries.async_transform(entry) for entry in cast("Iterable[object]", data)]
+
+        if self._union_variants is not None:
+            for variant in self._union_variants:
+                data = await variant.async_transform(data) if variant.needs_async else variant.transform(data)
+            return data
+
+        if isinstance(data, pydantic.BaseModel):
+            return _dump_model(data)
+
+        if self._format is not None:
+            return await _async_format_data(data, self._format.format, self._format.format_template)  # type: ignore[arg-type]
+
+        return data
+
+
+_TransformerKey = Tuple[int, int]
+
+
+class _TransformerCache:
+    """A bounded cache of transformers that evicts the least recently used entry once it's full.
+
+    Each entry keeps a reference to its types so that their `id()` can't be reused while it is cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[_TransformerKey, tuple[type, type, _Transformer]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: _TransformerKey) -> _Transformer | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # the entry was evicted by another thread
+            pass
+
+        return entry[2]
+
+    def update(self, entries: dict[_TransformerKey, tuple[type, type, _Transformer]]) -> None:
+        self._entries.update(entries)
+
+        while len(self._entries) > self.maxsize:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                break
+
+
+_transformers = _TransformerCache(maxsize=4096)
+
+
+def _get_transformer(
     annotation: type,
     inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
+    *,
+    building: dict[_TransformerKey, tuple[type, type, _Transformer]] | None = None,
+) -> _Transformer:
+    """Returns the cached transformer for the given type, building it if necessary.
 
     Args:
         annotation: The direct type annotation given to the particular piece of data.
@@ -169,68 +466,63 @@ def _transform_recursive(
 
             Defaults to the same value as the `annotation` argument.
     """
-    from .._compat import model_dump
-
     if inner_type is None:
         inner_type = annotation
 
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return _transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-        # Sequence[T]
-        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = _transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
+    # note: we key on the identity of the types, the cached entries hold a reference to
+    # them to ensure that the `id()` can't be reused
+    key = (id(annotation), id(inner_type))
+    cached = _transformers.get(key)
+    if cached is not None:
+        return cached
 
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json", exclude=getattr(data, "__api_exclude__", None))
+    if building is not None:
+        pending = building.get(key)
+        if pending is not None:
+            # this is a recursive type that we're currently building
+            return pending[2]
 
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
+        transformer = _Transformer()
+        building[key] = (annotation, inner_type, transformer)
+        transformer._build(annotation, inner_type, building=building)
+        return transformer
 
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return _format_data(data, annotation.format, annotation.format_template)
+    building = {}
+    transformer = _Transformer()
+    building[key] = (annotation, inner_type, transformer)
+    transformer._build(annotation, inner_type, building=building)
+    _resolve_flags([entry[2] for entry in building.values()])
 
-    return data
+    # only publish the transformers once every nested transformer has been fully built
+    _transformers.update(building)
+    return transformer
+
+
+def _resolve_flags(transformers: list[_Transformer]) -> None:
+    """Propagates the `plain` & `needs_async` flags through the given transformers.
+
+    Recursive types mean that there can be cycles so we iterate until nothing changes.
+    """
+    for transformer in transformers:
+        transformer.plain = transformer._own_plain
+        transformer.needs_async = transformer._own_async
+
+    changed = True
+    while changed:
+        changed = False
+        for transformer in transformers:
+            plain = transformer.plain and all(child.plain for child in transformer._children)
+            needs_async = transformer.needs_async or any(child.needs_async for child in transformer._children)
+            if plain != transformer.plain or needs_async != transformer.needs_async:
+                transformer.plain = plain
+                transformer.needs_async = needs_async
+                changed = True
+
+
+def _dump_model(data: pydantic.BaseModel) -> object:
+    from .._compat import model_dump
+
+    return model_dump(data, exclude_unset=True, mode="json", exclude=getattr(data, "__api_exclude__", None))
 
 
 def _format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
@@ -260,27 +552,6 @@ def _format_data(data: object, format_: PropertyFormat, format_template: str | N
     return data
 
 
-def _transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include omitted values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = _transform_recursive(value, annotation=type_)
-    return result
-
-
 async def async_maybe_transform(
     data: object,
     expected_type: object,
@@ -313,92 +584,10 @@ async def async_transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = await _async_transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = await _get_transformer(cast(type, expected_type)).async_transform(data)
     return cast(_T, transformed)
 
 
-async def _async_transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
-
-    Args:
-        annotation: The direct type annotation given to the particular piece of data.
-            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
-
-        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
-            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
-            the list can be transformed using the metadata from the container type.
-
-            Defaults to the same value as the `annotation` argument.
-    """
-    from .._compat import model_dump
-
-    if inner_type is None:
-        inner_type = annotation
-
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return await _async_transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-        # Sequence[T]
-        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [await _async_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = await _async_transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
-
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json")
-
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
-
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return await _async_format_data(data, annotation.format, annotation.format_template)
-
-    return data
-
-
 async def _async_format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
     if isinstance(data, (date, datetime)):
         if format_ == "iso8601":
@@ -426,27 +615,6 @@ async def _async_format_data(data: object, format_: PropertyFormat, format_templ
     return data
 
 
-async def _async_transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include omitted values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = await _async_transform_recursive(value, annotation=type_)
-    return result
-
-
 @lru_cache(maxsize=8096)
 def get_type_hints(
     obj: Any,
@@ -0,0 +1,473 @@
+from __future__ import annotations
+
+import sys
+import array
+import base64
+import logging
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Set,
+    Dict,
+    List,
+    Deque,
+    Tuple,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Awaitable,
+    AsyncIterator,
+    cast,
+)
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import anyio
+
+from .._extras import numpy as np, has_numpy
+from .._models import BaseModel
+from ._uploads import _validate_max_concurrency
+from .._exceptions import BadRequestError
+from ..types.create_embedding_response import Usage
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+__all__ = [
+    "EmbeddingMatrix",
+    "Base64EmbeddingResponse",
+    "decode_embedding_matrix",
+    "pack_inputs",
+    "embed_batches",
+    "async_embed_batches",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# embeddings are returned as little-endian float32 values when requested in the base64 format
+_FLOAT32 = "<f4"
+
+
+class Base64Embedding(BaseModel):
+    embedding: Union[str, List[float]]
+    """The base64 encoded embedding, or a list of floats if the API ignored the requested format"""
+
+    index: int
+
+
+class Base64EmbeddingResponse(BaseModel):
+    """An embeddings response requested with `encoding_format="base64"`.
+
+    The embeddings are left encoded so that they can be decoded directly into a matrix.
+    """
+
+    data: List[Base64Embedding]
+
+    model: str
+
+    usage: Usage
+
+
+class EmbeddingMatrix:
+    """The embeddings for a list of inputs, stored in a single contiguous float32 buffer.
+
+    `data` is a `(len(input), dimensions)` NumPy array if NumPy is installed, otherwise it is
+    an `array.array` of every embedding in row-major order.
+    """
+
+    data: Union[npt.NDArray[np.float32], array.array[float]]
+
+    shape: Tuple[int, int]
+    """The number of embeddings and the number of dimensions of each embedding"""
+
+    model: str
+    """The name of the model used to generate the embeddings"""
+
+    usage: Usage
+    """The usage information for the request"""
+
+    offset: int
+    """The index of the input that the first embedding is for, when the inputs were split
+    across several matrices by `embed_many()`"""
+
+    def __init__(
+        self,
+        data: Union[npt.NDArray[np.float32], array.array[float]],
+        *,
+        shape: Tuple[int, int],
+        model: str,
+        usage: Usage,
+        offset: int = 0,
+    ) -> None:
+        self.data = data
+        self.shape = shape
+        self.model = model
+        self.usage = usage
+        self.offset = offset
+
+    def row(self, index: int) -> Sequence[float]:
+        """Returns the embedding for the input at the given index, without copying it if possible"""
+        if index < 0:
+            index += self.shape[0]
+        if not 0 <= index < self.shape[0]:
+            raise IndexError(f"Embedding index {index} is out of range for {self.shape[0]} embeddings")
+
+        if isinstance(self.data, array.array):
+            dimensions = self.shape[1]
+            return cast(Sequence[float], memoryview(self.data)[index * dimensions : (index + 1) * dimensions])
+
+        return cast(Sequence[float], self.data[index])
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+
+def _embedding_bytes(embedding: Base64Embedding) -> bytes:
+    if isinstance(embedding.embedding, str):
+        return base64.b64decode(embedding.embedding)
+
+    values = array.array("f", embedding.embedding)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def decode_embedding_matrix(response: Base64EmbeddingResponse) -> EmbeddingMatrix:
+    """Decodes every base64 encoded embedding in the response into a single preallocated
+    float32 matrix, ordered by the index of each embedding.
+    """
+    if not response.data:
+        raise ValueError("No embedding data received")
+
+    return embedding_matrix_from_rows(
+        [(embedding.index, _embedding_bytes(embedding)) for embedding in response.data],
+        model=response.model,
+        usage=response.usage,
+    )
+
+
+def embedding_matrix_from_rows(rows: Sequence[Tuple[int, bytes]], *, model: str, usage: Usage) -> EmbeddingMatrix:
+    """Copies the given little-endian float32 embeddings into a single preallocated matrix,
+    placing each embedding at the given row index.
+
+    The row indices must be exactly `0..len(rows) - 1` so that every row of the matrix is filled.
+    """
+    row_size = len(rows[0][1])
+    shape = (len(rows), row_size // 4)
+
+    seen: Set[int] = set()
+    for index, buffer in rows:
+        if len(buffer) != row_size:
+            raise ValueError(
+                f"Expected every embedding to have {shape[1]} dimensions but embedding {index} has {len(buffer) // 4}"
+            )
+        if not 0 <= index < len(rows):
+            raise ValueError(f"Received an embedding with index {index} for {len(rows)} inputs")
+        if index in seen:
+            raise ValueError(f"Received more than one embedding with index {index}")
+        seen.add(index)
+
+    if has_numpy():
+        matrix: npt.NDArray[np.float32] = np.empty(shape, dtype=np.float32)
+        for index, buffer in rows:
+            matrix[index] = np.frombuffer(buffer, dtype=_FLOAT32)  # type: ignore[no-untyped-call]
+
+        return EmbeddingMatrix(matrix, shape=shape, model=model, usage=usage)
+
+    contents = bytearray(len(rows) * row_size)
+    for index, buffer in rows:
+        contents[index * row_size : (index + 1) * row_size] = buffer
+
+    values = array.array("f")
+    values.frombytes(contents)
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return EmbeddingMatrix(values, shape=shape, model=model, usage=usage)
+
+
+def embedding_row_bytes(matrix: EmbeddingMatrix, index: int) -> bytes:
+    """Returns the embedding at the given row of the matrix as little-endian float32 bytes"""
+    if isinstance(matrix.data, array.array):
+        dimensions = matrix.shape[1]
+        values = matrix.data[index * dimensions : (index + 1) * dimensions]
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tobytes()
+
+    return bytes(matrix.data[index].astype(_FLOAT32, copy=False).tobytes())
+
+
+def concat_embedding_matrices(matrices: Sequence[EmbeddingMatrix]) -> EmbeddingMatrix:
+    """Joins the given matrices, in order, into a single matrix"""
+    first = matrices[0]
+    for matrix in matrices:
+        if matrix.shape[1] != first.shape[1]:
+            raise ValueError(
+                f"Expected every embedding to have {first.shape[1]} dimensions but received {matrix.shape[1]}"
+            )
+
+    data: Union[npt.NDArray[np.float32], array.array[float]]
+    if isinstance(first.data, array.array):
+        data = array.array("f")
+        for matrix in matrices:
+            data.extend(cast("array.array[float]", matrix.data))
+    else:
+        data = np.concatenate([matrix.data for matrix in matrices])
+
+    return EmbeddingMatrix(
+        data,
+        shape=(sum(matrix.shape[0] for matrix in matrices), first.shape[1]),
+        model=first.model,
+        usage=Usage(
+            prompt_tokens=sum(matrix.usage.prompt_tokens for matrix in matrices),
+            total_tokens=sum(matrix.usage.total_tokens for matrix in matrices),
+        ),
+        offset=first.offset,
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """A cheap, deliberately generous estimate of the number of tokens in the given text"""
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def pack_inputs(
+    input: Iterable[str],
+    *,
+    max_inputs: int,
+    max_tokens: int,
+    count_tokens: Optional[Callable[[str], int]] = None,
+) -> Iterator[Tuple[int, List[str]]]:
+    """Lazily packs the inputs into batches of at most `max_inputs` inputs and `max_tokens`
+    tokens, yielding the index of the first input in each batch along with the batch.
+
+    An input that is larger than `max_tokens` by itself is sent on its own.
+    """
+    if isinstance(input, str):
+        raise TypeError("Expected `input` to be an iterable of strings but received a single string")
+    if max_inputs < 1:
+        raise ValueError(f"Expected `max_inputs_per_request` to be a positive integer but received {max_inputs}")
+    if max_tokens < 1:
+        raise ValueError(f"Expected `max_tokens_per_request` to be a positive integer but received {max_tokens}")
+
+    return _pack_inputs(
+        input, max_inputs=max_inputs, max_tokens=max_tokens, count_tokens=count_tokens or estimate_tokens
+    )
+
+
+def _pack_inputs(
+    input: Iterable[str],
+    *,
+    max_inputs: int,
+    max_tokens: int,
+    count_tokens: Callable[[str], int],
+) -> Iterator[Tuple[int, List[str]]]:
+    offset = 0
+    batch: List[str] = []
+    tokens = 0
+
+    for text in input:
+        text_tokens = count_tokens(text)
+        if batch and (len(batch) >= max_inputs or tokens + text_tokens > max_tokens):
+            yield offset, batch
+            offset += len(batch)
+            batch = []
+            tokens = 0
+
+        batch.append(text)
+        tokens += text_tokens
+
+    if batch:
+        yield offset, batch
+
+
+def _is_token_limit_error(err: BadRequestError) -> bool:
+    """Whether the request was rejected because its inputs had too many tokens in total"""
+    return err.code == "max_tokens_per_request" or "tokens per request" in err.message
+
+
+def _embed_batch(embed: Callable[[List[str]], EmbeddingMatrix], offset: int, batch: List[str]) -> EmbeddingMatrix:
+    try:
+        matrix = embed(batch)
+    except BadRequestError as err:
+        # the batch may have been rejected because the token estimate was too low, so the
+        # halves are retried on their own until the input that was rejected is found
+        if len(batch) == 1 or not _is_token_limit_error(err):
+            raise
+
+        half = len(batch) // 2
+        log.info("Embedding request for %s inputs was rejected, retrying it as two requests", len(batch))
+        matrix = concat_embedding_matrices(
+            [_embed_batch(embed, offset, batch[:half]), _embed_batch(embed, offset + half, batch[half:])]
+        )
+
+    matrix.offset = offset
+    return matrix
+
+
+async def _async_embed_batch(
+    embed: Callable[[List[str]], Awaitable[EmbeddingMatrix]], offset: int, batch: List[str]
+) -> EmbeddingMatrix:
+    try:
+        matrix = await embed(batch)
+    except BadRequestError as err:
+        if len(batch) == 1 or not _is_token_limit_error(err):
+            raise
+
+        half = len(batch) // 2
+        log.info("Embedding request for %s inputs was rejected, retrying it as two requests", len(batch))
+        matrix = concat_embedding_matrices(
+            [
+                await _async_embed_batch(embed, offset, batch[:half]),
+                await _async_embed_batch(embed, offset + half, batch[half:]),
+            ]
+        )
+
+    matrix.offset = offset
+    return matrix
+
+
+def embed_batches(
+    batches: Iterator[Tuple[int, List[str]]],
+    embed: Callable[[List[str]], EmbeddingMatrix],
+    *,
+    max_concurrency: int,
+) -> Iterator[EmbeddingMatrix]:
+    """Embeds the given batches, up to `max_concurrency` at a time in a thread pool, yielding
+    a matrix for each batch in the order the batches were given.
+
+    Batches are taken lazily, only once there's a free worker to send them. If a batch fails
+    then the batches that haven't been sent yet are cancelled and the error is raised.
+    """
+    _validate_max_concurrency(max_concurrency)
+    return _embed_batches(batches, embed, max_concurrency=max_concurrency)
+
+
+def _embed_batches(
+    batches: Iterator[Tuple[int, List[str]]],
+    embed: Callable[[List[str]], EmbeddingMatrix],
+    *,
+    max_concurrency: int,
+) -> Iterator[EmbeddingMatrix]:
+    if max_concurrency == 1:
+        for offset, batch in batches:
+            yield _embed_batch(embed, offset, batch)
+        return
+
+    pending: Deque[Future[EmbeddingMatrix]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="openai-embed") as executor:
+        try:
+            while True:
+                for offset, batch in itertools.islice(batches, max_concurrency - len(pending)):
+                    pending.append(executor.submit(_embed_batch, embed, offset, batch))
+
+                if not pending:
+                    return
+
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def async_embed_batches(
+    batches: Iterator[Tuple[int, List[str]]],
+    embed: Callable[[List[str]], Awaitable[EmbeddingMatrix]],
+    *,
+    max_concurrency: int,
+) -> AsyncIterator[EmbeddingMatrix]:
+    """Embeds the given batches, yielding a matrix for each batch in order, see `embed_batches()`.
+
+    Note: if the iterator isn't exhausted then it should be closed with `aclose()` so that
+    the batches that are still being sent are cancelled.
+    """
+    _validate_max_concurrency(max_concurrency)
+    return _async_embed_batches(batches, embed, max_concurrency=max_concurrency)
+
+
+async def _async_embed_batches(
+    batches: Iterator[Tuple[int, List[str]]],
+    embed: Callable[[List[str]], Awaitable[EmbeddingMatrix]],
+    *,
+    max_concurrency: int,
+) -> AsyncIterator[EmbeddingMatrix]:
+    if max_concurrency == 1:
+        for offset, batch in batches:
+            yield await _async_embed_batch(embed, offset, batch)
+        return
+
+    # a batch holds the semaphore from when it's sent until its matrix has been yielded
+    semaphore = anyio.Semaphore(max_concurrency)
+    finished: Dict[int, anyio.Event] = {}
+    results: Dict[int, EmbeddingMatrix] = {}
+    errors: Dict[int, Exception] = {}
+    # the number of batches, set once every batch has been sent
+    count = -1
+    error: Optional[Exception] = None
+
+    def finished_event(index: int) -> anyio.Event:
+        if index not in finished:
+            finished[index] = anyio.Event()
+        return finished[index]
+
+    async with anyio.create_task_group() as task_group:
+
+        async def embed_batch(index: int, offset: int, batch: List[str]) -> None:
+            try:
+                results[index] = await _async_embed_batch(embed, offset, batch)
+            except Exception as exc:
+                # errors are raised in order by the iterator, which then cancels the other batches,
+                # rather than from here while the caller's own code may be running
+                errors[index] = exc
+            finally:
+                finished_event(index).set()
+
+        async def send_batches() -> None:
+            nonlocal count
+
+            index = 0
+            while True:
+                await semaphore.acquire()
+
+                try:
+                    item = next(batches, None)
+                except Exception as exc:
+                    errors[index] = exc
+                    finished_event(index).set()
+                    return
+
+                if item is None:
+                    break
+
+                task_group.start_soon(embed_batch, index, *item)
+                index += 1
+
+            count = index
+            finished_event(index).set()
+
+        task_group.start_soon(send_batches)
+
+        index = 0
+        while True:
+            await finished_event(index).wait()
+            del finished[index]
+
+            if index == count:
+                break
+
+            if index in errors:
+                error = errors[index]
+                task_group.cancel_scope.cancel()
+                break
+
+            yield results.pop(index)
+            semaphore.release()
+            index += 1
+
+    if error is not None:
+        raise error
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Union, Callable, Iterable, Optional, Awaitable, AsyncIterable
+from typing_extensions import override
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import anyio
+
+from .._types import FileTypes
+from ..types.file_object import FileObject
+from ..types.vector_stores.vector_store_file import LastError, VectorStoreFile
+from ..types.vector_stores.vector_store_file_batch import VectorStoreFileBatch
+
+__all__ = ["IngestedFile", "VectorStoreIngestion", "ingest_files", "async_ingest_files"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class IngestedFile:
+    """The outcome of ingesting a single file into a vector store"""
+
+    file: FileTypes
+    """The file that was given to be ingested"""
+
+    file_id: Optional[str]
+    """The ID of the uploaded file, or `None` if it couldn't be uploaded"""
+
+    batch_id: Optional[str]
+    """The ID of the file batch the file was added to, or `None` if it wasn't added to one"""
+
+    error: Optional[Exception]
+    """The error raised while uploading the file or creating its file batch"""
+
+    last_error: Optional[LastError]
+    """The error reported by the vector store if the file couldn't be processed"""
+
+    def __init__(self, file: FileTypes) -> None:
+        self.file = file
+        self.file_id = None
+        self.batch_id = None
+        self.error = None
+        self.last_error = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.batch_id is not None and self.error is None and self.last_error is None
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"IngestedFile(file_id={self.file_id!r}, batch_id={self.batch_id!r}, "
+            f"error={self.error!r}, last_error={self.last_error!r})"
+        )
+
+
+class VectorStoreIngestion:
+    """The outcome of ingesting files into a vector store"""
+
+    files: List[IngestedFile]
+    """Every file that was given to be ingested, in the order they were given"""
+
+    batches: List[VectorStoreFileBatch]
+    """The file batches that were created, in the order they finished processing"""
+
+    def __init__(self) -> None:
+        self.files = []
+        self.batches = []
+
+    @property
+    def failed(self) -> List[IngestedFile]:
+        """The files that couldn't be uploaded, added to a batch or processed"""
+        return [file for file in self.files if not file.succeeded]
+
+
+def _validate(*, max_concurrency: int, batch_size: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f"Expected `max_concurrency` to be a positive integer but received {max_concurrency}")
+    if batch_size < 1:
+        raise ValueError(f"Expected `batch_size` to be a positive integer but received {batch_size}")
+
+
+def _record_batch(ingestion: VectorStoreIngestion, entries: List[IngestedFile], batch: VectorStoreFileBatch) -> None:
+    ingestion.batches.append(batch)
+    for entry in entries:
+        entry.batch_id = batch.id
+
+
+def _record_batch_error(entries: List[IngestedFile], exc: Exception) -> None:
+    log.warning("Could not create a file batch for %s files", len(entries), exc_info=exc)
+    for entry in entries:
+        entry.error = exc
+
+
+def _record_failed_files(entries: List[IngestedFile], failed_files: Iterable[VectorStoreFile]) -> None:
+    last_errors = {file.id: file.last_error for file in failed_files}
+    for entry in entries:
+        entry.last_error = last_errors.get(entry.file_id) if entry.file_id else None
+
+
+def _record_failed_files_error(batch: VectorStoreFileBatch, exc: Exception) -> None:
+    # the batch itself was created, so its files keep their `batch_id` and only miss their `last_error`
+    log.warning("Could not list the failed files of file batch %s", batch.id, exc_info=exc)
+
+
+def ingest_files(
+    files: Iterable[FileTypes],
+    *,
+    upload: Callable[[FileTypes], FileObject],
+    create_batch: Callable[[List[str]], VectorStoreFileBatch],
+    list_failed_files: Callable[[VectorStoreFileBatch], Iterable[VectorStoreFile]],
+    max_concurrency: int,
+    batch_size: int,
+) -> VectorStoreIngestion:
+    """Uploads files in a thread pool, adding them to the vector store in batches of up to
+    `batch_size` files as soon as they've been uploaded.
+
+    Files are consumed lazily and errors are recorded against each file instead of being raised.
+    """
+    _validate(max_concurrency=max_concurrency, batch_size=batch_size)
+
+    ingestion = VectorStoreIngestion()
+    uploaded: List[IngestedFile] = []
+    uploads: Dict[Future[FileObject], IngestedFile] = {}
+    batches: Dict[Future[VectorStoreFileBatch], List[IngestedFile]] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="openai-ingest-upload"
+    ) as upload_executor, ThreadPoolExecutor(thread_name_prefix="openai-ingest-batch") as batch_executor:
+
+        def submit_batches(*, flush: bool) -> None:
+            while len(uploaded) >= batch_size or (flush and uploaded):
+                entries = uploaded[:batch_size]
+                del uploaded[:batch_size]
+                future = batch_executor.submit(create_batch, [entry.file_id for entry in entries if entry.file_id])
+                batches[future] = entries
+
+        def handle_upload(future: Future[FileObject]) -> None:
+            entry = uploads.pop(future)
+            try:
+                entry.file_id = future.result().id
+            except Exception as exc:
+                log.warning("Could not upload file %r", entry.file, exc_info=exc)
+                entry.error = exc
+            else:
+                uploaded.append(entry)
+                submit_batches(flush=False)
+
+        def handle_batch(future: Future[VectorStoreFileBatch]) -> None:
+            entries = batches.pop(future)
+            try:
+                batch = future.result()
+            except Exception as exc:
+                _record_batch_error(entries, exc)
+                return
+
+            _record_batch(ingestion, entries, batch)
+            if batch.file_counts.failed:
+                try:
+                    _record_failed_files(entries, list_failed_files(batch))
+                except Exception as exc:
+                    _record_failed_files_error(batch, exc)
+
+        def wait_for_any() -> None:
+            pending: List[Future[Any]] = [*uploads, *batches]
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in uploads:
+                    handle_upload(future)
+                else:
+                    handle_batch(future)
+
+        try:
+            for file in files:
+                while len(uploads) >= max_concurrency:
+                    wait_for_any()
+
+                entry = IngestedFile(file)
+                ingestion.files.append(entry)
+                uploads[upload_executor.submit(upload, file)] = entry
+
+            while uploads:
+                wait_for_any()
+
+            submit_batches(flush=True)
+
+            while batches:
+                wait_for_any()
+        except BaseException:
+            pending: List[Future[Any]] = [*uploads, *batches]
+            for future in pending:
+                future.cancel()
+            raise
+
+    return ingestion
+
+
+async def async_ingest_files(
+    files: Union[Iterable[FileTypes], AsyncIterable[FileTypes]],
+    *,
+    upload: Callable[[FileTypes], Awaitable[FileObject]],
+    create_batch: Callable[[List[str]], Awaitable[VectorStoreFileBatch]],
+    list_failed_files: Callable[[VectorStoreFileBatch], Awaitable[List[VectorStoreFile]]],
+    max_concurrency: int,
+    batch_size: int,
+) -> VectorStoreIngestion:
+    """Uploads files concurrently, adding them to the vector store in batches of up to
+    `batch_size` files as soon as they've been uploaded, see `ingest_files()`.
+    """
+    _validate(max_concurrency=max_concurrency, batch_size=batch_size)
+
+    ingestion = VectorStoreIngestion()
+    uploaded: List[IngestedFile] = []
+    semaphore = anyio.Semaphore(max_concurrency)
+
+    async with anyio.create_task_group() as task_group:
+
+        async def ingest_batch(entries: List[IngestedFile]) -> None:
+            try:
+                batch = await create_batch([entry.file_id for entry in entries if entry.file_id])
+            except Exception as exc:
+                _record_batch_error(entries, exc)
+                return
+
+            _record_batch(ingestion, entries, batch)
+            if batch.file_counts.failed:
+                try:
+                    _record_failed_files(entries, await list_failed_files(batch))
+                except Exception as exc:
+                    _record_failed_files_error(batch, exc)
+
+        def submit_batches(*, flush: bool) -> None:
+            while len(uploaded) >= batch_size or (flush and uploaded):
+                entries = uploaded[:batch_size]
+                del uploaded[:batch_size]
+                task_group.start_soon(ingest_batch, entries)
+
+        async def upload_file(entry: IngestedFile) -> None:
+            try:
+                entry.file_id = (await upload(entry.file)).id
+            except Exception as exc:
+                log.warning("Could not upload file %r", entry.file, exc_info=exc)
+                entry.error = exc
+            else:
+                uploaded.append(entry)
+                submit_batches(flush=False)
+            finally:
+                semaphore.release()
+
+        async def start_upload(file: FileTypes) -> None:
+            await semaphore.acquire()
+            entry = IngestedFile(file)
+            ingestion.files.append(entry)
+            task_group.start_soon(upload_file, entry)
+
+        if isinstance(files, AsyncIterable):
+            async for file in files:
+                await start_upload(file)
+        else:
+            for file in files:
+                await start_upload(file)
+
+        # wait for every upload to finish before adding the remaining files to a batch
+        for _ in range(max_concurrency):
+            await semaphore.acquire()
+
+        submit_batches(flush=True)
+
+    return ingestion
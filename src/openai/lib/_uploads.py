@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import IO, Any, Dict, List, Tuple, Union, Mapping, Callable, Iterator, Optional, Awaitable, cast
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import anyio
+import anyio.to_thread
+
+from .._files import FileRange
+from ..types.upload import Upload
+from ..types.uploads.upload_part import UploadPart
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class PartReader:
+    """Splits a file into parts.
+
+    Each part is a `FileRange` that is streamed from disk, or from the in-memory file, as it's
+    uploaded, so parts are never copied into memory. Parts can be uploaded in any order.
+    """
+
+    def __init__(self, file: Union[Path, bytes], *, part_size: int) -> None:
+        if part_size <= 0:
+            raise ValueError(f"Expected `part_size` to be a positive integer but received {part_size}")
+
+        self._file = file
+        self._part_size = part_size
+        self._total_size = len(file) if isinstance(file, bytes) else file.stat().st_size
+        self._offset = 0
+
+    def read_part(self) -> Optional[FileRange]:
+        """Returns the next part of the file, or `None` once the whole file has been read"""
+        offset = self._offset
+        size = self.skip_part()
+        if not size:
+            return None
+        return FileRange(self._file, offset, size)
+
+    def skip_part(self) -> int:
+        """Skips over the next part of the file, returning its size"""
+        size = min(self._part_size, self._total_size - self._offset)
+        if size <= 0:
+            return 0
+
+        self._offset += size
+        return size
+
+    def iter_parts(self, *, skip: Mapping[int, str]) -> Iterator[Tuple[int, FileRange]]:
+        """Iterate over the index and contents of every part, apart from the parts in `skip`"""
+        index = 0
+        while True:
+            if index in skip:
+                if not self.skip_part():
+                    # EOF
+                    return
+            else:
+                part = self.read_part()
+                if part is None:
+                    # EOF
+                    return
+                yield index, part
+
+            index += 1
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f"Expected `max_concurrency` to be a positive integer but received {max_concurrency}")
+
+
+def upload_parts(
+    reader: PartReader,
+    create_part: Callable[[IO[bytes]], UploadPart],
+    *,
+    upload_id: str,
+    max_concurrency: int,
+    uploaded: Mapping[int, str] = {},
+    on_uploaded: Optional[Callable[[int, int, str], None]] = None,
+) -> List[str]:
+    """Uploads every part from the given reader, returning the part IDs in the order the parts were read.
+
+    At most `max_concurrency` parts are uploaded at once. If any part
+    fails to upload then the parts that haven't been started yet are cancelled and the
+    error is raised.
+
+    Parts in `uploaded`, a mapping of part indexes to IDs, are skipped. `on_uploaded` is
+    called with the index, size & ID of each part once it has been uploaded.
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    part_ids: Dict[int, str] = dict(uploaded)
+
+    def upload_part(index: int, data: FileRange) -> None:
+        with data:
+            part = create_part(cast(IO[bytes], data))
+        log.info("Uploaded part %s for upload %s", part.id, upload_id)
+        if on_uploaded is not None:
+            on_uploaded(index, data.size, part.id)
+        part_ids[index] = part.id
+
+    if max_concurrency == 1:
+        for index, data in reader.iter_parts(skip=uploaded):
+            upload_part(index, data)
+        return _ordered_part_ids(part_ids)
+
+    pending: set[Future[None]] = set()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="openai-upload-part") as executor:
+        try:
+            for index, data in reader.iter_parts(skip=uploaded):
+                while len(pending) >= max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        # raises the error if the part failed to upload
+                        future.result()
+
+                pending.add(executor.submit(upload_part, index, data))
+
+            for future in pending:
+                future.result()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    return _ordered_part_ids(part_ids)
+
+
+async def async_upload_parts(
+    reader: PartReader,
+    create_part: Callable[[bytes], Awaitable[UploadPart]],
+    *,
+    upload_id: str,
+    max_concurrency: int,
+    uploaded: Mapping[int, str] = {},
+    on_uploaded: Optional[Callable[[int, int, str], None]] = None,
+) -> List[str]:
+    """Uploads every part from the given reader, returning the part IDs in the order the parts were read.
+
+    Parts are read, and `on_uploaded` is called, in a worker thread so that file IO doesn't block
+    the event loop, see `upload_parts()`. As `httpx` reads file objects synchronously the contents
+    of each part are read up front, so at most `max_concurrency` parts are held in memory at once.
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    part_ids: Dict[int, str] = dict(uploaded)
+    errors: List[BaseException] = []
+    semaphore = anyio.Semaphore(max_concurrency)
+    parts = reader.iter_parts(skip=uploaded)
+
+    async with anyio.create_task_group() as task_group:
+
+        async def upload_part(index: int, data: FileRange) -> None:
+            try:
+                with data:
+                    content = await anyio.to_thread.run_sync(data.read)
+                part = await create_part(content)
+                log.info("Uploaded part %s for upload %s", part.id, upload_id)
+                if on_uploaded is not None:
+                    await anyio.to_thread.run_sync(on_uploaded, index, data.size, part.id)
+            except Exception as exc:
+                # the first error is raised once the task group has exited, this avoids
+                # `anyio` wrapping it in an `ExceptionGroup`
+                errors.append(exc)
+                task_group.cancel_scope.cancel()
+                return
+            finally:
+                semaphore.release()
+
+            part_ids[index] = part.id
+
+        while True:
+            await semaphore.acquire()
+
+            item = await anyio.to_thread.run_sync(next, parts, None)
+            if item is None:
+                # EOF
+                semaphore.release()
+                break
+
+            task_group.start_soon(upload_part, *item)
+
+    if errors:
+        raise errors[0]
+
+    return _ordered_part_ids(part_ids)
+
+
+def _ordered_part_ids(part_ids: Dict[int, str]) -> List[str]:
+    return [part_ids[index] for index in sorted(part_ids)]
+
+
+class UploadManifest:
+    """A record of the parts of a file that have been uploaded, persisted to disk so that an
+    upload can be resumed if the process uploading it is interrupted.
+
+    The manifest is rewritten atomically after every part is uploaded and deleted once the
+    upload has been completed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, os.PathLike[str]], data: Dict[str, Any]) -> None:
+        self._path = Path(path)
+        self._data = data
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, os.PathLike[str]],
+        *,
+        filename: str,
+        bytes: int,
+        part_size: int,
+        mime_type: str,
+        purpose: str,
+    ) -> Optional[UploadManifest]:
+        """Returns the manifest at the given path if it exists and describes an upload of the same
+        file that can still be resumed"""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            log.warning("Ignoring invalid upload manifest at %s", path)
+            return None
+
+        expected = {
+            "version": cls.VERSION,
+            "filename": filename,
+            "bytes": bytes,
+            "part_size": part_size,
+            "mime_type": mime_type,
+            "purpose": purpose,
+        }
+        if not isinstance(data, dict):
+            log.warning("Ignoring invalid upload manifest at %s", path)
+            return None
+
+        data = cast(Dict[str, Any], data)
+        if any(data.get(key) != value for key, value in expected.items()):
+            log.info("Upload manifest at %s is for a different file, starting a new upload", path)
+            return None
+
+        manifest = cls(path, data)
+        if manifest.expires_at <= time.time():
+            log.info("Upload %s has expired, starting a new upload", manifest.upload_id)
+            return None
+
+        return manifest
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, os.PathLike[str]],
+        *,
+        upload: Upload,
+        filename: str,
+        bytes: int,
+        part_size: int,
+        mime_type: str,
+        purpose: str,
+    ) -> UploadManifest:
+        manifest = cls(
+            path,
+            {
+                "version": cls.VERSION,
+                "upload_id": upload.id,
+                "filename": filename,
+                "bytes": bytes,
+                "part_size": part_size,
+                "mime_type": mime_type,
+                "purpose": purpose,
+                "expires_at": upload.expires_at,
+                "parts": [],
+            },
+        )
+        manifest._write()
+        return manifest
+
+    @property
+    def upload_id(self) -> str:
+        return cast(str, self._data["upload_id"])
+
+    @property
+    def expires_at(self) -> int:
+        return cast(int, self._data["expires_at"])
+
+    @property
+    def uploaded_parts(self) -> Dict[int, str]:
+        """A mapping of the index of each part that has been uploaded to its ID"""
+        part_size = cast(int, self._data["part_size"])
+        return {part["offset"] // part_size: part["id"] for part in self._data["parts"]}
+
+    def record_part(self, index: int, size: int, part_id: str) -> None:
+        with self._lock:
+            self._data["parts"].append({"offset": index * self._data["part_size"], "size": size, "id": part_id})
+            self._write()
+
+    def delete(self) -> None:
+        try:
+            self._path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write(self) -> None:
+        tmp_path = self._path.with_name(f".{self._path.name}.tmp")
+        tmp_path.write_text(json.dumps(self._data), encoding="utf-8")
+        os.replace(tmp_path, self._path)
@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import os
 import inspect
-from typing import Any, Union, Mapping, TypeVar, Callable, Awaitable, cast, overload
+from typing import Any, Dict, Union, Generic, Mapping, TypeVar, Callable, Optional, Sequence, Awaitable, cast, overload
 from typing_extensions import Self, override
 
 import httpx
 
-from .._types import NOT_GIVEN, Omit, Query, Timeout, NotGiven
+from .._json import JSONCodecLike
+from .._types import NOT_GIVEN, Omit, Query, Timeout, NotGiven, HedgeAfter, HttpxSendArgs
 from .._utils import is_given, is_mapping
 from .._client import OpenAI, AsyncOpenAI
 from .._compat import model_copy
 from .._models import FinalRequestOptions
 from .._streaming import Stream, AsyncStream
-from .._exceptions import OpenAIError
+from .._coalescing import RequestCoalescer
+from .._exceptions import OpenAIError, CircuitBreakerOpenError
+from .._rate_limit import RateLimiter
 from .._base_client import DEFAULT_MAX_RETRIES, BaseClient
+from .._concurrency import AdaptiveConcurrencyLimiter
+from .._endpoint_pool import EndpointPool
+from .._circuit_breaker import CircuitBreaker
 
 _deployments_endpoints = set(
     [
@@ -34,6 +40,7 @@ AzureADTokenProvider = Callable[[], str]
 AsyncAzureADTokenProvider = Callable[[], "str | Awaitable[str]"]
 _HttpxClientT = TypeVar("_HttpxClientT", bound=Union[httpx.Client, httpx.AsyncClient])
 _DefaultStreamT = TypeVar("_DefaultStreamT", bound=Union[Stream[Any], AsyncStream[Any]])
+_TokenProviderT = TypeVar("_TokenProviderT", AzureADTokenProvider, AsyncAzureADTokenProvider)
 
 
 # we need to use a sentinel API key value for Azure AD
@@ -98,13 +105,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         azure_ad_token: str | None = None,
         azure_ad_token_provider: AzureADTokenProvider | None = None,
         organization: str | None = None,
+        project: str | None = None,
         webhook_secret: str | None = None,
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -118,13 +132,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         azure_ad_token: str | None = None,
         azure_ad_token_provider: AzureADTokenProvider | None = None,
         organization: str | None = None,
+        project: str | None = None,
         webhook_secret: str | None = None,
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -138,13 +159,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         azure_ad_token: str | None = None,
         azure_ad_token_provider: AzureADTokenProvider | None = None,
         organization: str | None = None,
+        project: str | None = None,
         webhook_secret: str | None = None,
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -164,9 +192,15 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         base_url: str | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new synchronous azure openai client instance.
@@ -242,10 +276,16 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            hedge_after=hedge_after,
             default_headers=default_headers,
             default_query=default_query,
             http_client=http_client,
+            http2=http2,
             websocket_base_url=websocket_base_url,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=pool_metrics,
             _strict_response_validation=_strict_response_validation,
         )
         self._api_version = api_version
@@ -269,7 +309,13 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
+        http2: bool | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
+        hedge_after: HedgeAfter | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -288,7 +334,13 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
             base_url=base_url,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=self._pool_metrics is not None if pool_metrics is None else pool_metrics,
             max_retries=max_retries,
+            hedge_after=hedge_after,
             default_headers=default_headers,
             set_default_headers=set_default_headers,
             default_query=default_query,
@@ -381,9 +433,17 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -402,9 +462,17 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -423,9 +491,17 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -445,9 +521,17 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         websocket_base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new asynchronous azure openai client instance.
@@ -523,10 +607,18 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            hedge_after=hedge_after,
             default_headers=default_headers,
             default_query=default_query,
             http_client=http_client,
+            http2=http2,
             websocket_base_url=websocket_base_url,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=pool_metrics,
+            concurrency_limiter=concurrency_limiter,
+            coalescer=coalescer,
             _strict_response_validation=_strict_response_validation,
         )
         self._api_version = api_version
@@ -550,7 +642,15 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
+        hedge_after: HedgeAfter | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -569,7 +669,15 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
             base_url=base_url,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=self._pool_metrics is not None if pool_metrics is None else pool_metrics,
+            concurrency_limiter=concurrency_limiter,
+            coalescer=coalescer,
             max_retries=max_retries,
+            hedge_after=hedge_after,
             default_headers=default_headers,
             set_default_headers=set_default_headers,
             default_query=default_query,
@@ -645,3 +753,562 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
 
         url = realtime_url.copy_with(params={**query})
         return url, auth_headers
+
+
+class _BaseAzureEndpoint(Generic[_TokenProviderT]):
+    azure_ad_token_provider: _TokenProviderT | None
+
+    def __init__(
+        self,
+        azure_endpoint: str,
+        *,
+        api_key: str | None = None,
+        azure_ad_token_provider: _TokenProviderT | None = None,
+        weight: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            azure_endpoint: Your Azure endpoint, including the resource, e.g. `https://example-resource.azure.openai.com/`
+
+            api_key: The API key for this resource.
+
+            azure_ad_token_provider: A function that returns an Azure Active Directory token for this resource, will be invoked on every request.
+
+            weight: The share of requests this resource should receive relative to the other resources.
+        """
+        if api_key is not None and azure_ad_token_provider is not None:
+            raise MutuallyExclusiveAuthError()
+
+        if api_key is None and azure_ad_token_provider is None:
+            raise OpenAIError(
+                f"Missing credentials for {azure_endpoint}. Please pass one of `api_key` or `azure_ad_token_provider`."
+            )
+
+        self.azure_endpoint = azure_endpoint
+        self.api_key = api_key
+        self.azure_ad_token_provider = azure_ad_token_provider
+        self.weight = weight
+        self.base_url = httpx.URL(f"{azure_endpoint.rstrip('/')}/openai/")
+
+
+class AzureEndpoint(_BaseAzureEndpoint[AzureADTokenProvider]):
+    """An Azure OpenAI resource that requests can be load balanced over, see `LoadBalancedAzureOpenAI`."""
+
+
+class AsyncAzureEndpoint(_BaseAzureEndpoint[AsyncAzureADTokenProvider]):
+    """An Azure OpenAI resource that requests can be load balanced over with an `azure_ad_token_provider`
+    that may be async, see `AsyncLoadBalancedAzureOpenAI`.
+    """
+
+
+class _LoadBalancedAzureClient(BaseAzureClient[_HttpxClientT, _DefaultStreamT]):
+    _endpoint_pool: EndpointPool
+    _endpoints: Dict[str, _BaseAzureEndpoint[Any]]
+
+    def _init_endpoints(
+        self, endpoints: Sequence[_BaseAzureEndpoint[Any]], *, cooldown: float, max_cooldown: float
+    ) -> None:
+        self._endpoints = {str(endpoint.base_url): endpoint for endpoint in endpoints}
+        self._endpoint_pool = EndpointPool(
+            [endpoint.base_url for endpoint in endpoints],
+            weights=[endpoint.weight for endpoint in endpoints],
+            cooldown=cooldown,
+            max_cooldown=max_cooldown,
+        )
+
+    @property
+    def endpoints(self) -> list[_BaseAzureEndpoint[Any]]:
+        return list(self._endpoints.values())
+
+    @property
+    @override
+    def auth_headers(self) -> dict[str, str]:
+        return {}
+
+    @override
+    def _prepare_url(self, url: str) -> httpx.URL:
+        """Merge a relative URL with the base URL of the endpoint the request should be sent to"""
+        merge_url = httpx.URL(url)
+        if merge_url.is_relative_url:
+            base_url = self._endpoint_pool.select()
+            return base_url.copy_with(raw_path=base_url.raw_path + merge_url.raw_path.lstrip(b"/"))
+
+        return merge_url
+
+    @override
+    def _get_warm_up_urls(self) -> list[httpx.URL]:
+        return self._endpoint_pool.base_urls
+
+    def _find_endpoint(self, url: httpx.URL) -> _BaseAzureEndpoint[Any] | None:
+        base_url = self._endpoint_pool.find(url)
+        return None if base_url is None else self._endpoints[str(base_url)]
+
+    @override
+    def _get_circuit_url(self, request: httpx.Request) -> httpx.URL:
+        # each endpoint has its own circuit
+        endpoint = self._find_endpoint(request.url)
+        return self.base_url if endpoint is None else endpoint.base_url
+
+    @override
+    def _is_circuit_open(self) -> bool:
+        breaker = self._circuit_breaker
+        return breaker is not None and all(breaker.is_open(base_url) for base_url in self._endpoint_pool.base_urls)
+
+    @override
+    def _can_retry_rejected_request(self) -> bool:
+        # the endpoint whose circuit is open has been taken out of rotation so the request can be sent to another one
+        return not self._is_circuit_open()
+
+    def _release_rejected_endpoint(self, endpoint: _BaseAzureEndpoint[Any], err: CircuitBreakerOpenError) -> None:
+        self._endpoint_pool.release(endpoint.base_url, success=False, retry_after=err.retry_after or None)
+
+    def _release_endpoint(self, endpoint: _BaseAzureEndpoint[Any], response: httpx.Response) -> None:
+        if response.status_code == 429 or response.status_code >= 500:
+            self._endpoint_pool.release(
+                endpoint.base_url,
+                success=False,
+                retry_after=self._parse_retry_after_header(response.headers),
+            )
+        else:
+            self._endpoint_pool.release(endpoint.base_url, success=True)
+
+    @override
+    def _calculate_retry_timeout(
+        self,
+        remaining_retries: int,
+        options: FinalRequestOptions,
+        response_headers: Optional[httpx.Headers] = None,
+    ) -> float:
+        # the endpoint that failed has been taken out of rotation so we can retry on another one straight away
+        if self._endpoint_pool.has_healthy_endpoint():
+            return 0
+
+        return super()._calculate_retry_timeout(remaining_retries, options, response_headers)
+
+
+class LoadBalancedAzureOpenAI(_LoadBalancedAzureClient[httpx.Client, Stream[Any]], AzureOpenAI):
+    """An `AzureOpenAI` client that spreads requests over several Azure OpenAI resources, e.g. deployments in different regions.
+
+    ```py
+    from openai import AzureEndpoint, LoadBalancedAzureOpenAI
+
+    client = LoadBalancedAzureOpenAI(
+        endpoints=[
+            AzureEndpoint("https://eastus-resource.openai.azure.com", api_key="...", weight=2),
+            AzureEndpoint("https://westeurope-resource.openai.azure.com", azure_ad_token_provider=token_provider),
+        ],
+        api_version="2024-10-21",
+    )
+    ```
+
+    Every request, including every retry, is sent to the healthy endpoint with the least load relative to its weight.
+    Endpoints that respond with a `429` or `5xx` status code or that can't be reached are taken out of rotation for a
+    while, so retries go to a different endpoint without waiting, see `EndpointPool` for details.
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoints: Sequence[AzureEndpoint],
+        api_version: str | None = None,
+        organization: str | None = None,
+        project: str | None = None,
+        webhook_secret: str | None = None,
+        timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
+        default_headers: Mapping[str, str] | None = None,
+        default_query: Mapping[str, object] | None = None,
+        http_client: httpx.Client | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        cooldown: float = 1.0,
+        max_cooldown: float = 60.0,
+        _strict_response_validation: bool = False,
+    ) -> None:
+        """Construct a new synchronous load balanced azure openai client instance.
+
+        This automatically infers the following arguments from their corresponding environment variables if they are not provided:
+        - `organization` from `OPENAI_ORG_ID`
+        - `project` from `OPENAI_PROJECT_ID`
+        - `api_version` from `OPENAI_API_VERSION`
+
+        Args:
+            endpoints: The Azure OpenAI resources to send requests to, each with its own credentials and weight.
+
+            cooldown: How long, in seconds, an endpoint is taken out of rotation for after a failure if it didn't
+                respond with a `retry-after` header. Doubles with each consecutive failure.
+
+            max_cooldown: The longest time, in seconds, an endpoint can be taken out of rotation for.
+        """
+        if not endpoints:
+            raise ValueError("Expected at least one endpoint")
+
+        super().__init__(
+            azure_endpoint=endpoints[0].azure_endpoint,
+            api_version=api_version,
+            api_key=API_KEY_SENTINEL,
+            organization=organization,
+            project=project,
+            webhook_secret=webhook_secret,
+            timeout=timeout,
+            max_retries=max_retries,
+            hedge_after=hedge_after,
+            default_headers=default_headers,
+            default_query=default_query,
+            http_client=http_client,
+            http2=http2,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=pool_metrics,
+            _strict_response_validation=_strict_response_validation,
+        )
+        self._init_endpoints(endpoints, cooldown=cooldown, max_cooldown=max_cooldown)
+        # credentials are configured per endpoint instead, e.g. `AZURE_OPENAI_AD_TOKEN` shouldn't be used
+        self._azure_ad_token = None
+
+    @override
+    def copy(  # type: ignore[override]
+        self,
+        *,
+        endpoints: Sequence[AzureEndpoint] | None = None,
+        api_version: str | None = None,
+        organization: str | None = None,
+        project: str | None = None,
+        webhook_secret: str | None = None,
+        timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
+        http_client: httpx.Client | None = None,
+        http2: bool | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool | None = None,
+        max_retries: int | NotGiven = NOT_GIVEN,
+        hedge_after: HedgeAfter | NotGiven = NOT_GIVEN,
+        default_headers: Mapping[str, str] | None = None,
+        set_default_headers: Mapping[str, str] | None = None,
+        default_query: Mapping[str, object] | None = None,
+        set_default_query: Mapping[str, object] | None = None,
+    ) -> Self:
+        """
+        Create a new client instance re-using the same options given to the current client with optional overriding.
+
+        The new client shares the health of the endpoints with this client unless different `endpoints` are given.
+        """
+        if default_headers is not None and set_default_headers is not None:
+            raise ValueError("The `default_headers` and `set_default_headers` arguments are mutually exclusive")
+
+        if default_query is not None and set_default_query is not None:
+            raise ValueError("The `default_query` and `set_default_query` arguments are mutually exclusive")
+
+        headers = self._custom_headers
+        if default_headers is not None:
+            headers = {**headers, **default_headers}
+        elif set_default_headers is not None:
+            headers = set_default_headers
+
+        params = self._custom_query
+        if default_query is not None:
+            params = {**params, **default_query}
+        elif set_default_query is not None:
+            params = set_default_query
+
+        client = self.__class__(
+            endpoints=endpoints or cast("list[AzureEndpoint]", self.endpoints),
+            api_version=api_version or self._api_version,
+            organization=organization or self.organization,
+            project=project or self.project,
+            webhook_secret=webhook_secret or self.webhook_secret,
+            timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
+            http_client=http_client if http2 is not None else http_client or self._client,
+            http2=bool(http2),
+            json_codec=json_codec or self._json_codec,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            circuit_breaker=circuit_breaker or self._circuit_breaker,
+            pool_metrics=self._pool_metrics is not None if pool_metrics is None else pool_metrics,
+            max_retries=max_retries if is_given(max_retries) else self.max_retries,
+            hedge_after=self.hedge_after if isinstance(hedge_after, NotGiven) else hedge_after,
+            default_headers=headers,
+            default_query=params,
+            cooldown=self._endpoint_pool.cooldown,
+            max_cooldown=self._endpoint_pool.max_cooldown,
+        )
+        if endpoints is None:
+            client._endpoint_pool = self._endpoint_pool
+        return client
+
+    with_options = copy  # type: ignore[assignment]
+
+    def _get_endpoint_auth_headers(self, endpoint: _BaseAzureEndpoint[Any]) -> dict[str, str]:
+        if endpoint.api_key is not None:
+            return {"api-key": endpoint.api_key}
+
+        assert endpoint.azure_ad_token_provider is not None
+        token: object = endpoint.azure_ad_token_provider()
+        if not token or not isinstance(token, str):
+            raise ValueError(
+                f"Expected `azure_ad_token_provider` argument to return a string but it returned {token}",
+            )
+        return {"Authorization": f"Bearer {token}"}
+
+    @override
+    def _prepare_options(self, options: FinalRequestOptions) -> FinalRequestOptions:
+        # the credentials depend on which endpoint the request is sent to, so they are added in `_prepare_request()`
+        return options
+
+    @override
+    def _prepare_request(self, request: httpx.Request) -> None:
+        endpoint = self._find_endpoint(request.url)
+        if endpoint is not None:
+            request.headers.update(self._get_endpoint_auth_headers(endpoint))
+
+    @override
+    def _send_request(self, request: httpx.Request, *, stream: bool, kwargs: HttpxSendArgs) -> httpx.Response:
+        endpoint = self._find_endpoint(request.url)
+        if endpoint is None:
+            return super()._send_request(request, stream=stream, kwargs=kwargs)
+
+        self._endpoint_pool.acquire(endpoint.base_url)
+        try:
+            response = super()._send_request(request, stream=stream, kwargs=kwargs)
+        except CircuitBreakerOpenError as err:
+            self._release_rejected_endpoint(endpoint, err)
+            raise
+        except BaseException as err:
+            # e.g. a `KeyboardInterrupt` doesn't tell us anything about the health of the endpoint
+            self._endpoint_pool.release(endpoint.base_url, success=False if isinstance(err, Exception) else None)
+            raise
+
+        self._release_endpoint(endpoint, response)
+        return response
+
+    @override
+    def _configure_realtime(self, model: str, extra_query: Query) -> tuple[httpx.URL, dict[str, str]]:
+        url, auth_headers = super()._configure_realtime(model, extra_query)
+        endpoint = self._find_endpoint(url)
+        if endpoint is not None:
+            auth_headers = self._get_endpoint_auth_headers(endpoint)
+        return url, auth_headers
+
+
+class AsyncLoadBalancedAzureOpenAI(_LoadBalancedAzureClient[httpx.AsyncClient, AsyncStream[Any]], AsyncAzureOpenAI):
+    """An `AsyncAzureOpenAI` client that spreads requests over several Azure OpenAI resources, e.g. deployments in different regions.
+
+    ```py
+    from openai import AzureEndpoint, AsyncAzureEndpoint, AsyncLoadBalancedAzureOpenAI
+
+    client = AsyncLoadBalancedAzureOpenAI(
+        endpoints=[
+            AzureEndpoint("https://eastus-resource.openai.azure.com", api_key="...", weight=2),
+            AsyncAzureEndpoint("https://westeurope-resource.openai.azure.com", azure_ad_token_provider=token_provider),
+        ],
+        api_version="2024-10-21",
+    )
+    ```
+
+    Every request, including every retry, is sent to the healthy endpoint with the least load relative to its weight.
+    Endpoints that respond with a `429` or `5xx` status code or that can't be reached are taken out of rotation for a
+    while, so retries go to a different endpoint without waiting, see `EndpointPool` for details.
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoints: Sequence[Union[AzureEndpoint, AsyncAzureEndpoint]],
+        api_version: str | None = None,
+        organization: str | None = None,
+        project: str | None = None,
+        webhook_secret: str | None = None,
+        timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        hedge_after: HedgeAfter = None,
+        default_headers: Mapping[str, str] | None = None,
+        default_query: Mapping[str, object] | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool = False,
+        cooldown: float = 1.0,
+        max_cooldown: float = 60.0,
+        _strict_response_validation: bool = False,
+    ) -> None:
+        """Construct a new asynchronous load balanced azure openai client instance.
+
+        This automatically infers the following arguments from their corresponding environment variables if they are not provided:
+        - `organization` from `OPENAI_ORG_ID`
+        - `project` from `OPENAI_PROJECT_ID`
+        - `api_version` from `OPENAI_API_VERSION`
+
+        Args:
+            endpoints: The Azure OpenAI resources to send requests to, each with its own credentials and weight.
+
+            cooldown: How long, in seconds, an endpoint is taken out of rotation for after a failure if it didn't
+                respond with a `retry-after` header. Doubles with each consecutive failure.
+
+            max_cooldown: The longest time, in seconds, an endpoint can be taken out of rotation for.
+        """
+        if not endpoints:
+            raise ValueError("Expected at least one endpoint")
+
+        super().__init__(
+            azure_endpoint=endpoints[0].azure_endpoint,
+            api_version=api_version,
+            api_key=API_KEY_SENTINEL,
+            organization=organization,
+            project=project,
+            webhook_secret=webhook_secret,
+            timeout=timeout,
+            max_retries=max_retries,
+            hedge_after=hedge_after,
+            default_headers=default_headers,
+            default_query=default_query,
+            http_client=http_client,
+            http2=http2,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            coalescer=coalescer,
+            circuit_breaker=circuit_breaker,
+            pool_metrics=pool_metrics,
+            _strict_response_validation=_strict_response_validation,
+        )
+        self._init_endpoints(endpoints, cooldown=cooldown, max_cooldown=max_cooldown)
+        # credentials are configured per endpoint instead, e.g. `AZURE_OPENAI_AD_TOKEN` shouldn't be used
+        self._azure_ad_token = None
+
+    @override
+    def copy(  # type: ignore[override]
+        self,
+        *,
+        endpoints: Sequence[Union[AzureEndpoint, AsyncAzureEndpoint]] | None = None,
+        api_version: str | None = None,
+        organization: str | None = None,
+        project: str | None = None,
+        webhook_secret: str | None = None,
+        timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
+        http2: bool | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        json_codec: JSONCodecLike | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        coalescer: RequestCoalescer | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_metrics: bool | None = None,
+        max_retries: int | NotGiven = NOT_GIVEN,
+        hedge_after: HedgeAfter | NotGiven = NOT_GIVEN,
+        default_headers: Mapping[str, str] | None = None,
+        set_default_headers: Mapping[str, str] | None = None,
+        default_query: Mapping[str, object] | None = None,
+        set_default_query: Mapping[str, object] | None = None,
+    ) -> Self:
+        """
+        Create a new client instance re-using the same options given to the current client with optional overriding.
+
+        The new client shares the health of the endpoints with this client unless different `endpoints` are given.
+        """
+        if default_headers is not None and set_default_headers is not None:
+            raise ValueError("The `default_headers` and `set_default_headers` arguments are mutually exclusive")
+
+        if default_query is not None and set_default_query is not None:
+            raise ValueError("The `default_query` and `set_default_query` arguments are mutually exclusive")
+
+        headers = self._custom_headers
+        if default_headers is not None:
+            headers = {**headers, **default_headers}
+        elif set_default_headers is not None:
+            headers = set_default_headers
+
+        params = self._custom_query
+        if default_query is not None:
+            params = {**params, **default_query}
+        elif set_default_query is not None:
+            params = set_default_query
+
+        client = self.__class__(
+            endpoints=endpoints or cast("list[Union[AzureEndpoint, AsyncAzureEndpoint]]", self.endpoints),
+            api_version=api_version or self._api_version,
+            organization=organization or self.organization,
+            project=project or self.project,
+            webhook_secret=webhook_secret or self.webhook_secret,
+            timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
+            http_client=http_client if http2 is not None else http_client or self._client,
+            http2=bool(http2),
+            json_codec=json_codec or self._json_codec,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            concurrency_limiter=concurrency_limiter or self._concurrency_limiter,
+            coalescer=coalescer or self._coalescer,
+            circuit_breaker=circuit_breaker or self._circuit_breaker,
+            pool_metrics=self._pool_metrics is not None if pool_metrics is None else pool_metrics,
+            max_retries=max_retries if is_given(max_retries) else self.max_retries,
+            hedge_after=self.hedge_after if isinstance(hedge_after, NotGiven) else hedge_after,
+            default_headers=headers,
+            default_query=params,
+            cooldown=self._endpoint_pool.cooldown,
+            max_cooldown=self._endpoint_pool.max_cooldown,
+        )
+        if endpoints is None:
+            client._endpoint_pool = self._endpoint_pool
+        return client
+
+    with_options = copy  # type: ignore[assignment]
+
+    async def _get_endpoint_auth_headers(self, endpoint: _BaseAzureEndpoint[Any]) -> dict[str, str]:
+        if endpoint.api_key is not None:
+            return {"api-key": endpoint.api_key}
+
+        assert endpoint.azure_ad_token_provider is not None
+        token = endpoint.azure_ad_token_provider()
+        if inspect.isawaitable(token):
+            token = await token
+        if not token or not isinstance(token, str):
+            raise ValueError(
+                f"Expected `azure_ad_token_provider` argument to return a string but it returned {token}",
+            )
+        return {"Authorization": f"Bearer {token}"}
+
+    @override
+    async def _prepare_options(self, options: FinalRequestOptions) -> FinalRequestOptions:
+        # the credentials depend on which endpoint the request is sent to, so they are added in `_prepare_request()`
+        return options
+
+    @override
+    async def _prepare_request(self, request: httpx.Request) -> None:
+        endpoint = self._find_endpoint(request.url)
+        if endpoint is not None:
+            request.headers.update(await self._get_endpoint_auth_headers(endpoint))
+
+    @override
+    async def _send_request(self, request: httpx.Request, *, stream: bool, kwargs: HttpxSendArgs) -> httpx.Response:
+        endpoint = self._find_endpoint(request.url)
+        if endpoint is None:
+            return await super()._send_request(request, stream=stream, kwargs=kwargs)
+
+        self._endpoint_pool.acquire(endpoint.base_url)
+        try:
+            response = await super()._send_request(request, stream=stream, kwargs=kwargs)
+        except CircuitBreakerOpenError as err:
+            self._release_rejected_endpoint(endpoint, err)
+            raise
+        except BaseException as err:
+            # e.g. a cancelled hedged request doesn't tell us anything about the health of the endpoint
+            self._endpoint_pool.release(endpoint.base_url, success=False if isinstance(err, Exception) else None)
+            raise
+
+        self._release_endpoint(endpoint, response)
+        return response
+
+    @override
+    async def _configure_realtime(self, model: str, extra_query: Query) -> tuple[httpx.URL, dict[str, str]]:
+        url, auth_headers = await super()._configure_realtime(model, extra_query)
+        endpoint = self._find_endpoint(url)
+        if endpoint is not None:
+            auth_headers = await self._get_endpoint_auth_headers(endpoint)
+        return url, auth_headers
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import os
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, List, Type, Tuple, Union, Mapping, TypeVar, Optional, Sequence, cast
+from pathlib import Path
+from collections import OrderedDict
+from typing_extensions import override
+
+import httpx
+import anyio.to_thread
+
+from .._types import Body, Omit, Query, Headers, NotGiven, SequenceNotStr, omit, not_given
+from .._utils import is_given
+from ._embeddings import EmbeddingMatrix, embedding_row_bytes, embedding_matrix_from_rows
+from ..types.embedding import Embedding
+from ..types.embedding_model import EmbeddingModel
+from ..types.create_embedding_response import Usage, CreateEmbeddingResponse
+
+if TYPE_CHECKING:
+    import mmap
+    import sqlite3
+
+    from ..resources.embeddings import Embeddings, AsyncEmbeddings
+
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "LRUEmbeddingCache",
+    "DiskEmbeddingCache",
+    "CachedEmbeddings",
+    "AsyncCachedEmbeddings",
+]
+
+
+_CacheT = TypeVar("_CacheT", bound="EmbeddingCache")
+
+
+class EmbeddingCacheStats:
+    """The number of inputs that were, and weren't, found in an embedding cache"""
+
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of inputs that were found in the cache, or 0 if nothing has been looked up"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def record(self, *, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    @override
+    def __repr__(self) -> str:
+        return f"EmbeddingCacheStats(hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.3f})"
+
+
+class EmbeddingCache(ABC):
+    """Stores embeddings as little-endian float32 bytes, keyed by the model, dimensions and
+    SHA-256 hash of the text that was embedded.
+
+    Subclasses must be safe to use from multiple threads.
+    """
+
+    stats: EmbeddingCacheStats
+
+    def __init__(self) -> None:
+        self.stats = EmbeddingCacheStats()
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        """Returns the embeddings that are stored for the given keys, omitting any that aren't"""
+
+    @abstractmethod
+    def set_many(self, embeddings: Mapping[str, bytes]) -> None:
+        """Stores the given embeddings"""
+
+    def close(self) -> None:
+        """Releases any resources held by the cache"""
+        return None
+
+    def __enter__(self: _CacheT) -> _CacheT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def embedding_cache_key(*, model: str, dimensions: Union[int, Omit], text: str) -> str:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model}:{dimensions if is_given(dimensions) else ''}:{digest}"
+
+
+class LRUEmbeddingCache(EmbeddingCache):
+    """An in-memory cache that evicts the least recently used embeddings once they take up
+    more than `max_bytes`."""
+
+    def __init__(self, *, max_bytes: int = 256 * 1024 * 1024) -> None:
+        super().__init__()
+        if max_bytes < 1:
+            raise ValueError(f"Expected `max_bytes` to be a positive integer but received {max_bytes}")
+
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes of embeddings in the cache"""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @override
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+        return found
+
+    @override
+    def set_many(self, embeddings: Mapping[str, bytes]) -> None:
+        with self._lock:
+            for key, value in embeddings.items():
+                if len(value) > self.max_bytes:
+                    continue
+
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._size -= len(previous)
+
+                self._entries[key] = value
+                self._size += len(value)
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class DiskEmbeddingCache(EmbeddingCache):
+    """A persistent cache that stores embeddings in an append-only float32 arena file, which is
+    memory-mapped for reads, with an sqlite index of where each embedding is stored.
+
+    Embeddings are written to the arena before they're added to the index, so an interrupted
+    write never leaves the index pointing at missing data. The arena is only appended to while
+    holding the index's write lock, so the same directory can be shared by multiple processes.
+    """
+
+    _ARENA_NAME = "embeddings.f32"
+    _INDEX_NAME = "index.sqlite3"
+
+    # sqlite limits the number of parameters in a single query
+    _QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, directory: Union[str, os.PathLike[str]]) -> None:
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # imported here so that importing the client doesn't import sqlite
+        import sqlite3
+
+        self._lock = threading.Lock()
+        # transactions are managed explicitly, see `set_many()`
+        self._index: sqlite3.Connection = sqlite3.connect(
+            str(self.directory / self._INDEX_NAME), check_same_thread=False, isolation_level=None
+        )
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, offset INTEGER NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._arena = open(self.directory / self._ARENA_NAME, "a+b")
+        self._map: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._index.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0])
+
+    def _lookup(self, keys: Sequence[str]) -> List[Tuple[str, int, int]]:
+        rows: List[Tuple[str, int, int]] = []
+        for start in range(0, len(keys), self._QUERY_CHUNK_SIZE):
+            chunk = keys[start : start + self._QUERY_CHUNK_SIZE]
+            rows.extend(
+                self._index.execute(
+                    f"SELECT key, offset, size FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return rows
+
+    def _mapped(self, end: int) -> mmap.mmap:
+        import mmap
+
+        if self._map is None or len(self._map) < end:
+            # the arena has grown since it was mapped
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._arena.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    @override
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        with self._lock:
+            rows = self._lookup(keys)
+            if not rows:
+                return {}
+
+            mapped = self._mapped(max(offset + size for _, offset, size in rows))
+            return {key: mapped[offset : offset + size] for key, offset, size in rows}
+
+    @override
+    def set_many(self, embeddings: Mapping[str, bytes]) -> None:
+        with self._lock:
+            # the index is locked for writing before the end of the arena is found, so that other
+            # processes using the same directory can't append to the arena at the same time
+            self._index.execute("BEGIN IMMEDIATE")
+            try:
+                self._append(embeddings)
+            except BaseException:
+                self._index.execute("ROLLBACK")
+                raise
+            self._index.execute("COMMIT")
+
+    def _append(self, embeddings: Mapping[str, bytes]) -> None:
+        existing = {key for key, _, _ in self._lookup(list(embeddings))}
+
+        self._arena.seek(0, os.SEEK_END)
+        offset = self._arena.tell()
+        rows: List[Tuple[str, int, int]] = []
+        for key, value in embeddings.items():
+            if key in existing:
+                continue
+
+            self._arena.write(value)
+            rows.append((key, offset, len(value)))
+            offset += len(value)
+
+        if not rows:
+            return
+
+        self._arena.flush()
+        self._index.executemany("INSERT OR IGNORE INTO embeddings (key, offset, size) VALUES (?, ?, ?)", rows)
+
+    @override
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._arena.close()
+            self._index.close()
+
+
+def _input_texts(input: Union[str, SequenceNotStr[str]]) -> List[str]:
+    texts = [input] if isinstance(input, str) else list(input)
+    if not texts:
+        raise ValueError("Expected at least one input to embed")
+    if not all(isinstance(cast(object, text), str) for text in texts):
+        raise TypeError("Only text inputs can be cached, use `embeddings.create()` to embed token arrays")
+    return texts
+
+
+class _Lookup:
+    """The keys for a list of inputs, the embeddings found in the cache and the unique inputs
+    that still have to be embedded."""
+
+    def __init__(self, cache: EmbeddingCache, keys: List[str], texts: List[str]) -> None:
+        self.keys = keys
+        self.found = cache.get_many(list(dict.fromkeys(keys)))
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in self.found:
+                missing.setdefault(key, text)
+        self.missing_keys = list(missing)
+        self.missing_texts = list(missing.values())
+
+        cache.stats.record(hits=len(keys) - len(missing), misses=len(missing))
+
+    def embedded(self, matrix: EmbeddingMatrix) -> Dict[str, bytes]:
+        """Returns the newly embedded inputs, keyed by their cache key"""
+        embedded = {key: embedding_row_bytes(matrix, index) for index, key in enumerate(self.missing_keys)}
+        self.found.update(embedded)
+        return embedded
+
+    def matrix(self, *, model: str, usage: Usage) -> EmbeddingMatrix:
+        return embedding_matrix_from_rows(
+            [(index, self.found[key]) for index, key in enumerate(self.keys)], model=model, usage=usage
+        )
+
+
+def _to_response(matrix: EmbeddingMatrix) -> CreateEmbeddingResponse:
+    return CreateEmbeddingResponse(
+        data=[
+            Embedding(embedding=list(matrix.row(index)), index=index, object="embedding")
+            for index in range(len(matrix))
+        ],
+        model=matrix.model,
+        object="list",
+        usage=matrix.usage,
+    )
+
+
+def _empty_usage() -> Usage:
+    return Usage(prompt_tokens=0, total_tokens=0)
+
+
+class CachedEmbeddings:
+    """Creates embeddings, only requesting the inputs that aren't already in the cache.
+
+    Every input that isn't cached is embedded in a single request. Token usage is only reported
+    for the inputs that were requested.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache) -> None:
+        self._embeddings = embeddings
+        self.cache = cache
+
+    def create_matrix(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> EmbeddingMatrix:
+        """See `Embeddings.create_matrix()`"""
+        texts = _input_texts(input)
+        lookup = _Lookup(
+            self.cache,
+            [embedding_cache_key(model=model, dimensions=dimensions, text=text) for text in texts],
+            texts,
+        )
+        if not lookup.missing_texts:
+            return lookup.matrix(model=model, usage=_empty_usage())
+
+        matrix = self._embeddings.create_matrix(
+            input=lookup.missing_texts,
+            model=model,
+            dimensions=dimensions,
+            user=user,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+        self.cache.set_many(lookup.embedded(matrix))
+        return lookup.matrix(model=matrix.model, usage=matrix.usage)
+
+    def create(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> CreateEmbeddingResponse:
+        """See `Embeddings.create()`"""
+        return _to_response(
+            self.create_matrix(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+        )
+
+
+class AsyncCachedEmbeddings:
+    """Creates embeddings, only requesting the inputs that aren't already in the cache, see
+    `CachedEmbeddings`.
+
+    The cache is read and written in a worker thread so that disk IO doesn't block the event loop.
+    """
+
+    def __init__(self, embeddings: AsyncEmbeddings, cache: EmbeddingCache) -> None:
+        self._embeddings = embeddings
+        self.cache = cache
+
+    async def create_matrix(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> EmbeddingMatrix:
+        """See `AsyncEmbeddings.create_matrix()`"""
+        texts = _input_texts(input)
+        lookup = await anyio.to_thread.run_sync(
+            _Lookup,
+            self.cache,
+            [embedding_cache_key(model=model, dimensions=dimensions, text=text) for text in texts],
+            texts,
+        )
+        if not lookup.missing_texts:
+            return lookup.matrix(model=model, usage=_empty_usage())
+
+        matrix = await self._embeddings.create_matrix(
+            input=lookup.missing_texts,
+            model=model,
+            dimensions=dimensions,
+            user=user,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+        await anyio.to_thread.run_sync(self.cache.set_many, lookup.embedded(matrix))
+        return lookup.matrix(model=matrix.model, usage=matrix.usage)
+
+    async def create(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> CreateEmbeddingResponse:
+        """See `AsyncEmbeddings.create()`"""
+        return _to_response(
+            await self.create_matrix(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+        )
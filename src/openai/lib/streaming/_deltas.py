@@ -62,3 +62,38 @@ def accumulate_delta(acc: dict[object, object], delta: dict[object, object]) ->
         acc[key] = acc_value
 
     return acc
+
+
+class StringAccumulator:
+    """Accumulates string deltas into attributes of snapshot objects.
+
+    Naively concatenating every delta onto the snapshot copies the entire string each time
+    which is quadratic over the course of a stream, instead the deltas are buffered and
+    only joined & written back onto the snapshot objects when `flush()` is called.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[int, str], tuple[object, str, list[str]]] = {}
+
+    def append(self, obj: object, attr: str, delta: str) -> None:
+        pending = self._pending.get((id(obj), attr))
+        if pending is not None:
+            pending[2].append(delta)
+            return
+
+        current = getattr(obj, attr)
+        if current is None:
+            setattr(obj, attr, delta)
+        else:
+            self._pending[(id(obj), attr)] = (obj, attr, [current, delta])
+
+    def flush_attr(self, obj: object, attr: str) -> None:
+        pending = self._pending.pop((id(obj), attr), None)
+        if pending is not None:
+            setattr(obj, attr, "".join(pending[2]))
+
+    def flush(self) -> None:
+        for obj, attr, parts in self._pending.values():
+            setattr(obj, attr, "".join(parts))
+
+        self._pending.clear()
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Union, Optional
+
+from jiter import from_json
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_CHARS = re.compile(r'[^"\\\x00-\x1f]*')
+_ESCAPE_CHARS = frozenset('"\\/bfnrt')
+_HEX_DIGITS = re.compile(r"[0-9a-fA-F]*")
+_SURROGATE = re.compile(r"[dD][89a-fA-F]")
+_NUMBER_CHARS = re.compile(r"[0-9eE.+-]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+# anything that could still become a valid number once more text is appended
+_NUMBER_PREFIX = re.compile(r"-?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]*|(?:\.[0-9]+)?[eE][+-]?[0-9]*)?)?")
+_LITERALS = {"t": ("true", True), "f": ("false", False), "n": ("null", None)}
+
+# the tokens the parser expects next
+_VALUE = 0
+_VALUE_OR_CLOSE = 1
+_KEY = 2
+_KEY_OR_CLOSE = 3
+_COLON = 4
+_COMMA_OR_CLOSE = 5
+_DONE = 6
+
+_MISSING = object()
+
+
+class _InvalidJSON(Exception):
+    pass
+
+
+class _Frame:
+    def __init__(self, container: Union[Dict[str, object], List[object]]) -> None:
+        self.container = container
+        self.key: Optional[str] = None
+
+
+class PartialJSONParser:
+    """Incrementally parses a JSON document as it is streamed.
+
+    Each call to `.parse()` is given the entire text received so far and returns the same
+    value as `jiter.from_json(text, partial_mode=True)` would, but the parser keeps its state
+    between calls so only the text appended since the previous call has to be processed.
+
+    Previously returned values are never changed, so when new tokens have been consumed the
+    objects & arrays that are still open are shallowly copied, which is proportional to their
+    number of entries rather than to the length of the text. When no new tokens have been
+    consumed, e.g. while a long string is streamed, the previous value is returned as is.
+
+    If the document turns out to be invalid the parser falls back to `jiter` so that the
+    same partial value is returned, or the same error is raised.
+    """
+
+    def __init__(self) -> None:
+        # the start of the first token that hasn't been fully consumed yet
+        self._pos = 0
+        # how far an incomplete string token has already been scanned
+        self._scan_pos = 0
+        self._stack: list[_Frame] = []
+        self._expect = _VALUE
+        self._root: object = _MISSING
+        self._failed = False
+        # the value returned by the previous call and the position it was built at
+        self._result: object = _MISSING
+        self._result_pos = -1
+
+    def parse(self, text: str) -> object:
+        if self._failed:
+            return from_json(bytes(text, "utf-8"), partial_mode=True)
+
+        try:
+            tentative = self._consume(text)
+        except (_InvalidJSON, ValueError):
+            self._failed = True
+            return from_json(bytes(text, "utf-8"), partial_mode=True)
+
+        if self._expect == _DONE:
+            return self._root
+
+        if not self._stack:
+            if tentative is _MISSING:
+                # an incomplete top-level value, defer to jiter to raise the appropriate error
+                return from_json(bytes(text, "utf-8"), partial_mode=True)
+            return tentative
+
+        if tentative is _MISSING and self._pos == self._result_pos:
+            # nothing has been consumed since the previous call
+            return self._result
+
+        # the containers that are still open are copied so that previously
+        # returned values aren't changed when more text is parsed
+        value = tentative
+        for frame in reversed(self._stack):
+            container = frame.container.copy()
+            if value is not _MISSING:
+                if isinstance(container, dict):
+                    assert frame.key is not None
+                    container[frame.key] = value
+                else:
+                    container.append(value)
+            value = container
+
+        self._result = value
+        self._result_pos = self._pos if tentative is _MISSING else -1
+        return value
+
+    def _consume(self, text: str) -> object:
+        """Consume as many complete tokens as possible, returning the value of a trailing number
+        that may still be extended by the next chunk of text."""
+        end = len(text)
+        pos = self._pos
+
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+            self._pos = pos
+            if pos >= end:
+                return _MISSING
+
+            expect = self._expect
+            if expect == _DONE:
+                # `jiter` ignores any trailing text in partial mode
+                self._pos = end
+                return _MISSING
+
+            char = text[pos]
+
+            if expect == _COLON:
+                if char != ":":
+                    raise _InvalidJSON()
+                pos += 1
+                self._expect = _VALUE
+            elif expect == _COMMA_OR_CLOSE:
+                is_object = isinstance(self._stack[-1].container, dict)
+                if char == ",":
+                    pos += 1
+                    self._expect = _KEY if is_object else _VALUE
+                elif char == ("}" if is_object else "]"):
+                    pos += 1
+                    self._add(self._stack.pop().container)
+                else:
+                    raise _InvalidJSON()
+            elif expect == _KEY or expect == _KEY_OR_CLOSE:
+                if char == "}" and expect == _KEY_OR_CLOSE:
+                    pos += 1
+                    self._add(self._stack.pop().container)
+                    continue
+
+                if char != '"':
+                    raise _InvalidJSON()
+
+                string_end = self._scan_string(text, pos)
+                if string_end is None:
+                    return _MISSING
+
+                self._stack[-1].key = _decode_string(text[pos:string_end])
+                pos = string_end
+                self._expect = _COLON
+            elif char == "]" and expect == _VALUE_OR_CLOSE:
+                pos += 1
+                self._add(self._stack.pop().container)
+            elif char == "{":
+                pos += 1
+                self._stack.append(_Frame({}))
+                self._expect = _KEY_OR_CLOSE
+            elif char == "[":
+                pos += 1
+                self._stack.append(_Frame([]))
+                self._expect = _VALUE_OR_CLOSE
+            elif char == '"':
+                string_end = self._scan_string(text, pos)
+                if string_end is None:
+                    return _MISSING
+
+                self._add(_decode_string(text[pos:string_end]))
+                pos = string_end
+            elif char in _LITERALS:
+                literal, value = _LITERALS[char]
+                if text.startswith(literal, pos):
+                    pos += len(literal)
+                    self._add(value)
+                elif literal.startswith(text[pos:]):
+                    return _MISSING
+                else:
+                    raise _InvalidJSON()
+            elif char == "-" or "0" <= char <= "9":
+                number_end = _NUMBER_CHARS.match(text, pos).end()  # type: ignore[union-attr]
+                token = text[pos:number_end]
+
+                if number_end >= end:
+                    # the number may continue in the next chunk so it can't be consumed yet
+                    if _NUMBER.fullmatch(token):
+                        return _to_number(token)
+                    if _NUMBER_PREFIX.fullmatch(token):
+                        return _MISSING
+                    raise _InvalidJSON()
+
+                if not _NUMBER.fullmatch(token):
+                    raise _InvalidJSON()
+
+                pos = number_end
+                self._add(_to_number(token))
+            else:
+                raise _InvalidJSON()
+
+    def _scan_string(self, text: str, start: int) -> int | None:
+        """Returns the end of the string token that starts at the given position, or `None` if it is incomplete"""
+        end = len(text)
+        pos = max(self._scan_pos, start + 1)
+
+        while True:
+            pos = _STRING_CHARS.match(text, pos).end()  # type: ignore[union-attr]
+            if pos >= end:
+                self._scan_pos = pos
+                return None
+
+            char = text[pos]
+            if char == '"':
+                self._scan_pos = 0
+                return pos + 1
+
+            if char != "\\":
+                # control characters must be escaped
+                raise _InvalidJSON()
+
+            if pos + 1 >= end:
+                self._scan_pos = pos
+                return None
+
+            escaped = text[pos + 1]
+            if escaped == "u":
+                digits = text[pos + 2 : pos + 6]
+                # surrogate pairs are rare enough that they're left to `jiter`
+                if not _HEX_DIGITS.fullmatch(digits) or _SURROGATE.match(digits):
+                    raise _InvalidJSON()
+
+                if len(digits) < 4:
+                    self._scan_pos = pos
+                    return None
+
+                pos += 6
+            elif escaped in _ESCAPE_CHARS:
+                pos += 2
+            else:
+                raise _InvalidJSON()
+
+    def _add(self, value: object) -> None:
+        if not self._stack:
+            self._root = value
+            self._expect = _DONE
+            return
+
+        frame = self._stack[-1]
+        if isinstance(frame.container, dict):
+            assert frame.key is not None
+            frame.container[frame.key] = value
+            frame.key = None
+        else:
+            frame.container.append(value)
+
+        self._expect = _COMMA_OR_CLOSE
+
+
+def _decode_string(token: str) -> str:
+    if "\\" not in token and token.isprintable():
+        return token[1:-1]
+
+    # let `jiter` handle escape sequences & reject control characters
+    value = from_json(bytes(token, "utf-8"))
+    assert isinstance(value, str)
+    return value
+
+
+def _to_number(token: str) -> int | float:
+    if "." in token or "e" in token or "E" in token:
+        return float(token)
+    return int(token)
@@ -12,11 +12,18 @@ from ._events import (
     LogprobsContentDoneEvent as LogprobsContentDoneEvent,
     LogprobsRefusalDoneEvent as LogprobsRefusalDoneEvent,
     ChatCompletionStreamEvent as ChatCompletionStreamEvent,
+    ChunkEventWithoutSnapshot as ChunkEventWithoutSnapshot,
     LogprobsContentDeltaEvent as LogprobsContentDeltaEvent,
     LogprobsRefusalDeltaEvent as LogprobsRefusalDeltaEvent,
     ParsedChatCompletionSnapshot as ParsedChatCompletionSnapshot,
+    ContentDeltaEventWithoutSnapshot as ContentDeltaEventWithoutSnapshot,
+    RefusalDeltaEventWithoutSnapshot as RefusalDeltaEventWithoutSnapshot,
     FunctionToolCallArgumentsDoneEvent as FunctionToolCallArgumentsDoneEvent,
     FunctionToolCallArgumentsDeltaEvent as FunctionToolCallArgumentsDeltaEvent,
+    LogprobsContentDeltaEventWithoutSnapshot as LogprobsContentDeltaEventWithoutSnapshot,
+    LogprobsRefusalDeltaEventWithoutSnapshot as LogprobsRefusalDeltaEventWithoutSnapshot,
+    ChatCompletionStreamEventWithoutSnapshots as ChatCompletionStreamEventWithoutSnapshots,
+    FunctionToolCallArgumentsDeltaEventWithoutSnapshot as FunctionToolCallArgumentsDeltaEventWithoutSnapshot,
 )
 from ._completions import (
     ChatCompletionStream as ChatCompletionStream,
@@ -24,4 +31,8 @@ from ._completions import (
     ChatCompletionStreamState as ChatCompletionStreamState,
     ChatCompletionStreamManager as ChatCompletionStreamManager,
     AsyncChatCompletionStreamManager as AsyncChatCompletionStreamManager,
+    ChatCompletionStreamWithoutSnapshots as ChatCompletionStreamWithoutSnapshots,
+    AsyncChatCompletionStreamWithoutSnapshots as AsyncChatCompletionStreamWithoutSnapshots,
+    ChatCompletionStreamManagerWithoutSnapshots as ChatCompletionStreamManagerWithoutSnapshots,
+    AsyncChatCompletionStreamManagerWithoutSnapshots as AsyncChatCompletionStreamManagerWithoutSnapshots,
 )
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import inspect
+from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Generic, Callable, Iterable, Awaitable, AsyncIterator, cast
-from typing_extensions import Self, Iterator, assert_never
-
-from jiter import from_json
+from typing import TYPE_CHECKING, Any, Union, Generic, TypeVar, Callable, Iterable, Awaitable, AsyncIterator, cast
+from typing_extensions import Self, Iterator, override, assert_never
 
 from ._types import ParsedChoiceSnapshot, ParsedChatCompletionSnapshot, ParsedChatCompletionMessageSnapshot
 from ._events import (
@@ -17,14 +16,21 @@ from ._events import (
     LogprobsContentDoneEvent,
     LogprobsRefusalDoneEvent,
     ChatCompletionStreamEvent,
+    ChunkEventWithoutSnapshot,
     LogprobsContentDeltaEvent,
     LogprobsRefusalDeltaEvent,
+    ContentDeltaEventWithoutSnapshot,
+    RefusalDeltaEventWithoutSnapshot,
     FunctionToolCallArgumentsDoneEvent,
     FunctionToolCallArgumentsDeltaEvent,
+    LogprobsContentDeltaEventWithoutSnapshot,
+    LogprobsRefusalDeltaEventWithoutSnapshot,
+    ChatCompletionStreamEventWithoutSnapshots,
+    FunctionToolCallArgumentsDeltaEventWithoutSnapshot,
 )
-from .._deltas import accumulate_delta
+from .._deltas import StringAccumulator, accumulate_delta
 from ...._types import Omit, IncEx, omit
-from ...._utils import is_given, consume_sync_iterator, consume_async_iterator
+from ...._utils import is_dict, is_list, is_given, consume_sync_iterator, consume_async_iterator
 from ...._compat import model_dump
 from ...._models import build, construct_type
 from ..._parsing import (
@@ -39,20 +45,31 @@ from ..._parsing import (
 from ...._streaming import Stream, AsyncStream
 from ....types.chat import ChatCompletionChunk, ParsedChatCompletion, ChatCompletionToolUnionParam
 from ...._exceptions import LengthFinishReasonError, ContentFilterFinishReasonError
+from .._partial_json import PartialJSONParser
 from ....types.chat.chat_completion import ChoiceLogprobs
 from ....types.chat.chat_completion_chunk import Choice as ChoiceChunk
+from ....types.chat.chat_completion_message import FunctionCall
 from ....types.chat.completion_create_params import ResponseFormat as ResponseFormatParam
+from ....types.chat.parsed_function_tool_call import ParsedFunction, ParsedFunctionToolCall
 
+_StreamEventT = TypeVar("_StreamEventT")
+_DoneEvent = Union[
+    ContentDoneEvent[ResponseFormatT],
+    RefusalDoneEvent,
+    FunctionToolCallArgumentsDoneEvent,
+    LogprobsContentDoneEvent,
+    LogprobsRefusalDoneEvent,
+]
+_StreamT = TypeVar("_StreamT", bound="_BaseChatCompletionStream[Any, Any]")
+_AsyncStreamT = TypeVar("_AsyncStreamT", bound="_BaseAsyncChatCompletionStream[Any, Any]")
 
-class ChatCompletionStream(Generic[ResponseFormatT]):
-    """Wrapper over the Chat Completions streaming API that adds helpful
-    events such as `content.done`, supports automatically parsing
-    responses & tool calls and accumulates a `ChatCompletion` object
-    from each individual chunk.
+# the delta properties that can be accumulated without rebuilding the message snapshot
+_MESSAGE_DELTA_KEYS = frozenset(["content", "refusal", "role", "function_call", "tool_calls"])
+_TOOL_CALL_DELTA_KEYS = frozenset(["index", "id", "type", "function"])
+_FUNCTION_DELTA_KEYS = frozenset(["name", "arguments"])
 
-    https://platform.openai.com/docs/api-reference/streaming
-    """
 
+class _BaseChatCompletionStream(ABC, Generic[_StreamEventT, ResponseFormatT]):
     def __init__(
         self,
         *,
@@ -65,10 +82,10 @@ class ChatCompletionStream(Generic[ResponseFormatT]):
         self._iterator = self.__stream__()
         self._state = ChatCompletionStreamState(response_format=response_format, input_tools=input_tools)
 
-    def __next__(self) -> ChatCompletionStreamEvent[ResponseFormatT]:
+    def __next__(self) -> _StreamEventT:
         return self._iterator.__next__()
 
-    def __iter__(self) -> Iterator[ChatCompletionStreamEvent[ResponseFormatT]]:
+    def __iter__(self) -> Iterator[_StreamEventT]:
         for item in self._iterator:
             yield item
 
@@ -111,29 +128,49 @@ class ChatCompletionStream(Generic[ResponseFormatT]):
     def current_completion_snapshot(self) -> ParsedChatCompletionSnapshot:
         return self._state.current_completion_snapshot
 
-    def __stream__(self) -> Iterator[ChatCompletionStreamEvent[ResponseFormatT]]:
+    @abstractmethod
+    def _handle_chunk(self, chunk: ChatCompletionChunk) -> Iterable[_StreamEventT]: ...
+
+    def __stream__(self) -> Iterator[_StreamEventT]:
         for sse_event in self._raw_stream:
             if not _is_valid_chat_completion_chunk_weak(sse_event):
                 continue
-            events_to_fire = self._state.handle_chunk(sse_event)
+            events_to_fire = self._handle_chunk(sse_event)
             for event in events_to_fire:
                 yield event
 
 
-class ChatCompletionStreamManager(Generic[ResponseFormatT]):
-    """Context manager over a `ChatCompletionStream` that is returned by `.stream()`.
+# the event unions can't be parametrized at runtime on older Python versions
+class ChatCompletionStream(_BaseChatCompletionStream["ChatCompletionStreamEvent[ResponseFormatT]", ResponseFormatT]):
+    """Wrapper over the Chat Completions streaming API that adds helpful
+    events such as `content.done`, supports automatically parsing
+    responses & tool calls and accumulates a `ChatCompletion` object
+    from each individual chunk.
 
-    This context manager ensures the response cannot be leaked if you don't read
-    the stream to completion.
+    https://platform.openai.com/docs/api-reference/streaming
+    """
 
-    Usage:
-    ```py
-    with client.chat.completions.stream(...) as stream:
-        for event in stream:
-            ...
-    ```
+    @override
+    def _handle_chunk(self, chunk: ChatCompletionChunk) -> Iterable[ChatCompletionStreamEvent[ResponseFormatT]]:
+        return self._state.handle_chunk(chunk)
+
+
+class ChatCompletionStreamWithoutSnapshots(
+    _BaseChatCompletionStream["ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]", ResponseFormatT]
+):
+    """The `ChatCompletionStream` that is returned by `.stream(accumulate=False)`.
+
+    The delta events don't include any snapshots, see `ChatCompletionStreamState.handle_chunk_without_snapshots()`.
     """
 
+    @override
+    def _handle_chunk(
+        self, chunk: ChatCompletionChunk
+    ) -> Iterable[ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]]:
+        return self._state.handle_chunk_without_snapshots(chunk)
+
+
+class _BaseChatCompletionStreamManager(ABC, Generic[_StreamT, ResponseFormatT]):
     def __init__(
         self,
         api_request: Callable[[], Stream[ChatCompletionChunk]],
@@ -141,19 +178,15 @@ class ChatCompletionStreamManager(Generic[ResponseFormatT]):
         response_format: type[ResponseFormatT] | ResponseFormatParam | Omit,
         input_tools: Iterable[ChatCompletionToolUnionParam] | Omit,
     ) -> None:
-        self.__stream: ChatCompletionStream[ResponseFormatT] | None = None
+        self.__stream: _StreamT | None = None
         self.__api_request = api_request
-        self.__response_format = response_format
-        self.__input_tools = input_tools
+        self._response_format = response_format
+        self._input_tools = input_tools
 
-    def __enter__(self) -> ChatCompletionStream[ResponseFormatT]:
+    def __enter__(self) -> _StreamT:
         raw_stream = self.__api_request()
 
-        self.__stream = ChatCompletionStream(
-            raw_stream=raw_stream,
-            response_format=self.__response_format,
-            input_tools=self.__input_tools,
-        )
+        self.__stream = self._make_stream(raw_stream)
 
         return self.__stream
 
@@ -166,16 +199,52 @@ class ChatCompletionStreamManager(Generic[ResponseFormatT]):
         if self.__stream is not None:
             self.__stream.close()
 
+    @abstractmethod
+    def _make_stream(self, raw_stream: Stream[ChatCompletionChunk]) -> _StreamT: ...
 
-class AsyncChatCompletionStream(Generic[ResponseFormatT]):
-    """Wrapper over the Chat Completions streaming API that adds helpful
-    events such as `content.done`, supports automatically parsing
-    responses & tool calls and accumulates a `ChatCompletion` object
-    from each individual chunk.
 
-    https://platform.openai.com/docs/api-reference/streaming
+class ChatCompletionStreamManager(
+    _BaseChatCompletionStreamManager[ChatCompletionStream[ResponseFormatT], ResponseFormatT]
+):
+    """Context manager over a `ChatCompletionStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+
+    Usage:
+    ```py
+    with client.chat.completions.stream(...) as stream:
+        for event in stream:
+            ...
+    ```
     """
 
+    @override
+    def _make_stream(self, raw_stream: Stream[ChatCompletionChunk]) -> ChatCompletionStream[ResponseFormatT]:
+        return ChatCompletionStream(
+            raw_stream=raw_stream,
+            response_format=self._response_format,
+            input_tools=self._input_tools,
+        )
+
+
+class ChatCompletionStreamManagerWithoutSnapshots(
+    _BaseChatCompletionStreamManager[ChatCompletionStreamWithoutSnapshots[ResponseFormatT], ResponseFormatT]
+):
+    """Context manager over a `ChatCompletionStreamWithoutSnapshots` that is returned by `.stream(accumulate=False)`."""
+
+    @override
+    def _make_stream(
+        self, raw_stream: Stream[ChatCompletionChunk]
+    ) -> ChatCompletionStreamWithoutSnapshots[ResponseFormatT]:
+        return ChatCompletionStreamWithoutSnapshots(
+            raw_stream=raw_stream,
+            response_format=self._response_format,
+            input_tools=self._input_tools,
+        )
+
+
+class _BaseAsyncChatCompletionStream(ABC, Generic[_StreamEventT, ResponseFormatT]):
     def __init__(
         self,
         *,
@@ -188,10 +257,10 @@ class AsyncChatCompletionStream(Generic[ResponseFormatT]):
         self._iterator = self.__stream__()
         self._state = ChatCompletionStreamState(response_format=response_format, input_tools=input_tools)
 
-    async def __anext__(self) -> ChatCompletionStreamEvent[ResponseFormatT]:
+    async def __anext__(self) -> _StreamEventT:
         return await self._iterator.__anext__()
 
-    async def __aiter__(self) -> AsyncIterator[ChatCompletionStreamEvent[ResponseFormatT]]:
+    async def __aiter__(self) -> AsyncIterator[_StreamEventT]:
         async for item in self._iterator:
             yield item
 
@@ -234,29 +303,50 @@ class AsyncChatCompletionStream(Generic[ResponseFormatT]):
     def current_completion_snapshot(self) -> ParsedChatCompletionSnapshot:
         return self._state.current_completion_snapshot
 
-    async def __stream__(self) -> AsyncIterator[ChatCompletionStreamEvent[ResponseFormatT]]:
+    @abstractmethod
+    def _handle_chunk(self, chunk: ChatCompletionChunk) -> Iterable[_StreamEventT]: ...
+
+    async def __stream__(self) -> AsyncIterator[_StreamEventT]:
         async for sse_event in self._raw_stream:
             if not _is_valid_chat_completion_chunk_weak(sse_event):
                 continue
-            events_to_fire = self._state.handle_chunk(sse_event)
+            events_to_fire = self._handle_chunk(sse_event)
             for event in events_to_fire:
                 yield event
 
 
-class AsyncChatCompletionStreamManager(Generic[ResponseFormatT]):
-    """Context manager over a `AsyncChatCompletionStream` that is returned by `.stream()`.
+class AsyncChatCompletionStream(
+    _BaseAsyncChatCompletionStream["ChatCompletionStreamEvent[ResponseFormatT]", ResponseFormatT]
+):
+    """Wrapper over the Chat Completions streaming API that adds helpful
+    events such as `content.done`, supports automatically parsing
+    responses & tool calls and accumulates a `ChatCompletion` object
+    from each individual chunk.
 
-    This context manager ensures the response cannot be leaked if you don't read
-    the stream to completion.
+    https://platform.openai.com/docs/api-reference/streaming
+    """
 
-    Usage:
-    ```py
-    async with client.chat.completions.stream(...) as stream:
-        for event in stream:
-            ...
-    ```
+    @override
+    def _handle_chunk(self, chunk: ChatCompletionChunk) -> Iterable[ChatCompletionStreamEvent[ResponseFormatT]]:
+        return self._state.handle_chunk(chunk)
+
+
+class AsyncChatCompletionStreamWithoutSnapshots(
+    _BaseAsyncChatCompletionStream["ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]", ResponseFormatT]
+):
+    """The `AsyncChatCompletionStream` that is returned by `.stream(accumulate=False)`.
+
+    The delta events don't include any snapshots, see `ChatCompletionStreamState.handle_chunk_without_snapshots()`.
     """
 
+    @override
+    def _handle_chunk(
+        self, chunk: ChatCompletionChunk
+    ) -> Iterable[ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]]:
+        return self._state.handle_chunk_without_snapshots(chunk)
+
+
+class _BaseAsyncChatCompletionStreamManager(ABC, Generic[_AsyncStreamT, ResponseFormatT]):
     def __init__(
         self,
         api_request: Awaitable[AsyncStream[ChatCompletionChunk]],
@@ -264,19 +354,15 @@ class AsyncChatCompletionStreamManager(Generic[ResponseFormatT]):
         response_format: type[ResponseFormatT] | ResponseFormatParam | Omit,
         input_tools: Iterable[ChatCompletionToolUnionParam] | Omit,
     ) -> None:
-        self.__stream: AsyncChatCompletionStream[ResponseFormatT] | None = None
+        self.__stream: _AsyncStreamT | None = None
         self.__api_request = api_request
-        self.__response_format = response_format
-        self.__input_tools = input_tools
+        self._response_format = response_format
+        self._input_tools = input_tools
 
-    async def __aenter__(self) -> AsyncChatCompletionStream[ResponseFormatT]:
+    async def __aenter__(self) -> _AsyncStreamT:
         raw_stream = await self.__api_request
 
-        self.__stream = AsyncChatCompletionStream(
-            raw_stream=raw_stream,
-            response_format=self.__response_format,
-            input_tools=self.__input_tools,
-        )
+        self.__stream = self._make_stream(raw_stream)
 
         return self.__stream
 
@@ -289,6 +375,50 @@ class AsyncChatCompletionStreamManager(Generic[ResponseFormatT]):
         if self.__stream is not None:
             await self.__stream.close()
 
+    @abstractmethod
+    def _make_stream(self, raw_stream: AsyncStream[ChatCompletionChunk]) -> _AsyncStreamT: ...
+
+
+class AsyncChatCompletionStreamManager(
+    _BaseAsyncChatCompletionStreamManager[AsyncChatCompletionStream[ResponseFormatT], ResponseFormatT]
+):
+    """Context manager over a `AsyncChatCompletionStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+
+    Usage:
+    ```py
+    async with client.chat.completions.stream(...) as stream:
+        for event in stream:
+            ...
+    ```
+    """
+
+    @override
+    def _make_stream(self, raw_stream: AsyncStream[ChatCompletionChunk]) -> AsyncChatCompletionStream[ResponseFormatT]:
+        return AsyncChatCompletionStream(
+            raw_stream=raw_stream,
+            response_format=self._response_format,
+            input_tools=self._input_tools,
+        )
+
+
+class AsyncChatCompletionStreamManagerWithoutSnapshots(
+    _BaseAsyncChatCompletionStreamManager[AsyncChatCompletionStreamWithoutSnapshots[ResponseFormatT], ResponseFormatT]
+):
+    """Context manager over an `AsyncChatCompletionStreamWithoutSnapshots` that is returned by `.stream(accumulate=False)`."""
+
+    @override
+    def _make_stream(
+        self, raw_stream: AsyncStream[ChatCompletionChunk]
+    ) -> AsyncChatCompletionStreamWithoutSnapshots[ResponseFormatT]:
+        return AsyncChatCompletionStreamWithoutSnapshots(
+            raw_stream=raw_stream,
+            response_format=self._response_format,
+            input_tools=self._input_tools,
+        )
+
 
 class ChatCompletionStreamState(Generic[ResponseFormatT]):
     """Helper class for manually accumulating `ChatCompletionChunk`s into a final `ChatCompletion` object.
@@ -309,6 +439,10 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
 
     print(state.get_final_completion())
     ```
+
+    If you only need the deltas, use `.handle_chunk_without_snapshots()` instead, the chunks are still
+    accumulated for the final completion but the events don't include any snapshots and the content &
+    tool call arguments aren't partially parsed while the stream is in progress.
     """
 
     def __init__(
@@ -318,7 +452,11 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
         response_format: type[ResponseFormatT] | ResponseFormatParam | Omit = omit,
     ) -> None:
         self.__current_completion_snapshot: ParsedChatCompletionSnapshot | None = None
+        # whether or not the events include snapshots, which have to be kept up to date for every chunk
+        self._accumulate = True
         self.__choice_event_states: list[ChoiceEventState] = []
+        self.__strings = StringAccumulator()
+        self.__json_parsers: dict[tuple[int, int | None], PartialJSONParser] = {}
 
         self._input_tools = [tool for tool in input_tools] if is_given(input_tools) else []
         self._response_format = response_format
@@ -339,10 +477,15 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
     @property
     def current_completion_snapshot(self) -> ParsedChatCompletionSnapshot:
         assert self.__current_completion_snapshot is not None
+        self.__strings.flush()
         return self.__current_completion_snapshot
 
     def handle_chunk(self, chunk: ChatCompletionChunk) -> Iterable[ChatCompletionStreamEvent[ResponseFormatT]]:
         """Accumulate a new chunk into the snapshot and returns an iterable of events to yield."""
+        if not self._accumulate:
+            self._accumulate = True
+            self.__strings.flush()
+
         self.__current_completion_snapshot = self._accumulate_chunk(chunk)
 
         return self._build_events(
@@ -350,6 +493,20 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
             completion_snapshot=self.__current_completion_snapshot,
         )
 
+    def handle_chunk_without_snapshots(
+        self, chunk: ChatCompletionChunk
+    ) -> Iterable[ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]]:
+        """Accumulate a new chunk into the snapshot and returns an iterable of events to yield,
+        without the overhead of including the accumulated snapshots in the delta events.
+        """
+        self._accumulate = False
+        self.__current_completion_snapshot = self._accumulate_chunk(chunk)
+
+        return self._build_events_without_snapshots(
+            chunk=chunk,
+            completion_snapshot=self.__current_completion_snapshot,
+        )
+
     def _get_choice_state(self, choice: ChoiceChunk) -> ChoiceEventState:
         try:
             return self.__choice_event_states[choice.index]
@@ -367,48 +524,6 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
         for choice in chunk.choices:
             try:
                 choice_snapshot = completion_snapshot.choices[choice.index]
-                previous_tool_calls = choice_snapshot.message.tool_calls or []
-
-                choice_snapshot.message = cast(
-                    ParsedChatCompletionMessageSnapshot,
-                    construct_type(
-                        type_=ParsedChatCompletionMessageSnapshot,
-                        value=accumulate_delta(
-                            cast(
-                                "dict[object, object]",
-                                model_dump(
-                                    choice_snapshot.message,
-                                    # we don't want to serialise / deserialise our custom properties
-                                    # as they won't appear in the delta and we don't want to have to
-                                    # continuosly reparse the content
-                                    exclude=cast(
-                                        # cast required as mypy isn't smart enough to infer `True` here to `Literal[True]`
-                                        IncEx,
-                                        {
-                                            "parsed": True,
-                                            "tool_calls": {
-                                                idx: {"function": {"parsed_arguments": True}}
-                                                for idx, _ in enumerate(choice_snapshot.message.tool_calls or [])
-                                            },
-                                        },
-                                    ),
-                                ),
-                            ),
-                            cast("dict[object, object]", choice.delta.to_dict()),
-                        ),
-                    ),
-                )
-
-                # ensure tools that have already been parsed are added back into the newly
-                # constructed message snapshot
-                for tool_index, prev_tool in enumerate(previous_tool_calls):
-                    new_tool = (choice_snapshot.message.tool_calls or [])[tool_index]
-
-                    if prev_tool.type == "function":
-                        assert new_tool.type == "function"
-                        new_tool.function.parsed_arguments = prev_tool.function.parsed_arguments
-                    elif TYPE_CHECKING:  # type: ignore[unreachable]
-                        assert_never(prev_tool)
             except IndexError:
                 choice_snapshot = cast(
                     ParsedChoiceSnapshot,
@@ -421,12 +536,18 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                     ),
                 )
                 completion_snapshot.choices.append(choice_snapshot)
+            else:
+                delta = choice.delta.to_dict()
+                if not self._accumulate_delta_in_place(choice_snapshot.message, delta):
+                    self.__strings.flush()
+                    self._accumulate_delta_by_rebuilding(choice_snapshot, delta)
 
             if choice.finish_reason:
                 choice_snapshot.finish_reason = choice.finish_reason
 
                 if has_parseable_input(response_format=self._response_format, input_tools=self._input_tools):
                     if choice.finish_reason == "length":
+                        self.__strings.flush()
                         # at the time of writing, `.usage` will always be `None` but
                         # we include it here in case that is changed in the future
                         raise LengthFinishReasonError(completion=completion_snapshot)
@@ -434,6 +555,30 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                     if choice.finish_reason == "content_filter":
                         raise ContentFilterFinishReasonError()
 
+            if choice.logprobs is not None:
+                if choice_snapshot.logprobs is None:
+                    choice_snapshot.logprobs = build(
+                        ChoiceLogprobs,
+                        content=choice.logprobs.content,
+                        refusal=choice.logprobs.refusal,
+                    )
+                else:
+                    if choice.logprobs.content:
+                        if choice_snapshot.logprobs.content is None:
+                            choice_snapshot.logprobs.content = []
+
+                        choice_snapshot.logprobs.content.extend(choice.logprobs.content)
+
+                    if choice.logprobs.refusal:
+                        if choice_snapshot.logprobs.refusal is None:
+                            choice_snapshot.logprobs.refusal = []
+
+                        choice_snapshot.logprobs.refusal.extend(choice.logprobs.refusal)
+
+            if not self._accumulate:
+                # partially parsed values are only exposed through the event snapshots
+                continue
+
             if (
                 choice_snapshot.message.content
                 and not choice_snapshot.message.refusal
@@ -441,9 +586,8 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                 # partial parsing fails on white-space
                 and choice_snapshot.message.content.lstrip()
             ):
-                choice_snapshot.message.parsed = from_json(
-                    bytes(choice_snapshot.message.content, "utf-8"),
-                    partial_mode=True,
+                choice_snapshot.message.parsed = self._parse_partial_json(
+                    (choice.index, None), choice_snapshot.message.content
                 )
 
             for tool_call_chunk in choice.delta.tool_calls or []:
@@ -459,37 +603,162 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                         and input_tool.get("function", {}).get("strict")
                         and tool_call_snapshot.function.arguments
                     ):
-                        tool_call_snapshot.function.parsed_arguments = from_json(
-                            bytes(tool_call_snapshot.function.arguments, "utf-8"),
-                            partial_mode=True,
+                        tool_call_snapshot.function.parsed_arguments = self._parse_partial_json(
+                            (choice.index, tool_call_chunk.index), tool_call_snapshot.function.arguments
                         )
                 elif TYPE_CHECKING:  # type: ignore[unreachable]
                     assert_never(tool_call_snapshot)
 
-            if choice.logprobs is not None:
-                if choice_snapshot.logprobs is None:
-                    choice_snapshot.logprobs = build(
-                        ChoiceLogprobs,
-                        content=choice.logprobs.content,
-                        refusal=choice.logprobs.refusal,
+        completion_snapshot.usage = chunk.usage
+        completion_snapshot.system_fingerprint = chunk.system_fingerprint
+
+        return completion_snapshot
+
+    def _parse_partial_json(self, key: tuple[int, int | None], text: str) -> object:
+        """Parse the JSON content or tool call arguments accumulated so far, keyed by the choice & tool call index"""
+        parser = self.__json_parsers.get(key)
+        if parser is None:
+            parser = self.__json_parsers[key] = PartialJSONParser()
+
+        return parser.parse(text)
+
+    def _accumulate_delta_in_place(
+        self, message: ParsedChatCompletionMessageSnapshot, delta: dict[str, object]
+    ) -> bool:
+        """Accumulate the common delta properties directly into the message snapshot.
+
+        Returns `False` without changing the snapshot if the delta has to be accumulated
+        by rebuilding the message instead, e.g. because it contains unknown properties.
+        """
+        if not _MESSAGE_DELTA_KEYS.issuperset(delta):
+            return False
+
+        function_call = delta.get("function_call")
+        if function_call is not None and not _is_function_delta(function_call):
+            return False
+
+        tool_calls = delta.get("tool_calls")
+        if tool_calls is not None:
+            if not is_list(tool_calls):
+                return False
+
+            for tool_call in tool_calls:
+                if not is_dict(tool_call) or not _TOOL_CALL_DELTA_KEYS.issuperset(tool_call):
+                    return False
+
+                index = tool_call.get("index")
+                if not isinstance(index, int) or not _is_function_delta(tool_call.get("function")):
+                    return False
+
+                if index < len(message.tool_calls or []) and (message.tool_calls or [])[index].type != "function":
+                    return False
+
+        for key in ("content", "refusal"):
+            value = delta.get(key)
+            if isinstance(value, str):
+                self._append_string(message, key, value)
+
+        role = delta.get("role")
+        if role is not None:
+            message.role = cast(Any, role)
+
+        if is_dict(function_call):
+            if message.function_call is None:
+                message.function_call = cast(FunctionCall, construct_type(type_=FunctionCall, value=function_call))
+            else:
+                self._accumulate_function_delta(message.function_call, function_call)
+
+        for tool_call in cast("list[dict[str, object]]", tool_calls or []):
+            index = cast(int, tool_call["index"])
+            if message.tool_calls is None:
+                message.tool_calls = []
+
+            if index >= len(message.tool_calls):
+                message.tool_calls.insert(
+                    index,
+                    cast(ParsedFunctionToolCall, construct_type(type_=ParsedFunctionToolCall, value=tool_call)),
+                )
+                continue
+
+            tool_call_snapshot = message.tool_calls[index]
+            tool_call_id = tool_call.get("id")
+            if isinstance(tool_call_id, str):
+                self._append_string(tool_call_snapshot, "id", tool_call_id)
+
+            tool_call_type = tool_call.get("type")
+            if tool_call_type is not None:
+                tool_call_snapshot.type = cast(Any, tool_call_type)
+
+            function = tool_call.get("function")
+            if is_dict(function):
+                if cast(Any, tool_call_snapshot).function is None:
+                    tool_call_snapshot.function = cast(
+                        ParsedFunction, construct_type(type_=ParsedFunction, value=function)
                     )
                 else:
-                    if choice.logprobs.content:
-                        if choice_snapshot.logprobs.content is None:
-                            choice_snapshot.logprobs.content = []
+                    self._accumulate_function_delta(tool_call_snapshot.function, function)
 
-                        choice_snapshot.logprobs.content.extend(choice.logprobs.content)
+        return True
 
-                    if choice.logprobs.refusal:
-                        if choice_snapshot.logprobs.refusal is None:
-                            choice_snapshot.logprobs.refusal = []
+    def _accumulate_function_delta(self, snapshot: object, delta: dict[object, object]) -> None:
+        for key in ("name", "arguments"):
+            value = delta.get(key)
+            if isinstance(value, str):
+                self._append_string(snapshot, key, value)
 
-                        choice_snapshot.logprobs.refusal.extend(choice.logprobs.refusal)
+    def _append_string(self, obj: object, attr: str, delta: str) -> None:
+        if not self._accumulate:
+            # the snapshot strings are only joined once they're read, e.g. for the done events
+            self.__strings.append(obj, attr, delta)
+            return
 
-        completion_snapshot.usage = chunk.usage
-        completion_snapshot.system_fingerprint = chunk.system_fingerprint
+        # every event exposes the full snapshot strings so there is nothing to gain from buffering the deltas
+        current = getattr(obj, attr)
+        setattr(obj, attr, delta if current is None else current + delta)
+
+    def _accumulate_delta_by_rebuilding(self, choice_snapshot: ParsedChoiceSnapshot, delta: dict[str, object]) -> None:
+        previous_tool_calls = choice_snapshot.message.tool_calls or []
+
+        choice_snapshot.message = cast(
+            ParsedChatCompletionMessageSnapshot,
+            construct_type(
+                type_=ParsedChatCompletionMessageSnapshot,
+                value=accumulate_delta(
+                    cast(
+                        "dict[object, object]",
+                        model_dump(
+                            choice_snapshot.message,
+                            # we don't want to serialise / deserialise our custom properties
+                            # as they won't appear in the delta and we don't want to have to
+                            # continuosly reparse the content
+                            exclude=cast(
+                                # cast required as mypy isn't smart enough to infer `True` here to `Literal[True]`
+                                IncEx,
+                                {
+                                    "parsed": True,
+                                    "tool_calls": {
+                                        idx: {"function": {"parsed_arguments": True}}
+                                        for idx, _ in enumerate(choice_snapshot.message.tool_calls or [])
+                                    },
+                                },
+                            ),
+                        ),
+                    ),
+                    cast("dict[object, object]", delta),
+                ),
+            ),
+        )
 
-        return completion_snapshot
+        # ensure tools that have already been parsed are added back into the newly
+        # constructed message snapshot
+        for tool_index, prev_tool in enumerate(previous_tool_calls):
+            new_tool = (choice_snapshot.message.tool_calls or [])[tool_index]
+
+            if prev_tool.type == "function":
+                assert new_tool.type == "function"
+                new_tool.function.parsed_arguments = prev_tool.function.parsed_arguments
+            elif TYPE_CHECKING:  # type: ignore[unreachable]
+                assert_never(prev_tool)
 
     def _build_events(
         self,
@@ -582,6 +851,80 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
 
         return events_to_fire
 
+    def _build_events_without_snapshots(
+        self,
+        *,
+        chunk: ChatCompletionChunk,
+        completion_snapshot: ParsedChatCompletionSnapshot,
+    ) -> list[ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]]:
+        events_to_fire: list[ChatCompletionStreamEventWithoutSnapshots[ResponseFormatT]] = []
+
+        events_to_fire.append(build(ChunkEventWithoutSnapshot, type="chunk", chunk=chunk))
+
+        for choice in chunk.choices:
+            choice_state = self._get_choice_state(choice)
+            choice_snapshot = completion_snapshot.choices[choice.index]
+
+            if choice.delta.content is not None:
+                events_to_fire.append(
+                    build(ContentDeltaEventWithoutSnapshot, type="content.delta", delta=choice.delta.content)
+                )
+
+            if choice.delta.refusal is not None:
+                events_to_fire.append(
+                    build(RefusalDeltaEventWithoutSnapshot, type="refusal.delta", delta=choice.delta.refusal)
+                )
+
+            for tool_call_delta in choice.delta.tool_calls or []:
+                tool_call = (choice_snapshot.message.tool_calls or [])[tool_call_delta.index]
+
+                if tool_call.type == "function":
+                    self.__strings.flush_attr(tool_call.function, "name")
+                    events_to_fire.append(
+                        build(
+                            FunctionToolCallArgumentsDeltaEventWithoutSnapshot,
+                            type="tool_calls.function.arguments.delta",
+                            name=tool_call.function.name,
+                            index=tool_call_delta.index,
+                            arguments_delta=(tool_call_delta.function and tool_call_delta.function.arguments) or "",
+                        )
+                    )
+                elif TYPE_CHECKING:  # type: ignore[unreachable]
+                    assert_never(tool_call)
+
+            if choice.logprobs is not None:
+                if choice.logprobs.content:
+                    events_to_fire.append(
+                        build(
+                            LogprobsContentDeltaEventWithoutSnapshot,
+                            type="logprobs.content.delta",
+                            content=choice.logprobs.content,
+                        )
+                    )
+
+                if choice.logprobs.refusal:
+                    events_to_fire.append(
+                        build(
+                            LogprobsRefusalDeltaEventWithoutSnapshot,
+                            type="logprobs.refusal.delta",
+                            refusal=choice.logprobs.refusal,
+                        )
+                    )
+
+            # the done events include the full content so the snapshot has to be brought up to date first
+            if choice.finish_reason or choice_state.is_new_tool_call(choice):
+                self.__strings.flush()
+
+            events_to_fire.extend(
+                choice_state.get_done_events(
+                    choice_chunk=choice,
+                    choice_snapshot=choice_snapshot,
+                    response_format=self._response_format,
+                )
+            )
+
+        return events_to_fire
+
 
 class ChoiceEventState:
     def __init__(self, *, input_tools: list[ChatCompletionToolUnionParam]) -> None:
@@ -594,14 +937,19 @@ class ChoiceEventState:
         self._done_tool_calls: set[int] = set()
         self.__current_tool_call_index: int | None = None
 
+    def is_new_tool_call(self, choice_chunk: ChoiceChunk) -> bool:
+        return any(
+            tool_call.index != self.__current_tool_call_index for tool_call in choice_chunk.delta.tool_calls or []
+        )
+
     def get_done_events(
         self,
         *,
         choice_chunk: ChoiceChunk,
         choice_snapshot: ParsedChoiceSnapshot,
         response_format: type[ResponseFormatT] | ResponseFormatParam | Omit,
-    ) -> list[ChatCompletionStreamEvent[ResponseFormatT]]:
-        events_to_fire: list[ChatCompletionStreamEvent[ResponseFormatT]] = []
+    ) -> list[_DoneEvent[ResponseFormatT]]:
+        events_to_fire: list[_DoneEvent[ResponseFormatT]] = []
 
         if choice_snapshot.finish_reason:
             events_to_fire.extend(
@@ -640,8 +988,8 @@ class ChoiceEventState:
         *,
         choice_snapshot: ParsedChoiceSnapshot,
         response_format: type[ResponseFormatT] | ResponseFormatParam | Omit,
-    ) -> list[ChatCompletionStreamEvent[ResponseFormatT]]:
-        events_to_fire: list[ChatCompletionStreamEvent[ResponseFormatT]] = []
+    ) -> list[_DoneEvent[ResponseFormatT]]:
+        events_to_fire: list[_DoneEvent[ResponseFormatT]] = []
 
         if choice_snapshot.message.content and not self._content_done:
             self._content_done = True
@@ -702,7 +1050,7 @@ class ChoiceEventState:
     def _add_tool_done_event(
         self,
         *,
-        events_to_fire: list[ChatCompletionStreamEvent[ResponseFormatT]],
+        events_to_fire: list[_DoneEvent[ResponseFormatT]],
         choice_snapshot: ParsedChoiceSnapshot,
         tool_index: int,
     ) -> None:
@@ -738,6 +1086,10 @@ class ChoiceEventState:
             assert_never(tool_call_snapshot)
 
 
+def _is_function_delta(value: object) -> bool:
+    return value is None or (is_dict(value) and _FUNCTION_DELTA_KEYS.issuperset(value))
+
+
 def _convert_initial_chunk_into_snapshot(chunk: ChatCompletionChunk) -> ParsedChatCompletionSnapshot:
     data = chunk.to_dict()
     choices = cast("list[object]", data["choices"])
@@ -121,3 +121,87 @@ ChatCompletionStreamEvent = Union[
     LogprobsRefusalDeltaEvent,
     LogprobsRefusalDoneEvent,
 ]
+
+
+class ChunkEventWithoutSnapshot(BaseModel):
+    """The `ChunkEvent` that is yielded by `.stream(accumulate=False)`"""
+
+    type: Literal["chunk"]
+
+    chunk: ChatCompletionChunk
+
+    snapshot: None = None
+
+
+class ContentDeltaEventWithoutSnapshot(BaseModel):
+    """The `ContentDeltaEvent` that is yielded by `.stream(accumulate=False)`"""
+
+    type: Literal["content.delta"]
+
+    delta: str
+
+    snapshot: None = None
+
+    parsed: None = None
+
+
+class RefusalDeltaEventWithoutSnapshot(BaseModel):
+    """The `RefusalDeltaEvent` that is yielded by `.stream(accumulate=False)`"""
+
+    type: Literal["refusal.delta"]
+
+    delta: str
+
+    snapshot: None = None
+
+
+class FunctionToolCallArgumentsDeltaEventWithoutSnapshot(BaseModel):
+    """The `FunctionToolCallArgumentsDeltaEvent` that is yielded by `.stream(accumulate=False)`"""
+
+    type: Literal["tool_calls.function.arguments.delta"]
+
+    name: str
+
+    index: int
+
+    arguments: None = None
+
+    parsed_arguments: None = None
+
+    arguments_delta: str
+    """The JSON string delta"""
+
+
+class LogprobsContentDeltaEventWithoutSnapshot(BaseModel):
+    """The `LogprobsContentDeltaEvent` that is yielded by `.stream(accumulate=False)`"""
+
+    type: Literal["logprobs.content.delta"]
+
+    content: List[ChatCompletionTokenLogprob]
+
+    snapshot: None = None
+
+
+class LogprobsRefusalDeltaEventWithoutSnapshot(BaseModel):
+    """The `LogprobsRefusalDeltaEvent` that is yielded by `.stream(accumulate=False)`"""
+
+    type: Literal["logprobs.refusal.delta"]
+
+    refusal: List[ChatCompletionTokenLogprob]
+
+    snapshot: None = None
+
+
+ChatCompletionStreamEventWithoutSnapshots = Union[
+    ChunkEventWithoutSnapshot,
+    ContentDeltaEventWithoutSnapshot,
+    ContentDoneEvent[ResponseFormatT],
+    RefusalDeltaEventWithoutSnapshot,
+    RefusalDoneEvent,
+    FunctionToolCallArgumentsDeltaEventWithoutSnapshot,
+    FunctionToolCallArgumentsDoneEvent,
+    LogprobsContentDeltaEventWithoutSnapshot,
+    LogprobsContentDoneEvent,
+    LogprobsRefusalDeltaEventWithoutSnapshot,
+    LogprobsRefusalDoneEvent,
+]
@@ -10,4 +10,8 @@ from ._responses import (
     ResponseStreamState as ResponseStreamState,
     ResponseStreamManager as ResponseStreamManager,
     AsyncResponseStreamManager as AsyncResponseStreamManager,
+    ResponseStreamWithoutSnapshots as ResponseStreamWithoutSnapshots,
+    AsyncResponseStreamWithoutSnapshots as AsyncResponseStreamWithoutSnapshots,
+    ResponseStreamManagerWithoutSnapshots as ResponseStreamManagerWithoutSnapshots,
+    AsyncResponseStreamManagerWithoutSnapshots as AsyncResponseStreamManagerWithoutSnapshots,
 )
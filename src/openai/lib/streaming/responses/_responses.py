@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import inspect
+from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import Any, List, Generic, Iterable, Awaitable, cast
-from typing_extensions import Self, Callable, Iterator, AsyncIterator
+from typing import Any, List, Generic, TypeVar, Iterable, Awaitable, cast
+from typing_extensions import Self, Callable, Iterator, AsyncIterator, override
 
 from ._types import ParsedResponseSnapshot
 from ._events import (
@@ -17,7 +18,12 @@ from ...._types import Omit, omit
 from ...._utils import is_given, consume_sync_iterator, consume_async_iterator
 from ...._models import build, construct_type_unchecked
 from ...._streaming import Stream, AsyncStream
-from ....types.responses import ParsedResponse, ResponseStreamEvent as RawResponseStreamEvent
+from ....types.responses import (
+    ParsedResponse,
+    ResponseStreamEvent as RawResponseStreamEvent,
+    ResponseTextDoneEvent as RawResponseTextDoneEvent,
+    ResponseCompletedEvent as RawResponseCompletedEvent,
+)
 from ..._parsing._responses import TextFormatT, parse_text, parse_response
 from ....types.responses.tool_param import ToolParam
 from ....types.responses.parsed_response import (
@@ -26,8 +32,12 @@ from ....types.responses.parsed_response import (
     ParsedResponseFunctionToolCall,
 )
 
+_StreamEventT = TypeVar("_StreamEventT", bound=RawResponseStreamEvent)
+_StreamT = TypeVar("_StreamT", bound="_BaseResponseStream[Any, Any]")
+_AsyncStreamT = TypeVar("_AsyncStreamT", bound="_BaseAsyncResponseStream[Any, Any]")
+
 
-class ResponseStream(Generic[TextFormatT]):
+class _BaseResponseStream(ABC, Generic[_StreamEventT, TextFormatT]):
     def __init__(
         self,
         *,
@@ -42,19 +52,22 @@ class ResponseStream(Generic[TextFormatT]):
         self._state = ResponseStreamState(text_format=text_format, input_tools=input_tools)
         self._starting_after = starting_after
 
-    def __next__(self) -> ResponseStreamEvent[TextFormatT]:
+    def __next__(self) -> _StreamEventT:
         return self._iterator.__next__()
 
-    def __iter__(self) -> Iterator[ResponseStreamEvent[TextFormatT]]:
+    def __iter__(self) -> Iterator[_StreamEventT]:
         for item in self._iterator:
             yield item
 
     def __enter__(self) -> Self:
         return self
 
-    def __stream__(self) -> Iterator[ResponseStreamEvent[TextFormatT]]:
+    @abstractmethod
+    def _handle_event(self, event: RawResponseStreamEvent) -> List[_StreamEventT]: ...
+
+    def __stream__(self) -> Iterator[_StreamEventT]:
         for sse_event in self._raw_stream:
-            events_to_fire = self._state.handle_event(sse_event)
+            events_to_fire = self._handle_event(sse_event)
             for event in events_to_fire:
                 if self._starting_after is None or event.sequence_number > self._starting_after:
                     yield event
@@ -92,7 +105,25 @@ class ResponseStream(Generic[TextFormatT]):
         return self
 
 
-class ResponseStreamManager(Generic[TextFormatT]):
+# the event unions can't be parametrized at runtime on older Python versions
+class ResponseStream(_BaseResponseStream["ResponseStreamEvent[TextFormatT]", TextFormatT]):
+    @override
+    def _handle_event(self, event: RawResponseStreamEvent) -> List[ResponseStreamEvent[TextFormatT]]:
+        return self._state.handle_event(event)
+
+
+class ResponseStreamWithoutSnapshots(_BaseResponseStream[RawResponseStreamEvent, TextFormatT]):
+    """The `ResponseStream` that is returned by `.stream(accumulate=False)`.
+
+    The events are yielded as-is, see `ResponseStreamState.handle_event_without_snapshots()`.
+    """
+
+    @override
+    def _handle_event(self, event: RawResponseStreamEvent) -> List[RawResponseStreamEvent]:
+        return self._state.handle_event_without_snapshots(event)
+
+
+class _BaseResponseStreamManager(ABC, Generic[_StreamT, TextFormatT]):
     def __init__(
         self,
         api_request: Callable[[], Stream[RawResponseStreamEvent]],
@@ -101,21 +132,16 @@ class ResponseStreamManager(Generic[TextFormatT]):
         input_tools: Iterable[ToolParam] | Omit,
         starting_after: int | None,
     ) -> None:
-        self.__stream: ResponseStream[TextFormatT] | None = None
+        self.__stream: _StreamT | None = None
         self.__api_request = api_request
-        self.__text_format = text_format
-        self.__input_tools = input_tools
-        self.__starting_after = starting_after
+        self._text_format = text_format
+        self._input_tools = input_tools
+        self._starting_after = starting_after
 
-    def __enter__(self) -> ResponseStream[TextFormatT]:
+    def __enter__(self) -> _StreamT:
         raw_stream = self.__api_request()
 
-        self.__stream = ResponseStream(
-            raw_stream=raw_stream,
-            text_format=self.__text_format,
-            input_tools=self.__input_tools,
-            starting_after=self.__starting_after,
-        )
+        self.__stream = self._make_stream(raw_stream)
 
         return self.__stream
 
@@ -128,8 +154,37 @@ class ResponseStreamManager(Generic[TextFormatT]):
         if self.__stream is not None:
             self.__stream.close()
 
+    @abstractmethod
+    def _make_stream(self, raw_stream: Stream[RawResponseStreamEvent]) -> _StreamT: ...
+
+
+class ResponseStreamManager(_BaseResponseStreamManager[ResponseStream[TextFormatT], TextFormatT]):
+    @override
+    def _make_stream(self, raw_stream: Stream[RawResponseStreamEvent]) -> ResponseStream[TextFormatT]:
+        return ResponseStream(
+            raw_stream=raw_stream,
+            text_format=self._text_format,
+            input_tools=self._input_tools,
+            starting_after=self._starting_after,
+        )
+
 
-class AsyncResponseStream(Generic[TextFormatT]):
+class ResponseStreamManagerWithoutSnapshots(
+    _BaseResponseStreamManager[ResponseStreamWithoutSnapshots[TextFormatT], TextFormatT]
+):
+    """Context manager over a `ResponseStreamWithoutSnapshots` that is returned by `.stream(accumulate=False)`."""
+
+    @override
+    def _make_stream(self, raw_stream: Stream[RawResponseStreamEvent]) -> ResponseStreamWithoutSnapshots[TextFormatT]:
+        return ResponseStreamWithoutSnapshots(
+            raw_stream=raw_stream,
+            text_format=self._text_format,
+            input_tools=self._input_tools,
+            starting_after=self._starting_after,
+        )
+
+
+class _BaseAsyncResponseStream(ABC, Generic[_StreamEventT, TextFormatT]):
     def __init__(
         self,
         *,
@@ -144,16 +199,19 @@ class AsyncResponseStream(Generic[TextFormatT]):
         self._state = ResponseStreamState(text_format=text_format, input_tools=input_tools)
         self._starting_after = starting_after
 
-    async def __anext__(self) -> ResponseStreamEvent[TextFormatT]:
+    async def __anext__(self) -> _StreamEventT:
         return await self._iterator.__anext__()
 
-    async def __aiter__(self) -> AsyncIterator[ResponseStreamEvent[TextFormatT]]:
+    async def __aiter__(self) -> AsyncIterator[_StreamEventT]:
         async for item in self._iterator:
             yield item
 
-    async def __stream__(self) -> AsyncIterator[ResponseStreamEvent[TextFormatT]]:
+    @abstractmethod
+    def _handle_event(self, event: RawResponseStreamEvent) -> List[_StreamEventT]: ...
+
+    async def __stream__(self) -> AsyncIterator[_StreamEventT]:
         async for sse_event in self._raw_stream:
-            events_to_fire = self._state.handle_event(sse_event)
+            events_to_fire = self._handle_event(sse_event)
             for event in events_to_fire:
                 if self._starting_after is None or event.sequence_number > self._starting_after:
                     yield event
@@ -194,7 +252,24 @@ class AsyncResponseStream(Generic[TextFormatT]):
         return self
 
 
-class AsyncResponseStreamManager(Generic[TextFormatT]):
+class AsyncResponseStream(_BaseAsyncResponseStream["ResponseStreamEvent[TextFormatT]", TextFormatT]):
+    @override
+    def _handle_event(self, event: RawResponseStreamEvent) -> List[ResponseStreamEvent[TextFormatT]]:
+        return self._state.handle_event(event)
+
+
+class AsyncResponseStreamWithoutSnapshots(_BaseAsyncResponseStream[RawResponseStreamEvent, TextFormatT]):
+    """The `AsyncResponseStream` that is returned by `.stream(accumulate=False)`.
+
+    The events are yielded as-is, see `ResponseStreamState.handle_event_without_snapshots()`.
+    """
+
+    @override
+    def _handle_event(self, event: RawResponseStreamEvent) -> List[RawResponseStreamEvent]:
+        return self._state.handle_event_without_snapshots(event)
+
+
+class _BaseAsyncResponseStreamManager(ABC, Generic[_AsyncStreamT, TextFormatT]):
     def __init__(
         self,
         api_request: Awaitable[AsyncStream[RawResponseStreamEvent]],
@@ -203,21 +278,16 @@ class AsyncResponseStreamManager(Generic[TextFormatT]):
         input_tools: Iterable[ToolParam] | Omit,
         starting_after: int | None,
     ) -> None:
-        self.__stream: AsyncResponseStream[TextFormatT] | None = None
+        self.__stream: _AsyncStreamT | None = None
         self.__api_request = api_request
-        self.__text_format = text_format
-        self.__input_tools = input_tools
-        self.__starting_after = starting_after
+        self._text_format = text_format
+        self._input_tools = input_tools
+        self._starting_after = starting_after
 
-    async def __aenter__(self) -> AsyncResponseStream[TextFormatT]:
+    async def __aenter__(self) -> _AsyncStreamT:
         raw_stream = await self.__api_request
 
-        self.__stream = AsyncResponseStream(
-            raw_stream=raw_stream,
-            text_format=self.__text_format,
-            input_tools=self.__input_tools,
-            starting_after=self.__starting_after,
-        )
+        self.__stream = self._make_stream(raw_stream)
 
         return self.__stream
 
@@ -230,6 +300,37 @@ class AsyncResponseStreamManager(Generic[TextFormatT]):
         if self.__stream is not None:
             await self.__stream.close()
 
+    @abstractmethod
+    def _make_stream(self, raw_stream: AsyncStream[RawResponseStreamEvent]) -> _AsyncStreamT: ...
+
+
+class AsyncResponseStreamManager(_BaseAsyncResponseStreamManager[AsyncResponseStream[TextFormatT], TextFormatT]):
+    @override
+    def _make_stream(self, raw_stream: AsyncStream[RawResponseStreamEvent]) -> AsyncResponseStream[TextFormatT]:
+        return AsyncResponseStream(
+            raw_stream=raw_stream,
+            text_format=self._text_format,
+            input_tools=self._input_tools,
+            starting_after=self._starting_after,
+        )
+
+
+class AsyncResponseStreamManagerWithoutSnapshots(
+    _BaseAsyncResponseStreamManager[AsyncResponseStreamWithoutSnapshots[TextFormatT], TextFormatT]
+):
+    """Context manager over an `AsyncResponseStreamWithoutSnapshots` that is returned by `.stream(accumulate=False)`."""
+
+    @override
+    def _make_stream(
+        self, raw_stream: AsyncStream[RawResponseStreamEvent]
+    ) -> AsyncResponseStreamWithoutSnapshots[TextFormatT]:
+        return AsyncResponseStreamWithoutSnapshots(
+            raw_stream=raw_stream,
+            text_format=self._text_format,
+            input_tools=self._input_tools,
+            starting_after=self._starting_after,
+        )
+
 
 class ResponseStreamState(Generic[TextFormatT]):
     def __init__(
@@ -276,19 +377,7 @@ class ResponseStreamState(Generic[TextFormatT]):
             content = output.content[event.content_index]
             assert content.type == "output_text"
 
-            events.append(
-                build(
-                    ResponseTextDoneEvent[TextFormatT],
-                    content_index=event.content_index,
-                    item_id=event.item_id,
-                    output_index=event.output_index,
-                    sequence_number=event.sequence_number,
-                    logprobs=event.logprobs,
-                    type="response.output_text.done",
-                    text=event.text,
-                    parsed=parse_text(event.text, text_format=self._text_format),
-                )
-            )
+            events.append(self._build_text_done_event(event))
         elif event.type == "response.function_call_arguments.delta":
             output = snapshot.output[event.output_index]
             assert output.type == "function_call"
@@ -306,22 +395,49 @@ class ResponseStreamState(Generic[TextFormatT]):
             )
 
         elif event.type == "response.completed":
-            response = self._completed_response
-            assert response is not None
-
-            events.append(
-                build(
-                    ResponseCompletedEvent,
-                    sequence_number=event.sequence_number,
-                    type="response.completed",
-                    response=response,
-                )
-            )
+            events.append(self._build_completed_event(event))
         else:
             events.append(event)
 
         return events
 
+    def handle_event_without_snapshots(self, event: RawResponseStreamEvent) -> List[RawResponseStreamEvent]:
+        """Like `.handle_event()` but without keeping a snapshot of the response up to date,
+        the events are returned as-is and only the final response is parsed.
+        """
+        if event.type == "response.completed":
+            self._completed_response = parse_response(
+                text_format=self._text_format,
+                response=event.response,
+                input_tools=self._input_tools,
+            )
+
+        return [event]
+
+    def _build_text_done_event(self, event: RawResponseTextDoneEvent) -> ResponseTextDoneEvent[TextFormatT]:
+        return build(
+            ResponseTextDoneEvent[TextFormatT],
+            content_index=event.content_index,
+            item_id=event.item_id,
+            output_index=event.output_index,
+            sequence_number=event.sequence_number,
+            logprobs=event.logprobs,
+            type="response.output_text.done",
+            text=event.text,
+            parsed=parse_text(event.text, text_format=self._text_format),
+        )
+
+    def _build_completed_event(self, event: RawResponseCompletedEvent) -> ResponseCompletedEvent[TextFormatT]:
+        response = self._completed_response
+        assert response is not None
+
+        return build(
+            ResponseCompletedEvent,
+            sequence_number=event.sequence_number,
+            type="response.completed",
+            response=response,
+        )
+
     def accumulate_event(self, event: RawResponseStreamEvent) -> ParsedResponseSnapshot:
         snapshot = self.__current_snapshot
         if snapshot is None:
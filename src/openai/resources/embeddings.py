@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import array
 import base64
-from typing import Union, Iterable, cast
+from typing import List, Union, Callable, Iterable, Iterator, Optional, AsyncIterator, cast
 from typing_extensions import Literal
 
 import httpx
@@ -18,8 +18,18 @@ from .._extras import numpy as np, has_numpy
 from .._resource import SyncAPIResource, AsyncAPIResource
 from .._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from .._base_client import make_request_options
+from ..lib._embeddings import (
+    EmbeddingMatrix,
+    Base64EmbeddingResponse,
+    pack_inputs,
+    embed_batches,
+    async_embed_batches,
+    decode_embedding_matrix,
+)
+from ..types.embedding import Embedding
+from ..lib.embedding_cache import EmbeddingCache, CachedEmbeddings, AsyncCachedEmbeddings
 from ..types.embedding_model import EmbeddingModel
-from ..types.create_embedding_response import CreateEmbeddingResponse
+from ..types.create_embedding_response import Usage, CreateEmbeddingResponse
 
 __all__ = ["Embeddings", "AsyncEmbeddings"]
 
@@ -44,6 +54,18 @@ class Embeddings(SyncAPIResource):
         """
         return EmbeddingsWithStreamingResponse(self)
 
+    def with_cache(self, cache: EmbeddingCache) -> CachedEmbeddings:
+        """
+        Returns a wrapper that only requests embeddings for inputs that aren't already in the
+        given cache, e.g. a `LRUEmbeddingCache` or a `DiskEmbeddingCache` from
+        `openai.lib.embedding_cache`.
+
+        Inputs are cached by the model, dimensions and SHA-256 hash of their text. All of the
+        inputs in a call that aren't cached are embedded in a single request, and
+        `cache.stats` reports how many inputs were found in the cache.
+        """
+        return CachedEmbeddings(self, cache)
+
     def create(
         self,
         *,
@@ -142,6 +164,103 @@ class Embeddings(SyncAPIResource):
             cast_to=CreateEmbeddingResponse,
         )
 
+    def create_matrix(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> EmbeddingMatrix:
+        """
+        Creates embeddings for the input and returns them as a single float32 matrix.
+
+        This avoids converting every dimension of every embedding into a Python `float`, which
+        is much faster and uses far less memory when embedding many inputs. `.data` is a
+        `(len(input), dimensions)` NumPy array if NumPy is installed, otherwise it is an
+        `array.array` of every embedding in row-major order.
+
+        See `create()` for the arguments.
+        """
+        params = {
+            "input": input,
+            "model": model,
+            "user": user,
+            "dimensions": dimensions,
+            "encoding_format": "base64",
+        }
+        response = self._post(
+            "/embeddings",
+            body=maybe_transform(params, embedding_create_params.EmbeddingCreateParams),
+            options=make_request_options(
+                extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
+            ),
+            cast_to=Base64EmbeddingResponse,
+        )
+        return decode_embedding_matrix(response)
+
+    def embed_many(
+        self,
+        input: Iterable[str],
+        *,
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        max_concurrency: int = 4,
+        max_inputs_per_request: int = 2048,
+        max_tokens_per_request: int = 300_000,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> Iterator[EmbeddingMatrix]:
+        """
+        Embeds any number of inputs, packing them into as few requests as possible and sending
+        up to `max_concurrency` requests at once.
+
+        A float32 `EmbeddingMatrix` is yielded for each request in the order of the inputs,
+        `matrix.offset` is the index of the input the first embedding is for. `input` is
+        consumed lazily so it can be a generator over a large dataset.
+
+        Each request holds at most `max_inputs_per_request` inputs and
+        `max_tokens_per_request` tokens. Tokens are estimated from the length of each input
+        unless `count_tokens` is given, e.g. `lambda text: len(encoding.encode(text))` with
+        `tiktoken`. If a request is rejected, for example because the estimate was too low,
+        it is split in half and each half is retried on its own. Failed requests are also
+        retried according to the client's `max_retries` option.
+
+        See `create()` for the other arguments.
+        """
+
+        def embed(batch: List[str]) -> EmbeddingMatrix:
+            return self.create_matrix(
+                input=batch,
+                model=model,
+                dimensions=dimensions,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        batches = pack_inputs(
+            input,
+            max_inputs=max_inputs_per_request,
+            max_tokens=max_tokens_per_request,
+            count_tokens=count_tokens,
+        )
+        return embed_batches(batches, embed, max_concurrency=max_concurrency)
+
 
 class AsyncEmbeddings(AsyncAPIResource):
     @cached_property
@@ -163,6 +282,18 @@ class AsyncEmbeddings(AsyncAPIResource):
         """
         return AsyncEmbeddingsWithStreamingResponse(self)
 
+    def with_cache(self, cache: EmbeddingCache) -> AsyncCachedEmbeddings:
+        """
+        Returns a wrapper that only requests embeddings for inputs that aren't already in the
+        given cache, e.g. a `LRUEmbeddingCache` or a `DiskEmbeddingCache` from
+        `openai.lib.embedding_cache`.
+
+        Inputs are cached by the model, dimensions and SHA-256 hash of their text. All of the
+        inputs in a call that aren't cached are embedded in a single request, and
+        `cache.stats` reports how many inputs were found in the cache.
+        """
+        return AsyncCachedEmbeddings(self, cache)
+
     async def create(
         self,
         *,
@@ -216,6 +347,26 @@ class AsyncEmbeddings(AsyncAPIResource):
 
           timeout: Override the client-level default timeout for this request, in seconds
         """
+        coalescer = self._client._coalescer
+        if (
+            coalescer is not None
+            and isinstance(input, str)
+            and extra_headers is None
+            and extra_query is None
+            and extra_body is None
+            and not is_given(timeout)
+        ):
+
+            async def send(inputs: List[str]) -> List[CreateEmbeddingResponse]:
+                response = await self.create(
+                    input=inputs, model=model, dimensions=dimensions, encoding_format=encoding_format, user=user
+                )
+                return _split_embedding_response(response, inputs)
+
+            return await coalescer.submit(
+                ("embeddings", self._client, model, dimensions, encoding_format, user), input, send
+            )
+
         params = {
             "input": input,
             "model": model,
@@ -261,6 +412,133 @@ class AsyncEmbeddings(AsyncAPIResource):
             cast_to=CreateEmbeddingResponse,
         )
 
+    async def create_matrix(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> EmbeddingMatrix:
+        """
+        Creates embeddings for the input and returns them as a single float32 matrix.
+
+        This avoids converting every dimension of every embedding into a Python `float`, which
+        is much faster and uses far less memory when embedding many inputs. `.data` is a
+        `(len(input), dimensions)` NumPy array if NumPy is installed, otherwise it is an
+        `array.array` of every embedding in row-major order.
+
+        See `create()` for the arguments.
+        """
+        params = {
+            "input": input,
+            "model": model,
+            "user": user,
+            "dimensions": dimensions,
+            "encoding_format": "base64",
+        }
+        response = await self._post(
+            "/embeddings",
+            body=maybe_transform(params, embedding_create_params.EmbeddingCreateParams),
+            options=make_request_options(
+                extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
+            ),
+            cast_to=Base64EmbeddingResponse,
+        )
+        return decode_embedding_matrix(response)
+
+    def embed_many(
+        self,
+        input: Iterable[str],
+        *,
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        user: str | Omit = omit,
+        max_concurrency: int = 4,
+        max_inputs_per_request: int = 2048,
+        max_tokens_per_request: int = 300_000,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncIterator[EmbeddingMatrix]:
+        """
+        Embeds any number of inputs, packing them into as few requests as possible and sending
+        up to `max_concurrency` requests at once, see `Embeddings.embed_many()`.
+
+        Note: if the iterator isn't exhausted then it should be closed with `aclose()` so that
+        the requests that are still being sent are cancelled.
+        """
+
+        async def embed(batch: List[str]) -> EmbeddingMatrix:
+            return await self.create_matrix(
+                input=batch,
+                model=model,
+                dimensions=dimensions,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        batches = pack_inputs(
+            input,
+            max_inputs=max_inputs_per_request,
+            max_tokens=max_tokens_per_request,
+            count_tokens=count_tokens,
+        )
+        return async_embed_batches(batches, embed, max_concurrency=max_concurrency)
+
+
+def _split_tokens(tokens: int, weights: List[int]) -> List[int]:
+    """Splits `tokens` in proportion to `weights`, the parts always add up to `tokens`"""
+    if not sum(weights):
+        weights = [1] * len(weights)
+
+    total = sum(weights)
+    parts = [tokens * weight // total for weight in weights]
+    # the tokens that are left over from rounding down go to the largest remainders
+    by_remainder = sorted(range(len(weights)), key=lambda index: tokens * weights[index] % total, reverse=True)
+    for index in by_remainder[: tokens - sum(parts)]:
+        parts[index] += 1
+    return parts
+
+
+def _split_embedding_response(response: CreateEmbeddingResponse, inputs: List[str]) -> List[CreateEmbeddingResponse]:
+    """Splits the response to a coalesced request into a response for each input.
+
+    The API only reports the usage of the whole request, so it's split between the inputs in
+    proportion to their length.
+    """
+    count = len(inputs)
+    embeddings = {embedding.index: embedding for embedding in response.data}
+    if len(embeddings) != count:
+        raise ValueError(f"Expected {count} embeddings but received {len(embeddings)}")
+
+    weights = [len(text) for text in inputs]
+    prompt_tokens = _split_tokens(response.usage.prompt_tokens, weights)
+    total_tokens = _split_tokens(response.usage.total_tokens, weights)
+
+    return [
+        CreateEmbeddingResponse.construct(
+            data=[Embedding.construct(embedding=embeddings[index].embedding, index=0, object="embedding")],
+            model=response.model,
+            object=response.object,
+            usage=Usage.construct(prompt_tokens=prompt_tokens[index], total_tokens=total_tokens[index]),
+        )
+        for index in range(count)
+    ]
+
 
 class EmbeddingsWithRawResponse:
     def __init__(self, embeddings: Embeddings) -> None:
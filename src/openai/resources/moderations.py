@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Union, Iterable
+from typing import List, Union, Iterable
 
 import httpx
 
 from .. import _legacy_response
 from ..types import moderation_create_params
 from .._types import Body, Omit, Query, Headers, NotGiven, SequenceNotStr, omit, not_given
-from .._utils import maybe_transform, async_maybe_transform
+from .._utils import is_given, maybe_transform, async_maybe_transform
 from .._compat import cached_property
 from .._resource import SyncAPIResource, AsyncAPIResource
 from .._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
@@ -145,6 +145,28 @@ class AsyncModerations(AsyncAPIResource):
 
           timeout: Override the client-level default timeout for this request, in seconds
         """
+        coalescer = self._client._coalescer
+        if (
+            coalescer is not None
+            and isinstance(input, str)
+            and extra_headers is None
+            and extra_query is None
+            and extra_body is None
+            and not is_given(timeout)
+        ):
+
+            async def send(inputs: List[str]) -> List[ModerationCreateResponse]:
+                response = await self.create(input=inputs, model=model)
+                if len(response.results) != len(inputs):
+                    raise ValueError(f"Expected {len(inputs)} moderation results but received {len(response.results)}")
+
+                return [
+                    ModerationCreateResponse.construct(id=response.id, model=response.model, results=[result])
+                    for result in response.results
+                ]
+
+            return await coalescer.submit(("moderations", self._client, model), input, send)
+
         return await self._post(
             "/moderations",
             body=await async_maybe_transform(
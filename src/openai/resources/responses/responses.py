@@ -44,7 +44,12 @@ from ...types.responses.tool_param import ToolParam, ParseableToolParam
 from ...types.shared_params.metadata import Metadata
 from ...types.shared_params.reasoning import Reasoning
 from ...types.responses.parsed_response import ParsedResponse
-from ...lib.streaming.responses._responses import ResponseStreamManager, AsyncResponseStreamManager
+from ...lib.streaming.responses._responses import (
+    ResponseStreamManager,
+    AsyncResponseStreamManager,
+    ResponseStreamManagerWithoutSnapshots,
+    AsyncResponseStreamManagerWithoutSnapshots,
+)
 from ...types.responses.response_includable import ResponseIncludable
 from ...types.shared_params.responses_model import ResponsesModel
 from ...types.responses.response_input_param import ResponseInputParam
@@ -887,6 +892,7 @@ class Responses(SyncAPIResource):
         *,
         response_id: str,
         text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[True] = True,
         starting_after: int | Omit = omit,
         tools: Iterable[ParseableToolParam] | Omit = omit,
         # The extra values given here take precedence over values defined on the client or passed to this method.
@@ -896,6 +902,38 @@ class Responses(SyncAPIResource):
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> ResponseStreamManager[TextFormatT]: ...
 
+    @overload
+    def stream(
+        self,
+        *,
+        response_id: str,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[False],
+        starting_after: int | Omit = omit,
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> ResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
+    @overload
+    def stream(
+        self,
+        *,
+        response_id: str,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: bool,
+        starting_after: int | Omit = omit,
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> ResponseStreamManager[TextFormatT] | ResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
     @overload
     def stream(
         self,
@@ -904,6 +942,7 @@ class Responses(SyncAPIResource):
         model: ResponsesModel,
         background: Optional[bool] | Omit = omit,
         text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[True] = True,
         tools: Iterable[ParseableToolParam] | Omit = omit,
         conversation: Optional[response_create_params.Conversation] | Omit = omit,
         include: Optional[List[ResponseIncludable]] | Omit = omit,
@@ -935,6 +974,86 @@ class Responses(SyncAPIResource):
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> ResponseStreamManager[TextFormatT]: ...
 
+    @overload
+    def stream(
+        self,
+        *,
+        input: Union[str, ResponseInputParam],
+        model: ResponsesModel,
+        background: Optional[bool] | Omit = omit,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[False],
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        conversation: Optional[response_create_params.Conversation] | Omit = omit,
+        include: Optional[List[ResponseIncludable]] | Omit = omit,
+        instructions: Optional[str] | Omit = omit,
+        max_output_tokens: Optional[int] | Omit = omit,
+        max_tool_calls: Optional[int] | Omit = omit,
+        metadata: Optional[Metadata] | Omit = omit,
+        parallel_tool_calls: Optional[bool] | Omit = omit,
+        previous_response_id: Optional[str] | Omit = omit,
+        prompt: Optional[ResponsePromptParam] | Omit = omit,
+        prompt_cache_key: str | Omit = omit,
+        reasoning: Optional[Reasoning] | Omit = omit,
+        safety_identifier: str | Omit = omit,
+        service_tier: Optional[Literal["auto", "default", "flex", "scale", "priority"]] | Omit = omit,
+        store: Optional[bool] | Omit = omit,
+        stream_options: Optional[response_create_params.StreamOptions] | Omit = omit,
+        temperature: Optional[float] | Omit = omit,
+        text: ResponseTextConfigParam | Omit = omit,
+        tool_choice: response_create_params.ToolChoice | Omit = omit,
+        top_logprobs: Optional[int] | Omit = omit,
+        top_p: Optional[float] | Omit = omit,
+        truncation: Optional[Literal["auto", "disabled"]] | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> ResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
+    @overload
+    def stream(
+        self,
+        *,
+        input: Union[str, ResponseInputParam],
+        model: ResponsesModel,
+        background: Optional[bool] | Omit = omit,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: bool,
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        conversation: Optional[response_create_params.Conversation] | Omit = omit,
+        include: Optional[List[ResponseIncludable]] | Omit = omit,
+        instructions: Optional[str] | Omit = omit,
+        max_output_tokens: Optional[int] | Omit = omit,
+        max_tool_calls: Optional[int] | Omit = omit,
+        metadata: Optional[Metadata] | Omit = omit,
+        parallel_tool_calls: Optional[bool] | Omit = omit,
+        previous_response_id: Optional[str] | Omit = omit,
+        prompt: Optional[ResponsePromptParam] | Omit = omit,
+        prompt_cache_key: str | Omit = omit,
+        reasoning: Optional[Reasoning] | Omit = omit,
+        safety_identifier: str | Omit = omit,
+        service_tier: Optional[Literal["auto", "default", "flex", "scale", "priority"]] | Omit = omit,
+        store: Optional[bool] | Omit = omit,
+        stream_options: Optional[response_create_params.StreamOptions] | Omit = omit,
+        temperature: Optional[float] | Omit = omit,
+        text: ResponseTextConfigParam | Omit = omit,
+        tool_choice: response_create_params.ToolChoice | Omit = omit,
+        top_logprobs: Optional[int] | Omit = omit,
+        top_p: Optional[float] | Omit = omit,
+        truncation: Optional[Literal["auto", "disabled"]] | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> ResponseStreamManager[TextFormatT] | ResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
     def stream(
         self,
         *,
@@ -943,6 +1062,7 @@ class Responses(SyncAPIResource):
         model: ResponsesModel | Omit = omit,
         background: Optional[bool] | Omit = omit,
         text_format: type[TextFormatT] | Omit = omit,
+        accumulate: bool = True,
         tools: Iterable[ParseableToolParam] | Omit = omit,
         conversation: Optional[response_create_params.Conversation] | Omit = omit,
         include: Optional[List[ResponseIncludable]] | Omit = omit,
@@ -973,7 +1093,7 @@ class Responses(SyncAPIResource):
         extra_query: Query | None = None,
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
-    ) -> ResponseStreamManager[TextFormatT]:
+    ) -> ResponseStreamManager[TextFormatT] | ResponseStreamManagerWithoutSnapshots[TextFormatT]:
         new_response_args = {
             "input": input,
             "model": model,
@@ -1060,22 +1180,38 @@ class Responses(SyncAPIResource):
                 timeout=timeout,
             )
 
+            if not accumulate:
+                return ResponseStreamManagerWithoutSnapshots(
+                    api_request, text_format=text_format, input_tools=tools, starting_after=None
+                )
+
             return ResponseStreamManager(api_request, text_format=text_format, input_tools=tools, starting_after=None)
         else:
             if not is_given(response_id):
                 raise ValueError("id must be provided when streaming an existing response")
 
+            api_request = partial(
+                self.retrieve,
+                response_id=response_id,
+                stream=True,
+                include=include or [],
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                starting_after=omit,
+                timeout=timeout,
+            )
+
+            if not accumulate:
+                return ResponseStreamManagerWithoutSnapshots(
+                    api_request,
+                    text_format=text_format,
+                    input_tools=tools,
+                    starting_after=starting_after if is_given(starting_after) else None,
+                )
+
             return ResponseStreamManager(
-                lambda: self.retrieve(
-                    response_id=response_id,
-                    stream=True,
-                    include=include or [],
-                    extra_headers=extra_headers,
-                    extra_query=extra_query,
-                    extra_body=extra_body,
-                    starting_after=omit,
-                    timeout=timeout,
-                ),
+                api_request,
                 text_format=text_format,
                 input_tools=tools,
                 starting_after=starting_after if is_given(starting_after) else None,
@@ -2322,6 +2458,7 @@ class AsyncResponses(AsyncAPIResource):
         *,
         response_id: str,
         text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[True] = True,
         starting_after: int | Omit = omit,
         tools: Iterable[ParseableToolParam] | Omit = omit,
         # The extra values given here take precedence over values defined on the client or passed to this method.
@@ -2331,6 +2468,38 @@ class AsyncResponses(AsyncAPIResource):
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> AsyncResponseStreamManager[TextFormatT]: ...
 
+    @overload
+    def stream(
+        self,
+        *,
+        response_id: str,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[False],
+        starting_after: int | Omit = omit,
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
+    @overload
+    def stream(
+        self,
+        *,
+        response_id: str,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: bool,
+        starting_after: int | Omit = omit,
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncResponseStreamManager[TextFormatT] | AsyncResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
     @overload
     def stream(
         self,
@@ -2339,6 +2508,7 @@ class AsyncResponses(AsyncAPIResource):
         model: ResponsesModel,
         background: Optional[bool] | Omit = omit,
         text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[True] = True,
         tools: Iterable[ParseableToolParam] | Omit = omit,
         conversation: Optional[response_create_params.Conversation] | Omit = omit,
         include: Optional[List[ResponseIncludable]] | Omit = omit,
@@ -2370,6 +2540,86 @@ class AsyncResponses(AsyncAPIResource):
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> AsyncResponseStreamManager[TextFormatT]: ...
 
+    @overload
+    def stream(
+        self,
+        *,
+        input: Union[str, ResponseInputParam],
+        model: ResponsesModel,
+        background: Optional[bool] | Omit = omit,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: Literal[False],
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        conversation: Optional[response_create_params.Conversation] | Omit = omit,
+        include: Optional[List[ResponseIncludable]] | Omit = omit,
+        instructions: Optional[str] | Omit = omit,
+        max_output_tokens: Optional[int] | Omit = omit,
+        max_tool_calls: Optional[int] | Omit = omit,
+        metadata: Optional[Metadata] | Omit = omit,
+        parallel_tool_calls: Optional[bool] | Omit = omit,
+        previous_response_id: Optional[str] | Omit = omit,
+        prompt: Optional[ResponsePromptParam] | Omit = omit,
+        prompt_cache_key: str | Omit = omit,
+        reasoning: Optional[Reasoning] | Omit = omit,
+        safety_identifier: str | Omit = omit,
+        service_tier: Optional[Literal["auto", "default", "flex", "scale", "priority"]] | Omit = omit,
+        store: Optional[bool] | Omit = omit,
+        stream_options: Optional[response_create_params.StreamOptions] | Omit = omit,
+        temperature: Optional[float] | Omit = omit,
+        text: ResponseTextConfigParam | Omit = omit,
+        tool_choice: response_create_params.ToolChoice | Omit = omit,
+        top_logprobs: Optional[int] | Omit = omit,
+        top_p: Optional[float] | Omit = omit,
+        truncation: Optional[Literal["auto", "disabled"]] | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
+    @overload
+    def stream(
+        self,
+        *,
+        input: Union[str, ResponseInputParam],
+        model: ResponsesModel,
+        background: Optional[bool] | Omit = omit,
+        text_format: type[TextFormatT] | Omit = omit,
+        accumulate: bool,
+        tools: Iterable[ParseableToolParam] | Omit = omit,
+        conversation: Optional[response_create_params.Conversation] | Omit = omit,
+        include: Optional[List[ResponseIncludable]] | Omit = omit,
+        instructions: Optional[str] | Omit = omit,
+        max_output_tokens: Optional[int] | Omit = omit,
+        max_tool_calls: Optional[int] | Omit = omit,
+        metadata: Optional[Metadata] | Omit = omit,
+        parallel_tool_calls: Optional[bool] | Omit = omit,
+        previous_response_id: Optional[str] | Omit = omit,
+        prompt: Optional[ResponsePromptParam] | Omit = omit,
+        prompt_cache_key: str | Omit = omit,
+        reasoning: Optional[Reasoning] | Omit = omit,
+        safety_identifier: str | Omit = omit,
+        service_tier: Optional[Literal["auto", "default", "flex", "scale", "priority"]] | Omit = omit,
+        store: Optional[bool] | Omit = omit,
+        stream_options: Optional[response_create_params.StreamOptions] | Omit = omit,
+        temperature: Optional[float] | Omit = omit,
+        text: ResponseTextConfigParam | Omit = omit,
+        tool_choice: response_create_params.ToolChoice | Omit = omit,
+        top_logprobs: Optional[int] | Omit = omit,
+        top_p: Optional[float] | Omit = omit,
+        truncation: Optional[Literal["auto", "disabled"]] | Omit = omit,
+        user: str | Omit = omit,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncResponseStreamManager[TextFormatT] | AsyncResponseStreamManagerWithoutSnapshots[TextFormatT]: ...
+
     def stream(
         self,
         *,
@@ -2378,6 +2628,7 @@ class AsyncResponses(AsyncAPIResource):
         model: ResponsesModel | Omit = omit,
         background: Optional[bool] | Omit = omit,
         text_format: type[TextFormatT] | Omit = omit,
+        accumulate: bool = True,
         tools: Iterable[ParseableToolParam] | Omit = omit,
         conversation: Optional[response_create_params.Conversation] | Omit = omit,
         include: Optional[List[ResponseIncludable]] | Omit = omit,
@@ -2408,7 +2659,7 @@ class AsyncResponses(AsyncAPIResource):
         extra_query: Query | None = None,
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
-    ) -> AsyncResponseStreamManager[TextFormatT]:
+    ) -> AsyncResponseStreamManager[TextFormatT] | AsyncResponseStreamManagerWithoutSnapshots[TextFormatT]:
         new_response_args = {
             "input": input,
             "model": model,
@@ -2495,6 +2746,14 @@ class AsyncResponses(AsyncAPIResource):
                 timeout=timeout,
             )
 
+            if not accumulate:
+                return AsyncResponseStreamManagerWithoutSnapshots(
+                    api_request,
+                    text_format=text_format,
+                    input_tools=tools,
+                    starting_after=None,
+                )
+
             return AsyncResponseStreamManager(
                 api_request,
                 text_format=text_format,
@@ -2514,6 +2773,14 @@ class AsyncResponses(AsyncAPIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
+            if not accumulate:
+                return AsyncResponseStreamManagerWithoutSnapshots(
+                    api_request,
+                    text_format=text_format,
+                    input_tools=tools,
+                    starting_after=starting_after if is_given(starting_after) else None,
+                )
+
             return AsyncResponseStreamManager(
                 api_request,
                 text_format=text_format,
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import io
 import os
 import logging
 import builtins
+import functools
 from typing import overload
 from pathlib import Path
 
 import anyio
 import httpx
+import anyio.to_thread
 
 from ... import _legacy_response
 from .parts import (
@@ -28,6 +29,7 @@ from ..._compat import cached_property
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ..._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from ..._base_client import make_request_options
+from ...lib._uploads import PartReader, UploadManifest, upload_parts, async_upload_parts
 from ...types.upload import Upload
 from ...types.file_purpose import FilePurpose
 
@@ -74,8 +76,10 @@ class Uploads(SyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        manifest_path: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits a file into multiple 64MB parts and uploads them sequentially."""
+        """Splits a file into multiple 64MB parts and uploads them, up to `max_concurrency` at a time."""
 
     @overload
     def upload_file_chunked(
@@ -88,8 +92,10 @@ class Uploads(SyncAPIResource):
         purpose: FilePurpose,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        manifest_path: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits an in-memory file into multiple 64MB parts and uploads them sequentially."""
+        """Splits an in-memory file into multiple 64MB parts and uploads them, up to `max_concurrency` at a time."""
 
     def upload_file_chunked(
         self,
@@ -101,16 +107,27 @@ class Uploads(SyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        manifest_path: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits the given file into multiple parts and uploads them sequentially.
+        """Splits the given file into multiple parts and uploads them.
+
+        Up to `max_concurrency` parts are uploaded at once, each part is streamed from the
+        file as it's sent and retried according to the client's `max_retries`.
+
+        If a `manifest_path` is given then the upload can be resumed if it is interrupted: the
+        upload ID and every part that has been uploaded are recorded in a manifest at that path,
+        and calling this method again with the same file and manifest skips the parts that were
+        already uploaded. The manifest is deleted once the upload has been completed.
 
         ```py
         from pathlib import Path
 
-        client.uploads.upload_file(
+        client.uploads.upload_file_chunked(
             file=Path("my-paper.pdf"),
             mime_type="pdf",
             purpose="assistants",
+            max_concurrency=4,
         )
         ```
         """
@@ -130,38 +147,57 @@ class Uploads(SyncAPIResource):
             if bytes is None:
                 bytes = file.stat().st_size
 
-        upload = self.create(
-            bytes=bytes,
-            filename=filename,
-            mime_type=mime_type,
-            purpose=purpose,
-        )
-
-        part_ids: list[str] = []
-
         if part_size is None:
             part_size = DEFAULT_PART_SIZE
 
-        if isinstance(file, builtins.bytes):
-            buf: io.FileIO | io.BytesIO = io.BytesIO(file)
+        manifest: UploadManifest | None = None
+        if manifest_path is not None:
+            manifest = UploadManifest.load(
+                manifest_path,
+                filename=filename,
+                bytes=bytes,
+                part_size=part_size,
+                mime_type=mime_type,
+                purpose=purpose,
+            )
+
+        if manifest is not None:
+            upload_id = manifest.upload_id
+            log.info("Resuming upload %s", upload_id)
         else:
-            buf = io.FileIO(file)
-
-        try:
-            while True:
-                data = buf.read(part_size)
-                if not data:
-                    # EOF
-                    break
+            upload = self.create(
+                bytes=bytes,
+                filename=filename,
+                mime_type=mime_type,
+                purpose=purpose,
+            )
+            upload_id = upload.id
+
+            if manifest_path is not None:
+                manifest = UploadManifest.create(
+                    manifest_path,
+                    upload=upload,
+                    filename=filename,
+                    bytes=bytes,
+                    part_size=part_size,
+                    mime_type=mime_type,
+                    purpose=purpose,
+                )
+
+        part_ids = upload_parts(
+            PartReader(file, part_size=part_size),
+            lambda data: self.parts.create(upload_id=upload_id, data=data),
+            upload_id=upload_id,
+            max_concurrency=max_concurrency,
+            uploaded=manifest.uploaded_parts if manifest is not None else {},
+            on_uploaded=manifest.record_part if manifest is not None else None,
+        )
 
-                part = self.parts.create(upload_id=upload.id, data=data)
-                log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                part_ids.append(part.id)
-        except Exception:
-            buf.close()
-            raise
+        completed = self.complete(upload_id=upload_id, part_ids=part_ids, md5=md5)
+        if manifest is not None:
+            manifest.delete()
 
-        return self.complete(upload_id=upload.id, part_ids=part_ids, md5=md5)
+        return completed
 
     def create(
         self,
@@ -371,8 +407,10 @@ class AsyncUploads(AsyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        manifest_path: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits a file into multiple 64MB parts and uploads them sequentially."""
+        """Splits a file into multiple 64MB parts and uploads them, up to `max_concurrency` at a time."""
 
     @overload
     async def upload_file_chunked(
@@ -385,8 +423,10 @@ class AsyncUploads(AsyncAPIResource):
         purpose: FilePurpose,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        manifest_path: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits an in-memory file into multiple 64MB parts and uploads them sequentially."""
+        """Splits an in-memory file into multiple 64MB parts and uploads them, up to `max_concurrency` at a time."""
 
     async def upload_file_chunked(
         self,
@@ -398,16 +438,27 @@ class AsyncUploads(AsyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        manifest_path: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits the given file into multiple parts and uploads them sequentially.
+        """Splits the given file into multiple parts and uploads them.
+
+        Up to `max_concurrency` parts are uploaded at once, each part is streamed from the
+        file as it's sent and retried according to the client's `max_retries`.
+
+        If a `manifest_path` is given then the upload can be resumed if it is interrupted: the
+        upload ID and every part that has been uploaded are recorded in a manifest at that path,
+        and calling this method again with the same file and manifest skips the parts that were
+        already uploaded. The manifest is deleted once the upload has been completed.
 
         ```py
         from pathlib import Path
 
-        client.uploads.upload_file(
+        await client.uploads.upload_file_chunked(
             file=Path("my-paper.pdf"),
             mime_type="pdf",
             purpose="assistants",
+            max_concurrency=4,
         )
         ```
         """
@@ -428,48 +479,63 @@ class AsyncUploads(AsyncAPIResource):
                 stat = await file.stat()
                 bytes = stat.st_size
 
-        upload = await self.create(
-            bytes=bytes,
-            filename=filename,
-            mime_type=mime_type,
-            purpose=purpose,
-        )
-
-        part_ids: list[str] = []
-
         if part_size is None:
             part_size = DEFAULT_PART_SIZE
 
-        if isinstance(file, anyio.Path):
-            fd = await file.open("rb")
-            async with fd:
-                while True:
-                    data = await fd.read(part_size)
-                    if not data:
-                        # EOF
-                        break
-
-                    part = await self.parts.create(upload_id=upload.id, data=data)
-                    log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                    part_ids.append(part.id)
+        manifest: UploadManifest | None = None
+        if manifest_path is not None:
+            manifest = await anyio.to_thread.run_sync(
+                functools.partial(
+                    UploadManifest.load,
+                    manifest_path,
+                    filename=filename,
+                    bytes=bytes,
+                    part_size=part_size,
+                    mime_type=mime_type,
+                    purpose=purpose,
+                )
+            )
+
+        if manifest is not None:
+            upload_id = manifest.upload_id
+            log.info("Resuming upload %s", upload_id)
         else:
-            buf = io.BytesIO(file)
-
-            try:
-                while True:
-                    data = buf.read(part_size)
-                    if not data:
-                        # EOF
-                        break
-
-                    part = await self.parts.create(upload_id=upload.id, data=data)
-                    log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                    part_ids.append(part.id)
-            except Exception:
-                buf.close()
-                raise
-
-        return await self.complete(upload_id=upload.id, part_ids=part_ids, md5=md5)
+            upload = await self.create(
+                bytes=bytes,
+                filename=filename,
+                mime_type=mime_type,
+                purpose=purpose,
+            )
+            upload_id = upload.id
+
+            if manifest_path is not None:
+                manifest = await anyio.to_thread.run_sync(
+                    functools.partial(
+                        UploadManifest.create,
+                        manifest_path,
+                        upload=upload,
+                        filename=filename,
+                        bytes=bytes,
+                        part_size=part_size,
+                        mime_type=mime_type,
+                        purpose=purpose,
+                    )
+                )
+
+        part_ids = await async_upload_parts(
+            PartReader(file if isinstance(file, builtins.bytes) else Path(file), part_size=part_size),
+            lambda data: self.parts.create(upload_id=upload_id, data=data),
+            upload_id=upload_id,
+            max_concurrency=max_concurrency,
+            uploaded=manifest.uploaded_parts if manifest is not None else {},
+            on_uploaded=manifest.record_part if manifest is not None else None,
+        )
+
+        completed = await self.complete(upload_id=upload_id, part_ids=part_ids, md5=md5)
+        if manifest is not None:
+            await anyio.to_thread.run_sync(manifest.delete)
+
+        return completed
 
     async def create(
         self,
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Iterable, Optional
+from typing import Dict, List, Iterable, Optional, AsyncIterable
 from typing_extensions import Union, Literal
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait, as_completed
 
 import httpx
 import sniffio
@@ -18,6 +18,7 @@ from ..._compat import cached_property
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ..._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from ...pagination import SyncCursorPage, AsyncCursorPage
+from ...lib._ingest import VectorStoreIngestion, ingest_files, async_ingest_files
 from ..._base_client import AsyncPaginator, make_request_options
 from ...types.file_object import FileObject
 from ...types.vector_stores import file_batch_create_params, file_batch_list_files_params
@@ -332,29 +333,37 @@ class FileBatches(SyncAPIResource):
         By default, if any file upload fails then an exception will be eagerly raised.
 
         The number of concurrency uploads is configurable using the `max_concurrency`
-        parameter.
-
-        Note: this method only supports `asyncio` or `trio` as the backing async
-        runtime.
+        parameter. Files are uploaded in a thread pool and `files` is consumed lazily,
+        so it can be a generator over a large directory without building a list first.
         """
-        results: list[FileObject] = []
+        if max_concurrency < 1:
+            raise ValueError(f"Expected `max_concurrency` to be a positive integer but received {max_concurrency}")
 
-        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
-            futures: list[Future[FileObject]] = [
-                executor.submit(
-                    self._client.files.create,
-                    file=file,
-                    purpose="assistants",
-                )
-                for file in files
-            ]
+        results: list[FileObject] = []
+        pending: set[Future[FileObject]] = set()
 
-        for future in as_completed(futures):
-            exc = future.exception()
-            if exc:
-                raise exc
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="openai-file-upload") as executor:
+            try:
+                for file in files:
+                    # only take the next file once there's a free worker to upload it
+                    while len(pending) >= max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        results.extend(future.result() for future in done)
+
+                    pending.add(
+                        executor.submit(
+                            self._client.files.create,
+                            file=file,
+                            purpose="assistants",
+                        )
+                    )
 
-            results.append(future.result())
+                for future in as_completed(pending):
+                    results.append(future.result())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
 
         batch = self.create_and_poll(
             vector_store_id=vector_store_id,
@@ -364,6 +373,51 @@ class FileBatches(SyncAPIResource):
         )
         return batch
 
+    def ingest(
+        self,
+        vector_store_id: str,
+        *,
+        files: Iterable[FileTypes],
+        max_concurrency: int = 5,
+        batch_size: int = 500,
+        poll_interval_ms: int | Omit = omit,
+        chunking_strategy: FileChunkingStrategyParam | Omit = omit,
+    ) -> VectorStoreIngestion:
+        """Uploads the given files concurrently and adds them to the vector store in file batches
+        of up to `batch_size` files.
+
+        Unlike `upload_and_poll()`, a batch is created as soon as `batch_size` files have been
+        uploaded, while the remaining files are still being uploaded, and a file that fails
+        doesn't stop the others from being ingested. The returned `VectorStoreIngestion` reports
+        the outcome of every file, including upload errors and files the vector store couldn't
+        process.
+
+        Failed requests are retried according to the client's `max_retries` option, which can be
+        increased with `client.with_options(max_retries=...)`.
+
+        `files` is consumed lazily so it can be a generator over a large directory.
+        """
+
+        def create_batch(file_ids: List[str]) -> VectorStoreFileBatch:
+            return self.create_and_poll(
+                vector_store_id=vector_store_id,
+                file_ids=file_ids,
+                poll_interval_ms=poll_interval_ms,
+                chunking_strategy=chunking_strategy,
+            )
+
+        def list_failed_files(batch: VectorStoreFileBatch) -> List[VectorStoreFile]:
+            return list(self.list_files(batch.id, vector_store_id=vector_store_id, filter="failed"))
+
+        return ingest_files(
+            files,
+            upload=lambda file: self._client.files.create(file=file, purpose="assistants"),
+            create_batch=create_batch,
+            list_failed_files=list_failed_files,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+        )
+
 
 class AsyncFileBatches(AsyncAPIResource):
     @cached_property
@@ -724,6 +778,42 @@ class AsyncFileBatches(AsyncAPIResource):
         )
         return batch
 
+    async def ingest(
+        self,
+        vector_store_id: str,
+        *,
+        files: Union[Iterable[FileTypes], AsyncIterable[FileTypes]],
+        max_concurrency: int = 5,
+        batch_size: int = 500,
+        poll_interval_ms: int | Omit = omit,
+        chunking_strategy: FileChunkingStrategyParam | Omit = omit,
+    ) -> VectorStoreIngestion:
+        """Uploads the given files concurrently and adds them to the vector store in file batches
+        of up to `batch_size` files.
+
+        See `FileBatches.ingest()`, `files` can also be an async iterable.
+        """
+
+        async def create_batch(file_ids: List[str]) -> VectorStoreFileBatch:
+            return await self.create_and_poll(
+                vector_store_id=vector_store_id,
+                file_ids=file_ids,
+                poll_interval_ms=poll_interval_ms,
+                chunking_strategy=chunking_strategy,
+            )
+
+        async def list_failed_files(batch: VectorStoreFileBatch) -> List[VectorStoreFile]:
+            return [file async for file in self.list_files(batch.id, vector_store_id=vector_store_id, filter="failed")]
+
+        return await async_ingest_files(
+            files,
+            upload=lambda file: self._client.files.create(file=file, purpose="assistants"),
+            create_batch=create_batch,
+            list_failed_files=list_failed_files,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+        )
+
 
 class FileBatchesWithRawResponse:
     def __init__(self, file_batches: FileBatches) -> None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 import logging
-from typing import TYPE_CHECKING, Iterator, AsyncIterator
+from typing import TYPE_CHECKING, TypeVar, Iterator, AsyncIterator
 
 import httpx
 import pytest
@@ -43,6 +43,29 @@ def pytest_collection_modifyitems(items: list[pytest.Function]) -> None:
             item.add_marker(pytest.mark.skip(reason="aiohttp client is not compatible with respx_mock"))
 
 
+_T = TypeVar("_T")
+
+
+class FakeClock:
+    """A monotonic clock that only moves when `now` is changed"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def install(self, obj: _T) -> _T:
+        """Makes the given rate limiter, circuit breaker or endpoint pool read the time from this clock"""
+        setattr(obj, "_clock", self)  # noqa: B010
+        return obj
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
 base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
 
 api_key = "My API Key"
@@ -20,6 +20,7 @@ import openai
 from openai import OpenAI, AsyncOpenAI
 from openai._utils import consume_sync_iterator, assert_signatures_in_sync
 from openai._compat import model_copy
+from openai._models import construct_type
 from openai.types.chat import ChatCompletionChunk
 from openai.lib.streaming.chat import (
     ContentDoneEvent,
@@ -28,6 +29,9 @@ from openai.lib.streaming.chat import (
     ChatCompletionStreamState,
     ChatCompletionStreamManager,
     ParsedChatCompletionSnapshot,
+    ContentDeltaEventWithoutSnapshot,
+    ChatCompletionStreamWithoutSnapshots,
+    ChatCompletionStreamEventWithoutSnapshots,
 )
 from openai.lib._parsing._completions import ResponseFormatT
 
@@ -1068,6 +1072,141 @@ recommend checking a reliable weather website or a weather app.",
     )
 
 
+def make_chunk(delta: dict[str, object], finish_reason: str | None = None) -> ChatCompletionChunk:
+    return cast(
+        ChatCompletionChunk,
+        construct_type(
+            type_=ChatCompletionChunk,
+            value={
+                "id": "chatcmpl-123",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            },
+        ),
+    )
+
+
+def test_chat_completion_state_accumulates_in_place() -> None:
+    state = ChatCompletionStreamState()
+
+    state.handle_chunk(make_chunk({"role": "assistant", "content": ""}))
+    message = state.current_completion_snapshot.choices[0].message
+
+    events = list(state.handle_chunk(make_chunk({"content": "Hello"})))
+    assert [event.type for event in events] == ["chunk", "content.delta"]
+    events = list(state.handle_chunk(make_chunk({"content": " world"})))
+    assert events[1].type == "content.delta"
+    assert events[1].snapshot == "Hello world"
+
+    state.handle_chunk(
+        make_chunk(
+            {
+                "tool_calls": [
+                    {
+                        "index": 0,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "get_weather", "arguments": ""},
+                    }
+                ]
+            }
+        )
+    )
+    for arguments in ['{"city"', ': "SF"', "}"]:
+        state.handle_chunk(make_chunk({"tool_calls": [{"index": 0, "function": {"arguments": arguments}}]}))
+
+    # unknown delta properties are still accumulated
+    state.handle_chunk(make_chunk({"content": "!", "foo": "bar"}, finish_reason="tool_calls"))
+
+    completion = state.current_completion_snapshot
+    # the message is only rebuilt for the delta with unknown properties
+    assert completion.choices[0].message is not message
+    message = completion.choices[0].message
+    assert message.content == "Hello world!"
+    assert cast(Any, message).foo == "bar"
+    assert message.tool_calls is not None
+    assert message.tool_calls[0].id == "call_1"
+    assert message.tool_calls[0].function.name == "get_weather"
+    assert message.tool_calls[0].function.arguments == '{"city": "SF"}'
+    assert completion.choices[0].finish_reason == "tool_calls"
+
+
+def test_chat_completion_state_without_snapshots() -> None:
+    class Location(BaseModel):
+        city: str
+
+    state = ChatCompletionStreamState(response_format=Location)
+
+    events: list[ChatCompletionStreamEventWithoutSnapshots[Location]] = []
+    for chunk in [
+        make_chunk({"role": "assistant", "content": ""}),
+        make_chunk({"content": '{"city": '}),
+        make_chunk({"content": '"SF"}'}),
+        make_chunk({}, finish_reason="stop"),
+    ]:
+        events.extend(state.handle_chunk_without_snapshots(chunk))
+
+    assert [event.type for event in events] == [
+        "chunk",
+        "content.delta",
+        "chunk",
+        "content.delta",
+        "chunk",
+        "content.delta",
+        "chunk",
+        "content.done",
+    ]
+
+    delta = events[3]
+    assert isinstance(delta, ContentDeltaEventWithoutSnapshot)
+    assert delta.delta == '{"city": '
+    assert delta.snapshot is None
+    assert delta.parsed is None
+
+    done = events[-1]
+    assert done.type == "content.done"
+    assert done.content == '{"city": "SF"}'
+    assert done.parsed == Location(city="SF")
+
+    assert state.get_final_completion().choices[0].message.parsed == Location(city="SF")
+
+
+def test_chat_completion_state_joins_strings_lazily() -> None:
+    state = ChatCompletionStreamState()
+    list(state.handle_chunk_without_snapshots(make_chunk({"role": "assistant", "content": ""})))
+    message = state.current_completion_snapshot.choices[0].message
+
+    for content in ["Hello", " world"]:
+        events = list(state.handle_chunk_without_snapshots(make_chunk({"content": content})))
+        assert [event.type for event in events] == ["chunk", "content.delta"]
+
+    # the deltas are only joined once the snapshot is read
+    assert message.content == ""
+    assert state.current_completion_snapshot.choices[0].message.content == "Hello world"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_without_snapshots(client: OpenAI, respx_mock: MockRouter) -> None:
+    chunks = [make_chunk({"role": "assistant", "content": ""}), make_chunk({"content": "Hi"}), make_chunk({}, "stop")]
+    respx_mock.post("/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content="".join(f"data: {chunk.to_json(indent=None)}\n\n" for chunk in chunks) + "data: [DONE]\n\n",
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    with client.chat.completions.stream(model="gpt-4o", messages=[], accumulate=False) as stream:
+        assert isinstance(stream, ChatCompletionStreamWithoutSnapshots)
+        events = list(stream)
+
+    deltas = [event for event in events if event.type == "content.delta"]
+    assert [(event.delta, event.snapshot) for event in deltas] == [("", None), ("Hi", None)]
+    assert stream.get_final_completion().choices[0].message.content == "Hi"
+
+
 @pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
 def test_stream_method_in_sync(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
     checking_client: OpenAI | AsyncOpenAI = client if sync else async_client
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, cast
+
+from pydantic import BaseModel
+
+from openai._types import omit
+from openai._models import construct_type
+from openai.types.responses import ResponseStreamEvent
+from openai.lib.streaming.responses import ResponseStreamState
+
+TEXT = '{"city": "San Francisco"}'
+
+
+class Location(BaseModel):
+    city: str
+
+
+def make_events() -> List[ResponseStreamEvent]:
+    message: Dict[str, Any] = {
+        "id": "msg_123",
+        "type": "message",
+        "role": "assistant",
+        "status": "in_progress",
+        "content": [],
+    }
+    text_part: Dict[str, Any] = {"type": "output_text", "text": "", "annotations": [], "logprobs": []}
+    response: Dict[str, Any] = {"id": "resp_123", "object": "response", "status": "in_progress", "output": []}
+    completed_response = {
+        **response,
+        "status": "completed",
+        "output": [{**message, "status": "completed", "content": [{**text_part, "text": TEXT}]}],
+    }
+    text_event: Dict[str, Any] = {"item_id": "msg_123", "output_index": 0, "content_index": 0, "logprobs": []}
+
+    raw_events: List[Dict[str, Any]] = [
+        {"type": "response.created", "response": response},
+        {"type": "response.output_item.added", "output_index": 0, "item": message},
+        {
+            "type": "response.content_part.added",
+            "item_id": "msg_123",
+            "output_index": 0,
+            "content_index": 0,
+            "part": text_part,
+        },
+        {"type": "response.output_text.delta", "delta": TEXT[:10], **text_event},
+        {"type": "response.output_text.delta", "delta": TEXT[10:], **text_event},
+        {"type": "response.output_text.done", "text": TEXT, **text_event},
+        {"type": "response.completed", "response": completed_response},
+    ]
+    return [
+        cast(ResponseStreamEvent, construct_type(type_=ResponseStreamEvent, value={**event, "sequence_number": index}))
+        for index, event in enumerate(raw_events)
+    ]
+
+
+def test_stream_state() -> None:
+    state = ResponseStreamState(input_tools=omit, text_format=Location)
+
+    events = [event for raw_event in make_events() for event in state.handle_event(raw_event)]
+    assert [event.type for event in events] == [
+        "response.created",
+        "response.output_item.added",
+        "response.content_part.added",
+        "response.output_text.delta",
+        "response.output_text.delta",
+        "response.output_text.done",
+        "response.completed",
+    ]
+
+    delta = events[4]
+    assert delta.type == "response.output_text.delta"
+    assert delta.snapshot == TEXT
+
+    done = events[5]
+    assert done.type == "response.output_text.done"
+    assert done.parsed == Location(city="San Francisco")
+
+    completed = events[6]
+    assert completed.type == "response.completed"
+    assert completed.response.output_parsed == Location(city="San Francisco")
+
+
+def test_stream_state_without_snapshots() -> None:
+    state = ResponseStreamState(input_tools=omit, text_format=Location)
+
+    # the events are passed through as-is so a `response.created` event isn't required
+    raw_events = make_events()[3:]
+    events = [event for raw_event in raw_events for event in state.handle_event_without_snapshots(raw_event)]
+    assert len(events) == len(raw_events)
+    assert all(event is raw_event for event, raw_event in zip(events, raw_events))
+
+    assert state._completed_response is not None
+    assert state._completed_response.output_text == TEXT
+    assert state._completed_response.output_parsed == Location(city="San Francisco")
@@ -10,7 +10,17 @@ from respx import MockRouter
 
 from openai._utils import SensitiveHeadersFilter, is_dict
 from openai._models import FinalRequestOptions
-from openai.lib.azure import AzureOpenAI, AsyncAzureOpenAI
+from openai.lib.azure import (
+    AzureOpenAI,
+    AzureEndpoint,
+    AsyncAzureOpenAI,
+    AsyncAzureEndpoint,
+    LoadBalancedAzureOpenAI,
+    MutuallyExclusiveAuthError,
+    AsyncLoadBalancedAzureOpenAI,
+)
+from openai._exceptions import OpenAIError
+from openai._circuit_breaker import CircuitBreaker
 
 Client = Union[AzureOpenAI, AsyncAzureOpenAI]
 
@@ -802,3 +812,139 @@ def test_client_sets_base_url(client: Client) -> None:
         )
     )
     assert req.url == "https://example-resource.azure.openai.com/openai/models?api-version=2024-02-01"
+
+
+def make_endpoints() -> list[AzureEndpoint]:
+    return [
+        AzureEndpoint("https://east-resource.azure.openai.com", api_key="east key", weight=1000),
+        AzureEndpoint("https://west-resource.azure.openai.com", azure_ad_token_provider=lambda: "west token"),
+    ]
+
+
+@pytest.mark.respx()
+def test_load_balanced_client_fails_over(respx_mock: MockRouter) -> None:
+    respx_mock.post(
+        "https://east-resource.azure.openai.com/openai/deployments/gpt-4/chat/completions?api-version=2024-02-01"
+    ).mock(return_value=httpx.Response(429, json={"error": "rate limited"}, headers={"retry-after": "10"}))
+    respx_mock.post(
+        "https://west-resource.azure.openai.com/openai/deployments/gpt-4/chat/completions?api-version=2024-02-01"
+    ).mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+    client = LoadBalancedAzureOpenAI(endpoints=make_endpoints(), api_version="2024-02-01")
+    client._endpoint_pool._random.seed(0)
+    client.chat.completions.create(messages=[], model="gpt-4")
+
+    calls = cast("list[MockRequestCall]", respx_mock.calls)
+    assert len(calls) == 2
+
+    assert calls[0].request.url.host == "east-resource.azure.openai.com"
+    assert calls[0].request.headers.get("api-key") == "east key"
+    assert calls[0].request.headers.get("Authorization") is None
+
+    assert calls[1].request.url.host == "west-resource.azure.openai.com"
+    assert calls[1].request.headers.get("api-key") is None
+    assert calls[1].request.headers.get("Authorization") == "Bearer west token"
+
+    assert not client._endpoint_pool.is_healthy("https://east-resource.azure.openai.com/openai/")
+
+    # copies share the health of the endpoints
+    copied = client.with_options(max_retries=0)
+    assert copied._endpoint_pool is client._endpoint_pool
+    copied.chat.completions.create(messages=[], model="gpt-4")
+    assert len(respx_mock.calls) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.respx()
+async def test_load_balanced_client_fails_over_async(respx_mock: MockRouter) -> None:
+    respx_mock.post(
+        "https://east-resource.azure.openai.com/openai/deployments/gpt-4/chat/completions?api-version=2024-02-01"
+    ).mock(return_value=httpx.Response(503, json={"error": "unavailable"}))
+    respx_mock.post(
+        "https://west-resource.azure.openai.com/openai/deployments/gpt-4/chat/completions?api-version=2024-02-01"
+    ).mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+    async def token_provider() -> str:
+        return "west token"
+
+    client = AsyncLoadBalancedAzureOpenAI(
+        endpoints=[
+            AzureEndpoint("https://east-resource.azure.openai.com", api_key="east key", weight=1000),
+            AsyncAzureEndpoint("https://west-resource.azure.openai.com", azure_ad_token_provider=token_provider),
+        ],
+        api_version="2024-02-01",
+    )
+    client._endpoint_pool._random.seed(0)
+    await client.chat.completions.create(messages=[], model="gpt-4")
+
+    calls = cast("list[MockRequestCall]", respx_mock.calls)
+    assert len(calls) == 2
+    assert calls[0].request.headers.get("api-key") == "east key"
+    assert calls[1].request.headers.get("Authorization") == "Bearer west token"
+    assert client._endpoint_pool.in_flight("https://west-resource.azure.openai.com/openai/") == 0
+
+
+@pytest.mark.respx()
+def test_load_balanced_client_circuit_breaker(respx_mock: MockRouter) -> None:
+    east = respx_mock.post(
+        "https://east-resource.azure.openai.com/openai/deployments/gpt-4/chat/completions?api-version=2024-02-01"
+    ).mock(return_value=httpx.Response(500, json={"error": "unavailable"}))
+    west = respx_mock.post(
+        "https://west-resource.azure.openai.com/openai/deployments/gpt-4/chat/completions?api-version=2024-02-01"
+    ).mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = LoadBalancedAzureOpenAI(
+        endpoints=make_endpoints(), api_version="2024-02-01", project="my-project", circuit_breaker=breaker
+    )
+    client._endpoint_pool._random.seed(0)
+    copied = client.with_options(max_retries=1)
+    assert copied._circuit_breaker is breaker
+    assert copied.project == "my-project"
+
+    copied.chat.completions.create(messages=[], model="gpt-4")
+    assert east.call_count == 1
+    assert west.call_count == 1
+    calls = cast("list[MockRequestCall]", west.calls)
+    assert calls[0].request.headers.get("OpenAI-Project") == "my-project"
+
+    # each endpoint has its own circuit
+    assert breaker.is_open("https://east-resource.azure.openai.com/openai/")
+    assert not breaker.is_open("https://west-resource.azure.openai.com/openai/")
+
+    # requests that are rejected by an open circuit are retried against another endpoint
+    client._endpoint_pool.release("https://east-resource.azure.openai.com/openai/", success=True)
+    copied.chat.completions.create(messages=[], model="gpt-4")
+    assert east.call_count == 1
+    assert west.call_count == 2
+    assert not client._endpoint_pool.is_healthy("https://east-resource.azure.openai.com/openai/")
+
+
+@pytest.mark.parametrize("client_cls", [LoadBalancedAzureOpenAI, AsyncLoadBalancedAzureOpenAI])
+def test_load_balanced_client_prepare_url(
+    client_cls: type[LoadBalancedAzureOpenAI] | type[AsyncLoadBalancedAzureOpenAI],
+) -> None:
+    client = client_cls(endpoints=make_endpoints(), api_version="2024-02-01")
+    client._endpoint_pool._random.seed(0)
+    client._endpoint_pool.acquire("https://east-resource.azure.openai.com/openai/")
+
+    req = client._build_request(
+        FinalRequestOptions.construct(
+            method="post",
+            url="/chat/completions",
+            json_data={"model": "my-deployment"},
+        )
+    )
+    assert (
+        req.url
+        == "https://west-resource.azure.openai.com/openai/deployments/my-deployment/chat/completions?api-version=2024-02-01"
+    )
+    assert "Authorization" not in req.headers
+
+
+def test_azure_endpoint_credentials() -> None:
+    with pytest.raises(OpenAIError, match="Missing credentials"):
+        AzureEndpoint("https://east-resource.azure.openai.com")
+
+    with pytest.raises(MutuallyExclusiveAuthError):
+        AzureEndpoint("https://east-resource.azure.openai.com", api_key="key", azure_ad_token_provider=lambda: "token")
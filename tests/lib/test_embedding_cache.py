@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI
+from openai.lib.embedding_cache import LRUEmbeddingCache, DiskEmbeddingCache
+
+from ..conftest import base_url
+from .test_embeddings import MockEmbeddings
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache = LRUEmbeddingCache(max_bytes=8)
+    cache.set_many({"a": b"aaaa", "b": b"bbbb"})
+
+    # reading "a" makes "b" the least recently used
+    assert cache.get_many(["a", "c"]) == {"a": b"aaaa"}
+
+    cache.set_many({"c": b"cccc"})
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"aaaa", "c": b"cccc"}
+    assert cache.size == 8
+    assert len(cache) == 2
+
+    # embeddings larger than the whole budget aren't cached
+    cache.set_many({"d": b"d" * 12})
+    assert cache.get_many(["d"]) == {}
+
+
+def test_disk_cache_persists(tmp_path: Path) -> None:
+    with DiskEmbeddingCache(tmp_path / "cache") as cache:
+        cache.set_many({"a": b"aaaa", "b": b"bbbbbbbb"})
+        assert cache.get_many(["a", "missing"]) == {"a": b"aaaa"}
+
+        # the arena is remapped once it has grown
+        cache.set_many({"c": b"cccc", "a": b"xxxx"})
+        assert cache.get_many(["a", "b", "c"]) == {"a": b"aaaa", "b": b"bbbbbbbb", "c": b"cccc"}
+
+    with DiskEmbeddingCache(tmp_path / "cache") as cache:
+        assert len(cache) == 3
+        assert cache.get_many(["a", "b", "c"]) == {"a": b"aaaa", "b": b"bbbbbbbb", "c": b"cccc"}
+        assert (tmp_path / "cache" / "embeddings.f32").stat().st_size == 16
+
+
+def test_disk_cache_shared_directory(tmp_path: Path) -> None:
+    with DiskEmbeddingCache(tmp_path) as first, DiskEmbeddingCache(tmp_path) as second:
+        first.set_many({"a": b"aaaa"})
+
+        # another process is writing to the cache
+        other = sqlite3.connect(str(tmp_path / "index.sqlite3"), isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+
+        thread = threading.Thread(target=second.set_many, args=({"b": b"bbbb"},))
+        thread.start()
+        time.sleep(0.05)
+        # the write waits for the other process to commit
+        assert thread.is_alive()
+
+        with open(tmp_path / "embeddings.f32", "ab") as arena:
+            arena.write(b"cccc")
+        other.execute("INSERT INTO embeddings (key, offset, size) VALUES ('c', 4, 4)")
+        other.execute("COMMIT")
+        other.close()
+        thread.join()
+
+        assert first.get_many(["a", "b", "c"]) == {"a": b"aaaa", "b": b"bbbb", "c": b"cccc"}
+        assert second.get_many(["a", "b", "c"]) == {"a": b"aaaa", "b": b"bbbb", "c": b"cccc"}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_cached_embeddings(client: OpenAI, respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    cached = client.embeddings.with_cache(LRUEmbeddingCache())
+
+    matrix = cached.create_matrix(input=["text 1", "text 2", "text 1"], model="text-embedding-3-small")
+    assert matrix.data.tolist() == [[1, -1], [2, -2], [1, -1]]
+    assert matrix.usage.total_tokens == 3
+
+    response = cached.create(input=["text 2", "text 3"], model="text-embedding-3-small")
+    assert [embedding.embedding for embedding in response.data] == [[2, -2], [3, -3]]
+    assert [embedding.index for embedding in response.data] == [0, 1]
+
+    matrix = cached.create_matrix(input="text 3", model="text-embedding-3-small")
+    assert matrix.data.tolist() == [[3, -3]]
+    assert matrix.usage.total_tokens == 0
+
+    # misses in a call are embedded in a single request, without duplicates
+    assert embeddings.requests == [["text 1", "text 2"], ["text 3"]]
+    assert (cached.cache.stats.hits, cached.cache.stats.misses) == (3, 3)
+    assert cached.cache.stats.hit_rate == 0.5
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_cached_embeddings_keyed_by_dimensions(client: OpenAI, respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    cached = client.embeddings.with_cache(LRUEmbeddingCache())
+
+    cached.create_matrix(input=["text 1"], model="text-embedding-3-small")
+    cached.create_matrix(input=["text 1"], model="text-embedding-3-small", dimensions=2)
+    cached.create_matrix(input=["text 1"], model="text-embedding-3-large")
+
+    assert len(embeddings.requests) == 3
+
+
+def test_cached_embeddings_invalid_input(client: OpenAI) -> None:
+    cached = client.embeddings.with_cache(LRUEmbeddingCache())
+
+    with pytest.raises(TypeError, match="text inputs"):
+        cached.create_matrix(input=[[1, 2, 3]], model="text-embedding-3-small")  # type: ignore[list-item]
+
+    with pytest.raises(ValueError, match="at least one input"):
+        cached.create_matrix(input=[], model="text-embedding-3-small")
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_cached_embeddings(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+
+    with DiskEmbeddingCache(tmp_path) as cache:
+        cached = async_client.embeddings.with_cache(cache)
+
+        matrix = await cached.create_matrix(input=["text 4", "text 5"], model="text-embedding-3-small")
+        assert matrix.data.tolist() == [[4, -4], [5, -5]]
+
+        response = await cached.create(input=["text 5", "text 4", "text 6"], model="text-embedding-3-small")
+        assert [embedding.embedding for embedding in response.data] == [[5, -5], [4, -4], [6, -6]]
+
+    assert embeddings.requests == [["text 4", "text 5"], ["text 6"]]
+    assert cache.stats.hit_rate == 0.4
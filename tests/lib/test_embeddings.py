@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import json
+import time
+import array
+import base64
+import threading
+from typing import Any, Dict, List, Union, Optional
+
+import anyio
+import httpx
+import numpy as np
+import pytest
+from respx import MockRouter
+
+import openai.lib._embeddings
+from openai import OpenAI, AsyncOpenAI, BadRequestError
+from openai.lib._embeddings import EmbeddingMatrix, pack_inputs, async_embed_batches, embedding_matrix_from_rows
+from openai.types.create_embedding_response import Usage
+
+from ..conftest import base_url
+
+EMBEDDINGS = [[0.5, -1.0, 2.0], [1.5, 0.25, -3.0], [0.0, 4.0, 8.0]]
+
+
+def encode(values: List[float]) -> str:
+    return base64.b64encode(np.array(values, dtype="<f4").tobytes()).decode()
+
+
+def embeddings_response(embeddings: List[Any]) -> Dict[str, Any]:
+    # the embeddings are returned out of order to check that they're placed by index
+    return {
+        "object": "list",
+        "model": "text-embedding-3-small",
+        "data": [
+            {"object": "embedding", "index": index, "embedding": embeddings[index]}
+            for index in reversed(range(len(embeddings)))
+        ],
+        "usage": {"prompt_tokens": 3, "total_tokens": 3},
+    }
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix(client: OpenAI, respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(200, json=embeddings_response([encode(values) for values in EMBEDDINGS]))
+    )
+
+    matrix = client.embeddings.create_matrix(input=["a", "b", "c"], model="text-embedding-3-small")
+
+    assert b'"encoding_format":"base64"' in route.calls.last.request.content
+    assert isinstance(matrix.data, np.ndarray)
+    assert matrix.data.dtype == np.float32
+    assert matrix.data.flags["C_CONTIGUOUS"]
+    assert matrix.shape == (3, 3)
+    assert len(matrix) == 3
+    assert matrix.data.tolist() == EMBEDDINGS
+    assert list(matrix.row(-1)) == EMBEDDINGS[2]
+    assert matrix.model == "text-embedding-3-small"
+    assert matrix.usage.total_tokens == 3
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix_without_numpy(client: OpenAI, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(openai.lib._embeddings, "has_numpy", lambda: False)
+    respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(200, json=embeddings_response([encode(values) for values in EMBEDDINGS]))
+    )
+
+    matrix = client.embeddings.create_matrix(input=["a", "b", "c"], model="text-embedding-3-small")
+
+    assert isinstance(matrix.data, array.array)
+    assert matrix.data.typecode == "f"
+    assert matrix.shape == (3, 3)
+    assert matrix.data.tolist() == [value for values in EMBEDDINGS for value in values]
+    assert list(matrix.row(1)) == EMBEDDINGS[1]
+    with pytest.raises(IndexError):
+        matrix.row(3)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix_float_response(client: OpenAI, respx_mock: MockRouter) -> None:
+    respx_mock.post("/embeddings").mock(return_value=httpx.Response(200, json=embeddings_response(EMBEDDINGS)))
+
+    matrix = client.embeddings.create_matrix(input=["a", "b", "c"], model="text-embedding-3-small")
+
+    assert matrix.data.tolist() == EMBEDDINGS
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix_mismatched_dimensions(client: OpenAI, respx_mock: MockRouter) -> None:
+    respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(200, json=embeddings_response([encode([1.0, 2.0]), encode([1.0])]))
+    )
+
+    with pytest.raises(ValueError, match="dimensions"):
+        client.embeddings.create_matrix(input=["a", "b"], model="text-embedding-3-small")
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix_duplicate_index(client: OpenAI, respx_mock: MockRouter) -> None:
+    response = embeddings_response([encode(values) for values in EMBEDDINGS])
+    response["data"][0]["index"] = 0
+    respx_mock.post("/embeddings").mock(return_value=httpx.Response(200, json=response))
+
+    with pytest.raises(ValueError, match="more than one embedding with index 0"):
+        client.embeddings.create_matrix(input=["a", "b", "c"], model="text-embedding-3-small")
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_create_matrix(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(200, json=embeddings_response([encode(values) for values in EMBEDDINGS]))
+    )
+
+    matrix = await async_client.embeddings.create_matrix(input=["a", "b", "c"], model="text-embedding-3-small")
+
+    assert matrix.shape == (3, 3)
+    assert matrix.data.tolist() == EMBEDDINGS
+
+
+class MockEmbeddings:
+    """Embeds "text {i}" as `[i, -i]`, rejecting requests with more than `max_inputs` inputs"""
+
+    def __init__(self, respx_mock: MockRouter, *, max_inputs: Optional[int] = None, delay: bool = False) -> None:
+        self.max_inputs = max_inputs
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: List[List[str]] = []
+
+        respx_mock.post("/embeddings").mock(side_effect=self.create)
+
+    def create(self, request: httpx.Request) -> httpx.Response:
+        inputs: Union[str, List[str]] = json.loads(request.content)["input"]
+        if isinstance(inputs, str):
+            inputs = [inputs]
+
+        with self.lock:
+            self.requests.append(inputs)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.max_inputs is not None and len(inputs) > self.max_inputs:
+                return httpx.Response(
+                    400,
+                    json={
+                        "error": {
+                            "message": f"Requested {len(inputs)} tokens, max {self.max_inputs} tokens per request",
+                            "type": "max_tokens_per_request",
+                            "code": "max_tokens_per_request",
+                        }
+                    },
+                )
+
+            if self.delay:
+                # earlier requests finish last
+                time.sleep(0.02 / (1 + int(inputs[0].split()[1])))
+
+            values = [[float(text.split()[1]), -float(text.split()[1])] for text in inputs]
+            return httpx.Response(200, json=embeddings_response([encode(embedding) for embedding in values]))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def texts(count: int) -> List[str]:
+    return [f"text {index}" for index in range(count)]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_embed_many(client: OpenAI, respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock, delay=True)
+
+    blocks = list(
+        client.embeddings.embed_many(
+            iter(texts(10)), model="text-embedding-3-small", max_concurrency=2, max_inputs_per_request=3
+        )
+    )
+
+    assert [block.offset for block in blocks] == [0, 3, 6, 9]
+    assert [row for block in blocks for row in block.data.tolist()] == [[i, -i] for i in range(10)]
+    assert sorted(len(inputs) for inputs in embeddings.requests) == [1, 3, 3, 3]
+    assert embeddings.max_in_flight == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_embed_many_token_limit(client: OpenAI, respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+
+    blocks = list(
+        client.embeddings.embed_many(
+            ["text 0", "text 1", "text 22", "text 3"],
+            model="text-embedding-3-small",
+            max_tokens_per_request=12,
+            count_tokens=len,
+        )
+    )
+
+    assert sorted(embeddings.requests) == [["text 0", "text 1"], ["text 22"], ["text 3"]]
+    assert [block.shape for block in blocks] == [(2, 2), (1, 2), (1, 2)]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_embed_many_splits_rejected_requests(client: OpenAI, respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock, max_inputs=2)
+
+    blocks = list(
+        client.with_options(max_retries=0).embeddings.embed_many(
+            texts(5), model="text-embedding-3-small", max_inputs_per_request=5
+        )
+    )
+
+    assert len(blocks) == 1
+    assert blocks[0].shape == (5, 2)
+    assert blocks[0].data.tolist() == [[i, -i] for i in range(5)]
+    assert blocks[0].usage.total_tokens == 9
+    assert [len(inputs) for inputs in embeddings.requests] == [5, 2, 3, 1, 2]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_embed_many_rejected_input(client: OpenAI, respx_mock: MockRouter) -> None:
+    MockEmbeddings(respx_mock, max_inputs=0)
+
+    with pytest.raises(BadRequestError, match="tokens per request"):
+        list(client.with_options(max_retries=0).embeddings.embed_many(texts(2), model="text-embedding-3-small"))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_embed_many_does_not_split_other_errors(client: OpenAI, respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(400, json={"error": {"message": "Invalid model", "code": "model_not_found"}})
+    )
+
+    with pytest.raises(BadRequestError, match="Invalid model"):
+        list(client.with_options(max_retries=0).embeddings.embed_many(texts(4), model="text-embedding-3-small"))
+
+    assert route.call_count == 1
+
+
+def test_embed_many_invalid_input(client: OpenAI) -> None:
+    with pytest.raises(TypeError, match="iterable of strings"):
+        client.embeddings.embed_many("text", model="text-embedding-3-small")
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        client.embeddings.embed_many(texts(1), model="text-embedding-3-small", max_concurrency=0)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_embed_many(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock, max_inputs=3)
+
+    blocks = [
+        block
+        async for block in async_client.with_options(max_retries=0).embeddings.embed_many(
+            texts(10), model="text-embedding-3-small", max_concurrency=3, max_inputs_per_request=4
+        )
+    ]
+
+    assert [block.offset for block in blocks] == [0, 4, 8]
+    assert [row for block in blocks for row in block.data.tolist()] == [[i, -i] for i in range(10)]
+    assert sorted(len(inputs) for inputs in embeddings.requests) == [2, 2, 2, 2, 2, 4, 4]
+
+
+def test_async_embed_batches_trio() -> None:
+    in_flight = 0
+    max_in_flight = 0
+    cancelled: List[int] = []
+    failing: Optional[int] = None
+
+    async def embed(batch: List[str]) -> EmbeddingMatrix:
+        nonlocal in_flight, max_in_flight
+
+        index = int(batch[0].split()[1])
+        if index == failing:
+            raise BadRequestError(
+                "Invalid input", response=httpx.Response(400, request=httpx.Request("POST", "/")), body=None
+            )
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            # earlier batches finish last
+            await anyio.sleep(0.02 / (1 + index))
+        except anyio.get_cancelled_exc_class():
+            cancelled.append(index)
+            raise
+        finally:
+            in_flight -= 1
+
+        rows = [
+            (row, np.array([i, -i], dtype="<f4").tobytes()) for row, i in enumerate(range(index, index + len(batch)))
+        ]
+        return embedding_matrix_from_rows(
+            rows, model="text-embedding-3-small", usage=Usage(prompt_tokens=0, total_tokens=0)
+        )
+
+    async def embed_texts() -> List[EmbeddingMatrix]:
+        batches = pack_inputs(texts(10), max_inputs=2, max_tokens=1000)
+        return [block async for block in async_embed_batches(batches, embed, max_concurrency=3)]
+
+    blocks = anyio.run(embed_texts, backend="trio")
+
+    assert [block.offset for block in blocks] == [0, 2, 4, 6, 8]
+    assert [row for block in blocks for row in block.data.tolist()] == [[i, -i] for i in range(10)]
+    assert max_in_flight == 3
+
+    failing = 0
+    with pytest.raises(BadRequestError, match="Invalid input"):
+        anyio.run(embed_texts, backend="trio")
+
+    # the batches that were still being sent are cancelled
+    assert sorted(cancelled) == [2, 4]
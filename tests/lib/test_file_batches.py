@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import time
+import threading
+from typing import Any, Dict, List, Iterator, AsyncIterator
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, BadRequestError
+
+from ..conftest import base_url
+
+FILES = 12
+
+
+def file_batch(file_ids: List[str], *, batch_id: str = "vsfb_1", failed: int = 0) -> Dict[str, Any]:
+    return {
+        "id": batch_id,
+        "object": "vector_store.files_batch",
+        "created_at": 0,
+        "status": "completed",
+        "vector_store_id": "vs_1",
+        "file_counts": {
+            "in_progress": 0,
+            "completed": len(file_ids) - failed,
+            "failed": failed,
+            "cancelled": 0,
+            "total": len(file_ids),
+        },
+    }
+
+
+def vector_store_file(file_id: str) -> Dict[str, Any]:
+    return {
+        "id": file_id,
+        "object": "vector_store.file",
+        "created_at": 0,
+        "status": "failed",
+        "usage_bytes": 0,
+        "vector_store_id": "vs_1",
+        "last_error": {"code": "unsupported_file", "message": "unsupported file"},
+    }
+
+
+class MockFileBatches:
+    def __init__(
+        self,
+        respx_mock: MockRouter,
+        *,
+        fail_file: int | None = None,
+        unprocessable_file: int | None = None,
+        fail_listing: bool = False,
+    ) -> None:
+        self.fail_file = fail_file
+        self.unprocessable_file = unprocessable_file
+        self.fail_listing = fail_listing
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.uploaded: List[int] = []
+        self.batch_file_ids: List[str] = []
+        self.batches: Dict[str, List[str]] = {}
+        # the number of files that had been uploaded when each batch was created
+        self.uploaded_at_batch: List[int] = []
+
+        respx_mock.post("/files").mock(side_effect=self.create_file)
+        respx_mock.post("/vector_stores/vs_1/file_batches").mock(side_effect=self.create_batch)
+        respx_mock.get(url__regex=r".*/vector_stores/vs_1/file_batches/(?P<batch_id>vsfb_\d+)$").mock(
+            side_effect=self.retrieve_batch
+        )
+        if unprocessable_file is not None:
+            respx_mock.get(url__regex=r".*/vector_stores/vs_1/file_batches/(?P<batch_id>vsfb_\d+)/files").mock(
+                side_effect=self.list_batch_files
+            )
+
+    def create_file(self, request: httpx.Request) -> httpx.Response:
+        index = next(index for index in range(FILES) if f"document {index}\r\n".encode() in request.content)
+
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            time.sleep(0.01)
+
+            if index == self.fail_file:
+                return httpx.Response(400, json={"error": {"message": "bad file"}})
+
+            with self.lock:
+                self.uploaded.append(index)
+
+            return httpx.Response(
+                200,
+                json={
+                    "id": f"file-{index}",
+                    "object": "file",
+                    "bytes": 1,
+                    "created_at": 0,
+                    "filename": f"{index}.txt",
+                    "purpose": "assistants",
+                    "status": "processed",
+                },
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def create_batch(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.batch_file_ids = json.loads(request.content)["file_ids"]
+            batch_id = f"vsfb_{len(self.batches) + 1}"
+            self.batches[batch_id] = self.batch_file_ids
+            self.uploaded_at_batch.append(len(self.uploaded))
+        return self.retrieve_batch(request, batch_id)
+
+    def retrieve_batch(self, _request: httpx.Request, batch_id: str) -> httpx.Response:
+        file_ids = self.batches[batch_id]
+        return httpx.Response(200, json=file_batch(file_ids, batch_id=batch_id, failed=len(self.failed(file_ids))))
+
+    def list_batch_files(self, request: httpx.Request, batch_id: str) -> httpx.Response:
+        assert request.url.params["filter"] == "failed"
+        if self.fail_listing:
+            return httpx.Response(500, json={"error": {"message": "server error"}})
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": [vector_store_file(file_id) for file_id in self.failed(self.batches[batch_id])],
+                "has_more": False,
+            },
+        )
+
+    def failed(self, file_ids: List[str]) -> List[str]:
+        return [file_id for file_id in file_ids if file_id == f"file-{self.unprocessable_file}"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_and_poll_concurrently(client: OpenAI, respx_mock: MockRouter) -> None:
+    file_batches = MockFileBatches(respx_mock)
+    consumed: List[int] = []
+
+    def documents() -> Iterator[Any]:
+        for index in range(FILES):
+            # the next file is only taken once there's a free worker
+            assert len(consumed) - len(file_batches.uploaded) <= 3
+            consumed.append(index)
+            yield (f"{index}.txt", f"document {index}\r\n".encode())
+
+    batch = client.vector_stores.file_batches.upload_and_poll("vs_1", files=documents(), max_concurrency=3)
+
+    assert batch.status == "completed"
+    assert 1 < file_batches.max_in_flight <= 3
+    assert sorted(file_batches.batch_file_ids) == sorted(f"file-{index}" for index in range(FILES))
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_upload_and_poll_error(client: OpenAI, respx_mock: MockRouter) -> None:
+    file_batches = MockFileBatches(respx_mock, fail_file=2)
+    consumed: List[int] = []
+
+    def documents() -> Iterator[Any]:
+        for index in range(FILES):
+            consumed.append(index)
+            yield (f"{index}.txt", f"document {index}\r\n".encode())
+
+    with pytest.raises(BadRequestError, match="bad file"):
+        client.with_options(max_retries=0).vector_stores.file_batches.upload_and_poll(
+            "vs_1", files=documents(), max_concurrency=2
+        )
+
+    # the remaining files aren't uploaded once one has failed
+    assert len(consumed) < FILES
+    assert file_batches.batch_file_ids == []
+
+
+def documents(count: int = FILES) -> Iterator[Any]:
+    for index in range(count):
+        yield (f"{index}.txt", f"document {index}\r\n".encode())
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_ingest(client: OpenAI, respx_mock: MockRouter) -> None:
+    file_batches = MockFileBatches(respx_mock, fail_file=2, unprocessable_file=5)
+
+    ingestion = client.with_options(max_retries=0).vector_stores.file_batches.ingest(
+        "vs_1", files=documents(), max_concurrency=3, batch_size=4
+    )
+
+    assert len(ingestion.files) == FILES
+    assert [file.file for file in ingestion.files] == list(documents())
+    assert sorted(file_id for file_ids in file_batches.batches.values() for file_id in file_ids) == sorted(
+        f"file-{index}" for index in range(FILES) if index != 2
+    )
+    assert [len(file_ids) for file_ids in file_batches.batches.values()] == [4, 4, 3]
+    assert sorted(batch.id for batch in ingestion.batches) == ["vsfb_1", "vsfb_2", "vsfb_3"]
+    # batches are created while files are still being uploaded
+    assert file_batches.uploaded_at_batch[0] < FILES - 1
+
+    failed = {file.file_id: file for file in ingestion.failed}
+    assert list(failed) == [None, "file-5"]
+
+    upload_failure = ingestion.files[2]
+    assert isinstance(upload_failure.error, BadRequestError)
+    assert upload_failure.batch_id is None
+
+    processing_failure = failed["file-5"]
+    assert processing_failure.error is None
+    assert processing_failure.batch_id is not None
+    assert processing_failure.last_error is not None
+    assert processing_failure.last_error.code == "unsupported_file"
+
+    assert all(file.succeeded for file in ingestion.files if file.file_id not in (None, "file-5"))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_ingest_failed_files_lookup_error(client: OpenAI, respx_mock: MockRouter) -> None:
+    MockFileBatches(respx_mock, unprocessable_file=5, fail_listing=True)
+
+    ingestion = client.with_options(max_retries=0).vector_stores.file_batches.ingest(
+        "vs_1", files=documents(), batch_size=4
+    )
+
+    # the batches were still created, only the processing errors of their files are unknown
+    assert sorted(batch.id for batch in ingestion.batches) == ["vsfb_1", "vsfb_2", "vsfb_3"]
+    assert all(file.batch_id is not None and file.error is None for file in ingestion.files)
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_ingest_invalid_batch_size(client: OpenAI, respx_mock: MockRouter) -> None:
+    MockFileBatches(respx_mock)
+
+    with pytest.raises(ValueError, match="batch_size"):
+        client.vector_stores.file_batches.ingest("vs_1", files=documents(), batch_size=0)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_ingest(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    file_batches = MockFileBatches(respx_mock, fail_file=7, unprocessable_file=0)
+
+    async def async_documents() -> AsyncIterator[Any]:
+        for document in documents():
+            yield document
+
+    ingestion = await async_client.with_options(max_retries=0).vector_stores.file_batches.ingest(
+        "vs_1", files=async_documents(), max_concurrency=3, batch_size=5
+    )
+
+    assert len(ingestion.files) == FILES
+    assert len(ingestion.batches) == 3
+    assert sorted(len(file_ids) for file_ids in file_batches.batches.values()) == [1, 5, 5]
+    assert sorted(str(file.file_id) for file in ingestion.failed) == ["None", "file-0"]
+    assert isinstance(ingestion.files[7].error, BadRequestError)
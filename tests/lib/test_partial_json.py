@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from jiter import from_json
+
+from openai.lib.streaming._partial_json import PartialJSONParser
+
+DOCUMENTS: list[object] = [
+    {"name": "Jane", "age": 35.5, "tags": ["a", "b"], "address": {"city": "SF", "zip": None}, "active": True},
+    [1, -2, 0, 3.25, 1e21, -0.5e-3, 12345678901234567890, [], {}, [[{"a": [False]}]]],
+    {"escaped": 'quote " backslash \\ newline \n tab \t unicode é 😀', "é": ""},
+    "top level string",
+    42,
+]
+
+
+def jiter_parse(text: str) -> Any:
+    try:
+        return from_json(bytes(text, "utf-8"), partial_mode=True)
+    except ValueError as exc:
+        return exc.__class__, str(exc)
+
+
+def incremental_parse(parser: PartialJSONParser, text: str) -> Any:
+    try:
+        return parser.parse(text)
+    except ValueError as exc:
+        return exc.__class__, str(exc)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_matches_jiter(document: object, ensure_ascii: bool, chunk_size: int) -> None:
+    text = json.dumps(document, ensure_ascii=ensure_ascii, indent=2)
+    parser = PartialJSONParser()
+    results: list[tuple[Any, str]] = []
+
+    for end in range(chunk_size, len(text) + chunk_size, chunk_size):
+        result = incremental_parse(parser, text[:end])
+        assert result == jiter_parse(text[:end])
+        results.append((result, repr(result)))
+
+    # previously returned values should not change when more text is parsed
+    for result, result_repr in results:
+        assert repr(result) == result_repr
+
+
+def test_reuses_value_until_new_tokens_are_consumed() -> None:
+    parser = PartialJSONParser()
+    text = '{"items": [1, 2], "description": "a long'
+
+    first = parser.parse(text)
+    assert first == {"items": [1, 2]}
+    text += " string that is"
+    assert parser.parse(text) is first
+
+    text += ' still streaming", "done": true'
+    second = parser.parse(text)
+    assert second == {"items": [1, 2], "description": "a long string that is still streaming", "done": True}
+    assert first == {"items": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": 1} trailing',
+        "[1 2]",
+        '{"a": 01}',
+        '{"a": NaN}',
+        '{"a": "x\ny"}',
+        '{"a": "\\x"}',
+        '{"a": "\\ud800"}',
+        '{"a": "\\ud83d\\ude00"}',
+        '{"a": 1.e5}',
+        '{"a": 1,}',
+        "[tx]",
+        "  ",
+    ],
+)
+def test_invalid_json_matches_jiter(text: str) -> None:
+    parser = PartialJSONParser()
+
+    for end in range(1, len(text) + 1):
+        assert repr(incremental_parse(parser, text[:end])) == repr(jiter_parse(text[:end]))
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import json
+import time
+import threading
+from typing import Any, Dict, List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, BadRequestError
+
+from ..conftest import base_url
+
+PART_SIZE = 4
+CONTENT = b"aaaabbbbccccddddeeeeff"
+PARTS = [CONTENT[offset : offset + PART_SIZE] for offset in range(0, len(CONTENT), PART_SIZE)]
+
+
+def upload_object(status: str = "pending") -> Dict[str, Any]:
+    return {
+        "id": "upload_1",
+        "object": "upload",
+        "bytes": len(CONTENT),
+        "created_at": 0,
+        "expires_at": int(time.time()) + 3600,
+        "filename": "data.jsonl",
+        "purpose": "batch",
+        "status": status,
+    }
+
+
+class MockUploads:
+    def __init__(
+        self, respx_mock: MockRouter, *, fail_part: bytes | None = None, delay: bool = False, flaky: bool = False
+    ) -> None:
+        self.fail_part = fail_part
+        self.flaky = flaky
+        self.attempts: Dict[int, int] = {}
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed: Dict[str, Any] = {}
+        self.uploaded: List[int] = []
+
+        self.create_upload = respx_mock.post("/uploads").mock(return_value=httpx.Response(200, json=upload_object()))
+        respx_mock.post("/uploads/upload_1/parts").mock(side_effect=self.create_part)
+        respx_mock.post("/uploads/upload_1/complete").mock(side_effect=self.complete)
+
+    def create_part(self, request: httpx.Request) -> httpx.Response:
+        index = next(index for index, part in enumerate(PARTS) if b"\r\n\r\n" + part + b"\r\n" in request.content)
+
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.delay:
+                # later parts finish first
+                time.sleep(0.01 * (len(PARTS) - index))
+
+            if PARTS[index] == self.fail_part:
+                return httpx.Response(400, json={"error": {"message": "bad part"}})
+
+            with self.lock:
+                self.attempts[index] = self.attempts.get(index, 0) + 1
+            if self.flaky and self.attempts[index] == 1:
+                return httpx.Response(500, json={"error": {"message": "try again"}})
+
+            self.uploaded.append(index)
+            return httpx.Response(
+                200,
+                json={"id": f"part_{index}", "object": "upload.part", "created_at": 0, "upload_id": "upload_1"},
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def complete(self, request: httpx.Request) -> httpx.Response:
+        self.completed = json.loads(request.content)
+        return httpx.Response(200, json=upload_object(status="completed"))
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> Path:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_upload_file_chunked(client: OpenAI, respx_mock: MockRouter, data_file: Path, max_concurrency: int) -> None:
+    uploads = MockUploads(respx_mock, delay=True)
+
+    upload = client.uploads.upload_file_chunked(
+        file=data_file,
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        max_concurrency=max_concurrency,
+    )
+
+    assert upload.status == "completed"
+    assert uploads.completed == {
+        "part_ids": [f"part_{index}" for index in range(len(PARTS))],
+    }
+    assert uploads.max_in_flight <= max_concurrency
+    if max_concurrency > 1:
+        assert uploads.max_in_flight > 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_md5_given(client: OpenAI, respx_mock: MockRouter) -> None:
+    uploads = MockUploads(respx_mock)
+
+    client.uploads.upload_file_chunked(
+        file=CONTENT,
+        filename="data.jsonl",
+        bytes=len(CONTENT),
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        md5="my-checksum",
+        max_concurrency=2,
+    )
+
+    assert uploads.completed["md5"] == "my-checksum"
+    assert uploads.completed["part_ids"] == [f"part_{index}" for index in range(len(PARTS))]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_retries_parts(client: OpenAI, respx_mock: MockRouter, data_file: Path) -> None:
+    uploads = MockUploads(respx_mock, flaky=True)
+
+    client.with_options(max_retries=1).uploads.upload_file_chunked(
+        file=data_file,
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        max_concurrency=2,
+    )
+
+    # each part is streamed from disk again when it's retried
+    assert uploads.attempts == {index: 2 for index in range(len(PARTS))}
+    assert uploads.completed["part_ids"] == [f"part_{index}" for index in range(len(PARTS))]
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_upload_file_chunked_part_error(client: OpenAI, respx_mock: MockRouter, data_file: Path) -> None:
+    uploads = MockUploads(respx_mock, fail_part=PARTS[1])
+
+    with pytest.raises(BadRequestError, match="bad part"):
+        client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=data_file,
+            mime_type="text/jsonl",
+            purpose="batch",
+            part_size=PART_SIZE,
+            max_concurrency=2,
+        )
+
+    assert uploads.completed == {}
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_upload_file_chunked_invalid_concurrency(client: OpenAI, respx_mock: MockRouter, data_file: Path) -> None:
+    MockUploads(respx_mock)
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        client.uploads.upload_file_chunked(
+            file=data_file, mime_type="text/jsonl", purpose="batch", part_size=PART_SIZE, max_concurrency=0
+        )
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+async def test_async_upload_file_chunked(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, data_file: Path, max_concurrency: int
+) -> None:
+    uploads = MockUploads(respx_mock)
+
+    upload = await async_client.uploads.upload_file_chunked(
+        file=data_file,
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        max_concurrency=max_concurrency,
+    )
+
+    assert upload.status == "completed"
+    assert uploads.completed == {
+        "part_ids": [f"part_{index}" for index in range(len(PARTS))],
+    }
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+async def test_async_upload_file_chunked_part_error(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    uploads = MockUploads(respx_mock, fail_part=PARTS[2])
+
+    with pytest.raises(BadRequestError, match="bad part"):
+        await async_client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=CONTENT,
+            filename="data.jsonl",
+            bytes=len(CONTENT),
+            mime_type="text/jsonl",
+            purpose="batch",
+            part_size=PART_SIZE,
+            max_concurrency=2,
+        )
+
+    assert uploads.completed == {}
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_upload_file_chunked_resume(client: OpenAI, respx_mock: MockRouter, data_file: Path, tmp_path: Path) -> None:
+    manifest_path = tmp_path / "data.jsonl.manifest"
+    uploads = MockUploads(respx_mock, fail_part=PARTS[3])
+
+    with pytest.raises(BadRequestError, match="bad part"):
+        client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=data_file,
+            mime_type="text/jsonl",
+            purpose="batch",
+            part_size=PART_SIZE,
+            manifest_path=manifest_path,
+        )
+
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["upload_id"] == "upload_1"
+    assert manifest["parts"] == [
+        {"offset": index * PART_SIZE, "size": PART_SIZE, "id": f"part_{index}"} for index in range(3)
+    ]
+
+    respx_mock.reset()
+    uploads = MockUploads(respx_mock)
+
+    upload = client.uploads.upload_file_chunked(
+        file=data_file,
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        manifest_path=manifest_path,
+        max_concurrency=2,
+    )
+
+    assert upload.status == "completed"
+    assert not uploads.create_upload.called
+    assert sorted(uploads.uploaded) == [3, 4, 5]
+    assert uploads.completed == {
+        "part_ids": [f"part_{index}" for index in range(len(PARTS))],
+    }
+    assert not manifest_path.exists()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_stale_manifest(
+    client: OpenAI, respx_mock: MockRouter, data_file: Path, tmp_path: Path
+) -> None:
+    manifest_path = tmp_path / "data.jsonl.manifest"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "upload_id": "upload_0",
+                "filename": "data.jsonl",
+                "bytes": len(CONTENT),
+                "part_size": PART_SIZE * 2,
+                "mime_type": "text/jsonl",
+                "purpose": "batch",
+                "expires_at": int(time.time()) + 3600,
+                "parts": [{"offset": 0, "size": PART_SIZE * 2, "id": "part_0"}],
+            }
+        )
+    )
+    uploads = MockUploads(respx_mock)
+
+    client.uploads.upload_file_chunked(
+        file=data_file,
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        manifest_path=manifest_path,
+    )
+
+    assert uploads.create_upload.called
+    assert uploads.uploaded == list(range(len(PARTS)))
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+async def test_async_upload_file_chunked_resume(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    manifest_path = tmp_path / "data.jsonl.manifest"
+    MockUploads(respx_mock, fail_part=PARTS[1])
+
+    with pytest.raises(BadRequestError, match="bad part"):
+        await async_client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=CONTENT,
+            filename="data.jsonl",
+            bytes=len(CONTENT),
+            mime_type="text/jsonl",
+            purpose="batch",
+            part_size=PART_SIZE,
+            manifest_path=manifest_path,
+            md5="my-checksum",
+        )
+
+    respx_mock.reset()
+    uploads = MockUploads(respx_mock)
+
+    await async_client.uploads.upload_file_chunked(
+        file=CONTENT,
+        filename="data.jsonl",
+        bytes=len(CONTENT),
+        mime_type="text/jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        manifest_path=manifest_path,
+        md5="my-checksum",
+        max_concurrency=3,
+    )
+
+    assert not uploads.create_upload.called
+    assert sorted(uploads.uploaded) == [1, 2, 3, 4, 5]
+    assert uploads.completed == {
+        "part_ids": [f"part_{index}" for index in range(len(PARTS))],
+        "md5": "my-checksum",
+    }
+    assert not manifest_path.exists()
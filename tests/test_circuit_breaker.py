@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from openai import CircuitBreaker, CircuitBreakerOpenError
+
+from .conftest import FakeClock, base_url
+
+
+def make_request() -> httpx.Request:
+    return httpx.Request("POST", f"{base_url}/chat/completions")
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        breaker.acquire(base_url, make_request())
+        breaker.release(base_url, success=False)
+
+
+def test_opens_after_consecutive_failures(clock: FakeClock) -> None:
+    breaker = clock.install(CircuitBreaker(failure_threshold=3))
+
+    fail(breaker, 2)
+    assert breaker.state(base_url) == "closed"
+
+    fail(breaker)
+    assert breaker.state(base_url) == "open"
+    assert breaker.is_open(base_url)
+
+    with pytest.raises(CircuitBreakerOpenError) as exc_info:
+        breaker.acquire(base_url, make_request())
+    assert exc_info.value.retry_after == 30.0
+
+    # other base URLs have their own circuit
+    breaker.acquire("https://example.com/v1/", make_request())
+
+
+def test_success_resets_failures(clock: FakeClock) -> None:
+    breaker = clock.install(CircuitBreaker(failure_threshold=2))
+
+    fail(breaker)
+    breaker.acquire(base_url, make_request())
+    breaker.release(base_url, success=True)
+    fail(breaker)
+
+    assert breaker.state(base_url) == "closed"
+
+
+def test_half_open_probe_success_closes(clock: FakeClock) -> None:
+    breaker = clock.install(CircuitBreaker(failure_threshold=1, recovery_timeout=10))
+
+    fail(breaker)
+    clock.now = 10
+    assert breaker.state(base_url) == "half_open"
+
+    breaker.acquire(base_url, make_request())
+    # only one probe is allowed at a time
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.acquire(base_url, make_request())
+
+    breaker.release(base_url, success=True)
+    assert breaker.state(base_url) == "closed"
+    breaker.acquire(base_url, make_request())
+
+
+def test_half_open_probe_failure_reopens(clock: FakeClock) -> None:
+    breaker = clock.install(CircuitBreaker(failure_threshold=1, recovery_timeout=10))
+
+    fail(breaker)
+    clock.now = 10
+    fail(breaker)
+    assert breaker.state(base_url) == "open"
+
+    clock.now = 15
+    with pytest.raises(CircuitBreakerOpenError) as exc_info:
+        breaker.acquire(base_url, make_request())
+    assert exc_info.value.retry_after == 5
+
+
+def test_cancelled_probe_is_released(clock: FakeClock) -> None:
+    breaker = clock.install(CircuitBreaker(failure_threshold=1, recovery_timeout=10))
+
+    fail(breaker)
+    clock.now = 10
+    breaker.acquire(base_url, make_request())
+    breaker.release(base_url, success=None)
+    assert breaker.state(base_url) == "half_open"
+
+    breaker.acquire(base_url, make_request())
+
+
+def test_reset(clock: FakeClock) -> None:
+    breaker = clock.install(CircuitBreaker(failure_threshold=1))
+
+    fail(breaker)
+    breaker.reset(base_url)
+    assert breaker.state(base_url) == "closed"
+
+    fail(breaker)
+    breaker.reset()
+    assert breaker.state(base_url) == "closed"
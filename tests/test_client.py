@@ -6,19 +6,30 @@ import gc
 import os
 import sys
 import json
+import time
 import asyncio
 import inspect
 import tracemalloc
+import importlib.util
 from typing import Any, Union, Protocol, cast
 from unittest import mock
-from typing_extensions import Literal
+from typing_extensions import Literal, override
 
 import httpx
 import pytest
 from respx import MockRouter
 from pydantic import ValidationError
 
-from openai import OpenAI, AsyncOpenAI, APIResponseValidationError
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    RateLimiter,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    AdaptiveConcurrencyLimiter,
+    APIResponseValidationError,
+)
+from openai._json import StdlibJSONCodec
 from openai._types import Omit
 from openai._utils import asyncify
 from openai._models import BaseModel, FinalRequestOptions
@@ -55,6 +66,22 @@ def _low_retry_timeout(*_args: Any, **_kwargs: Any) -> float:
     return 0.1
 
 
+class _RecordingJSONCodec(StdlibJSONCodec):
+    def __init__(self) -> None:
+        self.dumped: list[Any] = []
+        self.loaded: list[Union[str, bytes]] = []
+
+    @override
+    def dumps(self, obj: Any) -> bytes:
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    @override
+    def loads(self, data: Union[str, bytes]) -> Any:
+        self.loaded.append(data)
+        return super().loads(data)
+
+
 def _get_open_connections(client: OpenAI | AsyncOpenAI) -> int:
     transport = client._client._transport
     assert isinstance(transport, httpx.HTTPTransport) or isinstance(transport, httpx.AsyncHTTPTransport)
@@ -509,6 +536,160 @@ class TestOpenAI:
         assert isinstance(response, Model2)
         assert response.foo == "bar"
 
+    @pytest.mark.respx(base_url=base_url)
+    def test_custom_json_codec(self, respx_mock: MockRouter) -> None:
+        class Model(BaseModel):
+            foo: str
+
+        codec = _RecordingJSONCodec()
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, json_codec=codec)
+        assert client.copy()._json_codec is codec
+
+        respx_mock.post("/foo").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+        response = client.post("/foo", body={"input": "ü"}, cast_to=Model)
+        assert response.foo == "bar"
+        assert codec.dumped == [{"input": "ü"}]
+        assert codec.loaded == [b'{"foo":"bar"}']
+
+        request = cast("list[MockRequestCall]", respx_mock.calls)[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"input": "ü"}
+
+    def test_invalid_json_codec(self) -> None:
+        with pytest.raises(TypeError, match="Invalid `json_codec` argument"):
+            OpenAI(base_url=base_url, api_key=api_key, json_codec=cast(Any, "foo"))
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_hedged_request(self, respx_mock: MockRouter) -> None:
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True)
+        assert client.with_options(hedge_after=0.5).copy().hedge_after == 0.5
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                time.sleep(1)
+                return httpx.Response(200, json={"attempt": 1})
+            return httpx.Response(200, json={"attempt": 2})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+
+        response = client.post("/foo", body={}, cast_to=object, options={"hedge_after": 0.05})
+        assert response == {"attempt": 2}
+
+        assert len(requests) == 2
+        assert requests[0].headers["Idempotency-Key"] == requests[1].headers["Idempotency-Key"]
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_hedged_request_not_needed(self, respx_mock: MockRouter) -> None:
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, hedge_after="auto")
+
+        respx_mock.post("/embeddings").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+        for _ in range(20):
+            assert client.post("/embeddings", body={}, cast_to=object) == {"foo": "bar"}
+
+        # requests are only hedged at the p95 latency once we've seen enough of them
+        assert len(respx_mock.calls) == 20
+        assert client._latency_tracker.percentile("POST /embeddings") is not None
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_hedge_after_only_applies_to_safe_requests(self, respx_mock: MockRouter) -> None:
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, hedge_after=0.05)
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            time.sleep(0.2)
+            return httpx.Response(200, json={"foo": "bar"})
+
+        respx_mock.post("/chat/completions").mock(side_effect=handler)
+        respx_mock.get("/files/file-abc123").mock(side_effect=handler)
+
+        # a client-wide `hedge_after` must not duplicate requests that create resources or are billed
+        assert client.post("/chat/completions", body={}, cast_to=object) == {"foo": "bar"}
+        assert len(requests) == 1
+
+        assert client.get("/files/file-abc123", cast_to=object) == {"foo": "bar"}
+        assert len(requests) == 3
+        assert list(client._latency_tracker._samples) == ["GET /files/{id}"]
+
+    @pytest.mark.respx(base_url=base_url)
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    def test_circuit_breaker(self, respx_mock: MockRouter) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = OpenAI(base_url=base_url, api_key=api_key, max_retries=5, circuit_breaker=breaker)
+        assert client.copy()._circuit_breaker is breaker
+
+        route = respx_mock.post("/foo").mock(return_value=httpx.Response(500))
+
+        # we stop retrying as soon as the circuit opens
+        with pytest.raises(APIStatusError):
+            client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 2
+        assert breaker.is_open(client.base_url)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    @mock.patch("openai._base_client.time.sleep")
+    def test_rate_limiter(self, sleep: mock.Mock, respx_mock: MockRouter) -> None:
+        limiter = RateLimiter()
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, rate_limiter=limiter)
+        assert client.copy()._rate_limiter is limiter
+
+        respx_mock.post("/foo").mock(
+            return_value=httpx.Response(
+                200,
+                json={"foo": "bar"},
+                headers={
+                    "x-ratelimit-limit-requests": "60",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1m",
+                },
+            )
+        )
+
+        client.post("/foo", body={"model": "gpt-4o"}, cast_to=httpx.Response)
+        sleep.assert_not_called()
+
+        client.post("/foo", body={"model": "gpt-4o"}, cast_to=httpx.Response)
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)  # pyright: ignore[reportUnknownMemberType]
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_warm_up(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.head("/").mock(return_value=httpx.Response(404))
+        client = OpenAI(base_url=base_url, api_key=api_key, pool_metrics=True)
+
+        assert client.warm_up(3) == 3
+        assert route.call_count == 3
+        assert client.pool_metrics is not None
+        assert client.copy().pool_metrics is client.pool_metrics
+        assert client.copy(pool_metrics=False).pool_metrics is None
+
+        # requests aren't traced unless pool metrics are enabled
+        assert OpenAI(base_url=base_url, api_key=api_key).pool_metrics is None
+
+        with pytest.raises(ValueError, match="at least 1"):
+            client.warm_up(0)
+
+    def test_http2(self) -> None:
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            OpenAI(base_url=base_url, api_key=api_key, http2=True, http_client=httpx.Client())
+
+        if importlib.util.find_spec("h2") is None:
+            with pytest.raises(OpenAIError, match=r"openai\[http2\]"):
+                OpenAI(base_url=base_url, api_key=api_key, http2=True)
+        else:
+            client = OpenAI(base_url=base_url, api_key=api_key, http2=True)
+            assert client.copy()._client is client._client
+
     @pytest.mark.respx(base_url=base_url)
     def test_union_response_different_types(self, respx_mock: MockRouter) -> None:
         """Union of objects with the same field name using a different type"""
@@ -1451,6 +1632,159 @@ class TestAsyncOpenAI:
         assert isinstance(response, Model2)
         assert response.foo == "bar"
 
+    @pytest.mark.respx(base_url=base_url)
+    async def test_custom_json_codec(self, respx_mock: MockRouter) -> None:
+        class Model(BaseModel):
+            foo: str
+
+        codec = _RecordingJSONCodec()
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, json_codec=codec)
+        assert client.copy()._json_codec is codec
+
+        respx_mock.post("/foo").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+        response = await client.post("/foo", body={"input": "ü"}, cast_to=Model)
+        assert response.foo == "bar"
+        assert codec.dumped == [{"input": "ü"}]
+        assert codec.loaded == [b'{"foo":"bar"}']
+
+        request = cast("list[MockRequestCall]", respx_mock.calls)[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"input": "ü"}
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_hedged_request(self, respx_mock: MockRouter) -> None:
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True)
+        assert client.with_options(hedge_after=0.5).copy().hedge_after == 0.5
+
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                await asyncio.sleep(10)
+                return httpx.Response(200, json={"attempt": 1})
+            return httpx.Response(200, json={"attempt": 2})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+
+        response = await client.post("/foo", body={}, cast_to=object, options={"hedge_after": 0.05})
+        assert response == {"attempt": 2}
+
+        assert len(requests) == 2
+        assert requests[0].headers["Idempotency-Key"] == requests[1].headers["Idempotency-Key"]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_hedged_request_error(self, respx_mock: MockRouter) -> None:
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, max_retries=0)
+
+        respx_mock.post("/foo").mock(return_value=httpx.Response(400, json={"error": "bad"}))
+
+        # a request that fails before we hedge isn't sent again
+        with pytest.raises(APIStatusError):
+            await client.post("/foo", body={}, cast_to=object, options={"hedge_after": 10})
+        assert len(respx_mock.calls) == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    async def test_circuit_breaker(self, respx_mock: MockRouter) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, max_retries=5, circuit_breaker=breaker)
+        assert client.copy()._circuit_breaker is breaker
+
+        route = respx_mock.post("/foo").mock(return_value=httpx.Response(500))
+
+        # we stop retrying as soon as the circuit opens
+        with pytest.raises(APIStatusError):
+            await client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 2
+        assert breaker.is_open(client.base_url)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    @mock.patch("openai._base_client.anyio.sleep")
+    async def test_rate_limiter(self, sleep: mock.AsyncMock, respx_mock: MockRouter) -> None:
+        limiter = RateLimiter()
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, rate_limiter=limiter)
+        assert client.copy()._rate_limiter is limiter
+
+        respx_mock.post("/foo").mock(
+            return_value=httpx.Response(
+                200,
+                json={"foo": "bar"},
+                headers={
+                    "x-ratelimit-limit-requests": "60",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1m",
+                },
+            )
+        )
+
+        await client.post("/foo", body={"model": "gpt-4o"}, cast_to=httpx.Response)
+        sleep.assert_not_called()
+
+        await client.post("/foo", body={"model": "gpt-4o"}, cast_to=httpx.Response)
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)  # pyright: ignore[reportUnknownMemberType]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_warm_up(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.head("/").mock(return_value=httpx.Response(404))
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, pool_metrics=True)
+
+        assert await client.warm_up(3) == 3
+        assert route.call_count == 3
+        assert client.pool_metrics is not None
+        assert client.copy().pool_metrics is client.pool_metrics
+        assert client.copy(pool_metrics=False).pool_metrics is None
+
+        # requests aren't traced unless pool metrics are enabled
+        assert AsyncOpenAI(base_url=base_url, api_key=api_key).pool_metrics is None
+
+        with pytest.raises(ValueError, match="at least 1"):
+            await client.warm_up(0)
+
+    async def test_http2(self) -> None:
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            AsyncOpenAI(base_url=base_url, api_key=api_key, http2=True, http_client=httpx.AsyncClient())
+
+        if importlib.util.find_spec("h2") is None:
+            with pytest.raises(OpenAIError, match=r"openai\[http2\]"):
+                AsyncOpenAI(base_url=base_url, api_key=api_key, http2=True)
+        else:
+            client = AsyncOpenAI(base_url=base_url, api_key=api_key, http2=True)
+            assert client.copy()._client is client._client
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_concurrency_limiter(self, respx_mock: MockRouter) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+        client = AsyncOpenAI(
+            base_url=base_url, api_key=api_key, _strict_response_validation=True, concurrency_limiter=limiter
+        )
+        assert client.copy()._concurrency_limiter is limiter
+
+        max_in_flight = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal max_in_flight
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            return httpx.Response(200, json={"foo": "bar"})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+        await asyncio.gather(*[client.post("/foo", cast_to=httpx.Response) for _ in range(10)])
+        assert max_in_flight <= 2
+        assert limiter.in_flight == 0
+        assert limiter.queue_depth == 0
+
+        respx_mock.post("/foo").mock(return_value=httpx.Response(429))
+        with pytest.raises(APIStatusError):
+            await client.post("/foo", cast_to=httpx.Response, options={"max_retries": 0})
+        assert limiter.limit == 1
+        assert limiter.in_flight == 0
+
     @pytest.mark.respx(base_url=base_url)
     async def test_union_response_different_types(self, respx_mock: MockRouter) -> None:
         """Union of objects with the same field name using a different type"""
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import AsyncOpenAI, RequestCoalescer
+
+from .conftest import base_url
+from .lib.test_embeddings import MockEmbeddings
+
+api_key = "My API Key"
+
+
+def make_client(*, max_wait: float = 0.05, max_batch_size: int = 64) -> AsyncOpenAI:
+    # `embeddings.create()` requests base64 embeddings that are only decoded after the response is parsed,
+    # which strict response validation would reject
+    return AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        max_retries=0,
+        coalescer=RequestCoalescer(max_wait=max_wait, max_batch_size=max_batch_size),
+    )
+
+
+def moderation(flagged: bool) -> Dict[str, Any]:
+    categories = [
+        "harassment",
+        "harassment/threatening",
+        "hate",
+        "hate/threatening",
+        "illicit",
+        "illicit/violent",
+        "self-harm",
+        "self-harm/instructions",
+        "self-harm/intent",
+        "sexual",
+        "sexual/minors",
+        "violence",
+        "violence/graphic",
+    ]
+    return {
+        "flagged": flagged,
+        "categories": {category: flagged for category in categories},
+        "category_scores": {category: 1.0 if flagged else 0.0 for category in categories},
+        "category_applied_input_types": {category: ["text"] for category in categories},
+    }
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_coalesces_embeddings(respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    client = make_client()
+
+    responses = await asyncio.gather(
+        *[client.embeddings.create(input=f"text {index}", model="text-embedding-3-small") for index in range(5)]
+    )
+
+    assert embeddings.requests == [[f"text {index}" for index in range(5)]]
+    assert [response.data[0].embedding for response in responses] == [[index, -index] for index in range(5)]
+    assert all(response.data[0].index == 0 and len(response.data) == 1 for response in responses)
+    # the usage of the request is split between the inputs
+    assert [response.usage.total_tokens for response in responses] == [1, 1, 1, 0, 0]
+    assert sum(response.usage.prompt_tokens for response in responses) == 3
+    assert client._coalescer is not None
+    assert (client._coalescer.requests, client._coalescer.coalesced) == (1, 5)
+    assert client.copy()._coalescer is client._coalescer
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_coalesces_by_model(respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    client = make_client()
+
+    await asyncio.gather(
+        client.embeddings.create(input="text 0", model="text-embedding-3-small"),
+        client.embeddings.create(input="text 1", model="text-embedding-3-large"),
+        client.embeddings.create(input="text 2", model="text-embedding-3-small"),
+    )
+
+    assert sorted(embeddings.requests) == [["text 0", "text 2"], ["text 1"]]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_max_batch_size(respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    client = make_client(max_wait=10, max_batch_size=2)
+
+    responses = await asyncio.wait_for(
+        asyncio.gather(
+            *[client.embeddings.create(input=f"text {index}", model="text-embedding-3-small") for index in range(4)]
+        ),
+        timeout=5,
+    )
+
+    assert embeddings.requests == [["text 0", "text 1"], ["text 2", "text 3"]]
+    assert [response.data[0].embedding for response in responses] == [[index, -index] for index in range(4)]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_rejected_batch_is_sent_alone(respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock, max_inputs=1)
+    client = make_client()
+
+    responses = await asyncio.gather(
+        *[client.embeddings.create(input=f"text {index}", model="text-embedding-3-small") for index in range(3)]
+    )
+
+    assert [response.data[0].embedding for response in responses] == [[index, -index] for index in range(3)]
+    assert embeddings.requests[0] == ["text 0", "text 1", "text 2"]
+    assert sorted(embeddings.requests[1:]) == [["text 0"], ["text 1"], ["text 2"]]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_only_coalesces_plain_single_inputs(respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    client = make_client()
+
+    await asyncio.gather(
+        client.embeddings.create(input=["text 0", "text 1"], model="text-embedding-3-small"),
+        client.embeddings.create(input="text 2", model="text-embedding-3-small", timeout=10),
+        client.embeddings.create(input="text 3", model="text-embedding-3-small", extra_headers={"X-Foo": "bar"}),
+    )
+
+    assert sorted(embeddings.requests) == [["text 0", "text 1"], ["text 2"], ["text 3"]]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_cancelled_leader(respx_mock: MockRouter) -> None:
+    embeddings = MockEmbeddings(respx_mock)
+    client = make_client()
+
+    leader = asyncio.ensure_future(client.embeddings.create(input="text 0", model="text-embedding-3-small"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(client.embeddings.create(input="text 1", model="text-embedding-3-small"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    response = await asyncio.wait_for(follower, timeout=5)
+
+    assert response.data[0].embedding == [1, -1]
+    assert embeddings.requests == [["text 1"]]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_coalesces_moderations(respx_mock: MockRouter) -> None:
+    requests: List[List[str]] = []
+
+    def create(request: httpx.Request) -> httpx.Response:
+        inputs: List[str] = json.loads(request.content)["input"]
+        requests.append(inputs)
+        return httpx.Response(
+            200,
+            json={
+                "id": "modr-1",
+                "model": "omni-moderation-latest",
+                "results": [moderation(text == "bad") for text in inputs],
+            },
+        )
+
+    respx_mock.post("/moderations").mock(side_effect=create)
+    client = make_client()
+
+    responses = await asyncio.gather(
+        client.moderations.create(input="good"),
+        client.moderations.create(input="bad"),
+        client.moderations.create(input="good", model="text-moderation-latest"),
+    )
+
+    assert sorted(requests) == [["good"], ["good", "bad"]]
+    assert [response.results[0].flagged for response in responses] == [False, True, False]
+    assert all(len(response.results) == 1 for response in responses)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="max_wait"):
+        RequestCoalescer(max_wait=-1)
+
+    with pytest.raises(ValueError, match="max_batch_size"):
+        RequestCoalescer(max_batch_size=0)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from openai import AdaptiveConcurrencyLimiter
+
+
+def make_response(status_code: int) -> httpx.Response:
+    return httpx.Response(status_code, request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"))
+
+
+@pytest.mark.asyncio
+async def test_limits_in_flight_requests() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+    first = await limiter.acquire()
+    await limiter.acquire()
+    assert limiter.in_flight == 2
+
+    task = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert limiter.queue_depth == 1
+
+    limiter.release(first, response=make_response(200))
+    await asyncio.wait_for(task, timeout=1)
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    started_at = await limiter.acquire()
+
+    task = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.queue_depth == 0
+
+    limiter.release(started_at, response=make_response(200))
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [429, 503])
+async def test_backs_off_when_overloaded(status_code: int) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+    started = [await limiter.acquire() for _ in range(8)]
+    limiter.release(started[0], response=make_response(status_code))
+    assert limiter.limit == 4
+
+    # the other requests were sent before we backed off so they shouldn't reduce the limit further
+    for started_at in started[1:]:
+        limiter.release(started_at, response=make_response(status_code))
+    assert limiter.limit == 4
+
+    started_at = await limiter.acquire()
+    limiter.release(started_at, response=None, timed_out=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_respects_min_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2)
+
+    started_at = await limiter.acquire()
+    limiter.release(started_at, response=make_response(429))
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_grows_when_saturated() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+    for _ in range(20):
+        started = [await limiter.acquire() for _ in range(limiter.limit)]
+        for started_at in started:
+            limiter.release(started_at, response=make_response(200))
+
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+    assert limiter.average_latency is not None
+
+
+@pytest.mark.asyncio
+async def test_does_not_grow_when_not_saturated() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+    for _ in range(20):
+        started_at = await limiter.acquire()
+        limiter.release(started_at, response=make_response(200))
+
+    assert limiter.limit == 2
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="min_limit"):
+        AdaptiveConcurrencyLimiter(min_limit=0)
+
+    with pytest.raises(ValueError, match="backoff_ratio"):
+        AdaptiveConcurrencyLimiter(backoff_ratio=1)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Any
+from collections import Counter
+
+import pytest
+
+from openai import EndpointPool
+
+from .conftest import FakeClock
+
+east = "https://east.example.com/openai/"
+west = "https://west.example.com/openai/"
+
+
+def make_pool(clock: FakeClock, **kwargs: Any) -> EndpointPool:
+    pool = clock.install(EndpointPool([east, west], **kwargs))
+    pool._random.seed(0)
+    return pool
+
+
+def test_prefers_least_loaded(clock: FakeClock) -> None:
+    pool = make_pool(clock)
+
+    pool.acquire(east)
+    for _ in range(10):
+        assert str(pool.select()) == west
+
+    pool.acquire(west)
+    pool.acquire(west)
+    for _ in range(10):
+        assert str(pool.select()) == east
+
+
+def test_spreads_by_weight(clock: FakeClock) -> None:
+    pool = make_pool(clock, weights=[3, 1])
+
+    counts = Counter(str(pool.select()) for _ in range(1000))
+    assert 650 < counts[east] < 850
+
+    # load is relative to the weight
+    pool.acquire(east)
+    pool.acquire(east)
+    pool.acquire(west)
+    assert str(pool.select()) == east
+
+
+def test_unhealthy_endpoint_is_skipped(clock: FakeClock) -> None:
+    pool = make_pool(clock, cooldown=1, max_cooldown=10)
+
+    pool.acquire(east)
+    pool.release(east, success=False)
+    assert not pool.is_healthy(east)
+    assert pool.has_healthy_endpoint()
+    for _ in range(10):
+        assert str(pool.select()) == west
+
+    clock.now = 1
+    assert pool.is_healthy(east)
+
+    # consecutive failures back off exponentially
+    pool.acquire(east)
+    pool.release(east, success=False)
+    clock.now = 2.5
+    assert not pool.is_healthy(east)
+    clock.now = 3
+    assert pool.is_healthy(east)
+
+    pool.acquire(east)
+    pool.release(east, success=True)
+    pool.acquire(east)
+    pool.release(east, success=False)
+    clock.now = 4
+    assert pool.is_healthy(east)
+
+
+def test_retry_after(clock: FakeClock) -> None:
+    pool = make_pool(clock, max_cooldown=10)
+
+    pool.acquire(east)
+    pool.release(east, success=False, retry_after=5)
+    clock.now = 4
+    assert not pool.is_healthy(east)
+    clock.now = 5
+    assert pool.is_healthy(east)
+
+    pool.acquire(east)
+    pool.release(east, success=False, retry_after=120)
+    clock.now = 15
+    assert pool.is_healthy(east)
+
+
+def test_all_unhealthy_uses_first_to_recover(clock: FakeClock) -> None:
+    pool = make_pool(clock)
+
+    pool.acquire(east)
+    pool.release(east, success=False, retry_after=5)
+    pool.acquire(west)
+    pool.release(west, success=False, retry_after=2)
+
+    assert not pool.has_healthy_endpoint()
+    assert str(pool.select()) == west
+
+
+def test_cancelled_request_does_not_affect_health(clock: FakeClock) -> None:
+    pool = make_pool(clock)
+
+    pool.acquire(east)
+    assert pool.in_flight(east) == 1
+    pool.release(east, success=None)
+    assert pool.in_flight(east) == 0
+    assert pool.is_healthy(east)
+
+
+def test_find(clock: FakeClock) -> None:
+    pool = make_pool(clock)
+
+    assert str(pool.find("https://east.example.com/openai/chat/completions?api-version=1")) == east
+    assert str(pool.find("wss://west.example.com/openai/realtime")) == west
+    assert pool.find("https://east.example.com/other") is None
+    assert pool.find("https://example.com/openai/") is None
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="at least one"):
+        EndpointPool([])
+
+    with pytest.raises(ValueError, match="weights"):
+        EndpointPool([east, west], weights=[1])
+
+    with pytest.raises(ValueError, match="positive"):
+        EndpointPool([east], weights=[0])
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        EndpointPool([east, east])
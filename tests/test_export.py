@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from typing import Any, List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI
+from openai.types import FileObject
+
+from .conftest import base_url
+
+PAGES = 3
+PAGE_SIZE = 2
+
+
+def file_object(index: int) -> Any:
+    return {
+        "id": f"file-{index}",
+        "object": "file",
+        "bytes": index,
+        "created_at": 0,
+        "filename": "file.jsonl",
+        "purpose": "fine-tune",
+        "status": "processed",
+        "unknown_field": {"nested": [index]},
+    }
+
+
+ALL_FILES = [file_object(index) for index in range(PAGES * PAGE_SIZE)]
+
+
+def mock_files(respx_mock: MockRouter) -> List[int]:
+    fetched: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        after = request.url.params.get("after")
+        page = int(after.split("-")[1]) // PAGE_SIZE + 1 if after else 0
+        fetched.append(page)
+
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": ALL_FILES[page * PAGE_SIZE : (page + 1) * PAGE_SIZE],
+                "has_more": page < PAGES - 1,
+            },
+        )
+
+    respx_mock.get("/files").mock(side_effect=handler)
+    return fetched
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_iter_raw(client: OpenAI, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    fetched = mock_files(respx_mock)
+    page = client.files.list()
+
+    constructed: List[object] = []
+    original = FileObject.construct.__func__  # type: ignore[attr-defined]
+    monkeypatch.setattr(
+        FileObject,
+        "construct",
+        classmethod(lambda cls, *args, **kwargs: constructed.append(kwargs) or original(cls, *args, **kwargs)),  # type: ignore
+    )
+
+    assert list(page.iter_raw()) == ALL_FILES
+    assert fetched == list(range(PAGES))
+
+    # only the last item of each later page is parsed to find the cursor
+    assert len(constructed) == PAGES - 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_export_jsonl(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    mock_files(respx_mock)
+    path = tmp_path / "files.jsonl"
+
+    assert client.files.list().export(path) == len(ALL_FILES)
+    assert [json.loads(line) for line in path.read_text().splitlines()] == ALL_FILES
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_export_arrow(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    mock_files(respx_mock)
+    path = tmp_path / "files.arrow"
+
+    assert client.files.list().export(path, format="arrow") == len(ALL_FILES)
+
+    with pyarrow.ipc.open_file(str(path)) as reader:
+        assert reader.read_all().to_pylist() == ALL_FILES
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_export_invalid_format(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    mock_files(respx_mock)
+
+    with pytest.raises(ValueError, match="Unsupported export format"):
+        client.files.list().export(tmp_path / "files", format="csv")  # type: ignore[arg-type]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_iter_raw(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    fetched = mock_files(respx_mock)
+
+    assert [item async for item in async_client.files.list().iter_raw()] == ALL_FILES
+    assert fetched == list(range(PAGES))
+
+    page = await async_client.files.list()
+    assert [item async for item in page.iter_raw()] == ALL_FILES
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_export_jsonl(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    mock_files(respx_mock)
+    path = tmp_path / "files.jsonl"
+
+    assert await async_client.files.list().export(path) == len(ALL_FILES)
+    assert [json.loads(line) for line in path.read_text().splitlines()] == ALL_FILES
@@ -1,10 +1,11 @@
+from typing import IO, Dict, Tuple, cast
 from pathlib import Path
 
 import anyio
 import pytest
-from dirty_equals import IsDict, IsList, IsBytes, IsTuple
+from dirty_equals import IsDict, IsList, IsBytes, IsTuple, IsInstance
 
-from openai._files import to_httpx_files, async_to_httpx_files
+from openai._files import FileRange, to_httpx_files, async_to_httpx_files
 
 readme_path = Path(__file__).parent.parent.joinpath("README.md")
 
@@ -12,13 +13,13 @@ readme_path = Path(__file__).parent.parent.joinpath("README.md")
 def test_pathlib_includes_file_name() -> None:
     result = to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(FileRange))})
 
 
 def test_tuple_input() -> None:
     result = to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(FileRange))))
 
 
 @pytest.mark.asyncio
@@ -49,3 +50,38 @@ def test_string_not_allowed() -> None:
                 "file": "foo",  # type: ignore
             }
         )
+
+
+def test_path_is_streamed() -> None:
+    result = to_httpx_files({"file": readme_path})
+    _, file = cast(Tuple[str, IO[bytes]], cast(Dict[str, object], result)["file"])
+
+    assert file.read() == readme_path.read_bytes()
+    assert file.seek(0) == 0
+    assert file.read() == readme_path.read_bytes()
+    file.close()
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_file_range(in_memory: bool) -> None:
+    content = readme_path.read_bytes()
+    file = FileRange(content if in_memory else readme_path, offset=10, length=100)
+
+    assert file.seek(0, 2) == 100
+    assert file.seek(0) == 0
+    assert file.read(40) == content[10:50]
+    assert file.tell() == 40
+    assert file.read() == content[50:110]
+    assert file.read() == b""
+
+    file.seek(95)
+    assert file.read() == content[105:110]
+    file.close()
+
+
+def test_file_range_to_end() -> None:
+    content = readme_path.read_bytes()
+
+    with FileRange(readme_path, offset=len(content) - 10) as file:
+        assert file.size == 10
+        assert file.read() == content[-10:]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from openai._models import FinalRequestOptions
+from openai._hedging import LatencyTracker, endpoint_key, is_safe_to_hedge
+
+
+def test_percentile() -> None:
+    tracker = LatencyTracker(min_samples=10)
+
+    for latency in range(1, 10):
+        tracker.record("POST /embeddings", latency)
+    assert tracker.percentile("POST /embeddings") is None
+
+    tracker.record("POST /embeddings", 10)
+    assert tracker.percentile("POST /embeddings") == 10
+    assert tracker.percentile("POST /embeddings", 0.5) == 5
+    assert tracker.percentile("POST /moderations") is None
+
+
+def test_window() -> None:
+    tracker = LatencyTracker(window=5, min_samples=5)
+
+    for latency in [100, 1, 1, 1, 1, 1]:
+        tracker.record("POST /embeddings", latency)
+
+    assert tracker.percentile("POST /embeddings") == 1
+
+
+def test_max_endpoints() -> None:
+    tracker = LatencyTracker(min_samples=1, max_endpoints=2)
+
+    tracker.record("GET /a", 1)
+    tracker.record("GET /b", 1)
+    tracker.record("GET /c", 1)
+
+    assert tracker.percentile("GET /a") is None
+    assert tracker.percentile("GET /b") == 1
+    assert tracker.percentile("GET /c") == 1
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("get", "/files/file-abc123", "GET /files/{id}"),
+        ("get", "/vector_stores/vs_abcdefghijklmnopqrstuvwx/files", "GET /vector_stores/{id}/files"),
+        ("post", "/threads/thread_1/runs/run_2/cancel", "POST /threads/{id}/runs/{id}/cancel"),
+        ("post", "/responses/input_tokens", "POST /responses/input_tokens"),
+        ("post", "/chat/completions", "POST /chat/completions"),
+    ],
+)
+def test_endpoint_key(method: str, url: str, expected: str) -> None:
+    assert endpoint_key(FinalRequestOptions.construct(method=method, url=url)) == expected
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("get", "/files/file-abc123", True),
+        ("post", "/embeddings", True),
+        ("post", "/deployments/my-deployment/embeddings", True),
+        ("post", "/moderations", True),
+        ("post", "/responses/input_tokens", True),
+        ("post", "/chat/completions", False),
+        ("post", "/responses", False),
+        ("post", "/batches", False),
+        ("delete", "/files/file-abc123", False),
+    ],
+)
+def test_is_safe_to_hedge(method: str, url: str, expected: bool) -> None:
+    assert is_safe_to_hedge(FinalRequestOptions.construct(method=method, url=url)) is expected
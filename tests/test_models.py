@@ -1,4 +1,7 @@
+import gc
+import sys
 import json
+import weakref
 from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional, cast
 from datetime import datetime, timezone
 from typing_extensions import Literal, Annotated, TypeAliasType
@@ -7,9 +10,10 @@ import pytest
 import pydantic
 from pydantic import Field
 
+import openai._models
 from openai._utils import PropertyInfo
 from openai._compat import PYDANTIC_V1, parse_obj, model_dump, model_json
-from openai._models import BaseModel, construct_type
+from openai._models import BaseModel, construct_type, get_type_constructor
 
 
 class BasicModel(BaseModel):
@@ -961,3 +965,80 @@ def test_extra_properties() -> None:
     assert model.a.prop == 1
     assert isinstance(model.a, Item)
     assert model.other == "foo"
+
+
+def test_type_constructor_is_cached() -> None:
+    class Model(BaseModel):
+        items: List[BasicModel]
+
+    assert get_type_constructor(List[Model]) is get_type_constructor(List[Model])
+
+    m = construct_type(value={"items": [{"foo": "a"}, {"foo": "b"}]}, type_=Model)
+    assert isinstance(m, Model)
+    assert [item.foo for item in m.items] == ["a", "b"]
+    assert all(isinstance(item, BasicModel) for item in m.items)
+
+
+def test_type_constructor_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(openai._models._type_constructors, "maxsize", 2)
+
+    def make_model() -> "weakref.ref[type]":
+        class Model(BaseModel):
+            foo: str
+
+        m = construct_type(value={"foo": "bar"}, type_=Model)
+        assert isinstance(m, Model)
+        return weakref.ref(Model)
+
+    models = [make_model() for _ in range(3)]
+    get_type_constructor(List[int])
+    get_type_constructor(Dict[str, int])
+    gc.collect()
+
+    # models that have been evicted from the cache can be garbage collected
+    assert all(model() is None for model in models)
+    assert len(openai._models._type_constructors) <= 2
+
+
+def test_type_constructor_union_variant_order() -> None:
+    class A(BaseModel):
+        foo: int
+
+    class B(BaseModel):
+        foo: int
+
+    # `Union[A, B] == Union[B, A]` but the first variant should still be used for each
+    assert isinstance(construct_type(value={"foo": "bar"}, type_=cast(Any, Union[A, B])), A)
+    assert isinstance(construct_type(value={"foo": "bar"}, type_=cast(Any, Union[B, A])), B)
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="TypeAliasType is not supported in Pydantic v1")
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="requires the `type` statement")
+def test_recursive_type_alias_type() -> None:
+    namespace: Dict[str, Any] = {"Dict": Dict, "List": List, "Union": Union}
+    exec("type JSONValue = Union[str, int, List[JSONValue], Dict[str, JSONValue]]", namespace)
+
+    class Model(BaseModel):
+        value: namespace["JSONValue"]  # type: ignore
+
+    m = construct_type(value={"value": {"a": [1, "b", {"c": [2]}]}}, type_=Model)
+    assert isinstance(m, Model)
+    assert cast(Any, m).value == {"a": [1, "b", {"c": [2]}]}
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="forward references have to be manually updated in Pydantic v1")
+def test_recursive_model() -> None:
+    class Node(BaseModel):
+        name: str
+        children: List["Node"]
+
+    m = construct_type(
+        value=cast(
+            object, {"name": "root", "children": [{"name": "child", "children": [{"name": "leaf", "children": []}]}]}
+        ),
+        type_=Node,
+    )
+    assert isinstance(m, Node)
+    assert isinstance(m.children[0], Node)
+    assert isinstance(m.children[0].children[0], Node)
+    assert m.children[0].children[0].name == "leaf"
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, Dict, List, Optional
+from concurrent.futures import CancelledError
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, Poller, AsyncOpenAI, AsyncPoller, NotFoundError
+from openai.types import Video
+
+from .conftest import base_url
+
+
+def video(video_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": video_id,
+        "object": "video",
+        "created_at": 0,
+        "model": "sora-2",
+        "progress": 100 if status == "completed" else 0,
+        "seconds": "4",
+        "size": "720x1280",
+        "status": status,
+    }
+
+
+class MockVideos:
+    """Video `video_{n}` is queued, then in progress, and completes on its `n`th retrieve"""
+
+    def __init__(self, respx_mock: MockRouter, *, poll_after_ms: Optional[Dict[str, int]] = None) -> None:
+        self.poll_after_ms = poll_after_ms or {}
+        self.lock = threading.Lock()
+        self.retrieves: List[str] = []
+        self.headers: List[httpx.Headers] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        respx_mock.get(url__regex=r".*/videos/[^/]+$").mock(side_effect=self.retrieve)
+
+    def retrieve(self, request: httpx.Request) -> httpx.Response:
+        video_id = request.url.path.split("/")[-1]
+        if not video_id.startswith("video_"):
+            return httpx.Response(404, json={"error": {"message": "No such video"}})
+
+        with self.lock:
+            self.retrieves.append(video_id)
+            self.headers.append(request.headers)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            count = self.retrieves.count(video_id)
+
+        try:
+            time.sleep(0.005)
+            status = "completed" if count >= int(video_id.split("_")[1]) else "queued" if count == 1 else "in_progress"
+            return httpx.Response(
+                200,
+                json=video(video_id, status),
+                headers={"openai-poll-after-ms": str(self.poll_after_ms.get(video_id, 1))},
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_polls_jobs_until_done(client: OpenAI, respx_mock: MockRouter) -> None:
+    videos = MockVideos(respx_mock)
+    done: List[str] = []
+
+    with Poller(client, max_concurrency=2) as poller:
+        futures = [poller.video(f"video_{n}", callback=lambda video: done.append(video.id)) for n in range(1, 6)]
+
+    assert [future.result().status for future in futures] == ["completed"] * 5
+    assert sorted(done) == [f"video_{n}" for n in range(1, 6)]
+    assert poller.requests == len(videos.retrieves) == 1 + 2 + 3 + 4 + 5
+    assert poller.pending == 0
+    assert videos.max_in_flight == 2
+    assert all(headers["X-Stainless-Poll-Helper"] == "true" for headers in videos.headers)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_schedules_by_poll_after_hint(client: OpenAI, respx_mock: MockRouter) -> None:
+    MockVideos(respx_mock, poll_after_ms={"video_2": 500})
+    done: List[str] = []
+
+    with Poller(client) as poller:
+        poller.video("video_2", callback=lambda video: done.append(video.id))
+        poller.video("video_4", callback=lambda video: done.append(video.id))
+
+    # the second video needs more retrieves but is polled more often
+    assert done == ["video_4", "video_2"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_custom_poll_interval(client: OpenAI, respx_mock: MockRouter) -> None:
+    videos = MockVideos(respx_mock, poll_after_ms={"video_2": 10_000})
+
+    with Poller(client) as poller:
+        future = poller.video("video_2", poll_interval_ms=1)
+
+    assert future.result().status == "completed"
+    assert videos.headers[0]["X-Stainless-Custom-Poll-Interval"] == "1"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_request_budget(client: OpenAI, respx_mock: MockRouter) -> None:
+    MockVideos(respx_mock, poll_after_ms={f"video_{n}": 0 for n in range(1, 4)})
+
+    start = time.monotonic()
+    with Poller(client, max_concurrency=4, max_requests_per_second=50) as poller:
+        for n in range(1, 4):
+            poller.video(f"video_{n}")
+
+    # 6 retrieves spaced 20ms apart
+    assert time.monotonic() - start >= 0.1
+    assert poller.requests == 6
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_failed_and_cancelled_jobs(client: OpenAI, respx_mock: MockRouter) -> None:
+    videos = MockVideos(respx_mock, poll_after_ms={"video_3": 10_000})
+
+    with Poller(client.with_options(max_retries=0)) as poller:
+        missing = poller.video("missing")
+        slow = poller.video("video_3")
+        while len(videos.retrieves) < 1:
+            time.sleep(0.001)
+        assert slow.cancel()
+
+    with pytest.raises(NotFoundError):
+        missing.result()
+    with pytest.raises(CancelledError):
+        slow.result()
+
+    assert videos.retrieves == ["video_3"]
+
+    with pytest.raises(RuntimeError, match="closed"):
+        poller.video("video_1")
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_callback_error_is_logged(client: OpenAI, respx_mock: MockRouter, caplog: pytest.LogCaptureFixture) -> None:
+    MockVideos(respx_mock)
+
+    def callback(video: Video) -> None:
+        raise ValueError(f"could not handle {video.id}")
+
+    with Poller(client) as poller:
+        future = poller.video("video_1", callback=callback)
+
+    assert future.result().id == "video_1"
+    assert "could not handle video_1" in caplog.text
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_close_cancels_on_error(client: OpenAI, respx_mock: MockRouter) -> None:
+    MockVideos(respx_mock, poll_after_ms={"video_2": 10_000})
+
+    poller = Poller(client)
+    future = poller.video("video_2")
+
+    with pytest.raises(KeyboardInterrupt):
+        with poller:
+            raise KeyboardInterrupt()
+
+    assert future.cancelled()
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_polls_jobs_until_done(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    videos = MockVideos(respx_mock)
+    done: List[str] = []
+
+    async def on_done(video: Video) -> None:
+        done.append(video.id)
+
+    async with AsyncPoller(async_client, max_concurrency=2) as poller:
+        handles = [poller.video(f"video_{n}", callback=on_done) for n in range(1, 5)]
+
+        first = await handles[0]
+        assert first.id == "video_1"
+
+    assert [(await handle).status for handle in handles] == ["completed"] * 4
+    assert sorted(done) == [f"video_{n}" for n in range(1, 5)]
+    assert poller.requests == len(videos.retrieves) == 1 + 2 + 3 + 4
+    assert videos.max_in_flight <= 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_failed_and_cancelled_jobs(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    videos = MockVideos(respx_mock, poll_after_ms={"video_3": 10_000})
+
+    async with AsyncPoller(async_client.with_options(max_retries=0)) as poller:
+        missing = poller.video("missing")
+        slow = poller.video("video_3")
+
+        with pytest.raises(NotFoundError):
+            await missing
+
+        assert slow.cancel()
+        assert not slow.cancel()
+
+    with pytest.raises(CancelledError):
+        await slow
+
+    assert videos.retrieves == ["video_3"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_callback_error_is_logged(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, caplog: pytest.LogCaptureFixture
+) -> None:
+    MockVideos(respx_mock)
+
+    async def callback(video: Video) -> None:
+        raise ValueError(f"could not handle {video.id}")
+
+    async with AsyncPoller(async_client) as poller:
+        handle = poller.video("video_1", callback=callback)
+
+    assert (await handle).id == "video_1"
+    assert "could not handle video_1" in caplog.text
+
+
+async def test_async_poller_must_be_entered(async_client: AsyncOpenAI) -> None:
+    poller = AsyncPoller(async_client)
+
+    with pytest.raises(RuntimeError, match="async with"):
+        poller.video("video_1")
+
+
+def test_invalid_arguments(client: OpenAI) -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        Poller(client, max_concurrency=0)
+
+    with pytest.raises(ValueError, match="max_requests_per_second"):
+        Poller(client, max_requests_per_second=0)
+
+    with pytest.raises(ValueError, match="poll_interval"):
+        Poller(client, poll_interval=-1)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+from unittest import mock
+
+import httpx
+import pytest
+
+from openai import PoolMetrics
+from openai._hedging import copy_request
+from openai._pool_metrics import trace_request, get_pool_metrics, async_trace_request
+
+
+def make_request() -> httpx.Request:
+    return httpx.Request("POST", "https://api.openai.com/v1/chat/completions", content=b"{}")
+
+
+def send_events(request: httpx.Request, events: List[str]) -> None:
+    trace = request.extensions["trace"]
+    for event in events:
+        trace(event, {})
+
+
+@mock.patch("openai._pool_metrics.time.monotonic")
+def test_new_connection(monotonic: mock.Mock) -> None:
+    metrics = PoolMetrics()
+
+    monotonic.return_value = 0.0
+    request = make_request()
+    trace_request(request, metrics)
+
+    monotonic.return_value = 0.5
+    send_events(request, ["connection.connect_tcp.started"])
+    monotonic.return_value = 0.6
+    send_events(request, ["connection.connect_tcp.complete", "connection.start_tls.started"])
+    monotonic.return_value = 0.8
+    send_events(request, ["connection.start_tls.complete", "http11.send_request_headers.started"])
+
+    assert metrics.requests == 1
+    assert metrics.average_checkout_wait == 0.5
+    assert metrics.connections_opened == 1
+    assert metrics.average_connect_time == pytest.approx(0.3)  # pyright: ignore[reportUnknownMemberType]
+
+
+@mock.patch("openai._pool_metrics.time.monotonic")
+def test_reused_connection(monotonic: mock.Mock) -> None:
+    metrics = PoolMetrics()
+
+    for wait in (0.1, 0.3):
+        monotonic.return_value = 0.0
+        request = make_request()
+        trace_request(request, metrics)
+
+        monotonic.return_value = wait
+        send_events(request, ["http2.send_request_headers.started", "http2.send_request_body.started"])
+
+    assert metrics.requests == 2
+    assert metrics.average_checkout_wait == pytest.approx(0.2)  # pyright: ignore[reportUnknownMemberType]
+    assert metrics.max_checkout_wait == 0.3
+    assert metrics.connections_opened == 0
+    assert metrics.average_connect_time is None
+
+    metrics.reset()
+    assert metrics.requests == 0
+    assert metrics.average_checkout_wait is None
+
+
+def test_calls_existing_trace() -> None:
+    metrics = PoolMetrics()
+    events: List[str] = []
+
+    def trace(name: str, info: Dict[str, Any]) -> None:  # noqa: ARG001
+        events.append(name)
+
+    request = httpx.Request("GET", "https://api.openai.com/v1/models", extensions={"trace": trace})
+    trace_request(request, metrics)
+
+    # a hedged copy of the request shouldn't trace events twice
+    hedged = copy_request(request)
+    trace_request(hedged, metrics)
+
+    send_events(hedged, ["http11.send_request_headers.started"])
+    assert events == ["http11.send_request_headers.started"]
+    assert metrics.requests == 1
+
+
+async def test_async_trace() -> None:
+    metrics = PoolMetrics()
+    events: List[str] = []
+
+    async def trace(name: str, info: Dict[str, Any]) -> None:  # noqa: ARG001
+        events.append(name)
+
+    request = httpx.Request("GET", "https://api.openai.com/v1/models", extensions={"trace": trace})
+    async_trace_request(request, metrics)
+    await request.extensions["trace"]("http11.send_request_headers.started", {})
+
+    assert events == ["http11.send_request_headers.started"]
+    assert metrics.requests == 1
+
+
+def test_metrics_are_shared_per_http_client() -> None:
+    http_client = httpx.Client()
+    assert get_pool_metrics(http_client) is get_pool_metrics(http_client)
+    assert get_pool_metrics(http_client) is not get_pool_metrics(httpx.Client())
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, List, Generator, cast
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, BadRequestError
+
+from .conftest import base_url
+
+PAGES = 5
+PAGE_SIZE = 2
+
+
+def file_object(index: int) -> object:
+    return {
+        "id": f"file-{index}",
+        "object": "file",
+        "bytes": 1,
+        "created_at": 0,
+        "filename": "file.jsonl",
+        "purpose": "fine-tune",
+        "status": "processed",
+    }
+
+
+def mock_files(respx_mock: MockRouter, *, fail_on_page: int | None = None) -> List[int]:
+    fetched: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        after = request.url.params.get("after")
+        page = int(after.split("-")[1]) // PAGE_SIZE + 1 if after else 0
+        fetched.append(page)
+
+        if page == fail_on_page:
+            return httpx.Response(400, json={"error": {"message": "bad page"}})
+
+        start = page * PAGE_SIZE
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": [file_object(index) for index in range(start, start + PAGE_SIZE)],
+                "has_more": page < PAGES - 1,
+            },
+        )
+
+    respx_mock.get("/files").mock(side_effect=handler)
+    return fetched
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_prefetch_pages(client: OpenAI, respx_mock: MockRouter) -> None:
+    fetched = mock_files(respx_mock)
+
+    files = client.files.list()
+    ids = [file.id for file in files.iter_items(prefetch=2)]
+
+    assert ids == [f"file-{index}" for index in range(PAGES * PAGE_SIZE)]
+    assert fetched == list(range(PAGES))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_prefetch_fetches_ahead(client: OpenAI, respx_mock: MockRouter) -> None:
+    fetched = mock_files(respx_mock)
+
+    pages = cast(Generator[Any, None, None], client.files.list().iter_pages(prefetch=2))
+    next(pages)
+
+    # the next two pages are fetched in the background without consuming them
+    deadline = time.monotonic() + 5
+    while len(fetched) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert fetched == [0, 1, 2]
+
+    pages.close()
+    assert len([thread for thread in threading.enumerate() if thread.name == "openai-page-prefetch"]) <= 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_prefetch_error(client: OpenAI, respx_mock: MockRouter) -> None:
+    mock_files(respx_mock, fail_on_page=2)
+    client = client.with_options(max_retries=0)
+
+    ids: List[str] = []
+    with pytest.raises(BadRequestError, match="bad page"):
+        for file in client.files.list().iter_items(prefetch=1):
+            ids.append(file.id)
+
+    assert ids == [f"file-{index}" for index in range(2 * PAGE_SIZE)]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_invalid_prefetch(client: OpenAI, respx_mock: MockRouter) -> None:
+    mock_files(respx_mock)
+
+    with pytest.raises(ValueError, match="non-negative"):
+        next(client.files.list().iter_pages(prefetch=-1))
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_prefetch_pages(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    fetched = mock_files(respx_mock)
+
+    ids = [file.id async for file in async_client.files.list().iter_items(prefetch=2)]
+
+    assert ids == [f"file-{index}" for index in range(PAGES * PAGE_SIZE)]
+    assert fetched == list(range(PAGES))
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_prefetch_error(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    mock_files(respx_mock, fail_on_page=1)
+    async_client = async_client.with_options(max_retries=0)
+
+    ids: List[str] = []
+    with pytest.raises(BadRequestError, match="bad page"):
+        async for file in async_client.files.list().iter_items(prefetch=3):
+            ids.append(file.id)
+
+    assert ids == [f"file-{index}" for index in range(PAGE_SIZE)]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import httpx
+import pytest
+
+from openai import RateLimiter
+from openai._models import FinalRequestOptions
+from openai._rate_limit import parse_reset_duration, estimate_request_tokens
+
+from .conftest import FakeClock
+
+
+def make_options(json_data: Optional[Dict[str, object]] = None) -> FinalRequestOptions:
+    return FinalRequestOptions.construct(method="post", url="/chat/completions", json_data=json_data)
+
+
+def make_request(organization: str | None = None) -> httpx.Request:
+    headers = {"OpenAI-Organization": organization} if organization else {}
+    return httpx.Request("POST", "https://api.openai.com/v1/chat/completions", headers=headers)
+
+
+def make_response(**headers: str) -> httpx.Response:
+    return httpx.Response(
+        200, headers={f"x-ratelimit-{key.replace('_', '-')}": value for key, value in headers.items()}
+    )
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("1s", 1.0),
+        ("20ms", 0.02),
+        ("6m0s", 360.0),
+        ("1h2m3.5s", 3723.5),
+        ("0s", 0.0),
+        ("", None),
+        (None, None),
+        ("soon", None),
+        ("1x", None),
+        ("1s ", None),
+    ],
+)
+def test_parse_reset_duration(value: str | None, expected: float | None) -> None:
+    assert parse_reset_duration(value) == expected
+
+
+def test_estimate_request_tokens() -> None:
+    assert estimate_request_tokens(make_options()) == 0
+    assert estimate_request_tokens(make_options({"model": "gpt-4o", "max_tokens": 100})) == 100
+    assert (
+        estimate_request_tokens(make_options({"model": "gpt-4o", "input": "a" * 400, "max_output_tokens": 50})) == 150
+    )
+
+
+def test_estimate_request_tokens_content_parts() -> None:
+    image = {"type": "image_url", "image_url": {"url": "data:image/png;base64," + "A" * 100_000}}
+    messages = [
+        {"role": "system", "content": "b" * 394},
+        {"role": "user", "content": [{"type": "text", "text": "a" * 392}, image]},
+    ]
+
+    # only the text is counted, each image costs a fixed number of tokens regardless of its size
+    assert estimate_request_tokens(make_options({"model": "gpt-4o", "messages": messages})) == 200 + 765
+
+
+def test_no_delay_without_headers(clock: FakeClock) -> None:
+    limiter = clock.install(RateLimiter())
+    options = make_options({"model": "gpt-4o"})
+
+    for _ in range(100):
+        assert limiter.reserve(options, make_request()) == 0
+
+    limiter.update(options, make_request(), httpx.Response(200))
+    assert limiter.reserve(options, make_request()) == 0
+
+
+def test_paces_requests(clock: FakeClock) -> None:
+    limiter = clock.install(RateLimiter())
+    options = make_options({"model": "gpt-4o"})
+
+    # 60 requests per minute, 2 left with one request refilled every second
+    limiter.update(
+        options,
+        make_request(),
+        make_response(limit_requests="60", remaining_requests="2", reset_requests="58s"),
+    )
+
+    assert limiter.reserve(options, make_request()) == 0
+    assert limiter.reserve(options, make_request()) == 0
+    assert limiter.reserve(options, make_request()) == pytest.approx(1.0)  # pyright: ignore[reportUnknownMemberType]
+    assert limiter.reserve(options, make_request()) == pytest.approx(2.0)  # pyright: ignore[reportUnknownMemberType]
+
+    clock.now = 10.0
+    assert limiter.reserve(options, make_request()) == 0
+
+
+def test_paces_tokens(clock: FakeClock) -> None:
+    limiter = clock.install(RateLimiter())
+    options = make_options({"model": "gpt-4o", "max_tokens": 500})
+
+    limiter.update(
+        options,
+        make_request(),
+        make_response(
+            limit_requests="1000",
+            remaining_requests="999",
+            reset_requests="60ms",
+            limit_tokens="1000",
+            remaining_tokens="500",
+            reset_tokens="5s",
+        ),
+    )
+
+    assert limiter.reserve(options, make_request()) == 0
+    # 100 tokens are refilled every second
+    assert limiter.reserve(options, make_request()) == pytest.approx(5.0)  # pyright: ignore[reportUnknownMemberType]
+
+    clock.now = 5.0
+    assert limiter.reserve(options, make_request()) == pytest.approx(5.0)  # pyright: ignore[reportUnknownMemberType]
+
+
+def test_max_delay(clock: FakeClock) -> None:
+    limiter = clock.install(RateLimiter(max_delay=1.5))
+    options = make_options({"model": "gpt-4o"})
+
+    limiter.update(
+        options, make_request(), make_response(limit_requests="1", remaining_requests="0", reset_requests="1m")
+    )
+    assert limiter.reserve(options, make_request()) == 1.5
+
+
+def test_tracks_models_and_organizations_separately(clock: FakeClock) -> None:
+    limiter = clock.install(RateLimiter())
+    gpt_4o = make_options({"model": "gpt-4o"})
+    gpt_4o_mini = make_options({"model": "gpt-4o-mini"})
+
+    limiter.update(
+        gpt_4o, make_request(), make_response(limit_requests="10", remaining_requests="0", reset_requests="1s")
+    )
+
+    assert limiter.reserve(gpt_4o, make_request()) > 0
+    assert limiter.reserve(gpt_4o_mini, make_request()) == 0
+    assert limiter.reserve(gpt_4o, make_request(organization="org-other")) == 0
@@ -216,6 +216,55 @@ async def test_multi_byte_character_multiple_chunks(
     assert sse.json() == {"content": "известни"}
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_crlf_terminators_split_across_chunks(
+    sync: bool,
+    client: OpenAI,
+    async_client: AsyncOpenAI,
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b"event: ping\r\n"
+        yield b'data: {"foo":true}\r\n\r'
+        yield b"\nevent: completion\r"
+        yield b'data: {"bar":false}\r\r'
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert sse.event == "ping"
+    assert sse.json() == {"foo": True}
+
+    sse = await iter_next(iterator)
+    assert sse.event == "completion"
+    assert sse.json() == {"bar": False}
+
+    await assert_empty_iter(iterator)
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_large_event_many_chunks(
+    sync: bool,
+    client: OpenAI,
+    async_client: AsyncOpenAI,
+) -> None:
+    content = "x" * 100_000
+
+    def body() -> Iterator[bytes]:
+        raw = b'data: {"content":"' + content.encode() + b'"}\n\ndata: {"content":"done"}\n\n'
+        for i in range(0, len(raw), 7):
+            yield raw[i : i + 7]
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert sse.json() == {"content": content}
+
+    sse = await iter_next(iterator)
+    assert sse.json() == {"content": "done"}
+
+    await assert_empty_iter(iterator)
+
+
 async def to_aiter(iter: Iterator[bytes]) -> AsyncIterator[bytes]:
     for chunk in iter:
         yield chunk
@@ -8,6 +8,7 @@ from typing_extensions import Required, Annotated, TypedDict
 
 import pytest
 
+import openai._utils._transform
 from openai._types import Base64FileInput, omit, not_given
 from openai._utils import (
     PropertyInfo,
@@ -458,3 +459,55 @@ async def test_strips_notgiven(use_async: bool) -> None:
 async def test_strips_omit(use_async: bool) -> None:
     assert await transform({"foo_bar": "bar"}, Foo1, use_async) == {"fooBar": "bar"}
     assert await transform({"foo_bar": omit}, Foo1, use_async) == {}
+
+
+class PlainParams(TypedDict, total=False):
+    name: Required[str]
+    tags: List[str]
+    metadata: Dict[str, str]
+    nested: "PlainParams"
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_plain_data_skipping(use_async: bool) -> None:
+    # types without any aliases or formats don't need to copy plain data
+    data: PlainParams = {"name": "foo", "tags": ["a", "b"], "metadata": {"a": "b"}, "nested": {"name": "bar"}}
+    assert await transform(data, PlainParams, use_async) is data
+
+    # but omitted values and models still need to be transformed
+    assert await transform({"name": "foo", "tags": not_given}, PlainParams, use_async) == {"name": "foo"}
+    assert await transform(
+        {"name": "foo", "nested": MyModel.construct(foo="bar")},  # type: ignore[typeddict-item]
+        PlainParams,
+        use_async,
+    ) == {"name": "foo", "nested": {"foo": "bar"}}
+
+
+class RecursiveAlias(TypedDict, total=False):
+    foo_bar: Annotated[str, PropertyInfo(alias="fooBar")]
+    children: List["RecursiveAlias"]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_recursive_typeddict_alias(use_async: bool) -> None:
+    assert await transform(
+        {"foo_bar": "a", "children": [{"foo_bar": "b", "children": [{"foo_bar": "c"}]}]},
+        RecursiveAlias,
+        use_async,
+    ) == {"fooBar": "a", "children": [{"fooBar": "b", "children": [{"fooBar": "c"}]}]}
+
+
+def test_transformer_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        openai._utils._transform, "_transformers", openai._utils._transform._TransformerCache(maxsize=2)
+    )
+
+    for _ in range(3):
+
+        class Params(TypedDict, total=False):
+            foo_bar: Annotated[str, PropertyInfo(alias="fooBar")]
+
+        assert _transform({"foo_bar": "a"}, Params) == {"fooBar": "a"}
+        assert len(openai._utils._transform._transformers) <= 2